@@ -0,0 +1,53 @@
+"""Keyset indexes and cached counts for the inventory list
+
+Revision ID: inventory_keyset
+Revises: report_views
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "inventory_keyset"
+down_revision: Union[str, Sequence[str], None] = "report_views"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (sort expression, id) for each inventory list sort; the expressions must
+# match SORT_COLUMNS in app/services/inventory_listing.py. Descending sorts
+# scan the same index backwards.
+KEYSET_INDEXES = {
+    "ix_products_keyset_created_at": "created_at, id",
+    "ix_products_keyset_brand": "(COALESCE(brand, '')), id",
+    "ix_products_keyset_model": "(COALESCE(model, '')), id",
+    "ix_products_keyset_category": "(COALESCE(category, '')), id",
+    "ix_products_keyset_price": "(COALESCE(base_price, 0)), id",
+    "ix_products_keyset_status": "status, id",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inventory_count_cache",
+        sa.Column("filter_key", sa.String(length=64), nullable=False),
+        sa.Column("facet", sa.String(length=32), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("filter_key", "facet", "value"),
+    )
+    op.create_index("ix_inventory_count_cache_refreshed_at", "inventory_count_cache", ["refreshed_at"])
+
+    for name, columns in KEYSET_INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON products ({columns})")
+
+
+def downgrade() -> None:
+    for name in KEYSET_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.drop_index("ix_inventory_count_cache_refreshed_at", table_name="inventory_count_cache")
+    op.drop_table("inventory_count_cache")
@@ -0,0 +1,73 @@
+"""Add platform_jobs table for queued outbound platform writes
+
+Revision ID: add_platform_jobs
+Revises: pending_sync_event_idx
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_platform_jobs"
+down_revision: Union[str, Sequence[str], None] = "pending_sync_event_idx"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "platform_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("platform", sa.String(length=32), nullable=False),
+        sa.Column("action", sa.String(length=64), nullable=False),
+        sa.Column(
+            "product_id",
+            sa.Integer(),
+            sa.ForeignKey("products.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="100"),
+        sa.Column("idempotency_key", sa.String(length=255), nullable=True),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default="{}"),
+        sa.Column("status", sa.String(length=32), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="5"),
+        sa.Column("run_after", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("last_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("timezone('utc', now())"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("timezone('utc', now())"),
+        ),
+    )
+    op.create_index(
+        "ix_platform_jobs_claim",
+        "platform_jobs",
+        ["status", "priority", "run_after"],
+    )
+    op.create_index(
+        "uq_platform_jobs_queued_idempotency_key",
+        "platform_jobs",
+        ["idempotency_key"],
+        unique=True,
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_platform_jobs_queued_idempotency_key", table_name="platform_jobs")
+    op.drop_index("ix_platform_jobs_claim", table_name="platform_jobs")
+    op.drop_table("platform_jobs")
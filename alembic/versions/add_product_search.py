@@ -0,0 +1,48 @@
+"""Full-text and trigram search indexes on products
+
+Revision ID: product_search
+Revises: inventory_keyset
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "product_search"
+down_revision: Union[str, Sequence[str], None] = "inventory_keyset"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Identifiers first, then free text. 'simple' keeps model numbers and SKUs
+# intact (no stemming or stop words). Must match Product.search_vector.
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('simple', coalesce(sku, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(brand, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(model, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(title, '')), 'C') ||
+    setweight(to_tsvector('simple', coalesce(description, '')), 'D')
+"""
+
+# Trigram index for substring (ILIKE) and typo-tolerant (word similarity)
+# matching; must match SEARCH_TEXT_SQL in app/services/product_search.py
+SEARCH_TEXT_SQL = (
+    "lower(coalesce(brand, '') || ' ' || coalesce(model, '') || ' ' || "
+    "coalesce(sku, '') || ' ' || coalesce(title, ''))"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(f"ALTER TABLE products ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED")
+    op.execute("CREATE INDEX ix_products_search_vector ON products USING gin (search_vector)")
+    op.execute(f"CREATE INDEX ix_products_search_trgm ON products USING gin (({SEARCH_TEXT_SQL}) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_products_search_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_products_search_vector")
+    op.execute("ALTER TABLE products DROP COLUMN IF EXISTS search_vector")
+    # pg_trgm is left installed; other objects may depend on it
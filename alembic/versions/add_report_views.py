@@ -0,0 +1,270 @@
+"""Materialized views and summary tables behind the heavy /reports pages
+
+Revision ID: report_views
+Revises: webhook_inbox
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "report_views"
+down_revision: Union[str, Sequence[str], None] = "webhook_inbox"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Live Reverb listings with engagement and the red-flag classification used by
+# the non-performing inventory report. Age-dependent figures (days on market,
+# views per month) are worked out when the report is read.
+REVERB_INVENTORY_SQL = """
+CREATE MATERIALIZED VIEW report_reverb_inventory_mv AS
+SELECT
+    rl.id AS listing_row_id,
+    pc.id AS platform_common_id,
+    rl.reverb_listing_id,
+    p.id AS product_id,
+    p.sku,
+    p.brand,
+    p.model,
+    p.year,
+    p.base_price,
+    p.primary_image,
+    rl.reverb_created_at AS listing_date,
+    COALESCE((rl.extended_attributes->'buyer_price'->>'amount')::decimal, 0) AS reverb_price,
+    COALESCE(rl.view_count, 0) AS views,
+    COALESCE(rl.watch_count, 0) AS watches,
+    COALESCE((rl.extended_attributes->>'offer_count')::int, 0) AS offers,
+    1 AS inventory_quantity,
+    CASE
+        WHEN COALESCE(rl.view_count, 0) = 0
+            AND COALESCE(rl.watch_count, 0) = 0
+            AND COALESCE((rl.extended_attributes->>'offer_count')::int, 0) = 0
+        THEN 'DEAD_STOCK'
+        WHEN COALESCE(rl.view_count, 0) > 50
+            AND COALESCE((rl.extended_attributes->>'offer_count')::int, 0) = 0
+        THEN 'HIGH_INTEREST_NO_OFFERS'
+        WHEN COALESCE((rl.extended_attributes->>'offer_count')::int, 0) > 3
+        THEN 'MULTIPLE_OFFERS_UNSOLD'
+        ELSE 'NORMAL'
+    END AS performance_flag,
+    -- Still live elsewhere (summary counts)
+    CASE WHEN EXISTS (
+        SELECT 1 FROM platform_common o
+        WHERE o.product_id = p.id AND o.platform_name = 'shopify' AND o.status NOT IN ('sold', 'ended')
+    ) THEN 1 ELSE 0 END AS has_shopify,
+    CASE WHEN EXISTS (
+        SELECT 1 FROM platform_common o
+        WHERE o.product_id = p.id AND o.platform_name = 'ebay' AND o.status NOT IN ('sold', 'ended')
+    ) THEN 1 ELSE 0 END AS has_ebay,
+    CASE WHEN EXISTS (
+        SELECT 1 FROM platform_common o
+        WHERE o.product_id = p.id AND o.platform_name = 'vr' AND o.status NOT IN ('sold', 'ended')
+    ) THEN 1 ELSE 0 END AS has_vr,
+    -- Listed at all elsewhere (detail badges)
+    EXISTS (SELECT 1 FROM platform_common o WHERE o.product_id = p.id AND o.platform_name = 'ebay') AS listed_on_ebay,
+    EXISTS (SELECT 1 FROM platform_common o WHERE o.product_id = p.id AND o.platform_name = 'shopify') AS listed_on_shopify,
+    EXISTS (SELECT 1 FROM platform_common o WHERE o.product_id = p.id AND o.platform_name = 'vr') AS listed_on_vr
+FROM reverb_listings rl
+JOIN platform_common pc ON rl.reverb_listing_id = pc.external_id AND pc.platform_name = 'reverb'
+JOIN products p ON pc.product_id = p.id
+WHERE rl.reverb_state = 'live'
+AND rl.reverb_created_at IS NOT NULL
+"""
+
+# One row per platform_common row: the listing's raw platform status and the
+# central status it maps to. Status mismatches are a self-join on product_id.
+LISTING_STATUS_SQL = """
+CREATE MATERIALIZED VIEW report_listing_status_mv AS
+SELECT
+    pc.id AS platform_common_id,
+    pc.product_id,
+    pc.platform_name,
+    p.sku,
+    p.brand,
+    p.model,
+    p.base_price AS price,
+    p.primary_image,
+    listing.raw_status,
+    psm.central_status
+FROM platform_common pc
+JOIN products p ON p.id = pc.product_id
+LEFT JOIN LATERAL (
+    -- A listing id can have more than one row (relists, re-imports); take the
+    -- most recently updated so the view is deterministic across refreshes
+    SELECT x.raw_status FROM (
+        SELECT rl.id, rl.updated_at, rl.reverb_state AS raw_status FROM reverb_listings rl
+        WHERE pc.platform_name = 'reverb' AND rl.reverb_listing_id = pc.external_id
+        UNION ALL
+        SELECT vl.id, vl.updated_at, vl.vr_state FROM vr_listings vl
+        WHERE pc.platform_name = 'vr' AND vl.vr_listing_id = pc.external_id
+        UNION ALL
+        SELECT el.id, el.updated_at, el.listing_status FROM ebay_listings el
+        WHERE pc.platform_name = 'ebay' AND el.ebay_item_id = pc.external_id
+        UNION ALL
+        SELECT sl.id, sl.updated_at, sl.status FROM shopify_listings sl
+        WHERE pc.platform_name = 'shopify' AND sl.platform_id = pc.id
+    ) x
+    ORDER BY x.updated_at DESC NULLS LAST, x.id DESC
+    LIMIT 1
+) listing ON TRUE
+LEFT JOIN platform_status_mappings psm
+    ON psm.platform_name = pc.platform_name AND psm.platform_status = LOWER(listing.raw_status)
+"""
+
+# ACTIVE products missing from at least one platform they should be on
+PLATFORM_COVERAGE_SQL = """
+CREATE MATERIALIZED VIEW report_platform_coverage_mv AS
+WITH platform_coverage AS (
+    SELECT
+        p.id AS product_id,
+        p.sku,
+        p.brand,
+        p.model,
+        p.base_price,
+        p.status,
+        p.category,
+        COALESCE(ARRAY_AGG(pc.platform_name) FILTER (WHERE pc.platform_name IS NOT NULL), ARRAY[]::text[]) AS platforms
+    FROM products p
+    LEFT JOIN platform_common pc ON p.id = pc.product_id
+        AND (pc.status NOT IN ('sold', 'ended') OR pc.status IS NULL)
+    WHERE p.status = 'ACTIVE'
+    GROUP BY p.id, p.sku, p.brand, p.model, p.base_price, p.status, p.category
+),
+vr_eligible AS (
+    SELECT DISTINCT source_category_name
+    FROM platform_category_mappings
+    WHERE source_platform = 'reverb' AND target_platform = 'vintageandrare'
+),
+coverage_data AS (
+    SELECT
+        pc.product_id,
+        pc.sku,
+        pc.brand,
+        pc.model,
+        pc.base_price,
+        pc.status,
+        pc.platforms,
+        COALESCE(ARRAY_LENGTH(pc.platforms, 1), 0) AS platform_count,
+        -- 'vr' is only expected for VR-mapped categories outside Pro Audio / Headphones
+        ARRAY(
+            SELECT unnest(
+                CASE
+                    WHEN ve.source_category_name IS NOT NULL
+                         AND pc.category NOT LIKE 'Pro Audio%'
+                         AND pc.category != 'Accessories / Headphones'
+                    THEN ARRAY['shopify', 'ebay', 'reverb', 'vr']
+                    ELSE ARRAY['shopify', 'ebay', 'reverb']
+                END
+            )
+            EXCEPT
+            SELECT unnest(pc.platforms)
+        ) AS missing_platforms
+    FROM platform_coverage pc
+    LEFT JOIN vr_eligible ve ON pc.category = ve.source_category_name
+)
+SELECT
+    product_id, sku, brand, model, base_price, status, platforms, platform_count,
+    missing_platforms,
+    ARRAY_LENGTH(missing_platforms, 1) AS missing_count
+FROM coverage_data
+WHERE ARRAY_LENGTH(missing_platforms, 1) > 0
+"""
+
+# Active/draft listing prices next to the product's base price (price markup report)
+PLATFORM_PRICES_SQL = """
+CREATE MATERIALIZED VIEW report_platform_prices_mv AS
+SELECT
+    pc.id AS platform_common_id,
+    p.id,
+    p.sku,
+    p.brand,
+    p.model,
+    p.year,
+    p.base_price,
+    p.primary_image,
+    p.status,
+    pc.platform_name,
+    pc.status AS platform_status,
+    listing.platform_price
+FROM products p
+JOIN platform_common pc ON p.id = pc.product_id
+LEFT JOIN LATERAL (
+    SELECT x.platform_price FROM (
+        SELECT rl.id, rl.list_price AS platform_price FROM reverb_listings rl
+        WHERE pc.platform_name = 'reverb' AND rl.platform_id = pc.id
+        UNION ALL
+        SELECT el.id, el.price FROM ebay_listings el
+        WHERE pc.platform_name = 'ebay' AND el.platform_id = pc.id
+        UNION ALL
+        SELECT sl.id, sl.price FROM shopify_listings sl
+        WHERE pc.platform_name = 'shopify' AND sl.platform_id = pc.id
+        UNION ALL
+        SELECT vl.id, vl.price_notax FROM vr_listings vl
+        WHERE pc.platform_name = 'vr' AND vl.platform_id = pc.id
+    ) x
+    ORDER BY x.id DESC
+    LIMIT 1
+) listing ON TRUE
+WHERE LOWER(pc.status) IN ('active', 'draft')
+AND p.base_price > 0
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "report_refresh_state",
+        sa.Column("view_name", sa.String(length=100), primary_key=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.Column("duration_ms", sa.Integer(), nullable=True),
+    )
+
+    # Listing health rules live in Python (app/services/report_views.py), so
+    # this one is a summary table rebuilt on refresh rather than a view
+    op.create_table(
+        "report_listing_health",
+        sa.Column("product_id", sa.Integer(), primary_key=True),
+        sa.Column("sku", sa.String(), nullable=True),
+        sa.Column("title", sa.String(), nullable=True),
+        sa.Column("product_status", sa.String(length=32), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("core", postgresql.JSONB(), nullable=False),
+        sa.Column("media", postgresql.JSONB(), nullable=False),
+        sa.Column("platforms", postgresql.JSONB(), nullable=False),
+        sa.Column("overall_status", sa.String(length=32), nullable=False),
+    )
+    op.create_index(
+        "ix_report_listing_health_status_created",
+        "report_listing_health",
+        ["product_status", sa.text("created_at DESC")],
+    )
+
+    # Each view needs a unique index for REFRESH ... CONCURRENTLY
+    op.execute(REVERB_INVENTORY_SQL)
+    op.execute("CREATE UNIQUE INDEX uq_report_reverb_inventory_mv ON report_reverb_inventory_mv (listing_row_id, platform_common_id)")
+    op.execute("CREATE INDEX ix_report_reverb_inventory_mv_listing_date ON report_reverb_inventory_mv (listing_date)")
+
+    op.execute(LISTING_STATUS_SQL)
+    op.execute("CREATE UNIQUE INDEX uq_report_listing_status_mv ON report_listing_status_mv (platform_common_id)")
+    op.execute("CREATE INDEX ix_report_listing_status_mv_platform_product ON report_listing_status_mv (platform_name, product_id)")
+
+    op.execute(PLATFORM_COVERAGE_SQL)
+    op.execute("CREATE UNIQUE INDEX uq_report_platform_coverage_mv ON report_platform_coverage_mv (product_id)")
+
+    op.execute(PLATFORM_PRICES_SQL)
+    op.execute("CREATE UNIQUE INDEX uq_report_platform_prices_mv ON report_platform_prices_mv (platform_common_id)")
+    op.execute("CREATE INDEX ix_report_platform_prices_mv_status ON report_platform_prices_mv (status)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS report_platform_prices_mv")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS report_platform_coverage_mv")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS report_listing_status_mv")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS report_reverb_inventory_mv")
+    op.drop_index("ix_report_listing_health_status_created", table_name="report_listing_health")
+    op.drop_table("report_listing_health")
+    op.drop_table("report_refresh_state")
@@ -0,0 +1,53 @@
+"""Turn webhook_events into the inbox for platform order webhooks
+
+Revision ID: webhook_inbox
+Revises: add_platform_jobs
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "webhook_inbox"
+down_revision: Union[str, Sequence[str], None] = "add_platform_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("webhook_events", sa.Column("delivery_id", sa.String(length=255), nullable=True))
+    op.add_column(
+        "webhook_events",
+        sa.Column("status", sa.String(length=32), nullable=False, server_default="pending"),
+    )
+    op.add_column("webhook_events", sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("webhook_events", sa.Column("last_error", sa.Text(), nullable=True))
+    op.add_column("webhook_events", sa.Column("claimed_at", sa.DateTime(), nullable=True))
+    # Rows written by the old website hook were handled inline
+    op.execute("UPDATE webhook_events SET status = 'processed' WHERE processed IS TRUE")
+    op.create_index(
+        "uq_webhook_events_platform_delivery",
+        "webhook_events",
+        ["platform", "delivery_id"],
+        unique=True,
+        postgresql_where=sa.text("delivery_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_webhook_events_pending",
+        "webhook_events",
+        ["id"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhook_events_pending", table_name="webhook_events")
+    op.drop_index("uq_webhook_events_platform_delivery", table_name="webhook_events")
+    op.drop_column("webhook_events", "claimed_at")
+    op.drop_column("webhook_events", "last_error")
+    op.drop_column("webhook_events", "attempts")
+    op.drop_column("webhook_events", "status")
+    op.drop_column("webhook_events", "delivery_id")
@@ -0,0 +1,51 @@
+"""Ensure the partial unique index on pending sync events exists
+
+Revision ID: pending_sync_event_idx
+Revises: add_sync_watermarks
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "pending_sync_event_idx"
+down_revision: Union[str, Sequence[str], None] = "add_sync_watermarks"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases built from the older migration chain may lack the index and
+    # hold duplicate pending rows; keep the oldest of each and ignore the rest.
+    op.execute(
+        """
+        UPDATE sync_events se
+        SET status = 'ignored',
+            notes = COALESCE(se.notes || ' | ', '') || 'Duplicate pending event'
+        FROM (
+            SELECT id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY platform_name, external_id, change_type
+                       ORDER BY id
+                   ) AS rn
+            FROM sync_events
+            WHERE status = 'pending'
+        ) dupes
+        WHERE se.id = dupes.id
+          AND dupes.rn > 1
+        """
+    )
+    op.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_unique_pending_sync_event
+        ON sync_events (platform_name, external_id, change_type)
+        WHERE status = 'pending'
+        """
+    )
+
+
+def downgrade() -> None:
+    # The index predates this revision in 001_initial_schema; leave it in place.
+    pass
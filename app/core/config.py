@@ -60,6 +60,13 @@ class Settings(BaseSettings):
     EBAY_SANDBOX_PASSWORD: str = ""
     EBAY_DEV_PASSWORD: str = ""
 
+    # eBay HTTP connection pool (shared by the Trading/Inventory/Account API clients)
+    EBAY_HTTP_MAX_CONNECTIONS: int = 20
+    EBAY_HTTP_MAX_KEEPALIVE: int = 10
+    EBAY_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    # Refresh the cached OAuth access token in the background once it is this close to expiry
+    EBAY_TOKEN_REFRESH_MARGIN_SECONDS: int = 600
+
     # Platform Pricing Markups (percentage over base price)
     SHOPIFY_PRICE_MARKUP_PERCENT: float = 0.0   # Shopify: base price
     EBAY_PRICE_MARKUP_PERCENT: float = 10.0     # eBay: +10% over base
@@ -80,6 +87,16 @@ class Settings(BaseSettings):
     REVERB_SANDBOX_API_KEY: str = ""
     
     REVERB_USE_SANDBOX: bool = False
+
+    # Reverb HTTP connection pool (shared by all ReverbClient instances)
+    REVERB_HTTP_MAX_CONNECTIONS: int = 20
+    REVERB_HTTP_MAX_KEEPALIVE: int = 10
+    REVERB_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    REVERB_HTTP2: bool = False  # requires the optional 'h2' package
+    # Incremental sync: re-read this many minutes before the watermark, and
+    # force a full reconcile when the last one is older than the interval
+    REVERB_SYNC_WATERMARK_OVERLAP_MINUTES: int = 10
+    REVERB_FULL_RECONCILE_HOURS: int = 24
     
     # VintageAndRare
     VINTAGEANDRARE_API_KEY: str = ""
@@ -115,7 +132,80 @@ class Settings(BaseSettings):
     
     # Monitoring
     SENTRY_DSN: str = ""
-    
+
+    # Sync scheduler (scripts/run_sync_scheduler.py): jobs run concurrently
+    # within these limits; jobs for the same platform share the per-platform limit.
+    # Reserved slots (in both limits) are only used by priority jobs (order fetches)
+    SCHEDULER_MAX_CONCURRENT_JOBS: int = 4
+    SCHEDULER_MAX_JOBS_PER_PLATFORM: int = 2
+    SCHEDULER_RESERVED_PRIORITY_SLOTS: int = 1
+
+    # Outbound platform writes (scripts/platform_job_worker.py). When enabled,
+    # edits, end-listings and sale quantity updates are queued in platform_jobs
+    # instead of being sent inline; the worker must be running.
+    PLATFORM_JOB_QUEUE_ENABLED: bool = False
+    PLATFORM_JOB_MAX_ATTEMPTS: int = 5
+    PLATFORM_JOB_RETRY_BASE_SECONDS: float = 30.0
+    PLATFORM_JOB_RETRY_MAX_SECONDS: float = 1800.0
+    PLATFORM_JOB_WORKER_CONCURRENCY: int = 4
+    # Per-platform limits: jobs started per second, and jobs in flight at once
+    PLATFORM_JOB_RATE_LIMITS: Dict[str, float] = {"ebay": 2.0, "reverb": 2.0, "shopify": 2.0, "vr": 0.2}
+    PLATFORM_JOB_PLATFORM_CONCURRENCY: Dict[str, int] = {"ebay": 2, "reverb": 2, "shopify": 2, "vr": 1}
+
+    # Batched reconcile (SyncService.reconcile_sync_run): prefetch the run's rows
+    # and send end-listing calls grouped by platform, this many at once per platform
+    SYNC_RECONCILE_BATCHED: bool = False
+    SYNC_RECONCILE_PLATFORM_CONCURRENCY: Dict[str, int] = {"ebay": 4, "reverb": 4, "shopify": 4, "vr": 1}
+
+    # Platform syncs: diff the fetched snapshot against local data in Postgres via a
+    # staging table (app/services/snapshot_diff.py) instead of in Python
+    SYNC_SNAPSHOT_DIFF_IN_DB: bool = False
+
+    # Dashboard WebSocket fan-out: messages buffered per client. A full queue drops its
+    # oldest message; a client whose queue stays full this long without sending is dropped
+    WEBSOCKET_CLIENT_QUEUE_SIZE: int = 200
+    WEBSOCKET_SLOW_CLIENT_GRACE_SECONDS: float = 5.0
+
+    # Materialized /reports views (app/services/report_views.py): refreshed after
+    # scheduled platform syncs and /api/sync/all, and on this interval by the scheduler
+    REPORT_VIEWS_REFRESH_MINUTES: int = 30
+    REPORT_VIEWS_REFRESH_AFTER_SYNC: bool = True
+
+    # Dashboard snapshot (app/services/dashboard_snapshot.py): how long the landing
+    # page serves cached counters; platform syncs invalidate it as they finish.
+    # The listener picks up invalidations from the separate scheduler process.
+    DASHBOARD_CACHE_TTL_SECONDS: int = 30
+    DASHBOARD_SNAPSHOT_LISTENER_ENABLED: bool = True
+
+    # Inventory list (app/services/inventory_listing.py): how long filtered totals and
+    # dropdown facet counts are reused, and the page size behind per_page=all
+    INVENTORY_COUNTS_CACHE_SECONDS: int = 120
+    INVENTORY_MAX_PAGE_SIZE: int = 1000
+
+    # Response cache for polled JSON endpoints (app/services/response_cache.py).
+    # "memory" is a per-process LRU of up to RESPONSE_CACHE_MAX_ENTRIES responses;
+    # "redis" shares it between workers (needs the redis package and a URL).
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_REDIS_URL: str = ""
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+
+    # Bulk sync event processing (/reports/sync-events/process-bulk): products handled at once
+    EVENT_PROCESSOR_BULK_CONCURRENCY: int = 4
+
+    # Order webhooks (app/routes/webhooks.py). Reverb doesn't sign webhooks, so its
+    # secret is a token in the registered URL; Shopify HMACs with SHOPIFY_WEBHOOK_SECRET;
+    # eBay Platform Notifications are signed with the dev/app/cert ids.
+    REVERB_WEBHOOK_SECRET: str = ""
+    SHOPIFY_WEBHOOK_SECRET: str = ""
+    EBAY_NOTIFICATION_MAX_AGE_SECONDS: int = 600
+    # Inbox consumer started with the web app
+    WEBHOOK_INBOX_CONSUMER_ENABLED: bool = True
+    WEBHOOK_INBOX_POLL_SECONDS: float = 30.0
+    WEBHOOK_INBOX_MAX_ATTEMPTS: int = 5
+    # A delivery still 'processing' this long after being claimed is re-queued
+    WEBHOOK_INBOX_LEASE_SECONDS: int = 900
+
     # Environment
     ENVIRONMENT: str = "development"
     DEBUG: bool = False
@@ -97,15 +97,48 @@ async def lifespan(app: FastAPI):
     log_review_scheduler = DailyLogReviewScheduler(log_handler)
     asyncio.create_task(log_review_scheduler.run())
 
+    # Platform order webhooks are stored in an inbox and drained in the background
+    if settings.WEBHOOK_INBOX_CONSUMER_ENABLED:
+        from app.services.webhook_inbox import webhook_inbox_consumer
+        asyncio.create_task(webhook_inbox_consumer.run())
+
+    # Drop the cached dashboard snapshot when a sync in another process finishes
+    if settings.DASHBOARD_SNAPSHOT_LISTENER_ENABLED:
+        from app.services.dashboard_snapshot import dashboard_snapshot_cache
+        asyncio.create_task(dashboard_snapshot_cache.listen())
+
+    # Drop cached API responses when data changes in another process
+    if settings.RESPONSE_CACHE_ENABLED:
+        from app.services.response_cache import response_cache
+        asyncio.create_task(response_cache.listen())
+
     # Initialise shared executors
     app.state.vr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vr-worker")
     try:
         yield  # This is where the app runs
     finally:
+        if settings.WEBHOOK_INBOX_CONSUMER_ENABLED:
+            from app.services.webhook_inbox import webhook_inbox_consumer
+            webhook_inbox_consumer.stop()
+
+        if settings.DASHBOARD_SNAPSHOT_LISTENER_ENABLED:
+            from app.services.dashboard_snapshot import dashboard_snapshot_cache
+            dashboard_snapshot_cache.stop()
+
+        if settings.RESPONSE_CACHE_ENABLED:
+            from app.services.response_cache import response_cache
+            response_cache.stop()
+
         executor = getattr(app.state, "vr_executor", None)
         if executor:
             executor.shutdown(wait=False)
 
+        from app.services.reverb.client import close_shared_http_client as close_reverb_http_client
+        await close_reverb_http_client()
+
+        from app.services.ebay.http_client import close_shared_http_client as close_ebay_http_client
+        await close_ebay_http_client()
+
 app = FastAPI(
     title="Realtime Inventory Form Flows",
     lifespan=lifespan
@@ -122,6 +155,11 @@ async def proxy_headers_middleware(request: Request, call_next):
     response = await call_next(request)
     return response
 
+# Serve polled JSON endpoints from the response cache (runs before auth; keyed per credentials)
+if get_settings().RESPONSE_CACHE_ENABLED:
+    from app.services.response_cache import response_cache_middleware
+    app.middleware("http")(response_cache_middleware)
+
 # Templates - reuse single instance from app.core.templates
 from app.core.templates import templates
 settings = get_settings() # Ensure settings are loaded early
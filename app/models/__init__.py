@@ -13,9 +13,11 @@ from .shipping import Shipment, ShippingProfile
 from .sync_event import SyncEvent
 from .platform_status_mapping import PlatformStatusMapping
 from .sync_stats import SyncStats
+from .sync_watermark import SyncWatermark
 from .condition_mapping import PlatformConditionMapping
 from .job import Job
 from .vr_job import VRJob, VRJobStatus
+from .platform_job import PlatformJob, PlatformJobStatus, PlatformJobPriority
 from .listing_stats_history import ListingStatsHistory
 from .reverb_historical import ReverbHistoricalListing
 from .category_stats import CategoryVelocityStats, InventoryHealthSnapshot
@@ -46,10 +48,14 @@ __all__ = [
     'ActivityLog',
     'PlatformStatusMapping',
     'SyncStats',
+    'SyncWatermark',
     'Job',
     'PlatformConditionMapping',
     'VRJob',
     'VRJobStatus',
+    'PlatformJob',
+    'PlatformJobStatus',
+    'PlatformJobPriority',
     'ListingStatsHistory',
     'ReverbHistoricalListing',
     'CategoryVelocityStats',
@@ -0,0 +1,66 @@
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.database import Base
+
+
+class PlatformJobStatus(str, Enum):
+    QUEUED = "queued"          # Waiting to run (run_after may be in the future after a retry)
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"          # Gave up after max_attempts or a non-retryable error
+    SUPERSEDED = "superseded"  # Not retried because a newer job with the same key is queued
+
+
+class PlatformJobPriority:
+    """Lower runs first. Sales and end-listing must beat routine edits."""
+
+    SALE = 0
+    END_LISTING = 10
+    PRICE = 50
+    EDIT = 100
+
+
+class PlatformJob(Base):
+    """
+    Durable outbound write to eBay / Reverb / Shopify / V&R.
+
+    Drained by scripts/platform_job_worker.py. `idempotency_key` is unique
+    among queued jobs only, so re-enqueueing identical pending work is a
+    no-op while a job that has already been claimed never swallows a newer one.
+    """
+    __tablename__ = "platform_jobs"
+
+    id = Column(Integer, primary_key=True)
+    platform = Column(String(32), nullable=False)
+    action = Column(String(64), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=True)
+    priority = Column(Integer, nullable=False, default=PlatformJobPriority.EDIT)
+    idempotency_key = Column(String(255), nullable=True)
+    payload = Column(JSONB(astext_type=Text()), nullable=False, default=dict)
+    status = Column(String(32), nullable=False, default=PlatformJobStatus.QUEUED.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+    last_error = Column(Text, nullable=True)
+    last_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_platform_jobs_claim", "status", "priority", "run_after"),
+        Index(
+            "uq_platform_jobs_queued_idempotency_key",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=text("status = 'queued'"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (f"<PlatformJob(id={self.id}, platform={self.platform}, action={self.action}, "
+                f"status={self.status}, attempts={self.attempts})>")
@@ -6,9 +6,9 @@ It provides the database structure for storing product information and tracking
 products are listed across different e-commerce platforms.
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Enum, ForeignKey, text, TIMESTAMP
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import JSONB, ENUM
+from sqlalchemy import Column, Computed, Integer, String, Float, Boolean, DateTime, Enum, ForeignKey, text, TIMESTAMP
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.dialects.postgresql import JSONB, ENUM, TSVECTOR
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 from datetime import datetime, timezone
@@ -190,6 +190,20 @@ class Product(Base):
     package_weight = Column(Float, nullable=True)
     package_dimensions = Column(JSONB, nullable=True)  # Using JSONB for dimensions
 
+    # Search (app/services/product_search.py): generated by Postgres, never written
+    # by the app, and deferred so ordinary product loads don't pull it
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(sku, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(brand, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(model, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'C') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'D')",
+            persisted=True,
+        ),
+    ))
+
 
 
 
@@ -1,5 +1,5 @@
 # app/models/sync_event.py
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.database import Base
@@ -11,6 +11,16 @@ class SyncEvent(Base):
     This table serves as a permanent audit log for all sync activities.
     """
     __tablename__ = "sync_events"
+    __table_args__ = (
+        # At most one pending event per listing and change type; bulk inserts
+        # rely on this for ON CONFLICT DO NOTHING (see sync_event_writer)
+        Index(
+            "ix_unique_pending_sync_event",
+            "platform_name", "external_id", "change_type",
+            unique=True,
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -0,0 +1,27 @@
+# app/models/sync_watermark.py
+from sqlalchemy import Column, DateTime, String
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class SyncWatermark(Base):
+    """
+    Per-platform high-water mark for incremental (delta) syncs.
+
+    `watermark_at` is the time the last successful sync *started*; the next
+    delta run asks the platform only for listings changed since then.
+    `last_full_sync_at` records the last full reconcile so delta mode can
+    fall back to one periodically.
+    """
+    __tablename__ = "sync_watermarks"
+
+    platform_name = Column(String, primary_key=True)
+    watermark_at = Column(DateTime(timezone=True), nullable=True)
+    last_full_sync_at = Column(DateTime(timezone=True), nullable=True)
+    last_sync_run_id = Column(String, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return (f"<SyncWatermark(platform='{self.platform_name}', watermark_at={self.watermark_at}, "
+                f"last_full_sync_at={self.last_full_sync_at})>")
@@ -1,7 +1,8 @@
-# Currently not being used. This was for the old website but now moving to Shopify. May not be required.
+# Inbox for platform webhooks (app/routes/webhooks.py). Rows are written as
+# received and drained by WebhookInboxConsumer (app/services/webhook_inbox.py).
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, text, TIMESTAMP
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, Text, Index, text, TIMESTAMP
 from app.database import Base
 
 UTC_NOW = text("now() AT TIME ZONE 'utc'")
@@ -10,9 +11,16 @@ class WebhookEvent(Base):
     __tablename__ = "webhook_events"
     
     id = Column(Integer, primary_key=True)
-    event_type = Column(String)
-    platform = Column(String)  # In this case will be 'website'
+    event_type = Column(String)  # e.g. 'orders/paid', 'ItemSold'
+    platform = Column(String)  # 'reverb', 'ebay', 'shopify' (or the legacy 'website')
     payload = Column(JSON)
+    # Platform's delivery id, so redelivered webhooks are stored once
+    delivery_id = Column(String(255), nullable=True)
+    status = Column(String(32), nullable=False, default="pending", server_default="pending")  # pending / processed / error
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    last_error = Column(Text, nullable=True)
+    # When a consumer claimed the row (status 'processing'); stale claims are re-queued
+    claimed_at = Column(DateTime, nullable=True)
     processed = Column(Boolean, default=False)
     # created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), server_default=UTC_NOW)
     processed_at = Column(DateTime, nullable=True)
@@ -22,4 +30,15 @@ class WebhookEvent(Base):
         TIMESTAMP(timezone=False),
         server_default=text("timezone('utc', now())"), # Use standard PG function via text()
         nullable=False
-    )
\ No newline at end of file
+    )
+
+    __table_args__ = (
+        Index(
+            "uq_webhook_events_platform_delivery",
+            "platform",
+            "delivery_id",
+            unique=True,
+            postgresql_where=text("delivery_id IS NOT NULL"),
+        ),
+        Index("ix_webhook_events_pending", "id", postgresql_where=text("status = 'pending'")),
+    )
@@ -66,6 +66,18 @@ from app.models.ebay import EbayListing
 from app.models.shopify import ShopifyListing
 from app.services.category_mapping_service import CategoryMappingService
 from app.services.product_service import ProductService
+from app.services.product_search import search_clause, search_products
+from app.services.response_cache import invalidate_cache_tags
+from app.services.inventory_listing import (
+    InvalidCursor,
+    apply_keyset,
+    decode_cursor,
+    encode_cursor,
+    filter_cache_key,
+    get_inventory_counts,
+    resolve_page_size,
+    resolve_sort,
+)
 from app.services.ebay_service import EbayService, MUSICAL_INSTRUMENT_CATEGORY_IDS
 from app.services.reverb_service import ReverbService
 from app.services.shopify_service import ShopifyService
@@ -1352,6 +1364,19 @@ def process_platform_data(form_data: Dict[str, Any]) -> Dict[str, Any]:
     
     return platform_data
 
+@router.get("/api/products/search")
+async def search_products_json(
+    q: str = "",
+    limit: int = Query(10, ge=1, le=50),
+    status: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Ranked product search for the instant-search box (declared before /api/products/{product_id})"""
+    if len(q.strip()) < 2:
+        return {"query": q, "results": []}
+    results = await search_products(db, q, limit=limit, status=status)
+    return {"query": q, "results": results}
+
 @router.get("/api/products/{product_id}")
 async def get_product_json(
     product_id: int,
@@ -1384,21 +1409,13 @@ async def list_products(
     state: Optional[str] = None,
     sort: Optional[str] = None,      # NEW: Sort column
     order: Optional[str] = 'asc',    # NEW: Sort direction
+    after: Optional[str] = None,     # Keyset cursor from the "Next" link
+    before: Optional[str] = None,    # Keyset cursor from the "Previous" link
     db: AsyncSession = Depends(get_db),
     settings: Settings = Depends(get_settings)
 ):
-    # Handle the case when per_page is 'all'
-    if per_page == 'all':
-        pagination_limit = None  # No limit
-        pagination_offset = 0
-    else:
-        try:
-            per_page = int(per_page)
-        except (ValueError, TypeError):
-            per_page = 100  # Default to 100 if conversion fails
-            
-        pagination_limit = per_page
-        pagination_offset = (page - 1) * per_page
+    # per_page=all is capped at INVENTORY_MAX_PAGE_SIZE and paged like any other size
+    per_page, page_size = resolve_page_size(per_page)
     
     # Handle status/state parameter (state is alias for status)
     status_query_param = request.query_params.get("status")
@@ -1473,16 +1490,9 @@ async def list_products(
                 query = query.where(Product.status == enum_status)
     
     # Apply existing filters
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Product.brand.ilike(search_term),
-                Product.model.ilike(search_term),
-                Product.sku.ilike(search_term),
-                Product.description.ilike(search_term)
-            )
-        )
+    if search and search.strip():
+        # Full-text prefix, substring and fuzzy matching on the search indexes
+        query = query.filter(search_clause(search))
     
     if category:
         query = query.filter(Product.category == category)
@@ -1490,99 +1500,63 @@ async def list_products(
     if brand:
         query = query.filter(Product.brand == brand)
     
-    # Get total count before pagination
-    count_query = select(func.count()).select_from(query.subquery())
-    count_result = await db.execute(count_query)
-    total = count_result.scalar_one()
-    
-    # Apply pagination and ordering
-    # Add sorting logic BEFORE the default ordering
-    if sort and sort in ['brand', 'model', 'category', 'price', 'status']:
-        if sort == 'price':
-            sort_column = Product.base_price
-        elif sort == 'brand':
-            sort_column = Product.brand
-        elif sort == 'model':
-            sort_column = Product.model
-        elif sort == 'category':
-            sort_column = Product.category
-        elif sort == 'status':
-            sort_column = Product.status
-        
-        # Apply sort direction
-        if order == 'desc':
-            query = query.order_by(desc(sort_column))
-        else:
-            query = query.order_by(sort_column)
-    else:
-        # Default ordering - newest first
-        query = query.order_by(desc(Product.created_at))
-    
-    if pagination_limit:
-        query = query.offset(pagination_offset).limit(pagination_limit)
-    
+    # Total and dropdown counts come from the count cache (refreshed every
+    # INVENTORY_COUNTS_CACHE_SECONDS) rather than being recounted per request
+    counts = await get_inventory_counts(
+        db,
+        filter_cache_key(
+            platform=platform,
+            status=filter_status,
+            search=search,
+            category=category,
+            brand=brand,
+        ),
+        query,
+    )
+    total = counts["total"]
+    categories_with_counts = counts["categories"]
+    brands_with_counts = counts["brands"]
+    status_counts = counts["status_counts"]
+
+    # Keyset pagination: Next/Previous links carry a cursor for the row at the
+    # edge of the current page; a bare ?page=N falls back to OFFSET
+    sort_key, descending = resolve_sort(sort, order)
+    cursor = None
+    backwards = False
+    if after or before:
+        try:
+            cursor = decode_cursor(before or after, sort_key)
+            backwards = bool(before)
+        except InvalidCursor:
+            logger.warning("Ignoring invalid inventory cursor: %s", before or after)
+
+    query = apply_keyset(query, sort_key, descending, cursor, backwards)
+    if cursor is None:
+        query = query.offset((page - 1) * page_size)
+    # One extra row tells us whether there is another page in that direction
+    query = query.limit(page_size + 1)
+
     # Execute query
     result = await db.execute(query)
-    products = result.scalars().all()
-    
-    # Get unique categories and brands for filters
-    # Configuration for dropdown sort order - Options: 'alphabetical' or 'count'
-    CATEGORY_DROPDOWN_SORT = 'count'  # Sort by most common first
-    BRAND_DROPDOWN_SORT = 'alphabetical'  # Sort alphabetically
-    
-    # Build categories query
-    categories_query = (
-        select(Product.category, func.count(Product.id).label("count"))
-        .filter(Product.category.isnot(None))
-        .group_by(Product.category)
-    )
-    if CATEGORY_DROPDOWN_SORT == 'count':
-        categories_query = categories_query.order_by(desc(func.count(Product.id)))
-    else:  # 'alphabetical'
-        categories_query = categories_query.order_by(Product.category)
-    
-    categories_result = await db.execute(categories_query)
-    categories_with_counts = [(c[0], c[1]) for c in categories_result.all() if c[0]]
-    
-    # Build brands query
-    brands_query = (
-        select(Product.brand, func.count(Product.id).label("count"))
-        .filter(Product.brand.isnot(None))
-        .group_by(Product.brand)
-    )
-    if BRAND_DROPDOWN_SORT == 'count':
-        brands_query = brands_query.order_by(desc(func.count(Product.id)))
-    else:  # 'alphabetical'
-        brands_query = brands_query.order_by(Product.brand)
-    brands_result = await db.execute(brands_query)
-    brands_with_counts = [(b[0], b[1]) for b in brands_result.all() if b[0]]
-
-    # Build status counts query
-    status_counts_query = (
-        select(Product.status, func.count(Product.id).label("count"))
-        .filter(Product.status.isnot(None))
-        .group_by(Product.status)
-    )
-    status_counts_result = await db.execute(status_counts_query)
-    status_counts = {s[0].lower(): s[1] for s in status_counts_result.all() if s[0]}
-    
-    # Calculate pagination info
-    if per_page != 'all' and per_page > 0:
-        total_pages = (total + per_page - 1) // per_page
-        start_page = max(1, page - 2)
-        end_page = min(total_pages, page + 2)
-        
-        # Calculate start and end items for display
-        start_item = (page - 1) * per_page + 1 if total > 0 else 0
-        end_item = min(page * per_page, total)
+    products = list(result.scalars().all())
+    more = len(products) > page_size
+    products = products[:page_size]
+    if backwards:
+        products.reverse()
+        has_prev, has_next = more, True
+        if not more:
+            page = 1
     else:
-        total_pages = 1
-        page = 1
-        start_page = 1
-        end_page = 1
-        # For "all" pages
-        start_item = 1 if total > 0 else 0
-        end_item = total
+        has_prev, has_next = page > 1, more
+
+    # Calculate pagination info (total may lag slightly behind the rows shown)
+    total_pages = (total + page_size - 1) // page_size
+    start_page = max(1, page - 2)
+    end_page = min(total_pages, page + 2)
+
+    # Calculate start and end items for display
+    start_item = (page - 1) * page_size + 1 if products else 0
+    end_item = start_item + len(products) - 1 if products else 0
     
     message = request.query_params.get("message")
     message_type = request.query_params.get("message_type", "info")
@@ -1615,8 +1589,10 @@ async def list_products(
             "status_counts": status_counts,
             "status_query_value": status_query_value,
             "search": search,
-            "has_prev": page > 1,
-            "has_next": page < total_pages,
+            "has_prev": has_prev,
+            "has_next": has_next,
+            "prev_cursor": encode_cursor(products[0], sort_key) if has_prev and products else None,
+            "next_cursor": encode_cursor(products[-1], sort_key) if has_next and products else None,
             "current_sort": sort,          # NEW: Pass current sort
             "current_order": order,        # NEW: Pass current order
             "message": message,
@@ -4511,6 +4487,11 @@ async def add_product(
                 except Exception as e2:
                     logger.error(f"Failed to update product status even via raw SQL: {e2}")
 
+        # The product and its listings are committed; drop cached product responses
+        # once, and commit again so the NOTIFY reaches the other processes
+        await invalidate_cache_tags(f"product:{product.id}", "products", db=db)
+        await db.commit()
+
         # Step 5: Queue for platform sync (if stock manager is available)
         try:
             print("About to queue product")
@@ -4591,6 +4572,7 @@ async def add_product(
         print(error_message)
         
         # Don't rollback the transaction since the product was created
+        await invalidate_cache_tags("products")
         response_data = {
             "status": "warning",
             "warning": error_message,
@@ -5946,6 +5928,7 @@ async def update_product(
             # If invalid condition value, keep existing
             pass
     
+    await invalidate_cache_tags(f"product:{product_id}", "products", db=db)
     await db.commit()
 
     changed_fields = {
@@ -6004,7 +5987,8 @@ async def update_product(
 async def update_product_stock(
     product_id: int,
     quantity: int,
-    request: Request
+    request: Request,
+    db: AsyncSession = Depends(get_db),
 ):
     try:
         event = StockUpdateEvent(
@@ -6014,6 +5998,8 @@ async def update_product_stock(
             timestamp=datetime.now()
         )
         await request.app.state.stock_manager.process_stock_update(event)
+        await invalidate_cache_tags(f"product:{product_id}", "products", db=db)
+        await db.commit()
         return {"status": "success", "new_quantity": quantity}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
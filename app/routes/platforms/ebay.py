@@ -17,6 +17,8 @@ from app.services.activity_logger import ActivityLogger
 from app.services.product_service import ProductService
 from app.services.ebay_service import EbayService
 from app.services.websockets.manager import manager
+from app.services.dashboard_snapshot import invalidate_dashboard_snapshot
+from app.services.response_cache import invalidate_cache_tags
 
 
 sync_in_progress = False
@@ -182,7 +184,9 @@ async def run_ebay_sync_background(db: AsyncSession, settings: Settings, sync_ru
             })
             logger.error(f"eBay sync completed with errors: {result.get('errors', 0)}")
         
-        # Commit the activity logging
+        # Commit the activity logging (and the cache NOTIFYs with it)
+        await invalidate_dashboard_snapshot(db)
+        await invalidate_cache_tags("products", "orders", "sync_events", db=db)
         await db.commit()
             
     except Exception as e:
@@ -31,6 +31,8 @@ from app.schemas.platform.reverb import (
 from sqlalchemy import select
 from app.services.reverb_service import ReverbService
 from app.services.websockets.manager import manager
+from app.services.dashboard_snapshot import invalidate_dashboard_snapshot
+from app.services.response_cache import invalidate_cache_tags
 from app.services.activity_logger import ActivityLogger
 from app.services.reconciliation_service import process_reconciliation
 from app.models.sync_event import SyncEvent
@@ -61,7 +63,13 @@ async def sync_reverb(
     return {"status": "success", "message": "Reverb sync started", "sync_run_id": sync_run_id}  # ADD sync_run_id to response
 
 # Add this background task function
-async def run_reverb_sync_background(api_key: str, db: AsyncSession, settings: Settings, sync_run_id: uuid.UUID):  # ADD sync_run_id parameter
+async def run_reverb_sync_background(
+    api_key: str,
+    db: AsyncSession,
+    settings: Settings,
+    sync_run_id: uuid.UUID,
+    incremental: bool = False,
+):
     """Run Reverb sync in background with WebSocket updates"""
     logger.info("Starting Reverb import process through background task")
     
@@ -88,7 +96,7 @@ async def run_reverb_sync_background(api_key: str, db: AsyncSession, settings: S
         # Initialize Reverb service
         reverb_service = ReverbService(db, settings)
         # You'll need to implement a sync method in ReverbService similar to V&R
-        result = await reverb_service.run_import_process(sync_run_id)
+        result = await reverb_service.run_import_process(sync_run_id, incremental=incremental)
         
         if result.get('status') == 'success':
             # Update last_sync timestamp for Reverb platform entries
@@ -148,7 +156,9 @@ async def run_reverb_sync_background(api_key: str, db: AsyncSession, settings: S
             })
             logger.error(f"Reverb sync error in result: {result.get('message', 'Unknown error')}")
         
-        # Commit the activity logging
+        # Commit the activity logging (and the cache NOTIFYs with it)
+        await invalidate_dashboard_snapshot(db)
+        await invalidate_cache_tags("products", "orders", "sync_events", db=db)
         await db.commit()
 
         # Auto-process any pending ended/sold status_change events
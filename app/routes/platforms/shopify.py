@@ -23,6 +23,8 @@ from datetime import datetime
 
 from app.services.shopify_service import ShopifyService
 from app.services.websockets.manager import manager
+from app.services.dashboard_snapshot import invalidate_dashboard_snapshot
+from app.services.response_cache import invalidate_cache_tags
 from app.services.activity_logger import ActivityLogger
 from app.dependencies import get_db
 from app.core.config import Settings, get_settings
@@ -153,7 +155,9 @@ async def run_shopify_sync_background(
             
             logger.error(f"Shopify sync error: {result.get('message', 'Unknown error')}")
         
-        # Commit the activity logging
+        # Commit the activity logging (and the cache NOTIFYs with it)
+        await invalidate_dashboard_snapshot(db)
+        await invalidate_cache_tags("products", "orders", "sync_events", db=db)
         await db.commit()
             
     except Exception as e:
@@ -27,6 +27,7 @@ from app.routes.platforms.ebay import run_ebay_sync_background
 from app.routes.platforms.reverb import run_reverb_sync_background
 from app.routes.platforms.shopify import run_shopify_sync_background
 from app.routes.platforms.vr import run_vr_sync_background
+from app.services.report_views import refresh_report_views_in_background
 from app.services.websockets.manager import manager
 
 logger = logging.getLogger(__name__)
@@ -271,6 +272,9 @@ async def _run_sync_all_background(
             }
         )
 
+        if all_successful and settings.REPORT_VIEWS_REFRESH_AFTER_SYNC:
+            asyncio.create_task(refresh_report_views_in_background())
+
         logger.info("Sync run %s finished with status %s", run_id, overall_status)
         return payload
 
@@ -12,6 +12,8 @@ from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException, UploadFi
 from app.services.vr_service import VRService
 from app.services.activity_logger import ActivityLogger
 from app.services.websockets.manager import manager
+from app.services.dashboard_snapshot import invalidate_dashboard_snapshot
+from app.services.response_cache import invalidate_cache_tags
 from app.services.vintageandrare.brand_validator import VRBrandValidator
 from app.core.config import Settings, get_settings
 from app.dependencies import get_db
@@ -163,7 +165,9 @@ async def run_vr_sync_background(username: str, password: str, db: AsyncSession,
             })
             logger.error(f"V&R sync error in result: {result.get('message', 'Unknown error')}")
 
-        # Commit the activity logging
+        # Commit the activity logging (and the cache NOTIFYs with it)
+        await invalidate_dashboard_snapshot(db)
+        await invalidate_cache_tags("products", "orders", "sync_events", db=db)
         await db.commit()
             
     except Exception as e:
@@ -7,11 +7,24 @@ import json
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from collections import Counter
+from types import SimpleNamespace
 from app.database import get_session
 from app.core.templates import templates
 from app.core.config import Settings, get_settings
 from app.services.reconciliation_service import process_reconciliation
 from app.services.ebay_service import EbayService
+from app.services.product_search import search_condition_sql, search_params
+from app.services.response_cache import invalidate_cache_tags
+from app.services.report_views import (
+    LISTING_HEALTH_PLATFORMS,
+    LISTING_HEALTH_TABLE,
+    LISTING_STATUS_VIEW,
+    PLATFORM_COVERAGE_VIEW,
+    PLATFORM_PRICES_VIEW,
+    REVERB_INVENTORY_VIEW,
+    get_report_as_of,
+    refresh_report_views_in_background,
+)
 from app.models import SyncEvent
 from app.models.product import Product, ProductStatus
 from app.models.platform_common import PlatformCommon, ListingStatus, SyncStatus
@@ -37,6 +50,13 @@ async def reports_index(request: Request):
     })
 
 
+@router.post("/refresh-views", response_class=JSONResponse)
+async def refresh_report_views_now():
+    """Refresh the materialized report views now instead of waiting for the next sync/schedule."""
+    asyncio.create_task(refresh_report_views_in_background())
+    return JSONResponse({"status": "queued", "message": "Report refresh started"})
+
+
 @router.get("/crazylister-coverage", response_class=HTMLResponse)
 async def crazylister_coverage_report(
     request: Request,
@@ -200,81 +220,37 @@ async def status_mismatches_report(
     """Status mismatches report with filtering"""
     
     async with get_session() as db:
-        # Real status mismatch query with proper JOIN logic
-        mismatch_query = text("""
-        SELECT 
-            p.id,
-            p.sku,
-            p.brand,
-            p.model,
-            p.base_price as price,
-            p.primary_image,
-            
-            -- Raw statuses
-            CASE 
-                WHEN :platform_a = 'reverb' THEN rl_a.reverb_state
-                WHEN :platform_a = 'vr' THEN vl_a.vr_state
-                WHEN :platform_a = 'ebay' THEN el_a.listing_status
-                WHEN :platform_a = 'shopify' THEN sl_a.status
-            END as raw_status_a,
-            CASE 
-                WHEN :platform_b = 'reverb' THEN rl_b.reverb_state
-                WHEN :platform_b = 'vr' THEN vl_b.vr_state
-                WHEN :platform_b = 'ebay' THEN el_b.listing_status
-                WHEN :platform_b = 'shopify' THEN sl_b.status
-            END as raw_status_b,
-            
-            -- Mapped statuses
-            psm_a.central_status as central_status_a,
-            psm_b.central_status as central_status_b
-            
-        FROM products p
-        -- Join to Platform A
-        INNER JOIN platform_common pc_a ON p.id = pc_a.product_id AND pc_a.platform_name = :platform_a
-        -- Join to Platform B
-        INNER JOIN platform_common pc_b ON p.id = pc_b.product_id AND pc_b.platform_name = :platform_b
-        
-        -- Platform listings (CORRECTED JOIN LOGIC)
-        LEFT JOIN reverb_listings rl_a ON (:platform_a = 'reverb' AND pc_a.external_id = rl_a.reverb_listing_id)
-        LEFT JOIN reverb_listings rl_b ON (:platform_b = 'reverb' AND pc_b.external_id = rl_b.reverb_listing_id)
-        LEFT JOIN vr_listings vl_a ON (:platform_a = 'vr' AND pc_a.external_id = vl_a.vr_listing_id)
-        LEFT JOIN vr_listings vl_b ON (:platform_b = 'vr' AND pc_b.external_id = vl_b.vr_listing_id)
-        LEFT JOIN ebay_listings el_a ON (:platform_a = 'ebay' AND pc_a.external_id = el_a.ebay_item_id)
-        LEFT JOIN ebay_listings el_b ON (:platform_b = 'ebay' AND pc_b.external_id = el_b.ebay_item_id)
-        LEFT JOIN shopify_listings sl_a ON (:platform_a = 'shopify' AND pc_a.id = sl_a.platform_id)
-        LEFT JOIN shopify_listings sl_b ON (:platform_b = 'shopify' AND pc_b.id = sl_b.platform_id)
-        
-        -- Status mappings (case-insensitive)
-        LEFT JOIN platform_status_mappings psm_a ON psm_a.platform_name = :platform_a AND (
-            (:platform_a = 'reverb' AND psm_a.platform_status = LOWER(rl_a.reverb_state)) OR
-            (:platform_a = 'vr' AND psm_a.platform_status = LOWER(vl_a.vr_state)) OR
-            (:platform_a = 'ebay' AND psm_a.platform_status = LOWER(el_a.listing_status)) OR
-            (:platform_a = 'shopify' AND psm_a.platform_status = LOWER(sl_a.status))
-        )
-        LEFT JOIN platform_status_mappings psm_b ON psm_b.platform_name = :platform_b AND (
-            (:platform_b = 'reverb' AND psm_b.platform_status = LOWER(rl_b.reverb_state)) OR
-            (:platform_b = 'vr' AND psm_b.platform_status = LOWER(vl_b.vr_state)) OR
-            (:platform_b = 'ebay' AND psm_b.platform_status = LOWER(el_b.listing_status)) OR
-            (:platform_b = 'shopify' AND psm_b.platform_status = LOWER(sl_b.status))
-        )
-        
-        -- ONLY show real mapped status mismatches
-        WHERE psm_a.central_status != psm_b.central_status
-        AND psm_a.central_status IS NOT NULL 
-        AND psm_b.central_status IS NOT NULL
-        
-        ORDER BY p.base_price DESC
+        # Mapped statuses come from the report_listing_status_mv snapshot
+        mismatch_query = text(f"""
+        SELECT
+            a.product_id AS id,
+            a.sku,
+            a.brand,
+            a.model,
+            a.price,
+            a.primary_image,
+            a.raw_status AS raw_status_a,
+            b.raw_status AS raw_status_b,
+            a.central_status AS central_status_a,
+            b.central_status AS central_status_b
+        FROM {LISTING_STATUS_VIEW} a
+        JOIN {LISTING_STATUS_VIEW} b ON b.product_id = a.product_id AND b.platform_name = :platform_b
+        WHERE a.platform_name = :platform_a
+        AND a.central_status != b.central_status
+        ORDER BY a.price DESC
         LIMIT 500;
         """)
-        
+
         result = await db.execute(mismatch_query, {
             "platform_a": platform_a, 
             "platform_b": platform_b
         })
         mismatches = [dict(row._mapping) for row in result.fetchall()]
-        
+        as_of = await get_report_as_of(db, LISTING_STATUS_VIEW)
+
         return templates.TemplateResponse("reports/status_mismatches.html", {
             "request": request,
+            "as_of": as_of,
             "summary_stats": [],  # Remove summary for now
             "detailed_mismatches": mismatches,
             "platform_a": platform_a,
@@ -291,189 +267,57 @@ async def listing_health_report(
     issues_only: bool = Query(False, description="Show only rows with warnings or errors"),
     limit: Optional[str] = Query("100", description="Maximum rows to display (or ALL)")
 ):
-    """Traffic-light view of product listing health across platforms."""
-
-    platform_defs = [
-        ("shopify", "Shopify", "shopify_listing"),
-        ("reverb", "Reverb", "reverb_listing"),
-        ("ebay", "eBay", "ebay_listing"),
-        ("vr", "Vintage & Rare", "vr_listing"),
-    ]
-
-    def _determine_status(errors: List[str], warnings: List[str]) -> str:
-        if errors:
-            return "error"
-        if warnings:
-            return "warning"
-        return "ok"
-
-    def _evaluate_core(product: Product) -> Dict[str, Any]:
-        errors: List[str] = []
-        warnings: List[str] = []
-
-        title_candidate = product.title or product.generate_title()
-        if not title_candidate:
-            errors.append("Missing product title")
-
-        if not product.category:
-            errors.append("Missing category")
-
-        if product.is_stocked_item:
-            if product.quantity is None:
-                warnings.append("Quantity not set for stocked item")
-            elif product.quantity <= 0:
-                errors.append("Stocked item has zero quantity")
-
-        if not product.description:
-            warnings.append("No description")
-
-        if product.status == ProductStatus.ACTIVE and not product.shipping_profile_id:
-            warnings.append("No shipping profile")
-
-        status_value = _determine_status(errors, warnings)
-        issues = errors + warnings
-        return {
-            "status": status_value,
-            "issues": issues,
-        }
-
-    def _evaluate_media(product: Product) -> Dict[str, Any]:
-        errors: List[str] = []
-        warnings: List[str] = []
-
-        primary_missing = not bool(product.primary_image)
-        gallery_missing = not bool(product.additional_images)
-
-        if primary_missing and gallery_missing:
-            errors.append("Missing ALL images")
-        else:
-            if primary_missing:
-                errors.append("Missing primary image")
-            if gallery_missing:
-                warnings.append("No Additional Images")
-
-        status_value = _determine_status(errors, warnings)
-        issues = errors + warnings
-        return {
-            "status": status_value,
-            "issues": issues,
-        }
-
-    def _evaluate_platform(product: Product, platform_name: str, label: str, attr: str) -> Dict[str, Any]:
-        commons = [pc for pc in product.platform_listings if (pc.platform_name or "").lower() == platform_name]
-        if not commons:
-            return {
-                "label": label,
-                "status": "not_listed",
-                "issues": [],
-            }
-
-        common = commons[0]
-        errors: List[str] = []
-        warnings: List[str] = []
-
-        if not common.external_id:
-            errors.append("Missing external ID")
-        if not common.listing_url:
-            warnings.append("Missing listing URL")
-
-        sync_state = (common.sync_status or "").lower()
-        if sync_state not in {"synced", "ok", "success"}:
-            warnings.append(f"Sync status is '{common.sync_status or 'unknown'}'")
-
-        listing = getattr(common, attr, None)
-        if listing is None:
-            errors.append("No platform listing record")
-        else:
-            if platform_name == "shopify" and not getattr(listing, "category_gid", None):
-                warnings.append("Category missing")
-            if platform_name == "ebay" and not getattr(listing, "listing_status", None):
-                warnings.append("eBay listing status unknown")
-            if platform_name == "reverb" and not getattr(listing, "reverb_state", None):
-                warnings.append("Reverb state missing")
-
-        status_value = _determine_status(errors, warnings)
-        issues = errors + warnings
-        return {
-            "label": label,
-            "status": status_value,
-            "issues": issues,
-            "platform_common": common,
-        }
+    """Traffic-light view of product listing health across platforms (from report_listing_health)."""
 
+    platform_defs = list(LISTING_HEALTH_PLATFORMS)
     status_filter = (status or "ALL").upper()
 
     async with get_session() as db:
-        query = (
-            select(Product)
-            .options(
-                selectinload(Product.platform_listings)
-                .selectinload(PlatformCommon.shopify_listing),
-                selectinload(Product.platform_listings)
-                .selectinload(PlatformCommon.reverb_listing),
-                selectinload(Product.platform_listings)
-                .selectinload(PlatformCommon.ebay_listing),
-                selectinload(Product.platform_listings)
-                .selectinload(PlatformCommon.vr_listing),
-            )
-            .order_by(Product.created_at.desc())
-        )
+        params: Dict[str, Any] = {}
+        where_sql = ""
+        if status_filter != "ALL":
+            if status_filter in ProductStatus.__members__:
+                where_sql = "WHERE product_status = :status"
+                params["status"] = ProductStatus[status_filter].value
+            else:
+                logger.warning("Unknown status filter '%s' supplied to listing health report", status_filter)
 
         limit_param = (limit or "100").upper()
-        limit_value: Optional[int]
-        if limit_param == "ALL":
-            limit_value = None
-        else:
+        limit_sql = ""
+        if limit_param != "ALL":
             try:
                 limit_value = max(1, min(500, int(limit_param)))
-                limit_param = str(limit_value)
             except ValueError:
                 limit_value = 100
-                limit_param = "100"
-
-        if limit_value is not None:
-            query = query.limit(limit_value)
-
-        if status_filter != "ALL":
-            try:
-                status_enum = ProductStatus[status_filter]
-                query = query.where(Product.status == status_enum)
-            except KeyError:
-                logger.warning("Unknown status filter '%s' supplied to listing health report", status_filter)
+            limit_param = str(limit_value)
+            limit_sql = "LIMIT :limit"
+            params["limit"] = limit_value
 
-        products = (await db.execute(query)).scalars().all()
-
-        status_priority = {"error": 0, "warning": 1, "ok": 2, "not_listed": 3}
-
-        health_rows: List[Dict[str, Any]] = []
-        for product in products:
-            core = _evaluate_core(product)
-            media = _evaluate_media(product)
-
-            platforms = {
-                name: _evaluate_platform(product, name, label, attr)
-                for name, label, attr in platform_defs
+        query = text(f"""
+            SELECT product_id, sku, title, product_status, core, media, platforms, overall_status
+            FROM {LISTING_HEALTH_TABLE}
+            {where_sql}
+            ORDER BY created_at DESC
+            {limit_sql}
+        """)
+        result = await db.execute(query, params)
+        as_of = await get_report_as_of(db, LISTING_HEALTH_TABLE)
+
+        health_rows: List[Dict[str, Any]] = [
+            {
+                "product": SimpleNamespace(
+                    id=row.product_id,
+                    sku=row.sku,
+                    title=row.title,
+                    status=ProductStatus(row.product_status) if row.product_status else None,
+                ),
+                "core": row.core,
+                "media": row.media,
+                "platforms": row.platforms,
+                "overall_status": row.overall_status,
             }
-
-            statuses_to_consider = [core["status"], media["status"]]
-            statuses_to_consider.extend(
-                info["status"]
-                for info in platforms.values()
-                if info["status"] != "not_listed"
-            )
-
-            if statuses_to_consider:
-                overall_status = min(statuses_to_consider, key=lambda s: status_priority.get(s, 4))
-            else:
-                overall_status = "not_listed"
-
-            health_rows.append({
-                "product": product,
-                "core": core,
-                "media": media,
-                "platforms": platforms,
-                "overall_status": overall_status,
-            })
+            for row in result.fetchall()
+        ]
 
         if issues_only:
             health_rows = [row for row in health_rows if row["overall_status"] in {"warning", "error", "not_listed"}]
@@ -507,6 +351,7 @@ async def listing_health_report(
 
         return templates.TemplateResponse("reports/listing_health_report.html", {
             "request": request,
+            "as_of": as_of,
             "rows": health_rows,
             "status_filter": status_filter,
             "status_options": status_options,
@@ -656,72 +501,17 @@ async def non_performing_inventory_report(
     
     async with get_session() as db:
         try:
-            # Summary metrics query with proper business filters
-            summary_query = text("""
+            # Rows come from the report_reverb_inventory_mv snapshot; age-based
+            # figures are worked out here so they don't go stale between refreshes
+            summary_query = text(f"""
             WITH inventory_base AS (
-                SELECT 
-                    rl.reverb_listing_id,
-                    p.sku,
-                    p.brand,
-                    p.model,
-                    p.year,
-                    p.base_price,
-                    
-                    -- Extract data - use table columns directly
-                    rl.reverb_created_at as listing_date,
-                    COALESCE((rl.extended_attributes->'buyer_price'->>'amount')::decimal, 0) as reverb_price,
-                    COALESCE(rl.view_count, 0) as views,
-                    COALESCE(rl.watch_count, 0) as watches,
-                    COALESCE((rl.extended_attributes->>'offer_count')::int, 0) as offers,
-                    
-                    -- Calculate engagement metrics (NO DECIMALS)
+                SELECT
+                    mv.*,
                     ROUND(
-                        COALESCE(rl.view_count::decimal, 0) / 
-                        GREATEST(COALESCE(EXTRACT(days FROM (CURRENT_DATE - rl.reverb_created_at)), 30) / 30, 1), 0
-                    ) as views_per_month,
-                    
-                    -- Red flags
-                    CASE 
-                        WHEN COALESCE(rl.view_count, 0) = 0 
-                            AND COALESCE(rl.watch_count, 0) = 0 
-                            AND COALESCE((rl.extended_attributes->>'offer_count')::int, 0) = 0 
-                        THEN 'DEAD_STOCK'
-                        WHEN COALESCE(rl.view_count, 0) > 50 
-                            AND COALESCE((rl.extended_attributes->>'offer_count')::int, 0) = 0 
-                        THEN 'HIGH_INTEREST_NO_OFFERS'
-                        WHEN COALESCE((rl.extended_attributes->>'offer_count')::int, 0) > 3 
-                        THEN 'MULTIPLE_OFFERS_UNSOLD'
-                        ELSE 'NORMAL'
-                    END as performance_flag,
-                    
-                    -- Platform coverage indicators
-                    CASE WHEN EXISTS (
-                        SELECT 1 FROM platform_common pc_shopify 
-                        WHERE pc_shopify.product_id = p.id 
-                        AND pc_shopify.platform_name = 'shopify'
-                        AND pc_shopify.status NOT IN ('sold', 'ended')
-                    ) THEN 1 ELSE 0 END as has_shopify,
-                    
-                    CASE WHEN EXISTS (
-                        SELECT 1 FROM platform_common pc_ebay 
-                        WHERE pc_ebay.product_id = p.id 
-                        AND pc_ebay.platform_name = 'ebay'
-                        AND pc_ebay.status NOT IN ('sold', 'ended')
-                    ) THEN 1 ELSE 0 END as has_ebay,
-                    
-                    CASE WHEN EXISTS (
-                        SELECT 1 FROM platform_common pc_vr 
-                        WHERE pc_vr.product_id = p.id 
-                        AND pc_vr.platform_name = 'vr'
-                        AND pc_vr.status NOT IN ('sold', 'ended')
-                    ) THEN 1 ELSE 0 END as has_vr
-
-                FROM reverb_listings rl
-                JOIN platform_common pc ON rl.reverb_listing_id = pc.external_id
-                JOIN products p ON pc.product_id = p.id
-                WHERE rl.reverb_state = 'live'
-                AND rl.reverb_created_at IS NOT NULL
-                AND pc.platform_name = 'reverb'
+                        mv.views::decimal /
+                        GREATEST(COALESCE(EXTRACT(days FROM (CURRENT_DATE - mv.listing_date)), 30) / 30, 1), 0
+                    ) as views_per_month
+                FROM {REVERB_INVENTORY_VIEW} mv
             )
 
             -- Summary with platform coverage counts
@@ -854,72 +644,22 @@ async def non_performing_inventory_report(
             
             detailed_query = text(f"""
             WITH inventory_base AS (
-                SELECT 
-                    rl.reverb_listing_id,
-                    p.sku,
-                    p.brand,
-                    p.model,
-                    p.year,
-                    p.base_price,
-                    p.primary_image,
-                    p.id as product_id,
-                    
-                    -- Extract data - use table columns directly
-                    rl.reverb_created_at as listing_date,
-                    COALESCE((rl.extended_attributes->'buyer_price'->>'amount')::decimal, 0) as reverb_price,
-                    COALESCE(rl.view_count, 0) as views,
-                    COALESCE(rl.watch_count, 0) as watches,
-                    COALESCE((rl.extended_attributes->>'offer_count')::int, 0) as offers,
-                    1 as inventory_quantity,
-                    
-                    -- Calculate days on market using reverb_created_at
+                SELECT
+                    mv.*,
                     COALESCE(
-                        EXTRACT(days FROM (CURRENT_DATE - rl.reverb_created_at)), 
+                        EXTRACT(days FROM (CURRENT_DATE - mv.listing_date)),
                         0
                     ) as days_on_market,
-                    
-                    -- Calculate engagement metrics
                     ROUND(
-                        COALESCE(rl.view_count::decimal, 0) / 
+                        mv.views::decimal /
                         GREATEST(
-                            COALESCE(EXTRACT(days FROM (CURRENT_DATE - rl.reverb_created_at)), 30) / 30, 
+                            COALESCE(EXTRACT(days FROM (CURRENT_DATE - mv.listing_date)), 30) / 30,
                             1
-                        ), 
+                        ),
                         0
-                    ) as views_per_month,
-                    
-                    -- Red flags
-                    CASE 
-                        WHEN COALESCE(rl.view_count, 0) = 0 
-                            AND COALESCE(rl.watch_count, 0) = 0 
-                            AND COALESCE((rl.extended_attributes->>'offer_count')::int, 0) = 0 
-                        THEN 'DEAD_STOCK'
-                        WHEN COALESCE(rl.view_count, 0) > 50 
-                            AND COALESCE((rl.extended_attributes->>'offer_count')::int, 0) = 0 
-                        THEN 'HIGH_INTEREST_NO_OFFERS'
-                        WHEN COALESCE((rl.extended_attributes->>'offer_count')::int, 0) > 3 
-                        THEN 'MULTIPLE_OFFERS_UNSOLD'
-                        ELSE 'NORMAL'
-                    END as performance_flag,
-                    
-                    -- Platform coverage indicators
-                    CASE WHEN pc_ebay.id IS NOT NULL THEN TRUE ELSE FALSE END as listed_on_ebay,
-                    CASE WHEN pc_shopify.id IS NOT NULL THEN TRUE ELSE FALSE END as listed_on_shopify,
-                    CASE WHEN pc_vr.id IS NOT NULL THEN TRUE ELSE FALSE END as listed_on_vr
-
-                FROM reverb_listings rl
-                JOIN platform_common pc ON rl.reverb_listing_id = pc.external_id
-                JOIN products p ON pc.product_id = p.id
-                
-                -- LEFT JOIN to check other platform listings for the same product
-                LEFT JOIN platform_common pc_ebay ON p.id = pc_ebay.product_id AND pc_ebay.platform_name = 'ebay'
-                LEFT JOIN platform_common pc_shopify ON p.id = pc_shopify.product_id AND pc_shopify.platform_name = 'shopify'
-                LEFT JOIN platform_common pc_vr ON p.id = pc_vr.product_id AND pc_vr.platform_name = 'vr'
-                
-                WHERE rl.reverb_state = 'live'
-                AND rl.reverb_created_at IS NOT NULL
-                AND pc.platform_name = 'reverb'
-                AND rl.reverb_created_at < (CURRENT_DATE - INTERVAL '{interval}')
+                    ) as views_per_month
+                FROM {REVERB_INVENTORY_VIEW} mv
+                WHERE mv.listing_date < (CURRENT_DATE - INTERVAL '{interval}')
             )
             SELECT * FROM inventory_base
             ORDER BY {sort_column} {order_direction}
@@ -933,9 +673,11 @@ async def non_performing_inventory_report(
             total_value = sum(float(item.get('reverb_price', 0) or 0) for item in detailed_items)
             
             logger.info(f"NPI Report: Found {len(summary_stats)} summary rows, {len(detailed_items)} detailed items (live only, single inventory)")
-            
+            as_of = await get_report_as_of(db, REVERB_INVENTORY_VIEW)
+
             return templates.TemplateResponse("reports/non_performing_inventory.html", {
                 "request": request,
+                "as_of": as_of,
                 "summary_stats": summary_stats,
                 "detailed_items": detailed_items,
                 "age_filter": age_filter,
@@ -1125,6 +867,7 @@ async def clear_pending_sync_events(
         # Delete all pending events
         delete_query = text("DELETE FROM sync_events WHERE status = 'pending'")
         await db.execute(delete_query)
+        await invalidate_cache_tags("sync_events", db=db)
         await db.commit()
 
         return JSONResponse({
@@ -1223,6 +966,8 @@ async def archive_single_product(product_id: int):
         # Update to ARCHIVED
         product.status = ProductStatus.ARCHIVED
         await db.commit()
+        # Keep the materialized report views in step with the change
+        asyncio.create_task(refresh_report_views_in_background())
 
         return JSONResponse({
             "status": "success",
@@ -1267,6 +1012,7 @@ async def archive_all_mismatched():
         """)
         await db.execute(update_query, {"ids": product_ids})
         await db.commit()
+        asyncio.create_task(refresh_report_views_in_background())
 
         return JSONResponse({
             "status": "success",
@@ -1285,8 +1031,7 @@ async def platform_coverage_report(
     Platform Coverage Report: Identify ACTIVE products missing from certain platforms.
     """
     async with get_session() as db:
-        # Only show ACTIVE products
-        status_clause = "WHERE p.status = 'ACTIVE'"
+        # report_platform_coverage_mv only holds ACTIVE products
         params = {}
         
         # Map sort columns to SQL
@@ -1304,72 +1049,10 @@ async def platform_coverage_report(
         sort_dir = "DESC" if sort_order == "desc" else "ASC"
         
         query = text(f"""
-        WITH platform_coverage AS (
-            SELECT
-                p.id AS product_id,
-                p.sku,
-                p.brand,
-                p.model,
-                p.base_price,
-                p.status,
-                p.category,
-                COALESCE(ARRAY_AGG(pc.platform_name) FILTER (WHERE pc.platform_name IS NOT NULL), ARRAY[]::text[]) AS platforms
-            FROM products p
-            LEFT JOIN platform_common pc ON p.id = pc.product_id
-                AND (pc.status NOT IN ('sold', 'ended') OR pc.status IS NULL)
-            {status_clause}
-            GROUP BY p.id, p.sku, p.brand, p.model, p.base_price, p.status, p.category
-        ),
-        vr_eligible AS (
-            -- Check which categories have VR mappings (have a vintageandrare target row)
-            SELECT DISTINCT source_category_name
-            FROM platform_category_mappings
-            WHERE source_platform = 'reverb' AND target_platform = 'vintageandrare'
-        ),
-        coverage_data AS (
-            SELECT
-                pc.product_id,
-                pc.sku,
-                pc.brand,
-                pc.model,
-                pc.base_price,
-                pc.status,
-                pc.platforms,
-                CASE
-                    WHEN ARRAY_LENGTH(pc.platforms, 1) IS NULL THEN 0
-                    ELSE ARRAY_LENGTH(pc.platforms, 1)
-                END AS platform_count,
-                -- Only include 'vr' in expected platforms if category has VR mapping AND is not excluded
-                -- Excluded categories: Pro Audio (all), Accessories / Headphones
-                -- (per add.html checkProAudioCategory and business rules)
-                ARRAY(
-                    SELECT unnest(
-                        CASE
-                            WHEN ve.source_category_name IS NOT NULL
-                                 AND pc.category NOT LIKE 'Pro Audio%'
-                                 AND pc.category != 'Accessories / Headphones'
-                            THEN ARRAY['shopify', 'ebay', 'reverb', 'vr']
-                            ELSE ARRAY['shopify', 'ebay', 'reverb']
-                        END
-                    )
-                    EXCEPT
-                    SELECT unnest(pc.platforms)
-                ) AS missing_platforms,
-                CASE
-                    WHEN ve.source_category_name IS NOT NULL
-                         AND pc.category NOT LIKE 'Pro Audio%'
-                         AND pc.category != 'Accessories / Headphones' THEN 4
-                    ELSE 3
-                END AS max_platforms
-            FROM platform_coverage pc
-            LEFT JOIN vr_eligible ve ON pc.category = ve.source_category_name
-        )
         SELECT
             product_id, sku, brand, model, base_price, status, platforms, platform_count,
-            missing_platforms,
-            ARRAY_LENGTH(missing_platforms, 1) AS missing_count
-        FROM coverage_data
-        WHERE ARRAY_LENGTH(missing_platforms, 1) > 0
+            missing_platforms, missing_count
+        FROM {PLATFORM_COVERAGE_VIEW}
         ORDER BY {sort_col} {sort_dir},
                  ARRAY_TO_STRING(missing_platforms, ',') ASC,
                  sku ASC;
@@ -1377,9 +1060,11 @@ async def platform_coverage_report(
         
         result = await db.execute(query, params)
         coverage_data = [dict(row._mapping) for row in result.fetchall()]
+        as_of = await get_report_as_of(db, PLATFORM_COVERAGE_VIEW)
 
         return templates.TemplateResponse("reports/platform_coverage.html", {
             "request": request,
+            "as_of": as_of,
             "coverage_data": coverage_data,
             "sort_by": sort_by,
             "sort_order": sort_order
@@ -1507,6 +1192,71 @@ async def process_sync_event(
     except Exception as e:
         logger.error(f"Error processing sync event {event_id}: {e}", exc_info=True)
         return {"status": "error", "message": str(e)}
+    finally:
+        # Every action above may have changed the event and its product
+        await _invalidate_sync_event_caches()
+
+
+async def _invalidate_sync_event_caches() -> None:
+    """Drop cached pending-sync and product responses in this and the other processes."""
+    try:
+        async with get_session() as db:
+            await invalidate_cache_tags("sync_events", "products", db=db)
+            await db.commit()
+    except Exception as exc:  # noqa: BLE001 - entries still expire by TTL
+        logger.warning("Failed to invalidate sync event caches: %s", exc)
+
+
+@router.post("/sync-events/process-bulk")
+async def process_sync_events_bulk(request: Request):
+    """
+    Process a backlog of sync events in one go.
+
+    Body: {"event_ids": [...]} for specific events, or {"change_types": [...],
+    "platform": ..., "limit": ...} to take the oldest pending events of those
+    types (default: new_listing and status_change, up to 500).
+    """
+    from app.services.event_processor import process_sync_events_bulk as run_bulk
+
+    try:
+        try:
+            payload = await request.json()
+            if not isinstance(payload, dict):
+                payload = {}
+        except Exception:
+            payload = {}
+
+        event_ids = [int(event_id) for event_id in payload.get('event_ids') or []]
+        if not event_ids:
+            change_types = payload.get('change_types') or ['new_listing', 'status_change']
+            limit = min(int(payload.get('limit') or 500), 2000)
+            async with get_session() as db:
+                stmt = select(SyncEvent.id).where(
+                    SyncEvent.status == 'pending',
+                    SyncEvent.change_type.in_(change_types),
+                )
+                if payload.get('platform'):
+                    stmt = stmt.where(SyncEvent.platform_name == payload['platform'])
+                stmt = stmt.order_by(SyncEvent.detected_at).limit(limit)
+                event_ids = list((await db.execute(stmt)).scalars().all())
+
+        if not event_ids:
+            return {"status": "warning", "message": "No pending events to process", "summary": {}}
+
+        summary = await run_bulk(event_ids)
+        status = "success" if not summary.failed else "error"
+        return {
+            "status": status,
+            "message": (
+                f"Processed {len(summary.processed)} of {summary.total} event(s) "
+                f"across {summary.partitions} product(s) in {summary.elapsed_seconds:.1f}s"
+            ),
+            "summary": summary.to_dict(),
+        }
+
+    except Exception as e:
+        logger.error(f"Error bulk processing sync events: {e}", exc_info=True)
+        return {"status": "error", "message": str(e)}
 
 
 async def _resolve_product_identifier(db: AsyncSession, identifier: Optional[str]) -> Optional[Product]:
@@ -2446,39 +2196,11 @@ async def price_inconsistencies_report(
         else:
             sort_dir = "DESC" if sort_order == "desc" else "ASC"
 
-        # ── Main query ──────────────────────────────────────────────
+        # ── Main query (listing prices from report_platform_prices_mv) ──
         query = text(f"""
             WITH platform_prices AS (
-                SELECT
-                    p.id,
-                    p.sku,
-                    p.brand,
-                    p.model,
-                    p.year,
-                    p.base_price,
-                    p.primary_image,
-                    p.status,
-                    pc.platform_name,
-                    pc.status as platform_status,
-                    CASE
-                        WHEN pc.platform_name = 'reverb' THEN
-                            rl.list_price
-                        WHEN pc.platform_name = 'ebay' THEN
-                            el.price
-                        WHEN pc.platform_name = 'shopify' THEN
-                            sl.price
-                        WHEN pc.platform_name = 'vr' THEN
-                            vl.price_notax
-                    END as platform_price
-                FROM products p
-                JOIN platform_common pc ON p.id = pc.product_id
-                LEFT JOIN reverb_listings rl ON pc.id = rl.platform_id AND pc.platform_name = 'reverb'
-                LEFT JOIN ebay_listings el   ON pc.id = el.platform_id AND pc.platform_name = 'ebay'
-                LEFT JOIN shopify_listings sl ON pc.id = sl.platform_id AND pc.platform_name = 'shopify'
-                LEFT JOIN vr_listings vl     ON pc.id = vl.platform_id AND pc.platform_name = 'vr'
+                SELECT * FROM {PLATFORM_PRICES_VIEW} p
                 {status_clause}
-                {"AND" if status_clause else "WHERE"} LOWER(pc.status) IN ('active', 'draft')
-                AND p.base_price > 0
             ),
             markup_calc AS (
                 SELECT *,
@@ -2525,29 +2247,8 @@ async def price_inconsistencies_report(
         # ── Summary statistics ──────────────────────────────────────
         summary_query = text(f"""
             WITH platform_prices AS (
-                SELECT
-                    p.id,
-                    p.base_price,
-                    pc.platform_name,
-                    CASE
-                        WHEN pc.platform_name = 'reverb' THEN
-                            rl.list_price
-                        WHEN pc.platform_name = 'ebay' THEN
-                            el.price
-                        WHEN pc.platform_name = 'shopify' THEN
-                            sl.price
-                        WHEN pc.platform_name = 'vr' THEN
-                            vl.price_notax
-                    END as platform_price
-                FROM products p
-                JOIN platform_common pc ON p.id = pc.product_id
-                LEFT JOIN reverb_listings rl ON pc.id = rl.platform_id AND pc.platform_name = 'reverb'
-                LEFT JOIN ebay_listings el   ON pc.id = el.platform_id AND pc.platform_name = 'ebay'
-                LEFT JOIN shopify_listings sl ON pc.id = sl.platform_id AND pc.platform_name = 'shopify'
-                LEFT JOIN vr_listings vl     ON pc.id = vl.platform_id AND pc.platform_name = 'vr'
+                SELECT * FROM {PLATFORM_PRICES_VIEW} p
                 {status_clause}
-                {"AND" if status_clause else "WHERE"} LOWER(pc.status) IN ('active', 'draft')
-                AND p.base_price > 0
             ),
             markup_calc AS (
                 SELECT *,
@@ -2576,9 +2277,11 @@ async def price_inconsistencies_report(
 
         summary_result = await db.execute(summary_query, params)
         summary_stats = dict(summary_result.fetchone()._mapping)
+        as_of = await get_report_as_of(db, PLATFORM_PRICES_VIEW)
 
         return templates.TemplateResponse("reports/price_inconsistencies.html", {
             "request": request,
+            "as_of": as_of,
             "inconsistencies": inconsistencies,
             "summary_stats": summary_stats,
             "threshold": threshold,
@@ -2646,25 +2349,8 @@ async def price_inconsistencies_csv(
 
         query = text(f"""
             WITH platform_prices AS (
-                SELECT
-                    p.id, p.sku, p.brand, p.model, p.year, p.base_price, p.status,
-                    pc.platform_name,
-                    CASE
-                        WHEN pc.platform_name = 'reverb' THEN
-                            rl.list_price
-                        WHEN pc.platform_name = 'ebay' THEN el.price
-                        WHEN pc.platform_name = 'shopify' THEN sl.price
-                        WHEN pc.platform_name = 'vr' THEN vl.price_notax
-                    END as platform_price
-                FROM products p
-                JOIN platform_common pc ON p.id = pc.product_id
-                LEFT JOIN reverb_listings rl ON pc.id = rl.platform_id AND pc.platform_name = 'reverb'
-                LEFT JOIN ebay_listings el   ON pc.id = el.platform_id AND pc.platform_name = 'ebay'
-                LEFT JOIN shopify_listings sl ON pc.id = sl.platform_id AND pc.platform_name = 'shopify'
-                LEFT JOIN vr_listings vl     ON pc.id = vl.platform_id AND pc.platform_name = 'vr'
+                SELECT * FROM {PLATFORM_PRICES_VIEW} p
                 {status_clause}
-                {"AND" if status_clause else "WHERE"} LOWER(pc.status) IN ('active', 'draft')
-                AND p.base_price > 0
             ),
             markup_calc AS (
                 SELECT *,
@@ -2915,6 +2601,7 @@ async def fix_ebay_price(request: Request, product_id: int):
             old_price = el.price
             el.price = new_price
             await db.commit()
+            asyncio.create_task(refresh_report_views_in_background())
 
             logger.info(
                 "Fixed eBay price for product %s (item %s): £%.0f -> £%.0f",
@@ -2979,6 +2666,7 @@ async def fix_reverb_price(request: Request, product_id: int):
                     ea["price"]["amount"] = str(new_price)
                     rl.extended_attributes = ea
             await db.commit()
+            asyncio.create_task(refresh_report_views_in_background())
 
             logger.info(
                 "Fixed Reverb price for product %s (listing %s): £%.0f -> £%.0f",
@@ -3036,6 +2724,7 @@ async def fix_vr_price(request: Request, product_id: int):
             old_price = vl.price_notax
             vl.price_notax = new_price
             await db.commit()
+            asyncio.create_task(refresh_report_views_in_background())
 
             logger.info(
                 "Fixed V&R price for product %s (item %s): £%.0f -> £%.0f",
@@ -3228,15 +2917,8 @@ async def get_products(
                 params["price_max"] = price_max
 
             if search_text and search_text.strip():
-                search_term = f"%{search_text.strip()}%"
-                where_conditions.append("""
-                    (LOWER(p.title) LIKE LOWER(:search_text) OR
-                     LOWER(p.description) LIKE LOWER(:search_text) OR
-                     LOWER(p.model) LIKE LOWER(:search_text) OR
-                     LOWER(p.sku) LIKE LOWER(:search_text) OR
-                     LOWER(p.finish) LIKE LOWER(:search_text))
-                """)
-                params["search_text"] = search_term
+                where_conditions.append(search_condition_sql("p"))
+                params.update(search_params(search_text))
 
             where_clause = " AND ".join(where_conditions)
 
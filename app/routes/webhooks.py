@@ -1,12 +1,21 @@
 
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Request, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_session
 from app.models.webhook import WebhookEvent
 from app.services.webhook_processor import process_website_sale
-from app.core.config import get_webhook_secret
+from app.services.webhook_inbox import record_webhook_event
+from app.core.config import Settings, get_settings, get_webhook_secret
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import xml.etree.ElementTree as ET
+import base64
 import hmac
 import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -47,4 +56,134 @@ async def website_sale_webhook(
     # Process the sale asynchronously
     await process_website_sale(payload, db)
     
-    return {"status": "received"}
\ No newline at end of file
+    return {"status": "received"}
+
+
+# --- Platform order webhooks ---------------------------------------------
+# Each endpoint verifies the delivery, stores it in the webhook_events inbox and
+# returns 200 at once; WebhookInboxConsumer does the order sync in the background.
+
+def verify_reverb_webhook(token: Optional[str], secret: str) -> bool:
+    """Reverb doesn't sign webhooks, so the registered URL carries a shared secret token."""
+    return bool(secret and token and hmac.compare_digest(token, secret))
+
+
+def verify_shopify_webhook(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """X-Shopify-Hmac-Sha256 is base64(HMAC-SHA256(raw body, webhook secret))."""
+    if not secret or not signature:
+        return False
+    expected = base64.b64encode(hmac.new(secret.encode("utf-8"), body, hashlib.sha256).digest()).decode()
+    return hmac.compare_digest(signature, expected)
+
+
+def parse_ebay_notification(body: bytes) -> Dict[str, Optional[str]]:
+    """Pull the fields we use out of an eBay Platform Notification SOAP envelope."""
+    fields = {"Timestamp": None, "NotificationSignature": None, "NotificationEventName": None,
+              "ItemID": None, "OrderID": None, "TransactionID": None}
+    root = ET.fromstring(body)
+    for element in root.iter():
+        tag = element.tag.rsplit("}", 1)[-1]
+        if tag in fields and fields[tag] is None and element.text:
+            fields[tag] = element.text.strip()
+    return fields
+
+
+def verify_ebay_notification(fields: Dict[str, Optional[str]], settings: Settings) -> bool:
+    """
+    NotificationSignature is base64(MD5(Timestamp + DevId + AppId + CertId)).
+
+    Deliveries older than EBAY_NOTIFICATION_MAX_AGE_SECONDS are rejected so a
+    captured notification can't be replayed.
+    """
+    timestamp, signature = fields.get("Timestamp"), fields.get("NotificationSignature")
+    if not (timestamp and signature and settings.EBAY_DEV_ID and settings.EBAY_CLIENT_ID and settings.EBAY_CLIENT_SECRET):
+        return False
+    raw = f"{timestamp}{settings.EBAY_DEV_ID}{settings.EBAY_CLIENT_ID}{settings.EBAY_CLIENT_SECRET}"
+    expected = base64.b64encode(hashlib.md5(raw.encode("utf-8")).digest()).decode()
+    if not hmac.compare_digest(signature, expected):
+        return False
+    try:
+        sent_at = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if sent_at.tzinfo is None:
+        sent_at = sent_at.replace(tzinfo=timezone.utc)
+    age = abs((datetime.now(timezone.utc) - sent_at).total_seconds())
+    return age <= settings.EBAY_NOTIFICATION_MAX_AGE_SECONDS
+
+
+def _json_payload(body: bytes) -> Dict[str, Any]:
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    return payload if isinstance(payload, dict) else {"data": payload}
+
+
+@router.post("/webhooks/reverb/orders")
+async def reverb_order_webhook(
+    request: Request,
+    token: Optional[str] = None,
+    x_reverb_event: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+):
+    """Reverb order/listing webhooks (register the URL with ?token=REVERB_WEBHOOK_SECRET)."""
+    if not verify_reverb_webhook(token, settings.REVERB_WEBHOOK_SECRET):
+        raise HTTPException(status_code=401, detail="Invalid webhook token")
+
+    payload = _json_payload(await request.body())
+    order_id = payload.get("uuid") or payload.get("order_number")
+    # Order updates (paid -> shipped) reuse the uuid, so include the status in the delivery id
+    delivery_id = f"{order_id}:{payload.get('status')}" if order_id else None
+    stored = await record_webhook_event(
+        db, platform="reverb", event_type=x_reverb_event or "order", payload=payload, delivery_id=delivery_id,
+    )
+    return {"status": "received", "duplicate": not stored}
+
+
+@router.post("/webhooks/shopify/orders")
+async def shopify_order_webhook(
+    request: Request,
+    x_shopify_hmac_sha256: Optional[str] = Header(None),
+    x_shopify_topic: Optional[str] = Header(None),
+    x_shopify_webhook_id: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+):
+    """Shopify orders/create, orders/paid and orders/updated webhooks."""
+    body = await request.body()
+    if not verify_shopify_webhook(body, x_shopify_hmac_sha256, settings.SHOPIFY_WEBHOOK_SECRET):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    payload = _json_payload(body)
+    stored = await record_webhook_event(
+        db, platform="shopify", event_type=x_shopify_topic, payload=payload, delivery_id=x_shopify_webhook_id,
+    )
+    return {"status": "received", "duplicate": not stored}
+
+
+@router.post("/webhooks/ebay/notifications")
+async def ebay_platform_notification(
+    request: Request,
+    db: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+):
+    """eBay Platform Notifications (ItemSold, FixedPriceTransaction, AuctionCheckoutComplete, ...)."""
+    body = await request.body()
+    try:
+        fields = parse_ebay_notification(body)
+    except ET.ParseError:
+        raise HTTPException(status_code=400, detail="Invalid notification body")
+    if not verify_ebay_notification(fields, settings):
+        raise HTTPException(status_code=401, detail="Invalid notification signature")
+
+    event_name = fields.get("NotificationEventName")
+    reference = fields.get("OrderID") or fields.get("TransactionID") or fields.get("ItemID")
+    delivery_id = f"{event_name}:{reference}:{fields.get('Timestamp')}" if reference else None
+    payload = {key: value for key, value in fields.items() if key != "NotificationSignature"}
+    payload["xml"] = body.decode("utf-8", errors="replace")
+    stored = await record_webhook_event(
+        db, platform="ebay", event_type=event_name, payload=payload, delivery_id=delivery_id,
+    )
+    return {"status": "received", "duplicate": not stored}
@@ -1,6 +1,7 @@
 # app/routes/websockets.py
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from app.services.websockets.manager import manager
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,8 +15,25 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             # Keep connection alive by waiting for messages
             data = await websocket.receive_text()
+            try:
+                command = json.loads(data)
+            except ValueError:
+                command = None
+
+            # {"action": "subscribe"|"unsubscribe", "topics": ["sync.ebay", ...]}
+            if isinstance(command, dict) and command.get("action") in ("subscribe", "unsubscribe"):
+                topics = command.get("topics") or []
+                if command["action"] == "subscribe":
+                    manager.subscribe(websocket, topics)
+                else:
+                    manager.unsubscribe(websocket, topics)
+                await manager.send_personal_message(
+                    json.dumps({"type": f"{command['action']}d", "topics": topics}), websocket
+                )
+                continue
+
             # Echo back for testing (optional)
             await manager.send_personal_message(f"Message received: {data}", websocket)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
-        logger.info("WebSocket client disconnected")
\ No newline at end of file
+        logger.info("WebSocket client disconnected")
@@ -0,0 +1,738 @@
+"""
+Dashboard data and the cached snapshot behind the landing page.
+
+DashboardService holds the individual queries. build_dashboard_snapshot()
+runs the independent parts side by side, each in its own session. Every
+listing counter, the last sync times and the product total come from one
+combined query, and the latest sync status per platform from a second.
+
+DashboardSnapshotCache keeps the result for DASHBOARD_CACHE_TTL_SECONDS.
+Once the TTL has passed, the old snapshot is still served while a rebuild
+runs in the background. Platform syncs call invalidate_dashboard_snapshot()
+when they finish, which drops the snapshot straight away. Given a session,
+it also queues a NOTIFY on DASHBOARD_CHANNEL, so the web app drops its copy
+when a sync run by scripts/run_sync_scheduler.py commits.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from fastapi import Request
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.activity_log import ActivityLog
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel that sync completion NOTIFYs and the web app LISTENs on
+DASHBOARD_CHANNEL = "dashboard_snapshot"
+
+_COUNT_KEYS = ("count", "sold_count", "ended_count", "archived_count", "draft_count", "other_count")
+
+# Platform listing status -> dashboard bucket; anything unlisted is other_count
+_STATUS_BUCKETS: Dict[str, Dict[str, str]] = {
+    "reverb": {
+        "live": "count",
+        "active": "count",
+        "sold": "sold_count",
+        "ended": "ended_count",
+        "archived": "archived_count",
+        "published": "archived_count",
+        "draft": "draft_count",
+    },
+    "ebay": {
+        "active": "count",
+        "sold": "sold_count",
+        "completed": "sold_count",
+        "ended": "ended_count",
+        "unsold": "ended_count",
+        "cancelled": "ended_count",
+        "canceled": "ended_count",
+        "suspended": "ended_count",
+        "": "ended_count",
+        "archived": "archived_count",
+        "draft": "draft_count",
+        "scheduled": "draft_count",
+    },
+    "shopify": {
+        "active": "count",
+        "sold": "sold_count",
+        "ended": "ended_count",
+        "archived": "archived_count",
+        "draft": "draft_count",
+    },
+    # Status categories shared with the VR dashboard card.
+    "vr": {
+        "active": "count",
+        "sold": "sold_count",
+        "ended": "ended_count",
+        "removed": "ended_count",
+        "deleted": "ended_count",
+        "inactive": "ended_count",
+        "archived": "archived_count",
+        "published": "archived_count",
+        "draft": "draft_count",
+        "pending": "draft_count",
+    },
+}
+
+_COUNTERS_SQL = """
+    SELECT 'listings' AS kind, 'reverb' AS platform, reverb_state AS status, COUNT(*) AS count, NULL AS at
+    FROM reverb_listings GROUP BY reverb_state
+    UNION ALL
+    SELECT 'listings', 'ebay', listing_status, COUNT(*), NULL
+    FROM ebay_listings GROUP BY listing_status
+    UNION ALL
+    SELECT 'listings', 'shopify', status, COUNT(*), NULL
+    FROM shopify_listings GROUP BY status
+    UNION ALL
+    SELECT 'listings', 'vr', vr_state, COUNT(*), NULL
+    FROM vr_listings GROUP BY vr_state
+    UNION ALL
+    SELECT 'products', NULL, NULL, COUNT(*), NULL
+    FROM products
+    UNION ALL
+    SELECT 'last_sync', platform_name, NULL, 0, MAX(last_sync)
+    FROM platform_common
+    WHERE platform_name = ANY(:platforms) AND last_sync IS NOT NULL
+    GROUP BY platform_name
+"""
+
+
+def _bucket_counts(platform: str, rows: Iterable[Tuple[Optional[str], int]]) -> Dict[str, int]:
+    """Fold (status, count) rows for one platform into the dashboard buckets plus total."""
+    buckets = _STATUS_BUCKETS.get(platform, {})
+    counts = dict.fromkeys(_COUNT_KEYS, 0)
+    for status, count in rows:
+        counts[buckets.get((status or "").strip().lower(), "other_count")] += count or 0
+    counts["total"] = sum(counts.values())
+    return counts
+
+
+class DashboardService:
+    """Service class to handle dashboard data collection"""
+
+    platforms = ["ebay", "reverb", "vr", "shopify"]
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_counters(self) -> dict:
+        """
+        Listing status counts for every platform, last sync times and the
+        product total, in one query.
+
+        Returns {"platform_counts": {...}, "sync_times": {...}, "total_products": n}
+        with the same keys the per-platform queries used to produce.
+        """
+        rows = (await self.db.execute(text(_COUNTERS_SQL), {"platforms": self.platforms})).fetchall()
+
+        by_platform: Dict[str, list] = {platform: [] for platform in _STATUS_BUCKETS}
+        sync_times: Dict[str, Any] = {}
+        total_products = 0
+        for row in rows:
+            if row.kind == "listings":
+                by_platform[row.platform].append((row.status, row.count))
+            elif row.kind == "last_sync" and row.at is not None:
+                sync_times[f"{row.platform}_last_sync"] = row.at
+            elif row.kind == "products":
+                total_products = row.count or 0
+
+        platform_counts = {}
+        for platform in self.platforms:
+            for key, value in _bucket_counts(platform, by_platform.get(platform, [])).items():
+                platform_counts[f"{platform}_{key}"] = value
+
+        return {
+            "platform_counts": platform_counts,
+            "sync_times": sync_times,
+            "total_products": total_products,
+        }
+
+    async def get_sync_statuses(self) -> dict:
+        """Get sync status for each platform based on last sync activity.
+
+        Returns 'ok', 'error', or 'stale' for each platform.
+        - 'error': Last sync for this platform failed
+        - 'stale': No sync in the last 24 hours
+        - 'ok': Last sync succeeded
+        """
+        stale_threshold = datetime.now(timezone.utc) - timedelta(hours=24)
+        sync_statuses = {f"{platform}_sync_status": "stale" for platform in self.platforms}  # never synced
+
+        try:
+            # Most recent sync activity per platform
+            query = text("""
+                SELECT DISTINCT ON (entity_id) entity_id, action, created_at
+                FROM activity_log
+                WHERE entity_id = ANY(:platforms)
+                AND action IN ('sync', 'sync_error', 'sync_start')
+                ORDER BY entity_id, created_at DESC
+            """)
+            result = await self.db.execute(query, {"platforms": self.platforms})
+            for log in result.fetchall():
+                if log.action == "sync_error":
+                    status = "error"
+                elif log.created_at.replace(tzinfo=timezone.utc) < stale_threshold:
+                    status = "stale"
+                else:
+                    status = "ok"
+                sync_statuses[f"{log.entity_id}_sync_status"] = status
+
+        except Exception as e:
+            logger.error(f"Error getting sync statuses: {str(e)}")
+            sync_statuses = {f"{platform}_sync_status": "ok" for platform in self.platforms}  # Default to ok on error
+
+        return sync_statuses
+
+    @classmethod
+    def get_platform_connections(
+        cls, request: Request, platform_counts: dict
+    ) -> dict:
+        """Determine platform connection status (per request, so not part of the snapshot)"""
+        connections = {}
+
+        for platform in cls.platforms:
+            # Check app state first, fallback to having active listings
+            if hasattr(request.app.state, f"{platform}_connected"):
+                is_connected = getattr(request.app.state, f"{platform}_connected")
+            else:
+                is_connected = platform_counts.get(f"{platform}_count", 0) > 0
+
+            connections[f"{platform}_connected"] = is_connected
+
+        return connections
+
+    async def get_recent_activity(self) -> list:
+        """Get recent activity logs"""
+        try:
+            query = select(ActivityLog).order_by(ActivityLog.created_at.desc()).limit(2000)
+            result = await self.db.execute(query)
+            logs = result.scalars().all()
+
+            uk_tz = ZoneInfo("Europe/London")
+            activity = []
+
+            for log in logs:
+                # Determine icon
+                icon = self._get_activity_icon(log)
+
+                # Determine message
+                message = self._get_activity_message(log)
+
+                # Format timestamp
+                if log.created_at.tzinfo is None:
+                    created_at_local = log.created_at.replace(
+                        tzinfo=timezone.utc
+                    ).astimezone(uk_tz)
+                else:
+                    created_at_local = log.created_at.astimezone(uk_tz)
+
+                # Get status from details
+                status = "success"
+                if log.details:
+                    status = log.details.get("status", "success")
+                if log.action in ["sync_error", "error"]:
+                    status = "error"
+
+                activity.append(
+                    {
+                        "icon": icon,
+                        "message": message,
+                        "time": created_at_local.strftime("%d/%m/%Y, %H:%M:%S"),
+                        "status": status,
+                    }
+                )
+
+            return activity
+
+        except Exception as e:
+            logger.error(f"Error getting recent activity: {str(e)}")
+            return []
+
+    def _get_activity_icon(self, log) -> str:
+        """Get icon for activity log entry"""
+        if log.details and "icon" in log.details:
+            return log.details["icon"]
+
+        icon_map = {
+            "create": "➕",
+            "update": "🔄",
+            "delete": "❌",
+            "sync": (
+                "✅" if log.details and log.details.get("status") == "success" else "🔄"
+            ),
+            "sync_start": "🔄",
+            "sync_error": "⚠️",
+            "sale": "💰",
+            "relist_detected": "🔁",
+            "auto_archive": "📦",
+            "orders_sync": "📦",
+            "stats_refresh": "📊",
+        }
+
+        return icon_map.get(log.action, "📝")
+
+    def _get_activity_message(self, log) -> str:
+        """Get message for activity log entry"""
+        if log.details and "message" in log.details:
+            return log.details["message"]
+
+        if log.action == "sync":
+            message = f"Synced {log.entity_id}"
+            if log.details and "processed" in log.details:
+                message += f" ({log.details['processed']} items)"
+            return message
+        elif log.action == "sync_start":
+            return f"Started sync for {log.entity_id}"
+        elif log.action == "sync_error":
+            message = f"Error syncing {log.entity_id}"
+            if log.details and "error" in log.details:
+                message += f": {log.details['error'][:30]}..."
+            return message
+        elif log.action in ("end_listing", "delete_listing"):
+            if log.details and "title" in log.details:
+                title = log.details["title"]
+                platform = (log.platform or "").upper()
+                action_word = "Deleted" if log.action == "delete_listing" else "Ended"
+                return f"{action_word} {title} on {platform}"
+            else:
+                action_word = "Deleted" if log.action == "delete_listing" else "Ended"
+                return f"{action_word} listing #{log.entity_id} on {(log.platform or '').upper()}"
+        else:
+            message = f"{log.action.capitalize()} {log.entity_type} #{log.entity_id}"
+            if log.platform:
+                message += f" on {log.platform}"
+            return message
+
+    async def get_latest_products(self, limit: int = 5) -> list:
+        """Get the most recently added products"""
+        try:
+            query = text("""
+                SELECT id, sku, title, brand, model, base_price, created_at, primary_image, status, is_sold
+                FROM products
+                ORDER BY created_at DESC
+                LIMIT :limit
+            """)
+            result = await self.db.execute(query, {"limit": limit})
+            rows = result.fetchall()
+
+            products = []
+            for row in rows:
+                # Format created_at
+                created_at = row.created_at
+                if created_at:
+                    time_str = created_at.strftime("%d/%m %H:%M")
+                else:
+                    time_str = "Unknown"
+
+                # Truncate title if needed
+                title = row.title or row.model or "Untitled"
+                full_title = title  # Keep full title for tooltip
+                if len(title) > 45:
+                    title = title[:45] + "..."
+
+                # Determine display status - use status field as source of truth
+                raw_status = (row.status or "ACTIVE").upper()
+                if raw_status == "SOLD":
+                    status = "sold"
+                elif raw_status == "DRAFT":
+                    status = "draft"
+                elif raw_status == "ARCHIVED":
+                    status = "archived"
+                elif raw_status == "DELETED":
+                    status = "deleted"
+                else:
+                    status = "active"
+
+                products.append({
+                    "id": row.id,
+                    "sku": row.sku,
+                    "title": title,
+                    "full_title": full_title,
+                    "brand": row.brand or "",
+                    "price": row.base_price,
+                    "created_at": time_str,
+                    "image": row.primary_image,
+                    "status": status,
+                })
+
+            return products
+
+        except Exception as e:
+            logger.error(f"Error getting latest products: {str(e)}")
+            return []
+
+    async def get_recent_orders(self, limit: int = 5) -> list:
+        """Get the most recent orders across all platforms"""
+        try:
+            # Query each table separately and combine in Python
+            # This avoids complex UNION issues with different column types
+            orders = []
+
+            # Reverb orders
+            reverb_query = text("""
+                SELECT
+                    order_number as order_id,
+                    title,
+                    buyer_name,
+                    total_amount as total,
+                    created_at,
+                    status
+                FROM reverb_orders
+                ORDER BY created_at DESC
+                LIMIT :limit
+            """)
+            result = await self.db.execute(reverb_query, {"limit": limit})
+            for row in result.fetchall():
+                orders.append({
+                    "platform": "reverb",
+                    "order_id": row.order_id,
+                    "title": row.title,
+                    "buyer": row.buyer_name,
+                    "total": row.total,
+                    "created_at": row.created_at,
+                    "status": row.status,
+                })
+
+            # eBay orders
+            ebay_query = text("""
+                SELECT
+                    order_id,
+                    raw_payload->'TransactionArray'->'Transaction'->'Item'->>'Title' as title,
+                    shipping_name as buyer_name,
+                    total_amount as total,
+                    created_time as created_at,
+                    order_status as status
+                FROM ebay_orders
+                ORDER BY created_time DESC
+                LIMIT :limit
+            """)
+            result = await self.db.execute(ebay_query, {"limit": limit})
+            for row in result.fetchall():
+                orders.append({
+                    "platform": "ebay",
+                    "order_id": row.order_id,
+                    "title": row.title or "eBay Order",
+                    "buyer": row.buyer_name,
+                    "total": row.total,
+                    "created_at": row.created_at,
+                    "status": row.status,
+                })
+
+            # Shopify orders (if any exist)
+            shopify_query = text("""
+                SELECT
+                    order_name as order_id,
+                    primary_title as title,
+                    CONCAT(customer_first_name, ' ', customer_last_name) as buyer_name,
+                    total_amount as total,
+                    created_at,
+                    financial_status as status
+                FROM shopify_orders
+                ORDER BY created_at DESC
+                LIMIT :limit
+            """)
+            result = await self.db.execute(shopify_query, {"limit": limit})
+            for row in result.fetchall():
+                orders.append({
+                    "platform": "shopify",
+                    "order_id": row.order_id,
+                    "title": row.title or "Shopify Order",
+                    "buyer": row.buyer_name,
+                    "total": row.total,
+                    "created_at": row.created_at,
+                    "status": row.status,
+                })
+
+            # Sort all orders by created_at descending and take top N
+            orders.sort(key=lambda x: x["created_at"] or datetime.min, reverse=True)
+            orders = orders[:limit]
+
+            # Format for display
+            formatted_orders = []
+            for order in orders:
+                created_at = order["created_at"]
+                if created_at:
+                    time_str = created_at.strftime("%d/%m %H:%M")
+                else:
+                    time_str = "Unknown"
+
+                title = order["title"] or "Order"
+                full_title = title  # Keep full title for tooltip
+                if len(title) > 45:
+                    title = title[:45] + "..."
+
+                formatted_orders.append({
+                    "platform": order["platform"],
+                    "order_id": order["order_id"],
+                    "title": title,
+                    "full_title": full_title,
+                    "buyer": order["buyer"] or "Unknown",
+                    "total": order["total"],
+                    "created_at": time_str,
+                    "status": order["status"] or "Unknown",
+                })
+
+            return formatted_orders
+
+        except Exception as e:
+            logger.error(f"Error getting recent orders: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            return []
+
+    async def get_pending_sync_events(self) -> dict:
+        """Get pending sync events with counts by platform and change type"""
+        try:
+            # Get pending events with product info
+            query = text("""
+                SELECT
+                    se.id,
+                    se.platform_name,
+                    se.change_type,
+                    se.external_id,
+                    se.change_data,
+                    se.detected_at,
+                    se.product_id,
+                    p.sku,
+                    p.title
+                FROM sync_events se
+                LEFT JOIN products p ON se.product_id = p.id
+                WHERE se.status = 'pending'
+                ORDER BY se.detected_at DESC
+                LIMIT 50
+            """)
+            result = await self.db.execute(query)
+            rows = result.fetchall()
+
+            # Get counts by platform
+            count_query = text("""
+                SELECT platform_name, COUNT(*) as count
+                FROM sync_events
+                WHERE status = 'pending'
+                GROUP BY platform_name
+            """)
+            count_result = await self.db.execute(count_query)
+            count_rows = count_result.fetchall()
+
+            platform_counts = {row.platform_name: row.count for row in count_rows}
+            total_pending = sum(platform_counts.values())
+
+            # Get counts by change type
+            type_query = text("""
+                SELECT change_type, COUNT(*) as count
+                FROM sync_events
+                WHERE status = 'pending'
+                GROUP BY change_type
+            """)
+            type_result = await self.db.execute(type_query)
+            type_rows = type_result.fetchall()
+            type_counts = {row.change_type: row.count for row in type_rows}
+
+            bst_tz = timezone(timedelta(hours=0))  # UTC for now
+
+            events = []
+            for row in rows:
+                # Format the change description
+                change_data = row.change_data or {}
+                if isinstance(change_data, str):
+                    import json
+                    try:
+                        change_data = json.loads(change_data)
+                    except:
+                        change_data = {}
+
+                change_desc = self._format_change_description(row.change_type, change_data)
+
+                # Format detected time
+                detected_at = row.detected_at
+                if detected_at:
+                    if detected_at.tzinfo is None:
+                        detected_at = detected_at.replace(tzinfo=timezone.utc)
+                    time_str = detected_at.strftime("%d/%m %H:%M")
+                else:
+                    time_str = "Unknown"
+
+                events.append({
+                    "id": row.id,
+                    "platform": row.platform_name,
+                    "change_type": row.change_type,
+                    "external_id": row.external_id,
+                    "change_desc": change_desc,
+                    "detected_at": time_str,
+                    "product_id": row.product_id,
+                    "sku": row.sku,
+                    "title": (row.title[:40] + "...") if row.title and len(row.title) > 40 else row.title,
+                })
+
+            return {
+                "events": events,
+                "platform_counts": platform_counts,
+                "type_counts": type_counts,
+                "total_pending": total_pending,
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting pending sync events: {str(e)}")
+            return {
+                "events": [],
+                "platform_counts": {},
+                "type_counts": {},
+                "total_pending": 0,
+            }
+
+    def _format_change_description(self, change_type: str, change_data: dict) -> str:
+        """Format a human-readable description of the change"""
+        if change_type == "status":
+            old = change_data.get("old", "?")
+            new = change_data.get("new", "?")
+            return f"{old} → {new}"
+        elif change_type == "price":
+            old = change_data.get("old_price", "?")
+            new = change_data.get("new_price", "?")
+            return f"£{old} → £{new}"
+        elif change_type == "quantity":
+            old = change_data.get("old_quantity", "?")
+            new = change_data.get("new_quantity", "?")
+            return f"{old} → {new}"
+        elif change_type == "new_listing":
+            return "New listing found"
+        elif change_type == "removed_listing":
+            return "Listing removed"
+        elif change_type == "order_sale":
+            return "Sale detected"
+        else:
+            # Fallback - show raw data keys
+            return ", ".join(f"{k}: {v}" for k, v in list(change_data.items())[:2])
+
+
+
+
+async def build_dashboard_snapshot(session_factory=None) -> Dict[str, Any]:
+    """Collect everything the dashboard shows; independent parts run concurrently."""
+    if session_factory is None:
+        from app.database import async_session
+        session_factory = async_session
+
+    async def part(fetch):
+        async with session_factory() as db:
+            return await fetch(DashboardService(db))
+
+    counters, sync_statuses, recent_activity, pending_sync, latest_products, recent_orders = await asyncio.gather(
+        part(lambda service: service.get_counters()),
+        part(lambda service: service.get_sync_statuses()),
+        part(lambda service: service.get_recent_activity()),
+        part(lambda service: service.get_pending_sync_events()),
+        part(lambda service: service.get_latest_products(limit=5)),
+        part(lambda service: service.get_recent_orders(limit=5)),
+    )
+    return {
+        **counters,
+        "sync_statuses": sync_statuses,
+        "recent_activity": recent_activity,
+        "pending_sync": pending_sync,
+        "latest_products": latest_products,
+        "recent_orders": recent_orders,
+        "built_at": datetime.now(timezone.utc),
+    }
+
+
+class DashboardSnapshotCache:
+    """
+    Short-lived cache of build_dashboard_snapshot().
+
+    Concurrent requests share one build. An expired snapshot is served while
+    a background rebuild runs; an invalidated one is rebuilt before serving.
+    """
+
+    def __init__(self, session_factory=None, ttl_seconds: Optional[float] = None):
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._listener = None
+        self._stopping = False
+
+    def _ttl(self) -> float:
+        if self.ttl_seconds is not None:
+            return self.ttl_seconds
+        return get_settings().DASHBOARD_CACHE_TTL_SECONDS
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+        self._generation += 1
+
+    async def get(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            if time.monotonic() >= self._expires_at and not self._refreshing:
+                self._refresh_task = asyncio.create_task(self._refresh_in_background())
+            return snapshot
+        return await self._rebuild()
+
+    @property
+    def _refreshing(self) -> bool:
+        return self._refresh_task is not None and not self._refresh_task.done()
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self._rebuild()
+        except Exception as exc:  # noqa: BLE001 - keep serving the old snapshot
+            logger.error("Dashboard snapshot refresh failed: %s", exc, exc_info=True)
+
+    async def _rebuild(self) -> Dict[str, Any]:
+        generation = self._generation
+        async with self._lock:
+            # Someone else finished a build while we waited for the lock
+            if self._snapshot is not None and generation == self._generation and time.monotonic() < self._expires_at:
+                return self._snapshot
+            generation = self._generation
+            snapshot = await build_dashboard_snapshot(self.session_factory)
+            # Don't keep data read before an invalidation that landed mid-build
+            if generation == self._generation:
+                self._snapshot = snapshot
+                self._expires_at = time.monotonic() + self._ttl()
+            return snapshot
+
+    async def listen(self) -> None:
+        """Invalidate on DASHBOARD_CHANNEL notifications until stop(); started from the app lifespan."""
+        from app.services.pg_listener import PgNotificationListener
+
+        self._stopping = False
+        self._listener = listener = PgNotificationListener(channel=DASHBOARD_CHANNEL)
+        await listener.start()
+        try:
+            while not self._stopping:
+                if await listener.wait(timeout=60):
+                    self.invalidate()
+        finally:
+            self._listener = None
+            await listener.close()
+
+    def stop(self) -> None:
+        self._stopping = True
+        if self._listener is not None:
+            self._listener.wake()
+
+
+dashboard_snapshot_cache = DashboardSnapshotCache()
+
+
+async def invalidate_dashboard_snapshot(db: Optional[AsyncSession] = None) -> None:
+    """
+    Drop the cached dashboard snapshot. With a session, also NOTIFY other
+    processes; the notification goes out when the caller commits.
+    """
+    dashboard_snapshot_cache.invalidate()
+    if db is not None:
+        await db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": DASHBOARD_CHANNEL})
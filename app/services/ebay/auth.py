@@ -3,21 +3,38 @@ eBay Authentication Manager using secure in-memory token storage
 No tokens are ever saved to files - only stored in memory
 """
 
+import asyncio
 import os
 import json
 import base64
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
 import httpx
 
 from app.core.config import get_settings
 from app.core.exceptions import EbayAPIError
+from .http_client import get_shared_http_client
 from .token_manager import SecureTokenManager
 
 logger = logging.getLogger(__name__)
 
+# One token refresh in flight per environment ("sandbox"/"production"), shared
+# by every EbayAuthManager instance. Locks are bound to the loop that created
+# them, so a new one is made if the loop changes between asyncio.run() calls.
+_refresh_locks: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+_background_refreshes: Dict[str, asyncio.Task] = {}
+
+
+def _refresh_lock(key: str) -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    entry = _refresh_locks.get(key)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Lock())
+        _refresh_locks[key] = entry
+    return entry[1]
+
 
 class EbayAuthManager:
     """
@@ -60,20 +77,59 @@ class EbayAuthManager:
 
         logger.debug(f"EbayAuthManager initialized. Sandbox: {sandbox}")
 
+    @property
+    def _token_key(self) -> str:
+        return "sandbox" if self.sandbox_mode else "production"
+
     async def get_access_token(self) -> str:
         """
         Get a valid access token, refreshing if necessary
+
+        Concurrent callers that find no valid token share a single refresh.
+        A token that is still valid but within EBAY_TOKEN_REFRESH_MARGIN_SECONDS
+        of expiry is returned immediately while a replacement is fetched in
+        the background.
         """
         # Check if we have a valid token in memory
         access_token = self.token_manager.get_access_token()
 
         if access_token:
             logger.debug("Using cached access token from memory")
+            self._schedule_proactive_refresh()
             return access_token
 
-        # Need to refresh the token
-        logger.info("No valid access token in memory, refreshing...")
+        async with _refresh_lock(self._token_key):
+            # Another caller may have refreshed while we waited for the lock
+            access_token = self.token_manager.get_access_token()
+            if access_token:
+                return access_token
 
+            logger.info("No valid access token in memory, refreshing...")
+            return await self._refresh_access_token()
+
+    def _schedule_proactive_refresh(self) -> None:
+        remaining = self.token_manager.seconds_until_expiry()
+        if remaining is None or remaining > self.settings.EBAY_TOKEN_REFRESH_MARGIN_SECONDS:
+            return
+
+        task = _background_refreshes.get(self._token_key)
+        if task is not None and not task.done():
+            return
+        _background_refreshes[self._token_key] = asyncio.create_task(self._proactive_refresh())
+
+    async def _proactive_refresh(self) -> None:
+        async with _refresh_lock(self._token_key):
+            remaining = self.token_manager.seconds_until_expiry()
+            if remaining is not None and remaining > self.settings.EBAY_TOKEN_REFRESH_MARGIN_SECONDS:
+                return
+            try:
+                await self._refresh_access_token()
+            except Exception as e:
+                # The current token is still valid; the next caller will retry
+                logger.warning(f"Background eBay token refresh failed: {str(e)}")
+
+    async def _refresh_access_token(self) -> str:
+        """Exchange the refresh token for a new access token and cache it"""
         try:
             # Get refresh token from environment
             refresh_token = self.token_manager.get_refresh_token()
@@ -88,13 +144,12 @@ class EbayAuthManager:
 
             auth = httpx.BasicAuth(self.client_id, self.client_secret)
 
-            # Make refresh request
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.token_refresh_url,
-                    data=refresh_data,
-                    auth=auth
-                )
+            # Make refresh request over the shared eBay connection pool
+            response = await get_shared_http_client().post(
+                self.token_refresh_url,
+                data=refresh_data,
+                auth=auth
+            )
 
             if response.status_code == 200:
                 token_data = response.json()
@@ -0,0 +1,48 @@
+# app/services/ebay/http_client.py
+"""
+Process-wide pooled transport for the eBay APIs.
+
+EbayTradingLegacyAPI, EbayInventoryAPI, EbayAccountAPI and the OAuth token
+refresh in EbayAuthManager all talk to api.ebay.com. They used to open a new
+httpx.AsyncClient per call, paying a TCP + TLS handshake every time; metadata
+and stats refreshes make hundreds of calls in a row. The pool (see
+app.services.http_pool) is closed once from the FastAPI lifespan / scheduler
+exit.
+"""
+
+from typing import Optional
+
+import httpx
+
+from app.services.http_pool import SharedHttpPool
+
+_pool = SharedHttpPool("eBay", settings_prefix="EBAY")
+
+
+def build_http_client(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    timeout: float = 30.0,
+) -> httpx.AsyncClient:
+    """
+    Build a keep-alive, connection-pooled AsyncClient for the eBay APIs.
+
+    Unspecified limits fall back to the EBAY_HTTP_* settings.
+    """
+    return _pool.build(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        timeout=timeout,
+    )
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Return the shared pooled client for the running event loop, creating it on first use."""
+    return _pool.get()
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared pool. Safe to call when no pool was ever created."""
+    await _pool.close()
@@ -109,7 +109,8 @@ class EbayImporter:
                 include_active=True,
                 include_sold=True,
                 include_unsold=True,
-                include_details=True
+                include_details=True,
+                concurrent=True,
             )
             
             # Process each type of listing
@@ -52,6 +52,18 @@ class SecureTokenManager:
 
         return None
 
+    def seconds_until_expiry(self) -> Optional[float]:
+        """Seconds until the cached access token expires, or None if there is none"""
+        key = "sandbox" if self.sandbox else "production"
+        expires_at_str = self._access_tokens.get(key, {}).get("expires_at")
+        if not expires_at_str:
+            return None
+        try:
+            expires_at = datetime.fromisoformat(expires_at_str)
+        except ValueError:
+            return None
+        return (expires_at - datetime.now()).total_seconds()
+
     def save_access_token(self, access_token: str, expires_in: int):
         """Save access token to memory only"""
         key = "sandbox" if self.sandbox else "production"
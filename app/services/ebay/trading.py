@@ -9,10 +9,18 @@ import asyncio
 import requests
 import warnings
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from xml.sax.saxutils import escape as xml_escape
+import xml.etree.ElementTree as ET
 
 from app.services.ebay.auth import EbayAuthManager
+from app.services.ebay.http_client import get_shared_http_client
+from app.services.ebay.xml_stream import (
+    ORDER_RECORD_PATH,
+    SELLING_RECORD_PATHS,
+    TradingRecord,
+    TradingXMLStreamParser,
+)
 from app.core.exceptions import EbayAPIError
 
 logger = logging.getLogger(__name__)
@@ -21,10 +29,11 @@ logger = logging.getLogger(__name__)
 class EbayInventoryAPI:
     """Class for eBay Inventory API (REST) operations"""
     
-    def __init__(self, sandbox: bool = False):
+    def __init__(self, sandbox: bool = False, http_client: Optional[httpx.AsyncClient] = None):
         self.auth_manager = EbayAuthManager(sandbox=sandbox)
         self.sandbox = sandbox
         self.marketplace_id = "EBAY_GB"  # Default for UK
+        self._http_client = http_client
         
         if sandbox:
             self.endpoint = "https://api.sandbox.ebay.com/sell/inventory/v1"
@@ -34,6 +43,10 @@ class EbayInventoryAPI:
     async def _get_auth_token(self) -> str:
         """Get OAuth token for API requests"""
         return await self.auth_manager.get_access_token()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """The injected client if any, otherwise the shared eBay connection pool"""
+        return self._http_client or get_shared_http_client()
         
     async def _make_request(self, method: str, path: str, data: Dict = None, params: Dict = None) -> Dict:
         """Make a request to eBay Inventory API"""
@@ -50,17 +63,17 @@ class EbayInventoryAPI:
             headers['X-EBAY-C-MARKETPLACE-ID'] = self.marketplace_id
             
         try:
-            async with httpx.AsyncClient() as client:
-                if method.upper() == 'GET':
-                    response = await client.get(url, headers=headers, params=params)
-                elif method.upper() == 'POST':
-                    response = await client.post(url, headers=headers, json=data)
-                elif method.upper() == 'PUT':
-                    response = await client.put(url, headers=headers, json=data)
-                elif method.upper() == 'DELETE':
-                    response = await client.delete(url, headers=headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+            client = self._get_http_client()
+            if method.upper() == 'GET':
+                response = await client.get(url, headers=headers, params=params)
+            elif method.upper() == 'POST':
+                response = await client.post(url, headers=headers, json=data)
+            elif method.upper() == 'PUT':
+                response = await client.put(url, headers=headers, json=data)
+            elif method.upper() == 'DELETE':
+                response = await client.delete(url, headers=headers)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
                     
             if response.status_code not in (200, 201, 204):
                 logger.error(f"Error in API call {method} {path}: {response.text}")
@@ -87,12 +100,13 @@ class EbayInventoryAPI:
 class EbayTradingLegacyAPI:
     """Class for eBay Trading API (XML-based) operations"""
     
-    def __init__(self, sandbox: bool = False, site_id: str = '3'):
+    def __init__(self, sandbox: bool = False, site_id: str = '3', http_client: Optional[httpx.AsyncClient] = None):
         # print(f"DEBUG: EbayTradingLegacyAPI.__init__ - Initializing. Sandbox: {sandbox}, SiteID: {site_id}")
         self.auth_manager = EbayAuthManager(sandbox=sandbox) # This will have its own init prints
         self.sandbox = sandbox
         self.site_id = site_id  # Default to UK (3)
         self.compatibility_level = '1155' # From your original, ensure it's current
+        self._http_client = http_client
         
         if sandbox:
             self.endpoint = "https://api.sandbox.ebay.com/ws/api.dll"
@@ -109,7 +123,23 @@ class EbayTradingLegacyAPI:
             # print("DEBUG: EbayTradingLegacyAPI._get_auth_token - ERROR: No token returned from auth_manager.")
             raise EbayAPIError("Failed to retrieve auth token for Trading API call.")
         return token
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """The injected client if any, otherwise the shared eBay connection pool"""
+        return self._http_client or get_shared_http_client()
         
+    def _build_headers(self, call_name: str, auth_token: str) -> Dict[str, str]:
+        return {
+            'X-EBAY-API-CALL-NAME': call_name,
+            'X-EBAY-API-COMPATIBILITY-LEVEL': self.compatibility_level,
+            'X-EBAY-API-SITEID': self.site_id,
+            # 'X-EBAY-API-APP-NAME': self.settings.EBAY_APP_ID, # Your original had APP-NAME, DEV-ID, CERT-ID
+            # 'X-EBAY-API-DEV-NAME': self.settings.EBAY_DEV_ID, # These are for traditional API Access Rules (non-OAuth)
+            # 'X-EBAY-API-CERT-NAME': self.settings.EBAY_CERT_ID, # If using OAuth, X-EBAY-API-IAF-TOKEN is primary
+            'X-EBAY-API-IAF-TOKEN': auth_token, # This is for OAuth
+            'Content-Type': 'text/xml'
+        }
+
     async def _make_request(self, call_name: str, xml_request: str, attempt: int = 1) -> Dict: # Added attempt parameter for clarity
         """Make a request to eBay Trading API"""
         max_attempts = 3 # Define max retry attempts for network issues
@@ -119,24 +149,16 @@ class EbayTradingLegacyAPI:
             auth_token = await self._get_auth_token() # This calls the instrumented get_access_token
             # print(f"DEBUG: EbayTradingLegacyAPI._make_request - Auth token obtained for {call_name} (masked): {'********' + auth_token[-5:] if auth_token and len(auth_token) > 5 else 'None'}")
             
-            headers = {
-                'X-EBAY-API-CALL-NAME': call_name,
-                'X-EBAY-API-COMPATIBILITY-LEVEL': self.compatibility_level,
-                'X-EBAY-API-SITEID': self.site_id,
-                # 'X-EBAY-API-APP-NAME': self.settings.EBAY_APP_ID, # Your original had APP-NAME, DEV-ID, CERT-ID
-                # 'X-EBAY-API-DEV-NAME': self.settings.EBAY_DEV_ID, # These are for traditional API Access Rules (non-OAuth)
-                # 'X-EBAY-API-CERT-NAME': self.settings.EBAY_CERT_ID, # If using OAuth, X-EBAY-API-IAF-TOKEN is primary
-                'X-EBAY-API-IAF-TOKEN': auth_token, # This is for OAuth
-                'Content-Type': 'text/xml'
-            }
+            headers = self._build_headers(call_name, auth_token)
             masked_headers = {k: (v if k != 'X-EBAY-API-IAF-TOKEN' else '********' + v[-5:]) for k,v in headers.items()}
             # print(f"DEBUG: EbayTradingLegacyAPI._make_request - Request Headers for {call_name} (token masked): {masked_headers}")
             # print(f"DEBUG: EbayTradingLegacyAPI._make_request - XML Request for {call_name}: {xml_request[:500]}...") # Optionally log part of XML
 
             # Your print: print(f"*** ABOUT TO MAKE HTTP REQUEST TO: {self.endpoint} ***")
             # print(f"DEBUG: EbayTradingLegacyAPI._make_request - Posting to endpoint: {self.endpoint} for call: {call_name}")
-            async with httpx.AsyncClient(timeout=60.0) as client: # Using a timeout
-                response = await client.post(self.endpoint, content=xml_request, headers=headers)
+            response = await self._get_http_client().post(
+                self.endpoint, content=xml_request, headers=headers, timeout=60.0
+            )
             
             # Your print: print(f"*** HTTP RESPONSE STATUS: {response.status_code} ***")
             # print(f"DEBUG: EbayTradingLegacyAPI._make_request - Response status for {call_name}: {response.status_code}")
@@ -200,6 +222,60 @@ class EbayTradingLegacyAPI:
             logger.error(f"Unexpected error in Trading API request {call_name}: {e_generic}", exc_info=True)
             raise EbayAPIError(f"Unexpected error on {call_name}: {e_generic}")
 
+    async def _make_streaming_request(
+        self,
+        call_name: str,
+        xml_request: str,
+        record_paths: Sequence[Tuple[str, ...]],
+        attempt: int = 1,
+    ) -> Tuple[Dict, List[TradingRecord]]:
+        """
+        Make a Trading API request and parse the body incrementally.
+
+        Instead of decoding the whole body and handing it to xmltodict, the
+        response bytes are fed to a TradingXMLStreamParser as they arrive. The
+        repeated elements at record_paths come back as TradingRecords and the
+        rest of the response (Ack, Errors, pagination) as an xmltodict-shaped
+        envelope, so a page is never held as one large nested dict.
+
+        Returns:
+            (envelope, records)
+        """
+        max_attempts = 3
+        parser = TradingXMLStreamParser(record_paths)
+        records: List[TradingRecord] = []
+
+        try:
+            auth_token = await self._get_auth_token()
+            headers = self._build_headers(call_name, auth_token)
+
+            client = self._get_http_client()
+            async with client.stream(
+                "POST", self.endpoint, content=xml_request, headers=headers, timeout=60.0
+            ) as response:
+                if response.status_code != 200:
+                    body = (await response.aread()).decode(errors="replace")
+                    raise EbayAPIError(
+                        f"eBay Trading API call {call_name} failed with HTTP status {response.status_code}: {body[:500]}"
+                    )
+                async for chunk in response.aiter_bytes():
+                    records.extend(parser.feed(chunk))
+
+            records.extend(parser.close())
+            envelope = parser.envelope()
+            if not envelope:
+                raise EbayAPIError(f"Empty response from eBay Trading API call {call_name}")
+            return envelope, records
+
+        except ET.ParseError as e_parse:
+            raise EbayAPIError(f"Failed to parse XML response from {call_name}: {e_parse}")
+        except (httpx.TimeoutException, httpx.RequestError) as e_req:
+            if attempt < max_attempts:
+                await asyncio.sleep(attempt * 2 if isinstance(e_req, httpx.TimeoutException) else attempt)
+                return await self._make_streaming_request(call_name, xml_request, record_paths, attempt=attempt + 1)
+            logger.error(f"Network error making Trading API request {call_name} after {max_attempts} attempts: {e_req}", exc_info=True)
+            raise EbayAPIError(f"Network error on {call_name} after {max_attempts} attempts: {e_req}")
+
     @staticmethod
     def _format_datetime(value: datetime) -> str:
         if isinstance(value, str):
@@ -454,7 +530,12 @@ class EbayTradingLegacyAPI:
     async def get_my_ebay_selling(self, detail_level: str = "ReturnAll", page_number: int = 1, entries_per_page: int = 25, list_name: str = "ActiveList") -> Dict:
         # print(f"DEBUG: EbayTradingLegacyAPI.get_my_ebay_selling - Entered. ListName: {list_name}, Page: {page_number}, Entries: {entries_per_page}, DetailLevel: {detail_level}")
         call_name = "GetMyeBaySelling"
-        
+        xml_request = self._my_ebay_selling_request(detail_level, page_number, entries_per_page, list_name)
+        # print(f"DEBUG: EbayTradingLegacyAPI.get_my_ebay_selling - XML for {call_name} ({list_name}): {xml_request}")
+        return await self._make_request(call_name, xml_request) # This will have its own prints
+
+    @staticmethod
+    def _my_ebay_selling_request(detail_level: str, page_number: int, entries_per_page: int, list_name: str) -> str:
         # Constructing list part based on list_name
         list_xml_part = f"""
         <{list_name}>
@@ -470,100 +551,233 @@ class EbayTradingLegacyAPI:
           <DetailLevel>{detail_level}</DetailLevel>
           {list_xml_part}
         </GetMyeBaySellingRequest>"""
-        # print(f"DEBUG: EbayTradingLegacyAPI.get_my_ebay_selling - XML for {call_name} ({list_name}): {xml_request}")
-        return await self._make_request(call_name, xml_request) # This will have its own prints
+        return xml_request
 
-    async def get_all_selling_listings(self, include_active=True, include_sold=True, include_unsold=True, include_details=False) -> Dict[str, List[Dict]]:
-        # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - Entered. Active: {include_active}, Sold: {include_sold}, Unsold: {include_unsold}, Details: {include_details}")
-        all_listings_data = {"active": [], "sold": [], "unsold": []}
-        
-        detail_level_val = "ReturnAll" if include_details else "ReturnSummary"
-        entries_per_page_val = 100 # Max for sold is 100, active is 200. Using 100 for simplicity.
+    async def get_my_ebay_selling_page(
+        self,
+        list_name: str = "ActiveList",
+        page_number: int = 1,
+        entries_per_page: int = 100,
+        detail_level: str = "ReturnAll",
+    ) -> Tuple[Optional[List[Dict]], int]:
+        """
+        Fetch one GetMyeBaySelling page with the streaming parser.
+
+        Same contract as _parse_selling_page: returns (items, total_pages), with
+        items None when eBay did not Ack the call. SoldList transactions are
+        flattened to their Item.
+        """
+        xml_request = self._my_ebay_selling_request(detail_level, page_number, entries_per_page, list_name)
+        envelope, records = await self._make_streaming_request(
+            "GetMyeBaySelling", xml_request, [SELLING_RECORD_PATHS[list_name]]
+        )
+
+        response = envelope.get("GetMyeBaySellingResponse") or {}
+        if response.get("Ack") not in ("Success", "Warning"): # Warning might still have data
+            return None, page_number
+
+        list_data_container = response.get(list_name) or {}
+        pagination_result = list_data_container.get("PaginationResult") or {}
+        total_pages = int(pagination_result.get("TotalNumberOfPages") or page_number)
+
+        if list_name != "SoldList":
+            return [record.data for record in records if record.data], total_pages
+        return [
+            item for item in (self._sold_item_from_transaction(record.data) for record in records) if item
+        ], total_pages
+
+    # GetMyeBaySelling limits: ActiveList allows 200 entries per page, Sold/Unsold 100
+    SELLING_LIST_PAGE_SIZES = {"ActiveList": 200, "SoldList": 100, "UnsoldList": 100}
+    SELLING_LIST_KEYS = {"ActiveList": "active", "SoldList": "sold", "UnsoldList": "unsold"}
+
+    @staticmethod
+    def _parse_selling_page(response_dict: Dict, list_type: str, current_page: int):
+        """
+        Pull the items and page count out of one GetMyeBaySelling response.
+
+        Returns (items, total_pages). items is None when eBay did not Ack the call;
+        total_pages falls back to current_page when the list or its pagination is missing.
+        """
+        get_mye_bay_selling_response = response_dict.get("GetMyeBaySellingResponse", {})
+        ack = get_mye_bay_selling_response.get("Ack")
+
+        if ack != "Success" and ack != "Warning": # Warning might still have data
+            return None, current_page
+
+        list_data_container = get_mye_bay_selling_response.get(list_type)
+        if not list_data_container: # list_data_container (e.g. ActiveList) itself is missing
+            return [], current_page
+
+        pagination_result = list_data_container.get("PaginationResult")
+        if pagination_result and "TotalNumberOfPages" in pagination_result:
+            total_pages = int(pagination_result["TotalNumberOfPages"])
+        else: # No more pages if PaginationResult or TotalNumberOfPages is missing
+            total_pages = current_page
+
+        items_key = "ItemArray" if list_type != "SoldList" else "OrderTransactionArray"
+        item_or_transaction_key = "Item" if list_type != "SoldList" else "OrderTransaction"
+
+        if items_key not in list_data_container or not list_data_container[items_key]:
+            # No items found for this list type on this page
+            return [], current_page
+
+        raw_items = list_data_container[items_key].get(item_or_transaction_key, [])
+        items_to_add = raw_items if isinstance(raw_items, list) else [raw_items]
+
+        if list_type != "SoldList":
+            return items_to_add, total_pages
+
+        # SoldList structure is OrderTransactionArray -> OrderTransaction -> Item
+        sold_items = []
+        for trans_item in items_to_add:
+            item = EbayTradingLegacyAPI._sold_item_from_transaction(trans_item)
+            if item:
+                sold_items.append(item)
+        return sold_items, total_pages
 
+    @staticmethod
+    def _sold_item_from_transaction(trans_item: Optional[Dict]) -> Optional[Dict]:
+        if trans_item and "Item" in trans_item:
+            return trans_item["Item"]
+        if trans_item and "Transaction" in trans_item and "Item" in trans_item["Transaction"]: # Another possible structure
+            return trans_item["Transaction"]["Item"]
+        return trans_item or None # If the item itself is the transaction data
+
+    async def get_all_selling_listings(
+        self,
+        include_active=True,
+        include_sold=True,
+        include_unsold=True,
+        include_details=False,
+        concurrent: bool = False,
+        max_concurrent: int = 5,
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch every page of the requested GetMyeBaySelling lists.
+
+        With concurrent=True page 1 of each list is fetched in parallel, then the
+        remaining pages (known from TotalNumberOfPages) are fanned out under a
+        shared semaphore of max_concurrent calls. ActiveList uses 200 entries per
+        page in that mode. Results keep eBay's page order either way. A page that
+        still fails after its retries raises EbayAPIError rather than leaving a
+        gap in the results.
+        """
         list_types_to_fetch = []
         if include_active: list_types_to_fetch.append("ActiveList")
         if include_sold: list_types_to_fetch.append("SoldList")
         if include_unsold: list_types_to_fetch.append("UnsoldList")
 
+        detail_level_val = "ReturnAll" if include_details else "ReturnSummary"
+
+        if concurrent:
+            return await self._get_all_selling_listings_concurrent(
+                list_types_to_fetch, detail_level_val, max_concurrent
+            )
+
+        all_listings_data = {"active": [], "sold": [], "unsold": []}
+        entries_per_page_val = 100 # Max for sold is 100, active is 200. Using 100 for simplicity.
+
         for list_type in list_types_to_fetch:
             current_page = 1
             total_pages = 1 # Start with 1, will be updated by response
-            # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - Starting fetch for ListType: {list_type}")
             
             while current_page <= total_pages:
-                # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - Fetching Page: {current_page}/{total_pages} for ListType: {list_type}")
                 try:
-                    response_dict = await self.get_my_ebay_selling(
-                        detail_level=detail_level_val,
+                    items, total_pages = await self.get_my_ebay_selling_page(
+                        list_name=list_type,
                         page_number=current_page,
                         entries_per_page=entries_per_page_val,
-                        list_name=list_type
-                    ) # This method now has its own debug prints
-
-                    get_mye_bay_selling_response = response_dict.get("GetMyeBaySellingResponse", {})
-                    ack = get_mye_bay_selling_response.get("Ack")
-                    # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - Ack for {list_type} Page {current_page}: {ack}")
-
-                    if ack == "Success" or ack == "Warning": # Warning might still have data
-                        list_data_container = get_mye_bay_selling_response.get(list_type)
-                        if list_data_container:
-                            # Update total_pages from PaginationResult if available
-                            pagination_result = list_data_container.get("PaginationResult")
-                            if pagination_result and "TotalNumberOfPages" in pagination_result:
-                                total_pages = int(pagination_result["TotalNumberOfPages"])
-                                # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - Updated TotalPages for {list_type} to: {total_pages} based on response.")
-                            else: # No more pages if PaginationResult or TotalNumberOfPages is missing
-                                total_pages = current_page 
-
-                            items_key = "ItemArray" if list_type != "SoldList" else "OrderTransactionArray"
-                            item_or_transaction_key = "Item" if list_type != "SoldList" else "OrderTransaction"
-                            
-                            if items_key in list_data_container and list_data_container[items_key]:
-                                raw_items = list_data_container[items_key].get(item_or_transaction_key, [])
-                                items_to_add = raw_items if isinstance(raw_items, list) else [raw_items]
-                                
-                                if list_type == "ActiveList":
-                                    all_listings_data["active"].extend(items_to_add)
-                                elif list_type == "UnsoldList":
-                                    all_listings_data["unsold"].extend(items_to_add)
-                                elif list_type == "SoldList": # SoldList structure is OrderTransactionArray -> OrderTransaction -> Item
-                                    for trans_item in items_to_add:
-                                        if trans_item and "Item" in trans_item:
-                                            all_listings_data["sold"].append(trans_item["Item"])
-                                        elif trans_item and "Transaction" in trans_item and "Item" in trans_item["Transaction"]: # Another possible structure
-                                             all_listings_data["sold"].append(trans_item["Transaction"]["Item"])
-                                        elif trans_item: # If the item itself is the transaction data
-                                            all_listings_data["sold"].append(trans_item)
-
-
-                                # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - Fetched {len(items_to_add)} items for {list_type} Page {current_page}. Total so far for {list_type}: {len(all_listings_data[list_type.replace('List','').lower()])}")
-                            else: # No items found for this list type on this page
-                                # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - No '{items_key}' or empty for {list_type} Page {current_page}. Assuming end of pages for this list.")
-                                total_pages = current_page # Stop pagination for this list type
-                        else: # list_data_container (e.g. ActiveList) itself is missing
-                            # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - List container '{list_type}' missing in response for Page {current_page}. Assuming end of pages.")
-                            total_pages = current_page # Stop pagination
-
-                    else: # Ack was not Success or Warning
-                        ebay_errors = get_mye_bay_selling_response.get("Errors", {})
-                        error_message = f"GetMyeBaySelling failed for {list_type} Page {current_page}. Ack: {ack}."
-                        # ... (error message construction as in get_user_info) ...
-                        # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - {error_message}")
-                        # Break from while loop for this list_type on error
-                        break 
-                    
+                        detail_level=detail_level_val,
+                    )
+                    if items is None:
+                        # Ack was not Success or Warning - break from while loop for this list_type on error
+                        break
+                    all_listings_data[self.SELLING_LIST_KEYS[list_type]].extend(items)
+
                     current_page += 1
                     if current_page > total_pages: # Safety break if total_pages wasn't updated correctly to a smaller number
                         print(f"EbayTradingLegacyAPI.get_all_selling_listings - Reached end of pagination for {list_type}. CurrentPage: {current_page}, TotalPages: {total_pages}")
 
                 except EbayAPIError as e_api_paginate:
-                    # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - EbayAPIError while paginating {list_type} on page {current_page}: {e_api_paginate}")
                     break # Stop paginating this list type on API error
                 except Exception as e_paginate:
-                    # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - Generic EXCEPTION while paginating {list_type} on page {current_page}: {e_paginate}")
                     break # Stop paginating this list type
 
-        # print(f"DEBUG: EbayTradingLegacyAPI.get_all_selling_listings - Finished fetching all lists. Total active: {len(all_listings_data['active'])}, sold: {len(all_listings_data['sold'])}, unsold: {len(all_listings_data['unsold'])}")
+        return all_listings_data
+
+    async def _get_all_selling_listings_concurrent(
+        self,
+        list_types: List[str],
+        detail_level: str,
+        max_concurrent: int,
+        max_attempts: int = 3,
+    ) -> Dict[str, List[Dict]]:
+        """Fan-out implementation behind get_all_selling_listings(concurrent=True)."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def fetch_page(list_type: str, page_number: int):
+            """Fetch and parse one page, retrying failed calls and non-Success Acks with backoff."""
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    async with semaphore:
+                        items, total_pages = await self.get_my_ebay_selling_page(
+                            list_name=list_type,
+                            page_number=page_number,
+                            entries_per_page=self.SELLING_LIST_PAGE_SIZES[list_type],
+                            detail_level=detail_level,
+                        )
+                    if items is not None:
+                        return items, total_pages
+                    logger.warning(
+                        "GetMyeBaySelling %s page %s not acknowledged (attempt %s/%s)",
+                        list_type, page_number, attempt, max_attempts,
+                    )
+                except Exception as e_page:
+                    logger.warning(
+                        "GetMyeBaySelling %s page %s failed (attempt %s/%s): %s",
+                        list_type, page_number, attempt, max_attempts, e_page,
+                    )
+                if attempt < max_attempts:
+                    await asyncio.sleep(attempt)
+
+            # A missing page would make every listing on it look removed to the
+            # sync, so the whole fetch fails instead of returning a partial list
+            logger.error("Giving up on GetMyeBaySelling %s page %s after %s attempts", list_type, page_number, max_attempts)
+            raise EbayAPIError(
+                f"GetMyeBaySelling {list_type} page {page_number} failed after {max_attempts} attempts"
+            )
+
+        async def gather_or_cancel(coros) -> List:
+            """gather() that cancels the sibling calls as soon as one of them fails."""
+            tasks = [asyncio.ensure_future(coro) for coro in coros]
+            try:
+                return await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        async def fetch_list(list_type: str) -> List[Dict]:
+            first_items, total_pages = await fetch_page(list_type, 1)
+            if total_pages <= 1:
+                return first_items
+
+            logger.info("GetMyeBaySelling %s: fetching pages 2-%s concurrently", list_type, total_pages)
+            remaining = await gather_or_cancel(
+                fetch_page(list_type, page) for page in range(2, total_pages + 1)
+            )
+            items = list(first_items)
+            for page_items, _ in remaining:
+                items.extend(page_items)
+            return items
+
+        results = await gather_or_cancel(fetch_list(list_type) for list_type in list_types)
+
+        all_listings_data = {"active": [], "sold": [], "unsold": []}
+        for list_type, items in zip(list_types, results):
+            all_listings_data[self.SELLING_LIST_KEYS[list_type]] = items
+            logger.info("GetMyeBaySelling %s: %s items", list_type, len(items))
         return all_listings_data
 
     async def get_orders(
@@ -612,12 +826,9 @@ class EbayTradingLegacyAPI:
           {time_filters}
         </GetOrdersRequest>"""
 
-        response = await self._make_request("GetOrders", xml_request)
-        payload = response.get("GetOrdersResponse") or {}
-        order_array = payload.get("OrderArray") or {}
-        orders = order_array.get("Order") or []
-        if isinstance(orders, dict):
-            orders = [orders]
+        envelope, records = await self._make_streaming_request("GetOrders", xml_request, [ORDER_RECORD_PATH])
+        payload = envelope.get("GetOrdersResponse") or {}
+        orders = [record.data for record in records if record.data]
 
         has_more = payload.get("HasMoreOrders", False)
         if isinstance(has_more, str):
@@ -1669,9 +1880,10 @@ class EbayTradingLegacyAPI:
 class EbayAccountAPI:
     """Class for eBay Account API (REST) operations."""
 
-    def __init__(self, sandbox: bool = False):
+    def __init__(self, sandbox: bool = False, http_client: Optional[httpx.AsyncClient] = None):
         self.auth_manager = EbayAuthManager(sandbox=sandbox)
         self.sandbox = sandbox
+        self._http_client = http_client
         self.endpoint = (
             "https://api.sandbox.ebay.com/sell/account/v1"
             if sandbox
@@ -1688,17 +1900,17 @@ class EbayAccountAPI:
             'Content-Type': 'application/json'
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.request(method, url, headers=headers, params=params)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logging.error(f"Account API Error: {e.response.status_code} - {e.response.text}")
-                raise EbayAPIError(f"Account API call failed: {e.response.text}")
-            except Exception as e:
-                logging.error(f"An unexpected error occurred: {e}")
-                raise EbayAPIError(str(e))
+        client = self._http_client or get_shared_http_client()
+        try:
+            response = await client.request(method, url, headers=headers, params=params, timeout=30.0)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logging.error(f"Account API Error: {e.response.status_code} - {e.response.text}")
+            raise EbayAPIError(f"Account API call failed: {e.response.text}")
+        except Exception as e:
+            logging.error(f"An unexpected error occurred: {e}")
+            raise EbayAPIError(str(e))
 
     async def get_business_policies(self) -> Dict[str, Any]:
         """
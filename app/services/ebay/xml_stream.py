@@ -0,0 +1,137 @@
+# app/services/ebay/xml_stream.py
+"""
+Incremental parsing of eBay Trading API XML responses.
+
+GetMyeBaySelling / GetOrders pages with DetailLevel=ReturnAll are large; parsing
+the whole body with xmltodict builds one nested dict for the page that callers
+then pick apart. TradingXMLStreamParser is fed the response bytes as they
+arrive and emits one record per repeated element (Item, OrderTransaction,
+Order), detaching each from the tree once converted so only the element being
+parsed and the small response envelope (Ack, Errors, PaginationResult, ...) are
+held in memory.
+
+Record payloads use the same dict shape as xmltodict (repeated tags become
+lists, attributes become '@name' with the text under '#text'), so existing
+mapping code such as EbayService._prepare_api_data works unchanged.
+"""
+
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# Paths are local tag names from the document root down to the record element
+SELLING_RECORD_PATHS = {
+    "ActiveList": ("GetMyeBaySellingResponse", "ActiveList", "ItemArray", "Item"),
+    "UnsoldList": ("GetMyeBaySellingResponse", "UnsoldList", "ItemArray", "Item"),
+    "SoldList": ("GetMyeBaySellingResponse", "SoldList", "OrderTransactionArray", "OrderTransaction"),
+}
+ORDER_RECORD_PATH = ("GetOrdersResponse", "OrderArray", "Order")
+
+
+@dataclass
+class TradingRecord:
+    """One repeated element from a Trading API response."""
+    path: Tuple[str, ...]
+    data: Dict[str, Any]
+
+    @property
+    def tag(self) -> str:
+        return self.path[-1]
+
+    @property
+    def list_name(self) -> Optional[str]:
+        """The GetMyeBaySelling list (ActiveList, SoldList, ...) the record came from, if any."""
+        return self.path[1] if len(self.path) > 2 else None
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1] if tag.startswith("{") else tag
+
+
+def element_to_dict(element: ET.Element) -> Any:
+    """Convert an element's content to the value xmltodict.parse would produce for it."""
+    result: Dict[str, Any] = {f"@{_local_name(key)}": value for key, value in element.attrib.items()}
+
+    for child in element:
+        key = _local_name(child.tag)
+        value = element_to_dict(child)
+        if key in result:
+            existing = result[key]
+            if isinstance(existing, list):
+                existing.append(value)
+            else:
+                result[key] = [existing, value]
+        else:
+            result[key] = value
+
+    text = (element.text or "").strip()
+    if not result:
+        return text or None
+    if text:
+        result["#text"] = text
+    return result
+
+
+class TradingXMLStreamParser:
+    """
+    Feed-driven parser that yields TradingRecords as soon as each one closes.
+
+    Usage:
+        parser = TradingXMLStreamParser([ORDER_RECORD_PATH])
+        async for chunk in response.aiter_bytes():
+            records.extend(parser.feed(chunk))
+        records.extend(parser.close())
+        envelope = parser.envelope()
+    """
+
+    def __init__(self, record_paths: Iterable[Tuple[str, ...]]):
+        self._record_paths = {tuple(path) for path in record_paths}
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: List[ET.Element] = []
+        self._path: List[str] = []
+        self._record_depth: Optional[int] = None
+        self._root: Optional[ET.Element] = None
+
+    def feed(self, data: bytes) -> List[TradingRecord]:
+        self._parser.feed(data)
+        return self._read_records()
+
+    def close(self) -> List[TradingRecord]:
+        self._parser.close()
+        return self._read_records()
+
+    def envelope(self) -> Dict[str, Any]:
+        """
+        The response with every record element removed, in xmltodict shape.
+
+        Record containers (e.g. ItemArray) are left in place but empty.
+        """
+        if self._root is None:
+            return {}
+        return {_local_name(self._root.tag): element_to_dict(self._root)}
+
+    def _read_records(self) -> List[TradingRecord]:
+        records = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._stack.append(element)
+                self._path.append(_local_name(element.tag))
+                if self._record_depth is None and tuple(self._path) in self._record_paths:
+                    self._record_depth = len(self._path)
+                continue
+
+            path = tuple(self._path)
+            self._stack.pop()
+            self._path.pop()
+
+            if len(path) == self._record_depth:
+                self._record_depth = None
+                records.append(TradingRecord(path=path, data=element_to_dict(element)))
+                # Detach the converted record so the tree never holds more than one
+                if self._stack:
+                    self._stack[-1].remove(element)
+                element.clear()
+            elif not self._stack:
+                self._root = element
+        return records
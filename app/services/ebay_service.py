@@ -11,17 +11,18 @@ from typing import Optional, Dict, List, Any, Tuple, Set, Sequence
 from datetime import datetime, timezone, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text, select, update, delete, func
-from sqlalchemy.dialects.postgresql import insert
 
 from app.models.ebay import EbayListing
 from app.models.product import Product, ProductCondition, ProductStatus
 from app.models.platform_common import PlatformCommon, ListingStatus, SyncStatus
-from app.models.sync_event import SyncEvent
 from app.core.config import Settings
 from app.core.exceptions import EbayAPIError
 from app.core.enums import ManufacturingCountry, PlatformName
 from app.services.ebay.trading import EbayTradingLegacyAPI
 from app.services.match_utils import suggest_product_match
+from app.services.sync_event_writer import bulk_insert_sync_events
+from app.services.snapshot_diff import SnapshotDiffSpec, calculate_changes_in_db, snapshot_diff_enabled
+from app.services.websockets.manager import publish_sync_progress
 from app.services.condition_mapping_service import ConditionMappingService
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,47 @@ ROSEWOOD_VARIANT_PATTERNS = [
     re.compile(r"\brio\s+rosewood\b", re.IGNORECASE),
 ]
 
+# Local eBay rows compared against the API snapshot (see sync_ebay_inventory)
+_EXISTING_EBAY_DATA_SQL = """
+    SELECT 
+        p.id                    AS product_id,
+        p.sku,
+        p.base_price,                        -- Canonical price
+        p.quantity              AS product_quantity,
+        p.is_stocked_item       AS product_is_stocked,
+        pc.id                   AS platform_common_id,
+        pc.external_id,
+        pc.status               AS platform_common_status,
+        pc.listing_url,
+        el.price                AS specialist_price,
+        el.quantity             AS listing_quantity,
+        el.quantity_available   AS listing_quantity_available
+    FROM platform_common pc
+    LEFT JOIN products p      ON p.id = pc.product_id
+    LEFT JOIN ebay_listings el ON pc.id = el.platform_id
+        AND UPPER(el.listing_status) = 'ACTIVE'
+    WHERE pc.platform_name = 'ebay'
+      AND pc.status NOT IN ('refreshed', 'deleted', 'removed')
+"""
+
+# SQL form of _calculate_changes / _has_changed, used when SYNC_SNAPSHOT_DIFF_IN_DB is on
+EBAY_SNAPSHOT_DIFF = SnapshotDiffSpec(
+    platform="ebay",
+    local_sql=_EXISTING_EBAY_DATA_SQL,
+    changed_sql="""
+        lower(COALESCE(s.status, '')) <> lower(COALESCE(l.platform_common_status, ''))
+        OR (COALESCE(s.listing_url, '') <> '' AND s.listing_url IS DISTINCT FROM l.listing_url)
+        OR (
+            s.quantity_available IS NOT NULL
+            AND COALESCE(l.listing_quantity_available, l.product_quantity) IS NOT NULL
+            AND s.quantity_available <> COALESCE(l.listing_quantity_available, l.product_quantity)
+        )
+        OR abs(COALESCE(s.price, 0) - COALESCE(NULLIF(l.specialist_price, 0), NULLIF(l.base_price, 0), 0)) > 0.01
+    """,
+    create_sql="s.status = 'active'",
+    remove_sql="l.platform_common_status = 'active'",
+)
+
 class EbayService:
     """
     Service for managing eBay listings and synchronization.
@@ -853,8 +895,9 @@ class EbayService:
 
         logger.info("Fetching all eBay listings (active, sold, unsold).")
         all_listings_from_api = await self.trading_api.get_all_selling_listings(
-            include_active=True, include_sold=True, include_unsold=True, include_details=True
-        )       
+            include_active=True, include_sold=True, include_unsold=True, include_details=True,
+            concurrent=True,
+        )
 
         # ====== DEBUGGING =======
         # logger.info("API Response structure:")
@@ -887,6 +930,10 @@ class EbayService:
             f"Total items fetched from API: {total_count} "
             f"(Active: {active_count}, Sold: {sold_count}, Unsold: {unsold_count})"
         )
+        publish_sync_progress(
+            "ebay", "fetch", sync_run_id, items_fetched=total_count,
+            active=active_count, sold=sold_count, unsold=unsold_count,
+        )
 
         # Run the differential sync logic
         sync_stats = await self.sync_ebay_inventory(flat_api_list, sync_run_id)
@@ -903,49 +950,63 @@ class EbayService:
         stats = {"total_from_ebay": len(ebay_api_items), "events_logged": 0, "created": 0, "updated": 0, "removed": 0, "unchanged": 0, "errors": 0}
         
         try:
-            # NEW: Fetch existing pending events first for duplicate checking
-            pending_events = await self._fetch_pending_events()
-            
-            # Step 1: Fetch all existing eBay data from our DB
-            existing_data = await self._fetch_existing_ebay_data()
+            if snapshot_diff_enabled(self.settings):
+                # Steps 1-3 in Postgres via a staging table; only changed rows come back
+                api_items = self._prepare_api_data(ebay_api_items)
+                changes = await calculate_changes_in_db(self.db, EBAY_SNAPSHOT_DIFF, api_items)
+            else:
+                # Step 1: Fetch all existing eBay data from our DB
+                existing_data = await self._fetch_existing_ebay_data()
             
-            # Step 2: Prepare data for comparison
-            api_items = self._prepare_api_data(ebay_api_items)
-            db_items = self._prepare_db_data(existing_data)
+                # Step 2: Prepare data for comparison
+                api_items = self._prepare_api_data(ebay_api_items)
+                db_items = self._prepare_db_data(existing_data)
             
-            # --- DEBUG BLOCK (demoted to debug level) ---
-            logger.debug("--- [DEBUG] DICTIONARY INSPECTION ---")
-            logger.debug(f"Total API items prepared: {len(api_items)}")
-            logger.debug(f"Total DB items prepared : {len(db_items)}")
-
-            # Print a few keys from each to check for type mismatches (e.g., str vs int)
-            if api_items:
-                logger.debug(f"Sample API keys: {list(api_items.keys())[:5]}")
-            if db_items:
-                logger.debug(f"Sample DB keys : {list(db_items.keys())[:5]}")
-
-            # Check for our specific test item in both dictionaries
-            test_id = '257056048177'
-            logger.debug(f"Test item '{test_id}' in api_items: {test_id in api_items}")
-            logger.debug(f"Test item '{test_id}' in db_items : {test_id in db_items}")
-            # --- END DEBUG BLOCK ---
-
-            # Step 3: Calculate differences
-            changes = self._calculate_changes(api_items, db_items)
+                # --- DEBUG BLOCK (demoted to debug level) ---
+                logger.debug("--- [DEBUG] DICTIONARY INSPECTION ---")
+                logger.debug(f"Total API items prepared: {len(api_items)}")
+                logger.debug(f"Total DB items prepared : {len(db_items)}")
+
+                # Print a few keys from each to check for type mismatches (e.g., str vs int)
+                if api_items:
+                    logger.debug(f"Sample API keys: {list(api_items.keys())[:5]}")
+                if db_items:
+                    logger.debug(f"Sample DB keys : {list(db_items.keys())[:5]}")
+
+                # Check for our specific test item in both dictionaries
+                test_id = '257056048177'
+                logger.debug(f"Test item '{test_id}' in api_items: {test_id in api_items}")
+                logger.debug(f"Test item '{test_id}' in db_items : {test_id in db_items}")
+                # --- END DEBUG BLOCK ---
+
+                # Step 3: Calculate differences
+                changes = self._calculate_changes(api_items, db_items)
             logger.info(f"Applying changes: {len(changes['create'])} new, {len(changes['update'])} updates, {len(changes['remove'])} removals")
+            publish_sync_progress(
+                "ebay", "diff", sync_run_id, items_diffed=len(api_items),
+                created=len(changes['create']), updated=len(changes['update']), removed=len(changes['remove']),
+            )
+
+            # Known events for create/remove candidates let us skip match suggestions and
+            # GetItem verification; update-event dedupe happens in the insert itself
+            pending_events = await self._fetch_pending_events(
+                [item['external_id'] for item in changes['create']]
+                + [item['external_id'] for item in changes['remove']]
+            )
 
             # Step 4: Apply changes and log events
             if changes['create']:
                 stats['created'], events_created = await self._batch_create_products(changes['create'], sync_run_id, pending_events)
                 stats['events_logged'] += events_created
             if changes['update']:
-                stats['updated'], events_updated = await self._batch_update_products(changes['update'], sync_run_id, pending_events)
+                stats['updated'], events_updated = await self._batch_update_products(changes['update'], sync_run_id)
                 stats['events_logged'] += events_updated
             if changes['remove']:
                 stats['removed'], events_removed = await self._batch_mark_removed(changes['remove'], sync_run_id, pending_events)
                 stats['events_logged'] += events_removed
 
             stats['unchanged'] = len(api_items) - stats['created'] - stats['updated']
+            publish_sync_progress("ebay", "events", sync_run_id, events_written=stats['events_logged'])
             await self.db.commit()
         except Exception as e:
             await self.db.rollback()
@@ -1094,18 +1155,21 @@ class EbayService:
     # =========================================================================
     # 4. BATCH PROCESSING / EVENT LOGGING (Called by differential sync)
     # =========================================================================
-    async def _fetch_pending_events(self) -> set:
-        """Fetches all sync events for eBay (pending, skipped, etc.) for quick lookups.
+    async def _fetch_pending_events(self, external_ids: List[str]) -> set:
+        """Fetches sync events for the given eBay items (pending, skipped, etc.) for quick lookups.
 
         This prevents duplicate events from being created for items that have already
         been seen and skipped/processed.
         """
+        if not external_ids:
+            return set()
         query = text("""
             SELECT external_id, change_type
             FROM sync_events
             WHERE platform_name = 'ebay'
+              AND external_id = ANY(:external_ids)
         """)
-        result = await self.db.execute(query)
+        result = await self.db.execute(query, {"external_ids": [str(external_id) for external_id in external_ids]})
         # Return a set of tuples for very fast checking, e.g., {('12345', 'status'), ('67890', 'price')}
         return {(row.external_id, row.change_type) for row in result.fetchall()}
     
@@ -1182,21 +1246,14 @@ class EbayService:
         # Bulk insert only the truly new events
         if events_to_log:
             try:
-                stmt = insert(SyncEvent).values(events_to_log)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending')
-                )
-                result = await self.db.execute(stmt)
-                events_logged = len(events_to_log)
-                logger.info(f"Attempted to log {len(events_to_log)} new listing events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, events_to_log, skip_seen=True)
             except Exception as e:
                 logger.error(f"Failed to bulk insert new listing events: {e}", exc_info=True)
         
         return created_count, events_logged 
 
-    async def _batch_update_products(self, items: List[Dict], sync_run_id: uuid.UUID, pending_events: set) -> Tuple[int, int]:
-        """SYNC PHASE: Only log changes to sync_events if no pending event already exists."""
+    async def _batch_update_products(self, items: List[Dict], sync_run_id: uuid.UUID) -> Tuple[int, int]:
+        """SYNC PHASE: Only log changes to sync_events if no event already exists for them."""
         updated_count, events_logged = 0, 0
         events_to_log = []
         
@@ -1213,27 +1270,26 @@ class EbayService:
                 db_specialist_price = db_data.get('specialist_price')
                 db_price_for_compare = float(db_specialist_price or db_data.get('base_price') or 0.0)
                 if is_active_listing and abs(api_data['price'] - db_price_for_compare) > 0.01:
-                    if (external_id, 'price') not in pending_events:
-                        recorded_price = (
-                            float(db_specialist_price)
-                            if db_specialist_price is not None
-                            else db_price_for_compare
-                        )
-                        events_to_log.append({
-                            'sync_run_id': sync_run_id,
-                            'platform_name': 'ebay',
-                            'product_id': db_data['product_id'],
-                            'platform_common_id': db_data['platform_common_id'],
-                            'external_id': external_id,
-                            'change_type': 'price',
-                            'change_data': {
-                                'old': recorded_price,
-                                'new': api_data['price'],
-                                'base_price': db_data.get('base_price'),
-                                'item_id': external_id,
-                            },
-                            'status': 'pending'
-                        })
+                    recorded_price = (
+                        float(db_specialist_price)
+                        if db_specialist_price is not None
+                        else db_price_for_compare
+                    )
+                    events_to_log.append({
+                        'sync_run_id': sync_run_id,
+                        'platform_name': 'ebay',
+                        'product_id': db_data['product_id'],
+                        'platform_common_id': db_data['platform_common_id'],
+                        'external_id': external_id,
+                        'change_type': 'price',
+                        'change_data': {
+                            'old': recorded_price,
+                            'new': api_data['price'],
+                            'base_price': db_data.get('base_price'),
+                            'item_id': external_id,
+                        },
+                        'status': 'pending'
+                    })
 
                 # Quantity change detection (primarily for stocked items)
                 api_quantity_available = api_data.get('quantity_available')
@@ -1244,39 +1300,37 @@ class EbayService:
                 is_stocked_item = bool(db_data.get('product_is_stocked'))
 
                 if is_stocked_item and is_active_listing and api_quantity_available is not None and db_quantity_available is not None and api_quantity_available != db_quantity_available:
-                    if (external_id, 'quantity_change') not in pending_events:
-                        events_to_log.append({
-                            'sync_run_id': sync_run_id,
-                            'platform_name': 'ebay',
-                            'product_id': db_data['product_id'],
-                            'platform_common_id': db_data['platform_common_id'],
-                            'external_id': external_id,
-                            'change_type': 'quantity_change',
-                            'change_data': {
-                                'old_quantity': db_quantity_available,
-                                'new_quantity': api_quantity_available,
-                                'total_quantity': api_data.get('quantity_total'),
-                                'quantity_sold': api_data.get('quantity_sold'),
-                                'is_stocked_item': is_stocked_item,
-                                'item_id': external_id
-                            },
-                            'status': 'pending'
-                        })
+                    events_to_log.append({
+                        'sync_run_id': sync_run_id,
+                        'platform_name': 'ebay',
+                        'product_id': db_data['product_id'],
+                        'platform_common_id': db_data['platform_common_id'],
+                        'external_id': external_id,
+                        'change_type': 'quantity_change',
+                        'change_data': {
+                            'old_quantity': db_quantity_available,
+                            'new_quantity': api_quantity_available,
+                            'total_quantity': api_data.get('quantity_total'),
+                            'quantity_sold': api_data.get('quantity_sold'),
+                            'is_stocked_item': is_stocked_item,
+                            'item_id': external_id
+                        },
+                        'status': 'pending'
+                    })
 
                 # Status change event check using the correct 'platform_common_status' key
                 if str(api_data.get('status', '')).lower() != str(db_data.get('platform_common_status', '')).lower():
-                    if (external_id, 'status_change') not in pending_events:
-                        is_sold_on_api = str(api_data.get('status', '')).lower() == 'sold'
-                        events_to_log.append({
-                            'sync_run_id': sync_run_id,
-                            'platform_name': 'ebay',
-                            'product_id': db_data['product_id'],
-                            'platform_common_id': db_data['platform_common_id'],
-                            'external_id': external_id,
-                            'change_type': 'status_change',
-                            'change_data': {'old': db_data.get('platform_common_status'), 'new': api_data.get('status'), 'item_id': external_id, 'is_sold': is_sold_on_api},
-                            'status': 'pending'
-                        })
+                    is_sold_on_api = str(api_data.get('status', '')).lower() == 'sold'
+                    events_to_log.append({
+                        'sync_run_id': sync_run_id,
+                        'platform_name': 'ebay',
+                        'product_id': db_data['product_id'],
+                        'platform_common_id': db_data['platform_common_id'],
+                        'external_id': external_id,
+                        'change_type': 'status_change',
+                        'change_data': {'old': db_data.get('platform_common_status'), 'new': api_data.get('status'), 'item_id': external_id, 'is_sold': is_sold_on_api},
+                        'status': 'pending'
+                    })
                 
                 raw_listing = api_data.get('_raw')
                 platform_common_id = db_data.get('platform_common_id')
@@ -1290,17 +1344,7 @@ class EbayService:
         # Bulk insert logic remains the same
         if events_to_log:
             try:
-                stmt = insert(SyncEvent).values(events_to_log)
-                # stmt = stmt.on_conflict_do_nothing(
-                #     constraint='sync_events_platform_external_change_unique'
-                # )
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending')
-                )
-                result = await self.db.execute(stmt)
-                events_logged = len(events_to_log)
-                logger.info(f"Attempted to log {len(events_to_log)} new update events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, events_to_log, skip_seen=True)
             except Exception as e:
                 logger.error(f"Failed to bulk insert update events: {e}", exc_info=True)
 
@@ -1711,14 +1755,7 @@ class EbayService:
         # Bulk insert only the truly new events
         if events_to_log:
             try:
-                stmt = insert(SyncEvent).values(events_to_log)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending')
-                )
-                result = await self.db.execute(stmt)
-                events_logged = len(events_to_log)
-                logger.info(f"Attempted to log {len(events_to_log)} new removal events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, events_to_log, skip_seen=True)
             except Exception as e:
                 logger.error(f"Failed to bulk insert removal events: {e}", exc_info=True)
         
@@ -2574,27 +2611,7 @@ class EbayService:
     # =========================================================================
     async def _fetch_existing_ebay_data(self) -> List[Dict]:
         """Fetches all eBay-related data from the local database."""
-        query = text("""
-            SELECT 
-                p.id                    AS product_id,
-                p.sku,
-                p.base_price,                        -- Canonical price
-                p.quantity              AS product_quantity,
-                p.is_stocked_item       AS product_is_stocked,
-                pc.id                   AS platform_common_id,
-                pc.external_id,
-                pc.status               AS platform_common_status,
-                pc.listing_url,
-                el.price                AS specialist_price,
-                el.quantity             AS listing_quantity,
-                el.quantity_available   AS listing_quantity_available
-            FROM platform_common pc
-            LEFT JOIN products p      ON p.id = pc.product_id
-            LEFT JOIN ebay_listings el ON pc.id = el.platform_id
-                AND UPPER(el.listing_status) = 'ACTIVE'
-            WHERE pc.platform_name = 'ebay'
-              AND pc.status NOT IN ('refreshed', 'deleted', 'removed')
-        """)
+        query = text(_EXISTING_EBAY_DATA_SQL)
         result = await self.db.execute(query)
         return [row._asdict() for row in result.fetchall()]
 
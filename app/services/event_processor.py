@@ -3,10 +3,12 @@ Event processor service that handles all types of sync events.
 This is the core logic extracted from scripts/process_sync_event.py
 to be reusable by both CLI and web UI.
 """
+import asyncio
 import logging
 import json as json_module
 import os
 import re
+import time
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -32,6 +34,7 @@ from app.services.shopify_service import ShopifyService
 from app.services.vr_service import VRService
 from app.core.config import get_settings
 from app.services.vr_job_queue import enqueue_vr_job
+from app.services.response_cache import invalidate_cache_tags
 
 logger = logging.getLogger(__name__)
 
@@ -1618,6 +1621,174 @@ async def reconcile_vr_listing_for_product(session: AsyncSession, product: Produ
         return False
 
 
+class BulkProcessingSummary:
+    """Outcome of process_sync_events_bulk"""
+    def __init__(self):
+        self.total: int = 0
+        self.partitions: int = 0
+        self.processed: List[int] = []
+        self.failed: List[int] = []
+        # Events left untouched because an earlier event for the same product failed
+        self.blocked: List[int] = []
+        self.results: Dict[int, EventProcessingResult] = {}
+        self.elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "partitions": self.partitions,
+            "processed": len(self.processed),
+            "failed": len(self.failed),
+            "blocked": len(self.blocked),
+            "failed_event_ids": self.failed,
+            "blocked_event_ids": self.blocked,
+            "errors": {
+                event_id: self.results[event_id].message
+                for event_id in self.failed
+                if event_id in self.results
+            },
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+        }
+
+
+def _partition_keys(event: SyncEvent) -> List[Any]:
+    """
+    The product and platform listing an event touches.
+
+    An unmatched new listing counts towards its suggested match_candidate
+    product, since processing it attaches the listing to that product.
+    """
+    keys: List[Any] = [("listing", event.platform_name, event.external_id)]
+    product_id = event.product_id
+    if not product_id and isinstance(event.change_data, dict):
+        candidate = event.change_data.get('match_candidate')
+        if isinstance(candidate, dict):
+            product_id = candidate.get('product_id')
+    if product_id:
+        keys.append(("product", int(product_id)))
+    return keys
+
+
+def partition_events_by_product(events: List[SyncEvent]) -> List[List[SyncEvent]]:
+    """
+    Group events that share a product or a platform listing, each group in
+    detection order (id breaks ties).
+    """
+    # Union-find over the keys, so a candidate match and a later event for the
+    # same product (or the same listing) always land in one partition
+    parent: Dict[Any, Any] = {}
+
+    def find(key):
+        parent.setdefault(key, key)
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    event_keys = [_partition_keys(event) for event in events]
+    for keys in event_keys:
+        root = find(keys[0])
+        for key in keys[1:]:
+            parent[find(key)] = root
+
+    partitions: Dict[Any, List[SyncEvent]] = {}
+    for event, keys in zip(events, event_keys):
+        partitions.setdefault(find(keys[0]), []).append(event)
+    min_time = datetime.min.replace(tzinfo=timezone.utc)
+    for group in partitions.values():
+        group.sort(key=lambda e: (_as_utc(e.detected_at) or min_time, e.id))
+    return list(partitions.values())
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+async def process_sync_events_bulk(
+    event_ids: List[int],
+    platforms: Optional[List[str]] = None,
+    sandbox: bool = False,
+    concurrency: Optional[int] = None,
+    session_factory=None,
+    stop_on_error: bool = True,
+) -> BulkProcessingSummary:
+    """
+    Process many sync events, running different products side by side.
+
+    Events are partitioned by product (an unmatched new listing by its
+    match_candidate product, else by its platform listing) and each partition
+    runs in order on one worker, so a product's new_listing is always handled
+    before its later status changes.
+    Each worker has its own session, since an AsyncSession can't be shared
+    across concurrent tasks. With stop_on_error, a failed event blocks the
+    rest of its partition; they stay pending for the next run.
+    """
+    summary = BulkProcessingSummary()
+    started = time.monotonic()
+
+    if session_factory is None:
+        from app.database import async_session
+        session_factory = async_session
+    if concurrency is None:
+        concurrency = get_settings().EVENT_PROCESSOR_BULK_CONCURRENCY
+
+    async with session_factory() as session:
+        stmt = select(SyncEvent).where(
+            SyncEvent.id.in_(event_ids),
+            SyncEvent.status.in_(['pending', 'error']),
+        )
+        events = list((await session.execute(stmt)).scalars().all())
+
+    partitions = partition_events_by_product(events)
+    summary.total = len(events)
+    summary.partitions = len(partitions)
+    logger.info(
+        f"Bulk processing {len(events)} sync events in {len(partitions)} partitions "
+        f"(concurrency={concurrency})"
+    )
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for partition in partitions:
+        queue.put_nowait([event.id for event in partition])
+
+    async def worker() -> None:
+        async with session_factory() as worker_session:
+            while True:
+                try:
+                    partition_ids = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                for index, event_id in enumerate(partition_ids):
+                    result = await process_sync_event(worker_session, event_id, platforms, sandbox)
+                    summary.results[event_id] = result
+                    if result.success:
+                        summary.processed.append(event_id)
+                        continue
+                    # Drop anything the failed handler left uncommitted before the next event
+                    await worker_session.rollback()
+                    summary.failed.append(event_id)
+                    if stop_on_error:
+                        summary.blocked.extend(partition_ids[index + 1:])
+                        break
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(partitions))))))
+
+    if summary.processed or summary.failed:
+        # Pending-sync counts and product responses are stale now, here and in other processes
+        async with session_factory() as session:
+            await invalidate_cache_tags("sync_events", "products", db=session)
+            await session.commit()
+
+    summary.elapsed_seconds = time.monotonic() - started
+    logger.info(
+        f"Bulk processing finished in {summary.elapsed_seconds:.1f}s: "
+        f"{len(summary.processed)} processed, {len(summary.failed)} failed, {len(summary.blocked)} blocked"
+    )
+    return summary
+
+
 class EventProcessor:
     """Event processor class that wraps the standalone function for compatibility"""
     def __init__(self, session: AsyncSession, dry_run: bool = False):
@@ -1633,3 +1804,12 @@ class EventProcessor:
             platforms=None,  # Process all platforms
             sandbox=self.dry_run
         )
+
+    async def process_sync_events(self, events: List[SyncEvent], concurrency: Optional[int] = None) -> BulkProcessingSummary:
+        """Process many events concurrently per product (see process_sync_events_bulk)"""
+        return await process_sync_events_bulk(
+            [event.id for event in events],
+            platforms=None,
+            sandbox=self.dry_run,
+            concurrency=concurrency,
+        )
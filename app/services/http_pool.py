@@ -0,0 +1,131 @@
+# app/services/http_pool.py
+"""
+Process-wide pooled httpx transports, one per platform API.
+
+Platform API classes are constructed freely (per request, per job), so each
+platform's keep-alive pool lives at module level in a SharedHttpPool and is
+closed once from the FastAPI lifespan / scheduler exit. Limits come from the
+<PREFIX>_HTTP_* settings (e.g. EBAY_HTTP_MAX_CONNECTIONS).
+
+httpx clients are bound to the event loop they first ran on, so a new pool is
+created when used from a different loop (e.g. a script that calls
+asyncio.run() more than once) and the old one is closed.
+"""
+
+import asyncio
+import logging
+from typing import Optional, Set
+
+import httpx
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (pip install httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception as e:
+        # Connections opened on a loop that has since closed can't shut down cleanly
+        logger.debug(f"Error closing stale HTTP connection pool: {e}")
+
+
+class SharedHttpPool:
+    """A lazily created, per-event-loop AsyncClient configured from <prefix>_HTTP_* settings."""
+
+    def __init__(self, name: str, settings_prefix: str):
+        self.name = name
+        self.settings_prefix = settings_prefix
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set[asyncio.Task] = set()  # close tasks for pools left by an earlier loop
+
+    def build(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        timeout: float = 30.0,
+    ) -> httpx.AsyncClient:
+        """
+        Build a keep-alive, connection-pooled AsyncClient.
+
+        Unspecified limits fall back to the <prefix>_HTTP_* settings; HTTP/2 is
+        off unless <prefix>_HTTP2 is set and `h2` is installed.
+        """
+        settings = get_settings()
+        prefix = self.settings_prefix
+        if max_connections is None:
+            max_connections = getattr(settings, f"{prefix}_HTTP_MAX_CONNECTIONS")
+        if max_keepalive_connections is None:
+            max_keepalive_connections = getattr(settings, f"{prefix}_HTTP_MAX_KEEPALIVE")
+        if keepalive_expiry is None:
+            keepalive_expiry = getattr(settings, f"{prefix}_HTTP_KEEPALIVE_EXPIRY")
+        if http2 is None:
+            http2 = getattr(settings, f"{prefix}_HTTP2", False)
+
+        if http2 and not _http2_available():
+            logger.warning(f"{prefix}_HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1")
+            http2 = False
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        return httpx.AsyncClient(limits=limits, http2=http2, timeout=timeout)
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the pooled client for the running loop, creating it on first use."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None:
+                self._close_stale(self._client, self._loop, loop)
+            self._client = self.build()
+            self._loop = loop
+            logger.info(f"Created shared {self.name} HTTP connection pool")
+
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pool. Safe to call when no pool was ever created."""
+        client, self._client = self._client, None
+        self._loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+            logger.info(f"Closed shared {self.name} HTTP connection pool")
+
+    def _close_stale(
+        self,
+        client: httpx.AsyncClient,
+        client_loop: Optional[asyncio.AbstractEventLoop],
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        """Close a pool created on another event loop instead of leaking its connections."""
+        if client.is_closed:
+            return
+        if client_loop is not None and client_loop.is_running() and not client_loop.is_closed():
+            # Its loop is still alive in another thread: close it there
+            asyncio.run_coroutine_threadsafe(_aclose_quietly(client), client_loop)
+        elif loop is not None:
+            task = loop.create_task(_aclose_quietly(client))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        else:
+            asyncio.run(_aclose_quietly(client))
+        logger.info(f"Closing {self.name} HTTP connection pool from a previous event loop")
@@ -0,0 +1,249 @@
+"""
+Paging and counts for the inventory list (GET /inventory/).
+
+Pages are fetched by keyset: the "Next"/"Previous" links carry an opaque
+cursor holding the sort value and id of the last (or first) row shown, and
+the next page is the rows after it in (sort column, id) order. Deep pages
+cost the same as the first one. A bare ?page=N (no cursor) still works via
+OFFSET.
+
+The filtered total and the dropdown facet counts (categories, brands,
+statuses across the whole catalogue) are kept in inventory_count_cache,
+keyed by a hash of the active filters, and recomputed once they are older
+than INVENTORY_COUNTS_CACHE_SECONDS. Totals can therefore lag the list by
+up to that long.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import desc, func, literal_column, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.core.config import get_settings
+from app.core.enums import ProductStatus
+from app.models.product import Product
+
+logger = logging.getLogger(__name__)
+
+# Facet rows are catalogue-wide, so they share one cache key
+FACETS_KEY = "all"
+
+DEFAULT_SORT = "created_at"
+
+# NULLs are folded into a comparable value so a (sort value, id) row
+# comparison can seek straight through the matching index. The fallbacks are
+# literals, not bind parameters, so the expressions match the indexes in
+# alembic revision inventory_keyset.
+SORT_COLUMNS = {
+    "created_at": Product.created_at,
+    "brand": func.coalesce(Product.brand, literal_column("''")),
+    "model": func.coalesce(Product.model, literal_column("''")),
+    "category": func.coalesce(Product.category, literal_column("''")),
+    "price": func.coalesce(Product.base_price, literal_column("0")),
+    "status": Product.status,
+}
+
+_SORT_VALUES = {
+    "created_at": lambda product: product.created_at,
+    "brand": lambda product: product.brand or "",
+    "model": lambda product: product.model or "",
+    "category": lambda product: product.category or "",
+    "price": lambda product: product.base_price or 0,
+    "status": lambda product: product.status,
+}
+
+_READ_CACHE_SQL = """
+    SELECT filter_key, facet, value, count, refreshed_at
+    FROM inventory_count_cache
+    WHERE filter_key = ANY(:keys)
+"""
+
+_STORE_CACHE_SQL = """
+    INSERT INTO inventory_count_cache (filter_key, facet, value, count, refreshed_at)
+    SELECT r.filter_key, r.facet, r.value, r.count, :refreshed_at
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r(
+        filter_key text,
+        facet text,
+        value text,
+        count integer
+    )
+    ON CONFLICT (filter_key, facet, value) DO UPDATE
+    SET count = EXCLUDED.count, refreshed_at = EXCLUDED.refreshed_at
+"""
+
+
+class InvalidCursor(ValueError):
+    """A ?after=/?before= token that doesn't decode for the current sort."""
+
+
+# --- Sorting and cursors ------------------------------------------------------
+
+def resolve_page_size(per_page: Union[int, str]) -> Tuple[Union[int, str], int]:
+    """(per_page as shown in the UI, rows to fetch); "all" means INVENTORY_MAX_PAGE_SIZE."""
+    max_page_size = get_settings().INVENTORY_MAX_PAGE_SIZE
+    if per_page == "all":
+        return per_page, max_page_size
+    try:
+        per_page = int(per_page)
+    except (ValueError, TypeError):
+        per_page = 100  # Default to 100 if conversion fails
+    if per_page <= 0:
+        per_page = 100
+    return per_page, min(per_page, max_page_size)
+
+
+def resolve_sort(sort: Optional[str], order: Optional[str]) -> Tuple[str, bool]:
+    """(sort key, descending) for the list's sort/order query params; newest first by default."""
+    if sort in SORT_COLUMNS and sort != DEFAULT_SORT:
+        return sort, order == "desc"
+    return DEFAULT_SORT, True
+
+
+def encode_cursor(product: Product, sort_key: str) -> str:
+    value = _SORT_VALUES[sort_key](product)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, ProductStatus):
+        value = value.value
+    payload = json.dumps([value, product.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort_key: str) -> Tuple[Any, int]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if sort_key == "created_at":
+            value = datetime.fromisoformat(value)
+        elif sort_key == "status":
+            value = ProductStatus(value)
+        elif sort_key == "price":
+            value = float(value)
+        else:
+            value = str(value)
+        return value, int(row_id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor(token) from exc
+
+
+def apply_keyset(
+    query: Select,
+    sort_key: str,
+    descending: bool,
+    cursor: Optional[Tuple[Any, int]] = None,
+    backwards: bool = False,
+) -> Select:
+    """
+    Order query by (sort column, id) and, given a cursor, keep only the rows
+    after it. backwards=True walks the other way (the "Previous" link); the
+    caller reverses the fetched rows back into display order.
+    """
+    column = SORT_COLUMNS[sort_key]
+    walk_desc = descending != backwards
+    key = tuple_(column, Product.id)
+    if cursor is not None:
+        value, row_id = cursor
+        query = query.where(key < tuple_(value, row_id) if walk_desc else key > tuple_(value, row_id))
+    if walk_desc:
+        return query.order_by(desc(column), desc(Product.id))
+    return query.order_by(column, Product.id)
+
+
+# --- Cached counts --------------------------------------------------------------
+
+def filter_cache_key(**filters: Any) -> str:
+    """Stable key for a combination of list filters (None/empty filters ignored)."""
+    active = {name: str(value) for name, value in filters.items() if value}
+    return hashlib.sha1(json.dumps(active, sort_keys=True).encode()).hexdigest()
+
+
+async def _compute_facets(db: AsyncSession) -> List[Dict[str, Any]]:
+    rows = [{"filter_key": FACETS_KEY, "facet": "products", "value": "", "count": 0}]
+    for facet, column in (("category", Product.category), ("brand", Product.brand), ("status", Product.status)):
+        result = await db.execute(
+            select(column, func.count(Product.id)).filter(column.isnot(None)).group_by(column)
+        )
+        for value, count in result.all():
+            if not value:
+                continue
+            if isinstance(value, ProductStatus):
+                value = value.value
+            rows.append({"filter_key": FACETS_KEY, "facet": facet, "value": value, "count": count})
+            if facet == "status":
+                rows[0]["count"] += count
+    return rows
+
+
+async def _store(db: AsyncSession, keys: List[str], rows: List[Dict[str, Any]], expired_before: datetime) -> None:
+    # Replace the recomputed keys and prune entries nobody has asked for lately
+    # (one-off searches), so the table stays small
+    await db.execute(
+        text("DELETE FROM inventory_count_cache WHERE filter_key = ANY(:keys) OR refreshed_at < :expired_before"),
+        {"keys": keys, "expired_before": expired_before},
+    )
+    await db.execute(
+        text(_STORE_CACHE_SQL),
+        {"rows": json.dumps(rows), "refreshed_at": datetime.now(timezone.utc).replace(tzinfo=None)},
+    )
+    await db.commit()
+
+
+async def get_inventory_counts(db: AsyncSession, filter_key: str, filtered_query: Select) -> Dict[str, Any]:
+    """
+    Filtered total plus the catalogue-wide facet counts, from
+    inventory_count_cache where fresh enough, otherwise recomputed and stored.
+
+    Returns {"total", "categories", "brands", "status_counts"}; categories are
+    (name, count) pairs most common first, brands (name, count) alphabetical.
+    """
+    ttl = timedelta(seconds=get_settings().INVENTORY_COUNTS_CACHE_SECONDS)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    fresh_after = now - ttl
+
+    total: Optional[int] = None
+    facets: List[Dict[str, Any]] = []
+    try:
+        result = await db.execute(text(_READ_CACHE_SQL), {"keys": [filter_key, FACETS_KEY]})
+        for row in result.fetchall():
+            if row.refreshed_at < fresh_after:
+                continue
+            if row.filter_key == filter_key and row.facet == "total":
+                total = row.count
+            elif row.filter_key == FACETS_KEY:
+                facets.append({"facet": row.facet, "value": row.value, "count": row.count})
+    except Exception as exc:  # noqa: BLE001 - fall back to counting live
+        logger.warning("Inventory count cache unavailable: %s", exc)
+        await db.rollback()
+
+    stale_keys: List[str] = []
+    new_rows: List[Dict[str, Any]] = []
+    if total is None:
+        count_result = await db.execute(select(func.count()).select_from(filtered_query.subquery()))
+        total = count_result.scalar_one()
+        stale_keys.append(filter_key)
+        new_rows.append({"filter_key": filter_key, "facet": "total", "value": "", "count": total})
+    if not any(facet["facet"] == "products" for facet in facets):
+        facets = await _compute_facets(db)
+        stale_keys.append(FACETS_KEY)
+        new_rows.extend(facets)
+
+    if new_rows:
+        try:
+            await _store(db, stale_keys, new_rows, expired_before=now - 10 * ttl)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not update inventory count cache: %s", exc)
+            await db.rollback()
+
+    categories = sorted(
+        ((f["value"], f["count"]) for f in facets if f["facet"] == "category"),
+        key=lambda item: (-item[1], item[0]),
+    )
+    brands = sorted((f["value"], f["count"]) for f in facets if f["facet"] == "brand")
+    status_counts = {f["value"].lower(): f["count"] for f in facets if f["facet"] == "status"}
+    return {"total": total, "categories": categories, "brands": brands, "status_counts": status_counts}
@@ -0,0 +1,276 @@
+"""
+Interval job runner used by scripts/run_sync_scheduler.py.
+
+Due jobs are started as independent tasks, bounded by a global limit and a
+per-platform limit, so a slow V&R sync no longer holds up the hourly order
+fetches. Priority jobs (the order fetches) have slots reserved for them in
+both limits, so a backlog of long syncs cannot starve them. A job that is still running when it next falls due is either
+skipped or coalesced into a single follow-up run. The runner sleeps until the
+earliest next_run instead of polling, and keeps per-job duration/lag metrics
+that are logged on completion and in the heartbeat.
+"""
+
+import asyncio
+import logging
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.database import async_session
+
+logger = logging.getLogger(__name__)
+
+OVERLAP_SKIP = "skip"
+OVERLAP_COALESCE = "coalesce"
+
+
+@dataclass
+class JobMetrics:
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    coalesced: int = 0
+    last_started_at: Optional[datetime] = None
+    last_duration_seconds: Optional[float] = None
+    last_lag_seconds: Optional[float] = None
+    max_lag_seconds: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "coalesced": self.coalesced,
+            "last_duration_s": round(self.last_duration_seconds, 1) if self.last_duration_seconds is not None else None,
+            "last_lag_s": round(self.last_lag_seconds, 1) if self.last_lag_seconds is not None else None,
+            "max_lag_s": round(self.max_lag_seconds, 1),
+        }
+
+
+class SlotPool:
+    """
+    Counting limit with slots held back for priority jobs.
+
+    Ordinary jobs may only take limit - reserved slots; priority jobs may
+    take any of them. Waiters are woken whenever a slot is released.
+    """
+
+    def __init__(self, limit: int, reserved: int = 0):
+        self.limit = max(1, limit)
+        # Always leave ordinary jobs at least one slot
+        self.reserved = max(0, min(reserved, self.limit - 1))
+        self.in_use = 0
+        self._changed = asyncio.Condition()
+
+    async def acquire(self, priority: bool = False) -> None:
+        limit = self.limit if priority else self.limit - self.reserved
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.in_use < limit)
+            self.in_use += 1
+
+    async def release(self) -> None:
+        async with self._changed:
+            self.in_use -= 1
+            self._changed.notify_all()
+
+
+class ScheduledJob:
+    def __init__(
+        self,
+        name: str,
+        interval_minutes: int,
+        coro: Callable[..., Awaitable[Any]],
+        platform: Optional[str] = None,
+        overlap: str = OVERLAP_SKIP,
+        priority: bool = False,
+    ):
+        if overlap not in (OVERLAP_SKIP, OVERLAP_COALESCE):
+            raise ValueError(f"Unknown overlap policy: {overlap}")
+        self.name = name
+        self.interval = timedelta(minutes=interval_minutes)
+        self.coro = coro
+        self.platform = platform
+        self.overlap = overlap
+        self.priority = priority
+        self.next_run = self._compute_next_run(datetime.now(timezone.utc))
+        self.task: Optional[asyncio.Task] = None
+        self.rerun_pending = False
+        self.metrics = JobMetrics()
+
+    def _compute_next_run(self, reference: datetime) -> datetime:
+        """
+        Align the next run to the next interval boundary after `reference`.
+        """
+        interval_seconds = self.interval.total_seconds()
+        reference_ts = reference.timestamp()
+        next_ts = math.ceil(reference_ts / interval_seconds) * interval_seconds
+        next_run = datetime.fromtimestamp(next_ts, tz=timezone.utc)
+        if next_run <= reference:
+            next_run = reference + self.interval
+        return next_run
+
+    @property
+    def is_running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def update_next_run(self, now: Optional[datetime] = None):
+        """Advance by one interval, jumping to the next boundary if several were missed."""
+        self.next_run = self.next_run + self.interval
+        if now is not None and self.next_run <= now:
+            self.next_run = self._compute_next_run(now)
+
+
+class JobRunner:
+    """
+    Runs ScheduledJobs concurrently.
+
+    Each run gets its own session from session_factory, as with the old
+    serial loop. Jobs with the same platform share a pool of max_per_platform
+    slots; every job shares the global max_concurrent slots. The platform slot
+    is taken first, so a job waiting on its platform does not hold a global
+    slot that another platform could use. reserved_slots of each pool are
+    only available to priority jobs.
+    """
+
+    def __init__(
+        self,
+        jobs: List[ScheduledJob],
+        settings,
+        session_factory=async_session,
+        max_concurrent: Optional[int] = None,
+        max_per_platform: Optional[int] = None,
+        reserved_slots: Optional[int] = None,
+    ):
+        self.jobs = jobs
+        self.settings = settings
+        self.session_factory = session_factory
+        self.max_concurrent = max_concurrent or settings.SCHEDULER_MAX_CONCURRENT_JOBS
+        self.max_per_platform = max_per_platform or settings.SCHEDULER_MAX_JOBS_PER_PLATFORM
+        self.reserved_slots = (
+            reserved_slots if reserved_slots is not None else settings.SCHEDULER_RESERVED_PRIORITY_SLOTS
+        )
+        self._global_slots = SlotPool(self.max_concurrent, self.reserved_slots)
+        self._platform_slots: Dict[str, SlotPool] = {}
+
+    def _platform_pool(self, platform: str) -> SlotPool:
+        pool = self._platform_slots.get(platform)
+        if pool is None:
+            pool = SlotPool(self.max_per_platform, self.reserved_slots)
+            self._platform_slots[platform] = pool
+        return pool
+
+    def dispatch_due(self, now: Optional[datetime] = None) -> List[asyncio.Task]:
+        """Start every job whose next_run has passed; returns the tasks started."""
+        now = now or datetime.now(timezone.utc)
+        started = []
+        for job in self.jobs:
+            if job.next_run > now:
+                continue
+            scheduled_for = job.next_run
+            job.update_next_run(now)
+
+            if job.is_running:
+                if job.overlap == OVERLAP_COALESCE and not job.rerun_pending:
+                    job.rerun_pending = True
+                    job.metrics.coalesced += 1
+                    logger.info("Job %s still running; queued one follow-up run", job.name)
+                else:
+                    job.metrics.skipped += 1
+                    logger.warning("Job %s still running; skipped run due at %s", job.name, scheduled_for.isoformat())
+                continue
+
+            started.append(self._start(job, scheduled_for))
+        return started
+
+    def _start(self, job: ScheduledJob, scheduled_for: datetime) -> asyncio.Task:
+        job.task = asyncio.create_task(self._run(job, scheduled_for), name=f"scheduler:{job.name}")
+        return job.task
+
+    async def _run(self, job: ScheduledJob, scheduled_for: datetime) -> None:
+        pools = [self._global_slots]
+        if job.platform:
+            pools.insert(0, self._platform_pool(job.platform))
+        acquired: List[SlotPool] = []
+        try:
+            try:
+                for pool in pools:
+                    await pool.acquire(job.priority)
+                    acquired.append(pool)
+                await self._execute(job, scheduled_for)
+            finally:
+                for pool in reversed(acquired):
+                    await pool.release()
+        except asyncio.CancelledError:
+            job.rerun_pending = False
+            raise
+
+        if job.rerun_pending:
+            job.rerun_pending = False
+            # The follow-up becomes job.task, so later due times see it as running
+            self._start(job, datetime.now(timezone.utc))
+
+    async def _execute(self, job: ScheduledJob, scheduled_for: datetime) -> None:
+        sync_run_id = uuid.uuid4()
+        started_at = datetime.now(timezone.utc)
+        lag = max(0.0, (started_at - scheduled_for).total_seconds())
+        metrics = job.metrics
+        metrics.runs += 1
+        metrics.last_started_at = started_at
+        metrics.last_lag_seconds = lag
+        metrics.max_lag_seconds = max(metrics.max_lag_seconds, lag)
+
+        logger.info("Starting job=%s sync_run_id=%s lag=%.1fs", job.name, sync_run_id, lag)
+        start = time.monotonic()
+        try:
+            async with self.session_factory() as db:
+                await job.coro(db=db, settings=self.settings, sync_run_id=sync_run_id)
+            metrics.last_duration_seconds = time.monotonic() - start
+            logger.info(
+                "Completed job=%s sync_run_id=%s duration=%.1fs",
+                job.name, sync_run_id, metrics.last_duration_seconds,
+            )
+        except Exception as exc:  # noqa: BLE001
+            metrics.last_duration_seconds = time.monotonic() - start
+            metrics.failures += 1
+            logger.warning("Job %s failed: %s", job.name, exc, exc_info=True)
+
+    def seconds_until_next_due(self, now: Optional[datetime] = None) -> float:
+        now = now or datetime.now(timezone.utc)
+        next_due = min(job.next_run for job in self.jobs)
+        return max(0.0, (next_due - now).total_seconds())
+
+    def metrics_summary(self) -> Dict[str, Dict[str, Any]]:
+        return {job.name: job.metrics.summary() for job in self.jobs}
+
+    async def run_forever(self, heartbeat_interval: timedelta = timedelta(minutes=60)) -> None:
+        next_heartbeat = datetime.now(timezone.utc) + heartbeat_interval
+        try:
+            while True:
+                self.dispatch_due()
+
+                now = datetime.now(timezone.utc)
+                if now >= next_heartbeat:
+                    schedule = {job.name: job.next_run.isoformat() for job in self.jobs}
+                    logger.info("Scheduler heartbeat; next runs: %s", schedule)
+                    logger.info("Scheduler job metrics: %s", self.metrics_summary())
+                    next_heartbeat = now + heartbeat_interval
+
+                # Sleep exactly until the next job (or heartbeat) is due
+                wait = min(
+                    self.seconds_until_next_due(now),
+                    max(0.0, (next_heartbeat - now).total_seconds()),
+                )
+                await asyncio.sleep(wait)
+        finally:
+            await self.shutdown()
+
+    async def shutdown(self) -> None:
+        """Cancel in-flight jobs and wait for them to unwind."""
+        tasks = [job.task for job in self.jobs if job.is_running]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -48,72 +48,76 @@ class ListingStatsService:
 
         client = ReverbClient(api_key=api_key)
 
-        # Fetch all live listings with full details (includes stats)
-        try:
-            listings = await client.get_all_listings_detailed(state="live", max_concurrent=10)
-            logger.info(f"Fetched {len(listings)} live listings from Reverb")
-        except Exception as e:
-            logger.error(f"Failed to fetch Reverb listings: {e}")
-            return {"status": "error", "message": str(e)}
-
-        if not listings:
-            logger.info("No live listings found on Reverb")
-            return {"status": "success", "listings_processed": 0, "message": "No live listings"}
-
         # Build a mapping of reverb_listing_id -> product_id for easier lookups
         product_id_map = await self._get_reverb_product_id_map()
 
+        listings_fetched = 0
         stats_inserted = 0
         listings_updated = 0
         errors = []
 
-        for listing in listings:
-            try:
-                listing_id = str(listing.get('id', ''))
-                if not listing_id:
-                    continue
-
-                # Extract stats
-                stats = listing.get('stats', {})
-                view_count = self._safe_int(stats.get('views'))
-                watch_count = self._safe_int(stats.get('watches'))
-
-                # Extract price
-                price = self._extract_price(listing)
-
-                # Extract state
-                state_data = listing.get('state', {})
-                state = state_data.get('slug') if isinstance(state_data, dict) else str(state_data)
-
-                # Get product_id if we have it
-                product_id = product_id_map.get(listing_id)
-
-                if not dry_run:
-                    # 1. Insert historical snapshot
-                    history_entry = ListingStatsHistory(
-                        platform="reverb",
-                        platform_listing_id=listing_id,
-                        product_id=product_id,
-                        view_count=view_count,
-                        watch_count=watch_count,
-                        price=price,
-                        state=state,
-                        recorded_at=datetime.now(timezone.utc).replace(tzinfo=None),
-                    )
-                    self.db.add(history_entry)
-                    stats_inserted += 1
-
-                    # 2. Update current stats in reverb_listings
-                    updated = await self._update_reverb_listing_stats(
-                        listing_id, view_count, watch_count
-                    )
-                    if updated:
-                        listings_updated += 1
-
-            except Exception as e:
-                error_msg = f"Error processing listing {listing.get('id')}: {e}"
-                logger.warning(error_msg)
-                errors.append(error_msg)
+        # Listings are processed as their details arrive (see
+        # ReverbClient.iter_all_listings_detailed), so the full catalogue is
+        # never held in memory; detail fetches continue while we write
+        try:
+            async for listing in client.iter_all_listings_detailed(state="live", max_concurrent=10):
+                listings_fetched += 1
+                try:
+                    listing_id = str(listing.get('id', ''))
+                    if not listing_id:
+                        continue
+
+                    # Extract stats
+                    stats = listing.get('stats', {})
+                    view_count = self._safe_int(stats.get('views'))
+                    watch_count = self._safe_int(stats.get('watches'))
+
+                    # Extract price
+                    price = self._extract_price(listing)
+
+                    # Extract state
+                    state_data = listing.get('state', {})
+                    state = state_data.get('slug') if isinstance(state_data, dict) else str(state_data)
+
+                    # Get product_id if we have it
+                    product_id = product_id_map.get(listing_id)
+
+                    if not dry_run:
+                        # 1. Insert historical snapshot
+                        history_entry = ListingStatsHistory(
+                            platform="reverb",
+                            platform_listing_id=listing_id,
+                            product_id=product_id,
+                            view_count=view_count,
+                            watch_count=watch_count,
+                            price=price,
+                            state=state,
+                            recorded_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                        )
+                        self.db.add(history_entry)
+                        stats_inserted += 1
+
+                        # 2. Update current stats in reverb_listings
+                        updated = await self._update_reverb_listing_stats(
+                            listing_id, view_count, watch_count
+                        )
+                        if updated:
+                            listings_updated += 1
+
+                except Exception as e:
+                    error_msg = f"Error processing listing {listing.get('id')}: {e}"
+                    logger.warning(error_msg)
+                    errors.append(error_msg)
+        except Exception as e:
+            logger.error(f"Failed to fetch Reverb listings: {e}")
+            if not dry_run:
+                await self.db.rollback()
+            return {"status": "error", "message": str(e)}
+
+        logger.info(f"Fetched {listings_fetched} live listings from Reverb")
+        if not listings_fetched:
+            logger.info("No live listings found on Reverb")
+            return {"status": "success", "listings_processed": 0, "message": "No live listings"}
 
         if not dry_run:
             await self.db.commit()
@@ -121,7 +125,7 @@ class ListingStatsService:
         summary = {
             "status": "success",
             "platform": "reverb",
-            "listings_fetched": len(listings),
+            "listings_fetched": listings_fetched,
             "stats_snapshots_inserted": stats_inserted,
             "listings_updated": listings_updated,
             "errors": len(errors),
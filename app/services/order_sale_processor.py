@@ -4,6 +4,8 @@ Order Sale Processor Service
 Processes orders to manage inventory changes:
 - For INVENTORIED items (is_stocked_item=True): Orders trigger quantity decrement
 - For NON-INVENTORIED items: Platform sync handles status changes, orders just get acknowledged
+  (or, with end_other_listings=True as the webhook inbox uses, the item's other
+  listings are ended straight away)
 
 The sale_processed flag prevents double-counting when orders are re-synced.
 """
@@ -12,7 +14,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.product import Product, ProductStatus
@@ -21,7 +23,9 @@ from app.models.reverb_order import ReverbOrder
 from app.models.ebay_order import EbayOrder
 from app.models.shopify_order import ShopifyOrder
 
+from app.models.platform_job import PlatformJobPriority
 from app.services.notification_service import EmailNotificationService
+from app.services.platform_job_queue import ACTION_END_LISTING, ACTION_UPDATE_QUANTITY, enqueue_platform_job
 
 if TYPE_CHECKING:
     from app.core.config import Settings
@@ -65,8 +69,12 @@ class OrderSaleProcessor:
         self._ebay_service = None
         self._reverb_service = None
         self._shopify_service = None
+        self._vr_service = None
         self._email_service = EmailNotificationService(settings) if settings else None
 
+    def _use_job_queue(self) -> bool:
+        return bool(self.settings and self.settings.PLATFORM_JOB_QUEUE_ENABLED)
+
     def _get_ebay_service(self):
         """Lazy load EbayService."""
         if self._ebay_service is None and self.settings:
@@ -88,6 +96,21 @@ class OrderSaleProcessor:
             self._shopify_service = ShopifyService(self.db, self.settings)
         return self._shopify_service
 
+    def _get_vr_service(self):
+        """Lazy load VRService."""
+        if self._vr_service is None and self.settings:
+            from app.services.vr_service import VRService
+            self._vr_service = VRService(self.db)
+        return self._vr_service
+
+    def _get_service(self, platform: str):
+        return {
+            "ebay": self._get_ebay_service,
+            "reverb": self._get_reverb_service,
+            "shopify": self._get_shopify_service,
+            "vr": self._get_vr_service,
+        }[platform]()
+
     async def _send_sale_alert(
         self,
         product: Product,
@@ -158,7 +181,8 @@ class OrderSaleProcessor:
         """
         Propagate quantity changes to other platforms.
 
-        For stocked items, we sync the new quantity via API calls.
+        For stocked items, we sync the new quantity via API calls (or, with
+        PLATFORM_JOB_QUEUE_ENABLED, queue them as sale-priority platform jobs).
         If quantity reaches 0, we also end listings.
 
         Returns list of actions taken.
@@ -185,7 +209,20 @@ class OrderSaleProcessor:
                 continue
 
             try:
-                if platform == "ebay" and listing.external_id:
+                if self._use_job_queue() and platform in {"ebay", "reverb", "shopify"} and listing.external_id:
+                    await enqueue_platform_job(
+                        self.db,
+                        platform=platform,
+                        action=ACTION_UPDATE_QUANTITY,
+                        payload={"platform_common_id": listing.id, "external_id": listing.external_id},
+                        product_id=product.id,
+                        priority=PlatformJobPriority.SALE,
+                        idempotency_key=f"{ACTION_UPDATE_QUANTITY}:{listing.id}",
+                        max_attempts=self.settings.PLATFORM_JOB_MAX_ATTEMPTS,
+                    )
+                    actions.append(f"{platform}: qty={new_qty} update queued")
+
+                elif platform == "ebay" and listing.external_id:
                     ebay_service = self._get_ebay_service()
                     if ebay_service:
                         # Get eBay listing to update local DB later
@@ -266,6 +303,71 @@ class OrderSaleProcessor:
 
         return actions
 
+    async def _end_other_listings(
+        self,
+        product: Product,
+        source_platform: str,
+        dry_run: bool = False,
+    ) -> List[str]:
+        """
+        End a one-off item's active listings on the other platforms.
+
+        With PLATFORM_JOB_QUEUE_ENABLED the calls are queued as end_listing
+        jobs (same idempotency key as SyncService uses, so a later sync
+        doesn't queue them twice); otherwise they are sent inline. Either
+        way the local listing is marked ended, as the sync's propagation does.
+
+        Returns list of actions taken.
+        """
+        actions = []
+        result = await self.db.execute(
+            select(PlatformCommon).where(
+                PlatformCommon.product_id == product.id,
+                PlatformCommon.platform_name != source_platform,
+                PlatformCommon.status == ListingStatus.ACTIVE.value,
+            )
+        )
+        for listing in result.scalars().all():
+            platform = listing.platform_name
+            if not listing.external_id or platform not in {"ebay", "reverb", "shopify", "vr"}:
+                continue
+            if dry_run:
+                actions.append(f"[DRY RUN] Would end listing on {platform}")
+                continue
+
+            try:
+                if self._use_job_queue():
+                    await enqueue_platform_job(
+                        self.db,
+                        platform=platform,
+                        action=ACTION_END_LISTING,
+                        payload={"external_id": listing.external_id},
+                        product_id=product.id,
+                        priority=PlatformJobPriority.END_LISTING,
+                        idempotency_key=f"{ACTION_END_LISTING}:{platform}:{listing.external_id}",
+                        max_attempts=self.settings.PLATFORM_JOB_MAX_ATTEMPTS,
+                    )
+                    actions.append(f"{platform}: end listing queued")
+                else:
+                    service = self._get_service(platform)
+                    if service is None:
+                        actions.append(f"{platform}: service unavailable (no settings)")
+                        continue
+                    if await service.mark_item_as_sold(listing.external_id) is False:
+                        actions.append(f"{platform}: end listing failed")
+                        logger.warning("Failed to end %s listing %s for product %s", platform, listing.external_id, product.id)
+                        continue
+                    actions.append(f"{platform}: listing ended")
+                    logger.info("Ended %s listing %s for product %s", platform, listing.external_id, product.id)
+
+                listing.status = ListingStatus.ENDED.value
+                self.db.add(listing)
+            except Exception as e:
+                actions.append(f"{platform}: error - {str(e)[:50]}")
+                logger.error(f"Error ending {platform} listing: {e}", exc_info=True)
+
+        return actions
+
     async def _update_source_platform_local_db(
         self,
         product: Product,
@@ -360,10 +462,14 @@ class OrderSaleProcessor:
         order: Union[ReverbOrder, EbayOrder, ShopifyOrder],
         platform: str,
         dry_run: bool = False,
+        end_other_listings: bool = False,
     ) -> Dict:
         """
         Process a single order for inventory management.
 
+        end_other_listings: for a non-stocked item, end its listings on the
+        other platforms now rather than waiting for the next platform sync.
+
         Returns a dict with processing results.
         """
         result = {
@@ -486,6 +592,10 @@ class OrderSaleProcessor:
             # We just acknowledge the order was processed
             result["notes"] = "Non-stocked item: platform sync handles status changes"
             result["actions"].append("Acknowledged sale (platform sync handles listing status)")
+            if end_other_listings:
+                # One-off item: end it everywhere else before it can be sold twice
+                result["notes"] = "Non-stocked item: other listings ended"
+                result["actions"].extend(await self._end_other_listings(product, platform, dry_run))
 
         # Mark order as processed
         if not dry_run:
@@ -501,10 +611,13 @@ class OrderSaleProcessor:
         platform: str,
         dry_run: bool = False,
         limit: Optional[int] = None,
+        end_other_listings: bool = False,
     ) -> Dict:
         """
         Process all unprocessed orders for a platform.
 
+        end_other_listings is passed to process_order().
+
         Returns summary of processing results.
         """
         # Select the right model
@@ -517,6 +630,14 @@ class OrderSaleProcessor:
         else:
             raise ValueError(f"Unknown platform: {platform}")
 
+        # Webhook ingestion and the scheduled order jobs can overlap: serialise per
+        # platform so an order is never decremented twice (released on commit)
+        if not dry_run:
+            await self.db.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+                {"key": f"order_sale_processor:{platform}"},
+            )
+
         # Fetch unprocessed orders that indicate sales
         stmt = select(model).where(model.sale_processed == False)
 
@@ -542,7 +663,7 @@ class OrderSaleProcessor:
 
         for order in orders:
             try:
-                result = await self.process_order(order, platform, dry_run)
+                result = await self.process_order(order, platform, dry_run, end_other_listings=end_other_listings)
                 summary["details"].append(result)
 
                 if result["was_already_processed"]:
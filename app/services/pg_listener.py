@@ -0,0 +1,116 @@
+"""Postgres LISTEN/NOTIFY listener shared by the job workers and the web app caches."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Most payloads kept between drain_payloads() calls
+PAYLOAD_BACKLOG = 1000
+
+
+class PgNotificationListener:
+    """
+    Dedicated asyncpg connection LISTENing on one channel.
+
+    Consumers await wait() instead of sleeping a fixed poll interval. If the
+    connection cannot be opened (or drops) wait() still returns after the
+    timeout, so they degrade to polling, and wait() retries the connection at
+    most every retry_interval seconds. Notifications sent while the listener
+    was not connected are lost, so a successful reconnect wakes the consumer
+    with an empty payload ("anything may have changed").
+    """
+
+    def __init__(self, channel: str, dsn: Optional[str] = None, retry_interval: float = 30.0):
+        self.channel = channel
+        self.dsn = dsn
+        self.retry_interval = retry_interval
+        self._connection = None
+        self._event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_attempt: Optional[float] = None
+        # Payloads received since the last drain_payloads(); bounded, so a
+        # consumer that never drains doesn't grow it
+        self._payloads: deque = deque(maxlen=PAYLOAD_BACKLOG)
+
+    @property
+    def is_listening(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def start(self) -> bool:
+        """Open the LISTEN connection; returns False (polling fallback) on failure."""
+        import asyncpg
+
+        self._loop = asyncio.get_running_loop()
+        self._last_attempt = time.monotonic()
+        dsn = self.dsn or _listen_dsn()
+        try:
+            self._connection = await asyncpg.connect(dsn)
+            await self._connection.add_listener(self.channel, self._on_notify)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("LISTEN %s unavailable, falling back to polling: %s", self.channel, exc)
+            await self.close()
+            return False
+        logger.info("Listening for notifications on channel %s", self.channel)
+        return True
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        logger.debug("Notification received on %s (payload=%s)", channel, payload or "?")
+        self._payloads.append(payload)
+        self._event.set()
+
+    def drain_payloads(self) -> List[str]:
+        """
+        Payloads received since the last call. Exactly PAYLOAD_BACKLOG of them
+        means some may have been dropped; an empty one follows a reconnect.
+        """
+        payloads = list(self._payloads)
+        self._payloads.clear()
+        return payloads
+
+    def wake(self) -> None:
+        """Release a pending wait(); safe to call from a signal handler."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    async def _reconnect_if_due(self) -> None:
+        # Only once start() has been called, and not on every short poll
+        if self._loop is None or self.is_listening:
+            return
+        if self._last_attempt is not None and time.monotonic() - self._last_attempt < self.retry_interval:
+            return
+        if self._connection is not None:
+            logger.warning("LISTEN %s connection lost; reconnecting", self.channel)
+            await self.close()
+        if await self.start():
+            # Whatever was notified while we weren't listening is gone
+            self._on_notify(self._connection, None, self.channel, "")
+
+    async def wait(self, timeout: float) -> bool:
+        """Block until a notification arrives or timeout elapses; True if notified."""
+        await self._reconnect_if_due()
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            notified = True
+        except asyncio.TimeoutError:
+            notified = False
+        self._event.clear()
+        return notified
+
+    async def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            try:
+                await connection.remove_listener(self.channel, self._on_notify)
+            finally:
+                await connection.close()
+
+
+def _listen_dsn() -> str:
+    """The application DATABASE_URL in the plain postgresql:// form asyncpg expects."""
+    from app.database import engine
+
+    return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
@@ -0,0 +1,127 @@
+"""Execute claimed platform_jobs rows against the platform services.
+
+Each handler raises on failure so the worker can retry with backoff;
+PlatformJobPermanentError marks failures that retrying cannot fix.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import PlatformServiceError
+from app.models.ebay import EbayListing
+from app.models.platform_common import PlatformCommon
+from app.models.platform_job import PlatformJob
+from app.models.product import Product
+from app.services.platform_job_queue import (
+    ACTION_APPLY_UPDATE,
+    ACTION_END_LISTING,
+    ACTION_UPDATE_PRICE,
+    ACTION_UPDATE_QUANTITY,
+    ACTION_VR_UPDATE,
+    PlatformJobPermanentError,
+)
+from app.services.sync_services import SyncService
+
+logger = logging.getLogger(__name__)
+
+
+async def run_platform_job(
+    db: AsyncSession,
+    job: PlatformJob,
+    sync_service: Optional[SyncService] = None,
+) -> Any:
+    """Run one job's platform write; the caller commits and records the outcome."""
+    handler = _HANDLERS.get(job.action)
+    if handler is None:
+        raise PlatformJobPermanentError(f"Unknown platform job action '{job.action}'")
+
+    sync_service = sync_service or SyncService(db)
+    service = sync_service.platform_services.get(job.platform)
+    if service is None:
+        raise PlatformJobPermanentError(f"No service for platform '{job.platform}'")
+
+    logger.info("Running %s job %s on %s (attempt %s)", job.action, job.id, job.platform, job.attempts)
+    return await handler(db, sync_service, service, job)
+
+
+async def _load_product_and_link(db: AsyncSession, job: PlatformJob):
+    product = await db.get(Product, job.product_id) if job.product_id else None
+    link = await db.get(PlatformCommon, (job.payload or {}).get("platform_common_id"))
+    if product is None or link is None:
+        raise PlatformJobPermanentError(
+            f"Product {job.product_id} or its {job.platform} listing no longer exists"
+        )
+    return product, link
+
+
+def _raise_for_error_result(job: PlatformJob, result: Any) -> None:
+    if result is False:
+        raise PlatformServiceError(f"{job.platform} {job.action} reported failure")
+    if isinstance(result, dict) and result.get("status") == "error":
+        raise PlatformServiceError(result.get("message") or str(result))
+
+
+async def _end_listing(db, sync_service, service, job: PlatformJob) -> Any:
+    result = await service.mark_item_as_sold(job.payload["external_id"])
+    _raise_for_error_result(job, result)
+    return result
+
+
+async def _update_quantity(db, sync_service, service, job: PlatformJob) -> Any:
+    # Quantity is read when the job runs, so a backlog of sales sends the latest value
+    product, link = await _load_product_and_link(db, job)
+    if job.platform == "ebay":
+        result = await service.update_listing_quantity(link.external_id, product.quantity, sku=product.sku)
+        _raise_for_error_result(job, result)
+        ebay_listing = (
+            await db.execute(select(EbayListing).where(EbayListing.platform_id == link.id))
+        ).scalar_one_or_none()
+        if ebay_listing:
+            ebay_listing.quantity_available = product.quantity
+            db.add(ebay_listing)
+        return result
+
+    result = await service.apply_product_update(product, link, {"quantity"})
+    _raise_for_error_result(job, result)
+    return result
+
+
+async def _apply_update(db, sync_service, service, job: PlatformJob) -> Any:
+    product, link = await _load_product_and_link(db, job)
+    result = await service.apply_product_update(product, link, set(job.payload.get("changed_fields") or []))
+    _raise_for_error_result(job, result)
+    return result
+
+
+async def _update_price(db, sync_service, service, job: PlatformJob) -> Any:
+    price = float(job.payload["price"])
+    result = await service.update_listing_price(job.payload["external_id"], price)
+    _raise_for_error_result(job, result)
+    if job.platform != "vr":
+        # V&R's local price is written optimistically when the job is queued
+        link = await db.get(PlatformCommon, job.payload.get("platform_common_id"))
+        if link is not None:
+            await sync_service.record_listing_price(link, price)
+    return result
+
+
+async def _vr_update(db, sync_service, service, job: PlatformJob) -> Any:
+    payload = job.payload
+    await sync_service._run_vr_update_background(
+        payload["snapshot"],
+        payload["external_id"],
+        set(payload.get("changed_fields") or []),
+        raise_on_error=True,
+    )
+
+
+_HANDLERS: Dict[str, Callable[..., Awaitable[Any]]] = {
+    ACTION_END_LISTING: _end_listing,
+    ACTION_UPDATE_QUANTITY: _update_quantity,
+    ACTION_APPLY_UPDATE: _apply_update,
+    ACTION_UPDATE_PRICE: _update_price,
+    ACTION_VR_UPDATE: _vr_update,
+}
@@ -0,0 +1,272 @@
+"""Helpers for enqueuing and claiming outbound platform write jobs.
+
+Edits, end-listings and sale quantity updates for eBay / Reverb / Shopify /
+V&R are written to platform_jobs (see app/models/platform_job.py) and sent by
+scripts/platform_job_worker.py, which claims jobs by priority, retries
+failures with exponential backoff and throttles each platform separately.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, exists, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.platform_job import PlatformJob, PlatformJobPriority, PlatformJobStatus
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel the platform job worker LISTENs on (see PgNotificationListener)
+PLATFORM_JOB_CHANNEL = "platform_jobs"
+
+# Job actions understood by app/services/platform_job_handlers.py
+ACTION_END_LISTING = "end_listing"
+ACTION_UPDATE_QUANTITY = "update_quantity"
+ACTION_APPLY_UPDATE = "apply_product_update"
+ACTION_UPDATE_PRICE = "update_price"
+ACTION_VR_UPDATE = "vr_update"
+
+
+class PlatformJobPermanentError(Exception):
+    """Raised by a job handler when retrying cannot help (e.g. listing gone)."""
+
+
+async def enqueue_platform_job(
+    db: AsyncSession,
+    *,
+    platform: str,
+    action: str,
+    payload: Dict[str, Any],
+    product_id: Optional[int] = None,
+    priority: int = PlatformJobPriority.EDIT,
+    idempotency_key: Optional[str] = None,
+    max_attempts: int = 5,
+) -> int:
+    """Queue an outbound write and return its job id.
+
+    If a job with the same idempotency_key is still queued, that job is
+    reused: its payload is replaced with the newer one (latest price /
+    quantity wins) and it keeps the more urgent of the two priorities.
+    The worker is notified when the caller commits.
+    """
+    stmt = insert(PlatformJob).values(
+        platform=platform,
+        action=action,
+        product_id=product_id,
+        priority=priority,
+        idempotency_key=idempotency_key,
+        payload=payload,
+        status=PlatformJobStatus.QUEUED.value,
+        attempts=0,
+        max_attempts=max_attempts,
+    )
+    if idempotency_key:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PlatformJob.idempotency_key],
+            index_where=PlatformJob.status == PlatformJobStatus.QUEUED.value,
+            set_={
+                "payload": stmt.excluded.payload,
+                "priority": func.least(PlatformJob.priority, stmt.excluded.priority),
+                "updated_at": func.now(),
+            },
+        )
+    job_id = (await db.execute(stmt.returning(PlatformJob.id))).scalar_one()
+    await notify_platform_worker(db, job_id)
+    logger.info("Queued %s job %s on %s (key=%s)", action, job_id, platform, idempotency_key)
+    return job_id
+
+
+async def notify_platform_worker(db: AsyncSession, job_id: Optional[int] = None) -> None:
+    """Queue a NOTIFY on PLATFORM_JOB_CHANNEL, delivered when the caller commits."""
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": PLATFORM_JOB_CHANNEL, "payload": str(job_id or "")},
+    )
+
+
+async def fetch_next_platform_job(
+    db: AsyncSession,
+    platforms: Optional[Iterable[str]] = None,
+) -> Optional[PlatformJob]:
+    """Fetch the most urgent runnable job (SKIP LOCKED), optionally for some platforms only."""
+    stmt = select(PlatformJob).where(
+        PlatformJob.status == PlatformJobStatus.QUEUED.value,
+        PlatformJob.run_after <= func.now(),
+    )
+    if platforms is not None:
+        stmt = stmt.where(PlatformJob.platform.in_(list(platforms)))
+    stmt = (
+        stmt.order_by(PlatformJob.priority.asc(), PlatformJob.run_after.asc(), PlatformJob.id.asc())
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(stmt)
+    return result.scalars().first()
+
+
+async def mark_platform_job_in_progress(db: AsyncSession, job: PlatformJob) -> None:
+    job.status = PlatformJobStatus.IN_PROGRESS.value
+    job.last_attempt_at = datetime.now(timezone.utc)
+    job.attempts += 1
+    await db.flush()
+
+
+async def mark_platform_job_completed(db: AsyncSession, job: PlatformJob) -> None:
+    job.status = PlatformJobStatus.COMPLETED.value
+    job.last_error = None
+    job.completed_at = datetime.now(timezone.utc)
+    await db.flush()
+
+
+def retry_delay_seconds(attempts: int, base_seconds: float, max_seconds: float) -> float:
+    """Exponential backoff: base, 2*base, 4*base, ... capped at max_seconds."""
+    return min(base_seconds * (2 ** max(attempts - 1, 0)), max_seconds)
+
+
+async def mark_platform_job_failed(
+    db: AsyncSession,
+    job: PlatformJob,
+    error_message: str,
+    *,
+    retryable: bool = True,
+    base_delay_seconds: float = 30.0,
+    max_delay_seconds: float = 1800.0,
+) -> bool:
+    """
+    Record a failed attempt; returns True if the job was re-queued for a retry.
+
+    A job whose idempotency_key has since been queued again is marked
+    SUPERSEDED instead: only one queued job may hold a key, and the queued
+    one carries the newer payload.
+    """
+    job.last_error = error_message[:2000]
+    if retryable and job.attempts < job.max_attempts:
+        if job.idempotency_key and await _key_is_queued(db, job.idempotency_key, job.id):
+            job.status = PlatformJobStatus.SUPERSEDED.value
+            await db.flush()
+            return False
+        delay = retry_delay_seconds(job.attempts, base_delay_seconds, max_delay_seconds)
+        job.status = PlatformJobStatus.QUEUED.value
+        job.run_after = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        await db.flush()
+        return True
+    job.status = PlatformJobStatus.FAILED.value
+    await db.flush()
+    return False
+
+
+async def _key_is_queued(db: AsyncSession, idempotency_key: str, job_id: int) -> bool:
+    result = await db.execute(
+        select(PlatformJob.id)
+        .where(
+            PlatformJob.idempotency_key == idempotency_key,
+            PlatformJob.status == PlatformJobStatus.QUEUED.value,
+            PlatformJob.id != job_id,
+        )
+        .limit(1)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+async def requeue_stale_platform_jobs(db: AsyncSession, stale_after: timedelta) -> int:
+    """
+    Return jobs stuck IN_PROGRESS (e.g. the worker died mid-job) to the queue.
+
+    A stale job is marked SUPERSEDED rather than re-queued when its key is
+    already queued, or when a newer stale job holds the same key, so the
+    queued-key unique index can't reject the update.
+    """
+    cutoff = datetime.now(timezone.utc) - stale_after
+    stale = and_(
+        PlatformJob.status == PlatformJobStatus.IN_PROGRESS.value,
+        PlatformJob.last_attempt_at < cutoff,
+    )
+    other = aliased(PlatformJob)
+    newer_holder = exists().where(
+        other.idempotency_key == PlatformJob.idempotency_key,
+        other.id != PlatformJob.id,
+        or_(
+            other.status == PlatformJobStatus.QUEUED.value,
+            and_(
+                other.status == PlatformJobStatus.IN_PROGRESS.value,
+                other.last_attempt_at < cutoff,
+                other.id > PlatformJob.id,
+            ),
+        ),
+    )
+    superseded = await db.execute(
+        update(PlatformJob)
+        .where(stale, PlatformJob.idempotency_key.isnot(None), newer_holder)
+        .values(status=PlatformJobStatus.SUPERSEDED.value)
+        .execution_options(synchronize_session=False)
+    )
+    if superseded.rowcount:
+        logger.info("Superseded %d stale platform jobs whose key is queued again", superseded.rowcount)
+    result = await db.execute(
+        update(PlatformJob)
+        .where(stale)
+        .values(status=PlatformJobStatus.QUEUED.value, run_after=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount or 0
+
+
+async def count_queued_platform_jobs(db: AsyncSession) -> Dict[str, int]:
+    """Queued job counts per platform (without locking)."""
+    stmt = (
+        select(PlatformJob.platform, func.count(PlatformJob.id))
+        .where(PlatformJob.status == PlatformJobStatus.QUEUED.value)
+        .group_by(PlatformJob.platform)
+    )
+    result = await db.execute(stmt)
+    return {platform: count for platform, count in result.all()}
+
+
+class PlatformThrottle:
+    """
+    Per-platform concurrency and start-rate limits for the job worker.
+
+    reserve() takes an in-flight slot synchronously at claim time, so the
+    worker never claims more jobs for a platform than it may run; wait_turn()
+    then spaces job starts at 1/rate seconds apart per platform.
+    """
+
+    def __init__(
+        self,
+        rates: Dict[str, float],
+        concurrency: Dict[str, int],
+        default_concurrency: int = 1,
+    ):
+        self.rates = rates
+        self.concurrency = concurrency
+        self.default_concurrency = default_concurrency
+        self._in_flight: Dict[str, int] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def has_capacity(self, platform: str) -> bool:
+        limit = self.concurrency.get(platform, self.default_concurrency)
+        return self._in_flight.get(platform, 0) < limit
+
+    def available_platforms(self, platforms: Iterable[str]) -> List[str]:
+        return [platform for platform in platforms if self.has_capacity(platform)]
+
+    def reserve(self, platform: str) -> None:
+        self._in_flight[platform] = self._in_flight.get(platform, 0) + 1
+
+    def release(self, platform: str) -> None:
+        self._in_flight[platform] = max(self._in_flight.get(platform, 0) - 1, 0)
+
+    async def wait_turn(self, platform: str) -> None:
+        rate = self.rates.get(platform)
+        if not rate or rate <= 0:
+            return
+        now = time.monotonic()
+        start_at = max(now, self._next_start.get(platform, now))
+        self._next_start[platform] = start_at + 1.0 / rate
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
@@ -0,0 +1,136 @@
+"""
+Catalogue search over products.
+
+Two indexes from alembic revision product_search back every search:
+
+- products.search_vector is a generated tsvector of sku and brand (weight A),
+  model (B), title (C) and description (D), with a GIN index. Each query word
+  is matched as a prefix, so "strat 62" finds "Stratocaster 1962".
+- A pg_trgm GIN index on the lower-cased brand/model/sku/title text serves
+  substring matches (what ILIKE '%term%' used to do) and typo-tolerant word
+  similarity ("stratocastr").
+
+Results are ranked by ts_rank_cd plus trigram word similarity.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import desc, func, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.product import Product
+
+# Must match the ix_products_search_trgm index expression
+SEARCH_TEXT_SQL = (
+    "lower(coalesce({p}brand, '') || ' ' || coalesce({p}model, '') || ' ' || "
+    "coalesce({p}sku, '') || ' ' || coalesce({p}title, ''))"
+)
+
+SEARCH_TEXT = literal_column(SEARCH_TEXT_SQL.format(p="products."))
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def search_text_sql(alias: str = "products") -> str:
+    return SEARCH_TEXT_SQL.format(p=f"{alias}.")
+
+
+def to_prefix_tsquery(term: str) -> Optional[str]:
+    """'Strat 62' -> 'strat:* & 62:*'; None when the term has no searchable words."""
+    words = _WORD.findall(term.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search_clause(term: str):
+    """WHERE clause matching term against the search indexes (for ORM queries on Product)."""
+    term = term.strip()
+    conditions = [
+        SEARCH_TEXT.like(_like_pattern(term), escape="\\"),
+        SEARCH_TEXT.op("%>")(term.lower()),
+    ]
+    tsquery = to_prefix_tsquery(term)
+    if tsquery:
+        conditions.insert(0, Product.search_vector.op("@@")(func.to_tsquery("simple", tsquery)))
+    return or_(*conditions)
+
+
+def search_rank(term: str):
+    term = term.strip()
+    similarity = func.word_similarity(term.lower(), SEARCH_TEXT)
+    tsquery = to_prefix_tsquery(term)
+    if not tsquery:
+        return similarity
+    return func.ts_rank_cd(Product.search_vector, func.to_tsquery("simple", tsquery)) + similarity
+
+
+def search_condition_sql(alias: str = "products") -> str:
+    """The search_clause() condition as raw SQL for text() queries; bind with search_params()."""
+    search_text = search_text_sql(alias)
+    return (
+        f"({alias}.search_vector @@ to_tsquery('simple', :search_tsquery)"
+        f" OR {search_text} LIKE :search_like ESCAPE '\\'"
+        f" OR {search_text} %> :search_term)"
+    )
+
+
+def search_params(term: str) -> Dict[str, str]:
+    term = term.strip()
+    return {
+        # An empty tsquery matches nothing; the trigram arms still apply
+        "search_tsquery": to_prefix_tsquery(term) or "",
+        "search_like": _like_pattern(term),
+        "search_term": term.lower(),
+    }
+
+
+async def search_products(
+    db: AsyncSession,
+    term: str,
+    limit: int = 20,
+    status: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Best matches for term, most relevant first, as JSON-ready dicts."""
+    if not term or not term.strip():
+        return []
+
+    rank = search_rank(term).label("rank")
+    query = (
+        select(
+            Product.id,
+            Product.sku,
+            Product.brand,
+            Product.model,
+            Product.title,
+            Product.base_price,
+            Product.status,
+            Product.primary_image,
+            rank,
+        )
+        .where(search_clause(term))
+        .order_by(desc(rank), desc(Product.id))
+        .limit(limit)
+    )
+    if status:
+        query = query.where(Product.status == status.upper())
+
+    result = await db.execute(query)
+    return [
+        {
+            "id": row.id,
+            "sku": row.sku,
+            "brand": row.brand,
+            "model": row.model,
+            "title": row.title or " ".join(part for part in (row.brand, row.model) if part),
+            "base_price": row.base_price,
+            "status": row.status.value if hasattr(row.status, "value") else row.status,
+            "primary_image": row.primary_image,
+            "rank": round(float(row.rank or 0), 4),
+        }
+        for row in result.fetchall()
+    ]
@@ -0,0 +1,306 @@
+"""
+Materialized reporting layer for the heavy /reports pages.
+
+The non-performing inventory, status mismatch, platform coverage and price
+markup reports read from materialized views (alembic revision report_views)
+instead of running their CTEs over the live listing tables on every page
+load. Listing health is rule-based Python, so its results are kept in the
+report_listing_health summary table instead.
+
+refresh_report_views() brings everything up to date. It runs after each
+scheduled platform sync and after /api/sync/all, plus on its own interval in
+scripts/run_sync_scheduler.py. Views are refreshed CONCURRENTLY (readers keep
+the previous contents until the new ones are swapped in, and only changed
+rows are written), and each source records its refresh time in
+report_refresh_state, which the report pages show as "as of".
+"""
+
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.platform_common import PlatformCommon
+from app.models.product import Product, ProductStatus
+
+logger = logging.getLogger(__name__)
+
+REVERB_INVENTORY_VIEW = "report_reverb_inventory_mv"
+LISTING_STATUS_VIEW = "report_listing_status_mv"
+PLATFORM_COVERAGE_VIEW = "report_platform_coverage_mv"
+PLATFORM_PRICES_VIEW = "report_platform_prices_mv"
+LISTING_HEALTH_TABLE = "report_listing_health"
+
+REPORT_VIEWS = (
+    REVERB_INVENTORY_VIEW,
+    LISTING_STATUS_VIEW,
+    PLATFORM_COVERAGE_VIEW,
+    PLATFORM_PRICES_VIEW,
+)
+REPORT_SOURCES = REPORT_VIEWS + (LISTING_HEALTH_TABLE,)
+
+LISTING_HEALTH_PLATFORMS = (
+    ("shopify", "Shopify", "shopify_listing"),
+    ("reverb", "Reverb", "reverb_listing"),
+    ("ebay", "eBay", "ebay_listing"),
+    ("vr", "Vintage & Rare", "vr_listing"),
+)
+
+_STATUS_PRIORITY = {"error": 0, "warning": 1, "ok": 2, "not_listed": 3}
+
+_MARK_REFRESHED_SQL = """
+    INSERT INTO report_refresh_state (view_name, refreshed_at, duration_ms)
+    VALUES (:view_name, :refreshed_at, :duration_ms)
+    ON CONFLICT (view_name) DO UPDATE
+    SET refreshed_at = EXCLUDED.refreshed_at, duration_ms = EXCLUDED.duration_ms
+"""
+
+_INSERT_HEALTH_SQL = f"""
+    INSERT INTO {LISTING_HEALTH_TABLE}
+        (product_id, sku, title, product_status, created_at, core, media, platforms, overall_status)
+    SELECT r.product_id, r.sku, r.title, r.product_status, r.created_at, r.core, r.media, r.platforms, r.overall_status
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r(
+        product_id integer,
+        sku text,
+        title text,
+        product_status text,
+        created_at timestamp,
+        core jsonb,
+        media jsonb,
+        platforms jsonb,
+        overall_status text
+    )
+"""
+
+
+# --- Listing health rules -------------------------------------------------------
+
+def _determine_status(errors: List[str], warnings: List[str]) -> str:
+    if errors:
+        return "error"
+    if warnings:
+        return "warning"
+    return "ok"
+
+
+def _evaluate_core(product: Product) -> Dict[str, Any]:
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    title_candidate = product.title or product.generate_title()
+    if not title_candidate:
+        errors.append("Missing product title")
+
+    if not product.category:
+        errors.append("Missing category")
+
+    if product.is_stocked_item:
+        if product.quantity is None:
+            warnings.append("Quantity not set for stocked item")
+        elif product.quantity <= 0:
+            errors.append("Stocked item has zero quantity")
+
+    if not product.description:
+        warnings.append("No description")
+
+    if product.status == ProductStatus.ACTIVE and not product.shipping_profile_id:
+        warnings.append("No shipping profile")
+
+    return {"status": _determine_status(errors, warnings), "issues": errors + warnings}
+
+
+def _evaluate_media(product: Product) -> Dict[str, Any]:
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    primary_missing = not bool(product.primary_image)
+    gallery_missing = not bool(product.additional_images)
+
+    if primary_missing and gallery_missing:
+        errors.append("Missing ALL images")
+    else:
+        if primary_missing:
+            errors.append("Missing primary image")
+        if gallery_missing:
+            warnings.append("No Additional Images")
+
+    return {"status": _determine_status(errors, warnings), "issues": errors + warnings}
+
+
+def _evaluate_platform(product: Product, platform_name: str, label: str, attr: str) -> Dict[str, Any]:
+    commons = [pc for pc in product.platform_listings if (pc.platform_name or "").lower() == platform_name]
+    if not commons:
+        return {"label": label, "status": "not_listed", "issues": []}
+
+    common = commons[0]
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    if not common.external_id:
+        errors.append("Missing external ID")
+    if not common.listing_url:
+        warnings.append("Missing listing URL")
+
+    sync_state = (common.sync_status or "").lower()
+    if sync_state not in {"synced", "ok", "success"}:
+        warnings.append(f"Sync status is '{common.sync_status or 'unknown'}'")
+
+    listing = getattr(common, attr, None)
+    if listing is None:
+        errors.append("No platform listing record")
+    else:
+        if platform_name == "shopify" and not getattr(listing, "category_gid", None):
+            warnings.append("Category missing")
+        if platform_name == "ebay" and not getattr(listing, "listing_status", None):
+            warnings.append("eBay listing status unknown")
+        if platform_name == "reverb" and not getattr(listing, "reverb_state", None):
+            warnings.append("Reverb state missing")
+
+    return {"label": label, "status": _determine_status(errors, warnings), "issues": errors + warnings}
+
+
+def evaluate_listing_health(product: Product) -> Dict[str, Any]:
+    """Traffic-light health of one product (platform_listings and their listings loaded)."""
+    core = _evaluate_core(product)
+    media = _evaluate_media(product)
+    platforms = {
+        name: _evaluate_platform(product, name, label, attr)
+        for name, label, attr in LISTING_HEALTH_PLATFORMS
+    }
+
+    statuses = [core["status"], media["status"]]
+    statuses.extend(info["status"] for info in platforms.values() if info["status"] != "not_listed")
+    overall_status = min(statuses, key=lambda s: _STATUS_PRIORITY.get(s, 4))
+
+    status = product.status.value if isinstance(product.status, ProductStatus) else product.status
+    return {
+        "product_id": product.id,
+        "sku": product.sku,
+        "title": product.title or product.generate_title(),
+        "product_status": status,
+        "created_at": product.created_at.isoformat() if product.created_at else None,
+        "core": core,
+        "media": media,
+        "platforms": platforms,
+        "overall_status": overall_status,
+    }
+
+
+# --- Refresh --------------------------------------------------------------------
+
+async def _try_lock(db: AsyncSession, source: str) -> bool:
+    # Transaction-scoped, so a second refresher skips a source that is mid-refresh
+    result = await db.execute(
+        text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"), {"key": f"report_refresh:{source}"}
+    )
+    return bool(result.scalar())
+
+
+async def _mark_refreshed(db: AsyncSession, source: str, duration: float) -> None:
+    await db.execute(
+        text(_MARK_REFRESHED_SQL),
+        {
+            "view_name": source,
+            "refreshed_at": datetime.now(timezone.utc).replace(tzinfo=None),
+            "duration_ms": int(duration * 1000),
+        },
+    )
+
+
+async def rebuild_listing_health(db: AsyncSession, batch_size: int = 500) -> int:
+    """Re-evaluate every product into report_listing_health; the caller commits."""
+    await db.execute(text(f"DELETE FROM {LISTING_HEALTH_TABLE}"))
+
+    last_id = 0
+    total = 0
+    while True:
+        query = (
+            select(Product)
+            .options(
+                selectinload(Product.platform_listings).selectinload(PlatformCommon.shopify_listing),
+                selectinload(Product.platform_listings).selectinload(PlatformCommon.reverb_listing),
+                selectinload(Product.platform_listings).selectinload(PlatformCommon.ebay_listing),
+                selectinload(Product.platform_listings).selectinload(PlatformCommon.vr_listing),
+            )
+            .where(Product.id > last_id)
+            .order_by(Product.id)
+            .limit(batch_size)
+        )
+        products = (await db.execute(query)).scalars().all()
+        if not products:
+            break
+
+        rows = [evaluate_listing_health(product) for product in products]
+        await db.execute(text(_INSERT_HEALTH_SQL), {"rows": json.dumps(rows, default=str)})
+        total += len(rows)
+        last_id = products[-1].id
+        # Keep the identity map from growing across the whole catalogue
+        db.expunge_all()
+
+    return total
+
+
+async def refresh_report_views(db: AsyncSession, sources: Optional[List[str]] = None) -> Dict[str, float]:
+    """
+    Refresh the report views and the listing health table, one transaction each.
+
+    Returns seconds taken per source. A source another process is already
+    refreshing is skipped, as is one that fails (logged; the previous
+    contents stay in place).
+    """
+    timings: Dict[str, float] = {}
+    for source in sources or REPORT_SOURCES:
+        start = time.monotonic()
+        try:
+            if not await _try_lock(db, source):
+                logger.info("Report source %s is already being refreshed; skipping", source)
+                await db.rollback()
+                continue
+            if source == LISTING_HEALTH_TABLE:
+                await rebuild_listing_health(db)
+            else:
+                await db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {source}"))
+            duration = time.monotonic() - start
+            await _mark_refreshed(db, source, duration)
+            await db.commit()
+            timings[source] = duration
+        except Exception as exc:  # noqa: BLE001
+            await db.rollback()
+            logger.error("Refreshing report source %s failed: %s", source, exc, exc_info=True)
+
+    if timings:
+        logger.info(
+            "Report views refreshed: %s",
+            ", ".join(f"{source}={seconds:.2f}s" for source, seconds in timings.items()),
+        )
+    return timings
+
+
+async def refresh_report_views_in_background(session_factory=None) -> Dict[str, float]:
+    """refresh_report_views() in its own session, for callers without one (e.g. after /api/sync/all)."""
+    if session_factory is None:
+        from app.database import async_session
+        session_factory = async_session
+    try:
+        async with session_factory() as db:
+            return await refresh_report_views(db)
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Report view refresh failed: %s", exc, exc_info=True)
+        return {}
+
+
+async def get_report_as_of(db: AsyncSession, *sources: str) -> Optional[datetime]:
+    """When the named report sources were last refreshed (the oldest of them); None if any never was."""
+    result = await db.execute(
+        text("SELECT view_name, refreshed_at FROM report_refresh_state WHERE view_name = ANY(:sources)"),
+        {"sources": list(sources)},
+    )
+    refreshed = {row.view_name: row.refreshed_at for row in result.fetchall()}
+    if any(source not in refreshed for source in sources):
+        return None
+    return min(refreshed.values())
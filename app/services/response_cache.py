@@ -0,0 +1,379 @@
+"""
+Response cache for the read-heavy JSON endpoints that dashboards poll.
+
+response_cache_middleware() serves GETs for the routes in CACHED_ROUTES from
+ResponseCache. A response is cached only if it was a 200 JSON response. The
+cache key is the path, the sorted query string and a hash of the
+Authorization header; the middleware runs before require_auth(), so a cached
+body is only ever returned to the same credentials that produced it. Every
+response carries an ETag, and a matching If-None-Match gets a bodyless 304.
+
+Each route lists invalidation tags (e.g. "products", "orders",
+"product:{product_id}"). Code that changes the underlying data calls
+invalidate_cache_tags(), which drops the tagged entries straight away. Given
+a session, it also queues a NOTIFY on RESPONSE_CACHE_CHANNEL with the tags
+as payload, so the web app drops its entries when a sync run by
+scripts/run_sync_scheduler.py commits. Entries otherwise expire after the
+route's TTL.
+
+The default backend is an in-process LRU (RESPONSE_CACHE_MAX_ENTRIES).
+RESPONSE_CACHE_BACKEND="redis" shares entries between workers; it needs the
+optional `redis` package and RESPONSE_CACHE_REDIS_URL, and falls back to the
+in-process LRU without them.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel that invalidations NOTIFY and the web app LISTENs on
+RESPONSE_CACHE_CHANNEL = "response_cache"
+
+# Response headers worth replaying on a hit; the rest are recomputed
+_REPLAYED_HEADERS = ("content-type",)
+
+
+@dataclass
+class CachePolicy:
+    """A cached route. {name} placeholders in path match numeric path segments."""
+
+    path: str
+    ttl_seconds: int
+    tags: Tuple[str, ...]
+
+    def __post_init__(self):
+        pattern = re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>\\d+)", re.escape(self.path))
+        self._pattern = re.compile(f"^{pattern}$")
+
+    def match(self, path: str) -> Optional[Dict[str, str]]:
+        found = self._pattern.match(path)
+        return found.groupdict() if found else None
+
+    def tags_for(self, params: Dict[str, str]) -> List[str]:
+        return [tag.format(**params) for tag in self.tags]
+
+
+CACHED_ROUTES: List[CachePolicy] = [
+    CachePolicy("/api/dashboard/latest-products", 30, ("products",)),
+    CachePolicy("/api/dashboard/recent-orders", 30, ("orders",)),
+    CachePolicy("/api/dashboard/pending-sync", 15, ("sync_events",)),
+    CachePolicy("/orders/api/stats", 120, ("orders",)),
+    CachePolicy("/insights/api/dashboard", 300, ("products", "orders")),
+    CachePolicy("/insights/api/category-benchmarks", 600, ("products", "orders")),
+    CachePolicy("/reports/matching/api/filter-options", 300, ("products",)),
+    CachePolicy("/inventory/api/products/{product_id}", 60, ("product:{product_id}", "products")),
+]
+
+
+def find_policy(path: str) -> Optional[Tuple[CachePolicy, Dict[str, str]]]:
+    for policy in CACHED_ROUTES:
+        params = policy.match(path)
+        if params is not None:
+            return policy, params
+    return None
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    etag: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    tags: List[str] = field(default_factory=list)
+
+    def dumps(self) -> str:
+        data = asdict(self)
+        data["body"] = self.body.decode("utf-8")
+        return json.dumps(data)
+
+    @classmethod
+    def loads(cls, raw) -> "CacheEntry":
+        data = json.loads(raw)
+        data["body"] = data["body"].encode("utf-8")
+        return cls(**data)
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # Weak comparison, as RFC 9110 asks for If-None-Match
+    return "*" in candidates or etag in (c[2:] if c.startswith("W/") else c for c in candidates)
+
+
+def cache_key(request: Request) -> str:
+    query = sorted(request.query_params.multi_items())
+    auth = hashlib.sha256(request.headers.get("authorization", "").encode()).hexdigest()[:16]
+    return f"{request.url.path}?{json.dumps(query, separators=(',', ':'))}#{auth}"
+
+
+# --- Backends -------------------------------------------------------------------
+
+class MemoryCacheBackend:
+    """Per-process LRU with per-entry expiry and a tag -> keys index."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, CacheEntry]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry, ttl_seconds: int) -> None:
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl_seconds, entry)
+        for tag in entry.tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        keys = set()
+        for tag in tags:
+            keys |= self._tags.get(tag, set())
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+    def _remove(self, key: str) -> None:
+        item = self._entries.pop(key, None)
+        if item is None:
+            return
+        for tag in item[1].tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisCacheBackend:
+    """Entries shared between workers; each tag is a Redis set of entry keys."""
+
+    PREFIX = "response_cache:"
+    # Tag sets outlive the entries they point at; stale members are harmless
+    TAG_TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(self, client):
+        self._client = client
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        raw = await self._client.get(self.PREFIX + key)
+        return CacheEntry.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, entry: CacheEntry, ttl_seconds: int) -> None:
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.set(self.PREFIX + key, entry.dumps(), ex=ttl_seconds)
+            for tag in entry.tags:
+                pipe.sadd(f"{self.PREFIX}tag:{tag}", key)
+                pipe.expire(f"{self.PREFIX}tag:{tag}", self.TAG_TTL_SECONDS)
+            await pipe.execute()
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        removed = 0
+        for tag in tags:
+            tag_key = f"{self.PREFIX}tag:{tag}"
+            keys = await self._client.smembers(tag_key)
+            if keys:
+                removed += await self._client.delete(*(self.PREFIX + _as_str(key) for key in keys))
+            await self._client.delete(tag_key)
+        return removed
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._client.scan_iter(match=self.PREFIX + "*")]
+        if keys:
+            await self._client.delete(*keys)
+
+
+def _as_str(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _build_backend(settings):
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        if not settings.RESPONSE_CACHE_REDIS_URL:
+            logger.warning("RESPONSE_CACHE_BACKEND is redis but RESPONSE_CACHE_REDIS_URL is not set; using the in-process cache")
+        else:
+            try:
+                import redis.asyncio as redis_asyncio
+            except ImportError:
+                logger.warning("RESPONSE_CACHE_BACKEND is redis but the 'redis' package is not installed; using the in-process cache")
+            else:
+                return RedisCacheBackend(redis_asyncio.from_url(settings.RESPONSE_CACHE_REDIS_URL))
+    return MemoryCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+# --- Cache ----------------------------------------------------------------------
+
+class ResponseCache:
+    """
+    Cached responses by key, invalidated by tag.
+
+    A response computed across an invalidation is not stored, so a request
+    that read the data before a sync committed can't cache the old answer.
+    """
+
+    def __init__(self, backend=None):
+        self._backend = backend
+        self._generation = 0
+        self._listener = None
+        self._stopping = False
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = _build_backend(get_settings())
+        return self._backend
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        return await self.backend.get(key)
+
+    async def store(self, key: str, entry: CacheEntry, ttl_seconds: int, generation: int) -> bool:
+        if generation != self._generation:
+            return False
+        await self.backend.set(key, entry, ttl_seconds)
+        return True
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tags = [tag for tag in tags if tag]
+        self._generation += 1
+        removed = await self.backend.invalidate(tags)
+        logger.debug("Response cache: dropped %d entries for tags %s", removed, tags)
+        return removed
+
+    async def clear(self) -> None:
+        self._generation += 1
+        await self.backend.clear()
+
+    async def listen(self) -> None:
+        """Invalidate on RESPONSE_CACHE_CHANNEL notifications until stop(); started from the app lifespan."""
+        from app.services.pg_listener import PAYLOAD_BACKLOG, PgNotificationListener
+
+        self._stopping = False
+        self._listener = listener = PgNotificationListener(channel=RESPONSE_CACHE_CHANNEL)
+        await listener.start()
+        try:
+            while not self._stopping:
+                if not await listener.wait(timeout=60):
+                    continue
+                payloads = listener.drain_payloads()
+                try:
+                    # A full backlog may have dropped payloads; an empty one (e.g. after a reconnect) names no tags
+                    if len(payloads) >= PAYLOAD_BACKLOG or not all(payloads):
+                        await self.clear()
+                    else:
+                        await self.invalidate_tags(
+                            tag for payload in payloads for tag in payload.split(",")
+                        )
+                except Exception as exc:  # noqa: BLE001 - keep listening
+                    logger.error("Response cache invalidation failed: %s", exc, exc_info=True)
+        finally:
+            self._listener = None
+            await listener.close()
+
+    def stop(self) -> None:
+        self._stopping = True
+        if self._listener is not None:
+            self._listener.wake()
+
+
+response_cache = ResponseCache()
+
+
+async def invalidate_cache_tags(*tags: str, db: Optional[AsyncSession] = None) -> None:
+    """
+    Drop cached responses carrying any of tags. With a session, also NOTIFY
+    other processes; the notification goes out when the caller commits.
+    Without one (or with an unresolved Depends default, when a route is
+    called directly) only this process's cache is cleared.
+    """
+    try:
+        await response_cache.invalidate_tags(tags)
+    except Exception as exc:  # noqa: BLE001 - entries still expire by TTL
+        logger.warning("Response cache invalidation failed: %s", exc)
+    if db is None or not hasattr(db, "execute"):
+        return
+    await db.execute(
+        text("SELECT pg_notify(:channel, :tags)"),
+        {"channel": RESPONSE_CACHE_CHANNEL, "tags": ",".join(tags)},
+    )
+
+
+# --- Middleware -----------------------------------------------------------------
+
+def _cached_response(entry: CacheEntry, status: str, not_modified: bool) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache", "X-Cache": status}
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, headers={**entry.headers, **headers})
+
+
+async def response_cache_middleware(request: Request, call_next):
+    if request.method != "GET":
+        return await call_next(request)
+    found = find_policy(request.url.path)
+    if found is None:
+        return await call_next(request)
+    policy, params = found
+
+    key = cache_key(request)
+    if_none_match = request.headers.get("if-none-match")
+    try:
+        entry = await response_cache.get(key)
+    except Exception as exc:  # noqa: BLE001 - serve uncached
+        logger.warning("Response cache read failed: %s", exc)
+        entry = None
+    if entry is not None:
+        return _cached_response(entry, "HIT", etag_matches(if_none_match, entry.etag))
+
+    generation = response_cache.generation
+    response = await call_next(request)
+    if response.status_code != 200 or not response.headers.get("content-type", "").startswith("application/json"):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    entry = CacheEntry(
+        body=body,
+        etag=make_etag(body),
+        headers={name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers},
+        tags=policy.tags_for(params),
+    )
+    try:
+        await response_cache.store(key, entry, policy.ttl_seconds, generation)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Response cache write failed: %s", exc)
+    return _cached_response(entry, "MISS", etag_matches(if_none_match, entry.etag))
@@ -4,14 +4,58 @@ import httpx
 import time
 import math
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, timezone
 
 from app.core.exceptions import ReverbAPIError
 from app.core.config import get_settings
+from app.services.http_pool import SharedHttpPool
 
 logger = logging.getLogger(__name__)
 
+
+# Process-wide pooled transport shared by every ReverbClient instance. Services
+# construct ReverbClient freely (per request, per job), so the pool lives at
+# module level and is closed once from the FastAPI lifespan / scheduler exit.
+_pool = SharedHttpPool("Reverb", settings_prefix="REVERB")
+
+
+def build_http_client(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: Optional[bool] = None,
+    timeout: float = 30.0,
+) -> httpx.AsyncClient:
+    """
+    Build a keep-alive, connection-pooled AsyncClient for the Reverb API.
+
+    Unspecified limits fall back to the REVERB_HTTP_* settings.
+    """
+    return _pool.build(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        http2=http2,
+        timeout=timeout,
+    )
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared pooled client, creating it on first use.
+
+    A new pool is created (and the old one closed) when called from a
+    different event loop; see app.services.http_pool.
+    """
+    return _pool.get()
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared pool. Safe to call when no pool was ever created."""
+    await _pool.close()
+
+
 class ReverbClient:
     """
     Purpose: Defines ReverbClient, an asynchronous client for interacting with the Reverb REST API (v3).
@@ -31,18 +75,34 @@ class ReverbClient:
     PRODUCTION_BASE_URL = "https://api.reverb.com/api"
     SANDBOX_BASE_URL = "https://sandbox.reverb.com/api"
     
-    def __init__(self, api_key: str, use_sandbox: bool = False):
+    def __init__(
+        self,
+        api_key: str,
+        use_sandbox: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize the Reverb client
         
         Args:
             api_key: Reverb API key
             use_sandbox: Whether to use the sandbox environment
+            http_client: Optional AsyncClient to send requests through. When omitted
+                the process-wide pooled client is used (see get_shared_http_client).
+                A client passed in here is owned by the caller and is not closed by us.
         """
         self.api_key = api_key
         self.use_sandbox = use_sandbox
         self.BASE_URL = self.SANDBOX_BASE_URL if use_sandbox else self.PRODUCTION_BASE_URL
+        self._http_client = http_client
         logger.info(f"Initializing ReverbClient with {'sandbox' if use_sandbox else 'production'} environment")
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The pooled AsyncClient used for all requests from this instance."""
+        if self._http_client is not None and not self._http_client.is_closed:
+            return self._http_client
+        return get_shared_http_client()
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
@@ -98,43 +158,43 @@ class ReverbClient:
             logger.debug(f"Data: {json.dumps(data)[:500]}...")  # Log only first 500 chars of data
         
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data,
-                    params=params
-                )
-                
-                if response.status_code not in (200, 201, 202, 204, 422):
-                    logger.error(f"Reverb API error: Status {response.status_code}, Body: {response.text}")
-                    error_msg = f"Request failed with status {response.status_code}"
-                    if response.text:
-                        error_msg += f": {response.text}"
-                    raise ReverbAPIError(error_msg)
+            response = await self.http_client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=data,
+                params=params,
+                timeout=timeout,
+            )
 
-                if response.status_code == 204:  # No content
-                    return {}
+            if response.status_code not in (200, 201, 202, 204, 422):
+                logger.error(f"Reverb API error: Status {response.status_code}, Body: {response.text}")
+                error_msg = f"Request failed with status {response.status_code}"
+                if response.text:
+                    error_msg += f": {response.text}"
+                raise ReverbAPIError(error_msg)
 
-                # Get the JSON response
-                json_response = response.json()
+            if response.status_code == 204:  # No content
+                return {}
 
-                # Handle 422 responses (validation errors)
-                if response.status_code == 422:
-                    # Check if a draft listing was created despite validation errors
-                    if isinstance(json_response, dict) and 'listing' in json_response and 'id' in json_response['listing']:
-                        logger.warning(f"Reverb created draft listing {json_response['listing']['id']} with validation warnings: {json_response.get('errors', {})}")
-                        return json_response['listing']
-                    else:
-                        # No listing was created, treat as error
-                        error_msg = f"Validation failed: {json_response.get('message', 'Unknown error')}"
-                        if 'errors' in json_response:
-                            error_msg += f" - Errors: {json_response['errors']}"
-                        raise ReverbAPIError(error_msg)
+            # Get the JSON response
+            json_response = response.json()
+
+            # Handle 422 responses (validation errors)
+            if response.status_code == 422:
+                # Check if a draft listing was created despite validation errors
+                if isinstance(json_response, dict) and 'listing' in json_response and 'id' in json_response['listing']:
+                    logger.warning(f"Reverb created draft listing {json_response['listing']['id']} with validation warnings: {json_response.get('errors', {})}")
+                    return json_response['listing']
+                else:
+                    # No listing was created, treat as error
+                    error_msg = f"Validation failed: {json_response.get('message', 'Unknown error')}"
+                    if 'errors' in json_response:
+                        error_msg += f" - Errors: {json_response['errors']}"
+                    raise ReverbAPIError(error_msg)
+
+            return json_response
 
-                return json_response
-        
         except httpx.RequestError as e:
             logger.error(f"Network error: {str(e)}")
             raise ReverbAPIError(f"Network error: {str(e)}")
@@ -430,7 +490,13 @@ class ReverbClient:
             "Please upload the image to a publicly accessible URL first, then use that URL."
         )
         
-    async def get_my_listings(self, page: int = 1, per_page: int = 50, state: str = "all") -> Dict:
+    async def get_my_listings(
+        self,
+        page: int = 1,
+        per_page: int = 50,
+        state: str = "all",
+        updated_start_date: Optional[datetime] = None,
+    ) -> Dict:
         """
         Get current user's listings from Reverb
         
@@ -438,62 +504,197 @@ class ReverbClient:
             page: Page number
             per_page: Items per page
             state: Listing state ('all', 'live', 'draft', 'sold', 'ended', 'suspended')
+            updated_start_date: Only return listings updated at or after this time
         """
         headers = self._get_headers()
-        url = f"{self.BASE_URL}/my/listings?page={page}&per_page={per_page}&state={state}"
+        url = f"{self.BASE_URL}/my/listings"
+        params = {"page": page, "per_page": per_page, "state": state}
+        if updated_start_date is not None:
+            params["updated_start_date"] = updated_start_date.isoformat()
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code != 200:
-                    logger.error(f"Reverb API error: {response.text}")
-                    raise ReverbAPIError(f"Failed to get listings: {response.text}")
-                
-                return response.json()
+            response = await self.http_client.get(url, headers=headers, params=params)
+
+            if response.status_code != 200:
+                logger.error(f"Reverb API error: {response.text}")
+                raise ReverbAPIError(f"Failed to get listings: {response.text}")
+
+            return response.json()
         
         except httpx.RequestError as e:
             logger.error(f"Network error getting listings: {str(e)}")
             raise ReverbAPIError(f"Network error getting listings: {str(e)}")
         
-    async def get_all_listings(self, state: str = "all") -> List[Dict]:
+    async def iter_listing_pages(
+        self,
+        state: str = "all",
+        per_page: int = 50,
+        max_concurrent_pages: int = 5,
+        updated_start_date: Optional[datetime] = None,
+    ) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """
+        Yield (page_number, listings) for every page of the user's listings.
+
+        Page 1 is fetched first to read `total`; the remaining pages are then
+        requested concurrently (at most max_concurrent_pages at once) and yielded
+        in the order they arrive, so consumers can start work before the last
+        page lands.
+
+        Args:
+            state: Listing state to fetch ('all', 'live', 'draft', 'sold', 'ended')
+            per_page: Listings per page
+            max_concurrent_pages: Maximum number of page requests in flight
+            updated_start_date: Only return listings updated at or after this time
+        """
+        first_page = await self.get_my_listings(
+            page=1, per_page=per_page, state=state, updated_start_date=updated_start_date
+        )
+        listings = first_page.get('listings', [])
+        if not listings:
+            return
+        yield 1, listings
+
+        total = first_page.get('total', 0)
+        total_pages = math.ceil(total / per_page) if per_page else 1
+        if total_pages <= 1:
+            return
+
+        logger.info(f"Reverb has {total} '{state}' listings; fetching pages 2-{total_pages} concurrently")
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_pages))
+
+        async def fetch_page(page: int) -> Tuple[int, List[Dict]]:
+            async with semaphore:
+                response = await self.get_my_listings(
+                    page=page, per_page=per_page, state=state, updated_start_date=updated_start_date
+                )
+            return page, response.get('listings', [])
+
+        tasks = [asyncio.create_task(fetch_page(page)) for page in range(2, total_pages + 1)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                page, page_listings = await next_done
+                if page_listings:
+                    yield page, page_listings
+        finally:
+            # Consumer stopped early or a page failed: don't leave requests running
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_all_listings(
+        self,
+        state: str = "all",
+        updated_start_date: Optional[datetime] = None,
+        on_page: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Dict]:
         """
         Get all listings by paginating through results
 
         Args:
             state: Listing state to fetch ('all', 'live', 'draft', 'sold', 'ended')
+            updated_start_date: Only return listings updated at or after this time
+            on_page: Called with (pages fetched, listings fetched) as each page arrives
 
         Returns:
-            List[Dict]: All listings
-        """
+            List[Dict]: All listings, in page order
+        """
+        pages: Dict[int, List[Dict]] = {}
+        fetched = 0
+        async for page, listings in self.iter_listing_pages(state=state, updated_start_date=updated_start_date):
+            pages[page] = listings
+            fetched += len(listings)
+            if on_page:
+                on_page(len(pages), fetched)
+
         all_listings = []
-        page = 1
-        per_page = 50
-        
-        while True:
-            response = await self.get_my_listings(page=page, per_page=per_page, state=state)
-            listings = response.get('listings', [])
-            
-            if not listings:
-                break
-                
-            all_listings.extend(listings)
-            
-            # Check if we've reached the last page
-            total = response.get('total', 0)
-            if page * per_page >= total:
-                break
-                
-            page += 1
-        
+        for page in sorted(pages):
+            all_listings.extend(pages[page])
         return all_listings
-    
+
+    async def iter_all_listings_detailed(
+        self,
+        max_concurrent: int = 10,
+        state: str = "all",
+        max_concurrent_pages: int = 5,
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield full listing details as they are fetched.
+
+        Pagination and detail fetching are pipelined: listings from each page are
+        pushed onto a bounded queue as soon as the page arrives and max_concurrent
+        workers fetch their details, so only the listings in flight are held in
+        memory rather than the whole basic catalogue. If a detail call fails the
+        basic listing is yielded instead. Order follows completion, not pages.
+
+        Args:
+            max_concurrent: Maximum number of concurrent detail requests
+            state: Listing state to fetch ('all', 'live', 'draft', 'sold', 'ended')
+            max_concurrent_pages: Maximum number of concurrent page requests
+        """
+        workers_count = max(1, max_concurrent)
+        pending: asyncio.Queue = asyncio.Queue(maxsize=workers_count * 2)
+        results: asyncio.Queue = asyncio.Queue()
+        done_marker = object()
+        # Set once the consumer has gone (break / aclose() / cancellation) and the
+        # workers are being cancelled; the producer must not wait on them then
+        stopping = False
+
+        async def produce():
+            try:
+                async for _, listings in self.iter_listing_pages(
+                    state=state, max_concurrent_pages=max_concurrent_pages
+                ):
+                    for listing in listings:
+                        await pending.put(listing)
+            finally:
+                if not stopping:
+                    for _ in range(workers_count):
+                        await pending.put(done_marker)
+
+        async def work():
+            while True:
+                listing = await pending.get()
+                if listing is done_marker:
+                    await results.put(done_marker)
+                    return
+                listing_id = listing.get('id')
+                if not listing_id:
+                    logger.warning(f"Listing missing ID: {listing}")
+                    await results.put(listing)
+                    continue
+                try:
+                    await results.put(await self.get_listing_details(str(listing_id)))
+                except Exception as e:
+                    logger.warning(f"Error getting details for listing {listing_id}: {str(e)}")
+                    await results.put(listing)  # Return basic listing if details fail
+
+        producer = asyncio.create_task(produce())
+        workers = [asyncio.create_task(work()) for _ in range(workers_count)]
+        finished_workers = 0
+        try:
+            while finished_workers < workers_count:
+                item = await results.get()
+                if item is done_marker:
+                    finished_workers += 1
+                    continue
+                yield item
+            # Surface pagination failures once the workers have drained
+            await producer
+        finally:
+            stopping = True
+            for task in [producer, *workers]:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(producer, *workers, return_exceptions=True)
+
     async def get_all_listings_detailed(self, max_concurrent: int = 10, state: str = "all") -> List[Dict]:
         """
         Get all listings with detailed information (handles pagination) using concurrent requests
         
         This enhanced version gets full listing details for each listing, which
-        provides all the data we need for our enhanced schema.
+        provides all the data we need for our enhanced schema. Detail requests
+        start as soon as the first page arrives (see iter_all_listings_detailed).
         
         Args:
             max_concurrent: Maximum number of concurrent API calls (default: 10)
@@ -506,50 +707,15 @@ class ReverbClient:
             ReverbAPIError: If the API request fails
         """
         try:
-            # First get the basic listings to get listing IDs
-            basic_listings = await self.get_all_listings(state=state)
-            logger.info(f"Got {len(basic_listings)} basic listings, fetching details...")
-            
-            # Create semaphore to limit concurrent requests
-            semaphore = asyncio.Semaphore(max_concurrent)
-            
-            async def get_details_with_semaphore(listing):
-                async with semaphore:
-                    try:
-                        listing_id = listing.get('id')
-                        if listing_id:
-                            detailed = await self.get_listing_details(str(listing_id))
-                            return detailed
-                        else:
-                            logger.warning(f"Listing missing ID: {listing}")
-                            return listing
-                    except Exception as e:
-                        logger.warning(f"Error getting details for listing {listing.get('id')}: {str(e)}")
-                        return listing  # Return basic listing if details fail
-            
-            # Execute all detail requests concurrently
-            logger.info(f"Starting {len(basic_listings)} concurrent detail requests (max {max_concurrent} at once)...")
-            detailed_listings = await asyncio.gather(
-                *[get_details_with_semaphore(listing) for listing in basic_listings],
-                return_exceptions=True
-            )
-            
-            # Filter out any exceptions and log them
-            valid_listings = []
-            for i, result in enumerate(detailed_listings):
-                if isinstance(result, Exception):
-                    logger.error(f"Failed to get details for listing {basic_listings[i].get('id')}: {result}")
-                    valid_listings.append(basic_listings[i])  # Use basic listing as fallback
-                else:
-                    valid_listings.append(result)
-            
-            logger.info(f"Successfully retrieved details for {len(valid_listings)} listings")
-            return valid_listings
-            
-        except Exception as e:
-            logger.error(f"Error getting all listings with details: {str(e)}")
-            raise ReverbAPIError(f"Failed to get all listings with details: {str(e)}")
-        
+            logger.info(f"Fetching '{state}' listings with details (max {max_concurrent} concurrent detail requests)...")
+            detailed_listings = [
+                listing async for listing in self.iter_all_listings_detailed(
+                    max_concurrent=max_concurrent, state=state
+                )
+            ]
+            logger.info(f"Successfully retrieved details for {len(detailed_listings)} listings")
+            return detailed_listings
+
         except Exception as e:
             logger.error(f"Error getting all listings with details: {str(e)}")
             raise ReverbAPIError(f"Failed to get all listings with details: {str(e)}")
@@ -572,23 +738,22 @@ class ReverbClient:
             headers = self._get_headers()
             url = f"{self.BASE_URL}/listings/{listing_id}"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code != 200:
-                    logger.error(f"Reverb API error: {response.text}")
-                    raise ReverbAPIError(f"Failed to get listing details: {response.text}")
-                
-                data = response.json()
-                
-                # Debug log
-                if 'slug' in data:
-                    logger.info(f"Listing {listing_id} has slug: {data['slug']}")
-                else:
-                    # [logger.warning(f"Listing {listing_id} MISSING slug field")
-                    logger.info(f"Available fields: {list(data.keys())}")
-                
-                return data
+            response = await self.http_client.get(url, headers=headers)
+
+            if response.status_code != 200:
+                logger.error(f"Reverb API error: {response.text}")
+                raise ReverbAPIError(f"Failed to get listing details: {response.text}")
+
+            data = response.json()
+
+            # Debug log
+            if 'slug' in data:
+                logger.info(f"Listing {listing_id} has slug: {data['slug']}")
+            else:
+                # [logger.warning(f"Listing {listing_id} MISSING slug field")
+                logger.info(f"Available fields: {list(data.keys())}")
+
+            return data
         
         except httpx.RequestError as e:
             logger.error(f"Network error getting listing details: {str(e)}")
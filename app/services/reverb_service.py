@@ -7,12 +7,11 @@ import logging
 import iso8601
 import re
 
-from datetime import datetime, timezone    
+from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
 from typing import Dict, List, Optional, Any, Tuple, Set
 from urllib.parse import urlparse, parse_qs
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.future import select
 from sqlalchemy import update, text, func
 from sqlalchemy.orm import selectinload
@@ -30,10 +29,50 @@ from app.services.activity_logger import ActivityLogger
 from app.core.enums import PlatformName, Handedness, ManufacturingCountry
 from app.models.category_mappings import ReverbCategory
 from app.services.sku_service import generate_next_riff_sku
+from app.services.sync_event_writer import bulk_insert_sync_events
+from app.services.snapshot_diff import SnapshotDiffSpec, calculate_changes_in_db, snapshot_diff_enabled
+from app.services.websockets.manager import publish_sync_progress
+from app.services.sync_watermarks import get_sync_watermark, needs_full_reconcile, save_sync_watermark
 from app.services.condition_mapping_service import ConditionMappingService
 
 logger = logging.getLogger(__name__)
 
+# Every Reverb listing known locally (any status), one row per external_id,
+# preferring the live reverb_listings row (see _fetch_local_live_reverb_ids)
+_LOCAL_REVERB_LISTINGS_SQL = """
+    SELECT DISTINCT ON (pc.external_id)
+        pc.external_id,
+        pc.product_id,
+        pc.id AS platform_common_id,
+        pc.status AS platform_status,
+        rl.reverb_state
+    FROM platform_common pc
+    LEFT JOIN reverb_listings rl ON pc.id = rl.platform_id
+    WHERE pc.platform_name = 'reverb'
+      AND pc.external_id IS NOT NULL
+      AND pc.status NOT IN ('deleted', 'removed')
+      {id_filter}
+    ORDER BY pc.external_id,
+             CASE WHEN rl.reverb_state = 'live' THEN 0 ELSE 1 END
+"""
+
+# Same test as ReverbService._locally_live_ids, over a local row l
+_LOCALLY_LIVE_SQL = "(lower(COALESCE(l.reverb_state, '')) = 'live' OR lower(COALESCE(l.platform_status, '')) IN ('active', 'live'))"
+
+# Full sync diff in Postgres (SYNC_SNAPSHOT_DIFF_IN_DB): the snapshot is the live
+# listing ids. Matched rows come back only when _live_listing_events has work
+# (local state not live, or a stale reverb_listings state); removals are rows
+# live locally but no longer live on Reverb.
+REVERB_SNAPSHOT_DIFF = SnapshotDiffSpec(
+    platform="reverb",
+    local_sql=_LOCAL_REVERB_LISTINGS_SQL.format(id_filter=""),
+    changed_sql="""
+        lower(COALESCE(l.reverb_state, '')) NOT IN ('', 'live')
+        OR lower(COALESCE(NULLIF(l.reverb_state, ''), l.platform_status, '')) NOT IN ('live', 'active')
+    """,
+    remove_sql=_LOCALLY_LIVE_SQL,
+)
+
 class ReverbService:
     """
     Service for interacting with Reverb marketplace.
@@ -1777,14 +1816,20 @@ class ReverbService:
         result = await self.db.execute(query)
         return result.scalars().first()
 
-    async def _get_all_listings_from_api(self, state: str) -> List[Dict]:
+    async def _get_all_listings_from_api(self, state: str, sync_run_id: Optional[uuid.UUID] = None) -> List[Dict]:
         """
         Fetches all listings for a given state by paginating through results
-        using the service's own client.
+        using the service's own client. Publishes fetch progress per page.
         """
         logger.info(f"Fetching all listings from Reverb API with state: '{state}'...")
+
+        def on_page(pages_fetched: int, items_fetched: int) -> None:
+            publish_sync_progress(
+                "reverb", "fetch", sync_run_id, pages_fetched=pages_fetched, items_fetched=items_fetched,
+            )
+
         # This now correctly uses the service's own configured client
-        return await self.client.get_all_listings(state=state)
+        return await self.client.get_all_listings(state=state, on_page=on_page)
     
     async def _prepare_listing_data(self, listing: ReverbListing, product: Product) -> Dict[str, Any]:
         """
@@ -2195,13 +2240,7 @@ class ReverbService:
         # Bulk insert with ON CONFLICT DO NOTHING to handle duplicates gracefully
         if events_to_create:
             try:
-                stmt = insert(SyncEvent).values(events_to_create)
-                stmt = stmt.on_conflict_do_nothing(
-                    constraint='sync_events_platform_external_change_unique'
-                )
-                result = await self.db.execute(stmt)
-                events_logged = len(events_to_create)
-                logger.info(f"Attempted to log {len(events_to_create)} new listing events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, events_to_create)
             except Exception as e:
                 logger.error(f"Failed to bulk insert new listing events: {e}", exc_info=True)
         
@@ -2262,13 +2301,7 @@ class ReverbService:
         # Bulk insert all events with duplicate handling
         if all_events:
             try:
-                stmt = insert(SyncEvent).values(all_events)
-                stmt = stmt.on_conflict_do_nothing(
-                    constraint='sync_events_platform_external_change_unique'
-                )
-                result = await self.db.execute(stmt)
-                events_logged = len(all_events)
-                logger.info(f"Attempted to log {len(all_events)} update events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, all_events)
             except Exception as e:
                 logger.error(f"Failed to bulk insert update events: {e}", exc_info=True)
         
@@ -2314,13 +2347,7 @@ class ReverbService:
                 logger.error(f"Failed to prepare events for Reverb item {item['api_data']['external_id']}: {e}", exc_info=True)
         
         if all_events:
-            stmt = insert(SyncEvent).values(all_events)
-            stmt = stmt.on_conflict_do_nothing(
-                index_elements=['platform_name', 'external_id', 'change_type'],
-                index_where=(SyncEvent.status == 'pending')
-            )
-            await self.db.execute(stmt)
-            events_logged = len(all_events)
+            events_logged = await bulk_insert_sync_events(self.db, all_events)
 
         return updated_count, events_logged
 
@@ -2353,13 +2380,7 @@ class ReverbService:
         # Bulk insert with duplicate handling
         if events_to_create:
             try:
-                stmt = insert(SyncEvent).values(events_to_create)
-                stmt = stmt.on_conflict_do_nothing(
-                    constraint='sync_events_platform_external_change_unique'
-                )
-                result = await self.db.execute(stmt)
-                events_logged = len(events_to_create)
-                logger.info(f"Attempted to log {len(events_to_create)} removal events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, events_to_create)
             except Exception as e:
                 logger.error(f"Failed to bulk insert removal events: {e}", exc_info=True)
         
@@ -2548,183 +2569,352 @@ class ReverbService:
             stats['errors'] += 1
             return {"status": "error", "message": str(e), **stats}
 
-    async def run_import_process(self, sync_run_id: uuid.UUID) -> Dict[str, Any]:
+    async def run_import_process(self, sync_run_id: uuid.UUID, incremental: bool = False) -> Dict[str, Any]:
         """
         Runs the sync for Reverb. This method detects new live listings on Reverb
         and status changes for existing listings (e.g., live -> sold).
+
+        With incremental=True only listings updated since the stored watermark
+        (less a small overlap) are fetched. A full reconcile still runs when no
+        watermark exists or the last full sync is older than
+        REVERB_FULL_RECONCILE_HOURS, which also catches listings deleted on
+        Reverb (they never show up in the updated-since feed).
         """
         stats = {"api_live_count": 0, "db_live_count": 0, "db_known_count": 0, "events_logged": 0, "errors": 0}
+        sync_started_at = datetime.now(timezone.utc)
         logger.info(f"=== ReverbService: STARTING SYNC (run_id: {sync_run_id}) ===")
 
         try:
-            # 1. Fetch all LIVE listings from the Reverb API.
-            live_listings_api = await self._get_all_listings_from_api(state='live')
-            api_live_ids = {str(item['id']) for item in live_listings_api}
-            stats['api_live_count'] = len(api_live_ids)
-            logger.info(f"Found {stats['api_live_count']} live listings on Reverb API.")
+            since = None
+            if incremental:
+                watermark = await get_sync_watermark(self.db, "reverb")
+                full_interval = timedelta(hours=self.settings.REVERB_FULL_RECONCILE_HOURS)
+                if needs_full_reconcile(watermark, full_interval, now=sync_started_at):
+                    logger.info("Reverb full reconcile due (no watermark or last full sync too old).")
+                else:
+                    overlap = timedelta(minutes=self.settings.REVERB_SYNC_WATERMARK_OVERLAP_MINUTES)
+                    since = watermark.watermark_at - overlap
+
+            if since is None:
+                stats["mode"] = "full"
+                events_to_log = await self._collect_full_sync_events(sync_run_id, stats)
+            else:
+                stats["mode"] = "incremental"
+                events_to_log = await self._collect_incremental_sync_events(sync_run_id, since, stats)
+
+            # Log all generated events to the database.
+            if events_to_log:
+                stats['events_logged'] = await self._batch_log_events(events_to_log)
+            publish_sync_progress("reverb", "events", sync_run_id, events_written=stats['events_logged'])
+
+            # Advance the watermark in the same transaction as the events
+            await save_sync_watermark(
+                self.db,
+                "reverb",
+                watermark_at=sync_started_at,
+                full_sync=since is None,
+                sync_run_id=sync_run_id,
+            )
 
+            await self.db.commit()
+            logger.info(f"=== ReverbService: FINISHED SYNC === Final Stats: {stats}")
+            return {"status": "success", "message": "Reverb sync complete.", **stats}
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Reverb sync failed: {e}", exc_info=True)
+            stats['errors'] += 1
+            return {"status": "error", "message": str(e), **stats}
+
+    async def _collect_full_sync_events(self, sync_run_id: uuid.UUID, stats: Dict[str, Any]) -> List[Dict]:
+        """Compare every live listing on Reverb with everything known locally."""
+        # 1. Fetch all LIVE listings from the Reverb API.
+        live_listings_api = await self._get_all_listings_from_api(state='live', sync_run_id=sync_run_id)
+        api_live_ids = {str(item['id']) for item in live_listings_api}
+        stats['api_live_count'] = len(api_live_ids)
+        logger.info(f"Found {stats['api_live_count']} live listings on Reverb API.")
+
+        if snapshot_diff_enabled(self.settings):
+            # 2-3. Diff in Postgres; only rows that need an event come back
+            new_rogue_ids, live_known_ids, missing_from_api_ids, local_reverb_items = (
+                await self._diff_live_ids_in_db(api_live_ids, stats)
+            )
+        else:
             # 2. Fetch all Reverb listings we already know about in our local DB (any status).
             local_reverb_items = await self._fetch_local_live_reverb_ids()
             local_known_ids = set(local_reverb_items.keys())
 
             # Determine which of the known listings we currently consider "live" locally.
-            local_live_ids = {
-                reverb_id
-                for reverb_id, data in local_reverb_items.items()
-                if str(data.get('reverb_state', '')).lower() == 'live'
-                or str(data.get('platform_status', '')).lower() in {'active', 'live'}
-            }
+            local_live_ids = self._locally_live_ids(local_reverb_items)
 
             stats['db_known_count'] = len(local_known_ids)
             stats['db_live_count'] = len(local_live_ids)
-            logger.info(
-                "Found %s Reverb listings in local DB (%s marked live locally).",
-                stats['db_known_count'],
-                stats['db_live_count'],
-            )
 
             # 3. Compare the sets of IDs to find differences.
             new_rogue_ids = api_live_ids - local_known_ids
+            live_known_ids = api_live_ids & local_known_ids
             missing_from_api_ids = {reverb_id for reverb_id in local_live_ids if reverb_id not in api_live_ids}
 
-            # Create a mapping for easy access to listing data
-            api_listings_map = {str(listing['id']): listing for listing in live_listings_api}
+        logger.info(
+            "Found %s Reverb listings in local DB (%s marked live locally).",
+            stats['db_known_count'],
+            stats['db_live_count'],
+        )
 
-            logger.info(f"Detected {len(new_rogue_ids)} new 'rogue' listings and {len(missing_from_api_ids)} potential status changes.")
+        # Create a mapping for easy access to listing data
+        api_listings_map = {str(listing['id']): listing for listing in live_listings_api}
 
-            events_to_log = []
+        logger.info(f"Detected {len(new_rogue_ids)} new 'rogue' listings and {len(missing_from_api_ids)} potential status changes.")
+        publish_sync_progress(
+            "reverb", "diff", sync_run_id,
+            items_diffed=len(api_live_ids), created=len(new_rogue_ids), removed=len(missing_from_api_ids),
+        )
 
-            # 4. Create 'new_listing' events for rogue items.
-            for reverb_id in new_rogue_ids:
-                listing = api_listings_map.get(reverb_id, {})
-
-                # Extract primary image URL
-                photos = listing.get('photos', [])
-                primary_image_url = None
-                if photos:
-                    primary_image_url = photos[0].get('_links', {}).get('full', {}).get('href')
-
-                # Extract listing details
-                change_data = {
-                    'reason': 'Live on Reverb but not in local DB',
-                    'title': listing.get('title'),
-                    'price': listing.get('price', {}).get('amount'),
-                    'brand': listing.get('make'),  # Reverb uses 'make' for brand
-                    'model': listing.get('model'),
-                    'primary_image_url': primary_image_url
-                }
+        # 4. Create 'new_listing' events for rogue items.
+        events_to_log = [
+            self._prepare_sync_event(
+                sync_run_id, 'new_listing', external_id=reverb_id,
+                change_data=self._new_listing_change_data(api_listings_map.get(reverb_id, {}))
+            )
+            for reverb_id in new_rogue_ids
+        ]
+
+        # 5. For listings that exist both locally and on the API, detect status mismatches.
+        events_to_log.extend(
+            await self._live_listing_events(sync_run_id, live_known_ids, local_reverb_items)
+        )
+
+        # 6. For items no longer 'live' on the API, fetch their details to find out WHY.
+        for reverb_id in missing_from_api_ids:
+            db_item = local_reverb_items[reverb_id]
+            try:
+                # This second API call is crucial to get the new status (e.g., 'sold', 'ended').
+                details = await self.client.get_listing_details(reverb_id)
+                new_status = details.get('state', {}).get('slug', 'unknown')
+
+                # Only log if status actually changed (avoid false positives from API lag/pagination)
+                if new_status == 'live':
+                    logger.info(f"Item {reverb_id} still live on API - skipping false positive status_change")
+                    continue
 
                 events_to_log.append(self._prepare_sync_event(
-                    sync_run_id, 'new_listing', external_id=reverb_id,
-                    change_data=change_data
+                    sync_run_id, 'status_change',
+                    external_id=reverb_id,
+                    product_id=db_item['product_id'],
+                    platform_common_id=db_item['platform_common_id'],
+                    change_data={'old': 'live', 'new': new_status, 'reverb_id': reverb_id}
                 ))
+            except ReverbAPIError:
+                # If the API gives a 'Not Found' error, the listing was likely deleted.
+                logger.warning(f"Logging item {reverb_id} as 'deleted' due to API error (Not Found).")
+                events_to_log.append(self._prepare_sync_event(
+                    sync_run_id, 'status_change',
+                    external_id=reverb_id,
+                    product_id=db_item['product_id'],
+                    platform_common_id=db_item['platform_common_id'],
+                    change_data={'old': 'live', 'new': 'deleted', 'reverb_id': reverb_id, 'reason': 'API Not Found'}
+                ))
+                stats['errors'] += 1
 
-            # 5. For listings that exist both locally and on the API, detect status mismatches
-            #    (e.g. local draft -> API live) and log them as status change events.
-            #    Also reconcile stale reverb_listings.reverb_state when API confirms live.
-            stale_rl_platform_ids = []
-            for reverb_id in api_live_ids & local_known_ids:
-                db_item = local_reverb_items.get(reverb_id)
-                if not db_item:
-                    continue
+        return events_to_log
 
-                rl_state = str(db_item.get('reverb_state') or '').lower()
-                pc_status = str(db_item.get('platform_status') or '').lower()
+    async def _diff_live_ids_in_db(
+        self, api_live_ids: Set[str], stats: Dict[str, Any]
+    ) -> Tuple[Set[str], Set[str], Set[str], Dict[str, Dict]]:
+        """
+        Steps 2-3 of _collect_full_sync_events with the comparison done in Postgres.
 
-                # Reconcile: API says live, but reverb_listings.reverb_state is stale
-                if rl_state and rl_state != 'live':
-                    pc_id = db_item.get('platform_common_id')
-                    if pc_id:
-                        stale_rl_platform_ids.append(pc_id)
-                        logger.info(
-                            "Reconciling stale reverb_listings state for %s "
-                            "(rl=%s, pc=%s -> live)",
-                            reverb_id, rl_state, pc_status,
-                        )
+        Returns (new ids, live-and-known ids needing a check, ids live locally
+        but gone from the API, local rows for those ids).
+        """
+        counts = (await self.db.execute(text(f"""
+            SELECT count(*) AS known, count(*) FILTER (WHERE {_LOCALLY_LIVE_SQL}) AS live
+            FROM ({REVERB_SNAPSHOT_DIFF.local_sql}) l
+        """))).one()
+        stats['db_known_count'] = counts.known
+        stats['db_live_count'] = counts.live
+
+        changes = await calculate_changes_in_db(
+            self.db,
+            REVERB_SNAPSHOT_DIFF,
+            {reverb_id: {'external_id': reverb_id, 'status': 'live'} for reverb_id in api_live_ids},
+        )
+        local_reverb_items = {str(change['db_data']['external_id']): change['db_data'] for change in changes['update']}
+        live_known_ids = set(local_reverb_items)
+        missing_from_api_ids = set()
+        for db_item in changes['remove']:
+            reverb_id = str(db_item['external_id'])
+            local_reverb_items[reverb_id] = db_item
+            missing_from_api_ids.add(reverb_id)
+        new_rogue_ids = {item['external_id'] for item in changes['create']}
+        return new_rogue_ids, live_known_ids, missing_from_api_ids, local_reverb_items
+
+    async def _collect_incremental_sync_events(
+        self, sync_run_id: uuid.UUID, since: datetime, stats: Dict[str, Any]
+    ) -> List[Dict]:
+        """
+        Compare only the listings Reverb reports as updated since `since`.
 
-                # Use reverb_state if available, fall back to platform_status
-                local_status = rl_state or pc_status
+        The listing payload already carries its state, so no per-listing
+        detail call is needed to classify live -> sold/ended transitions.
+        """
+        logger.info(f"Fetching Reverb listings updated since {since.isoformat()}...")
+        changed_listings = await self.client.get_all_listings(
+            state='all',
+            updated_start_date=since,
+            on_page=lambda pages, items: publish_sync_progress(
+                "reverb", "fetch", sync_run_id, pages_fetched=pages, items_fetched=items,
+            ),
+        )
+        changed_map = {str(listing['id']): listing for listing in changed_listings if listing.get('id')}
+        api_live_ids = {
+            reverb_id for reverb_id, listing in changed_map.items()
+            if self._listing_state_slug(listing) == 'live'
+        }
+        stats['api_changed_count'] = len(changed_map)
+        stats['api_live_count'] = len(api_live_ids)
 
-                if local_status in {'live', 'active'}:
-                    continue
+        if not changed_map:
+            logger.info("No Reverb listings changed since last sync.")
+            return []
 
-                events_to_log.append(
-                    self._prepare_sync_event(
-                        sync_run_id,
-                        'status_change',
-                        external_id=reverb_id,
-                        product_id=db_item.get('product_id'),
-                        platform_common_id=db_item.get('platform_common_id'),
-                        change_data={
-                            'old': local_status or 'unknown',
-                            'new': 'live',
-                            'reverb_id': reverb_id,
-                        },
+        local_reverb_items = await self._fetch_local_live_reverb_ids(external_ids=list(changed_map))
+        local_known_ids = set(local_reverb_items.keys())
+        local_live_ids = self._locally_live_ids(local_reverb_items)
+        stats['db_known_count'] = len(local_known_ids)
+        stats['db_live_count'] = len(local_live_ids)
+        logger.info(
+            "%s Reverb listings changed (%s live); %s known locally (%s marked live).",
+            len(changed_map), len(api_live_ids), len(local_known_ids), len(local_live_ids),
+        )
+
+        events_to_log = [
+            self._prepare_sync_event(
+                sync_run_id, 'new_listing', external_id=reverb_id,
+                change_data=self._new_listing_change_data(changed_map[reverb_id])
+            )
+            for reverb_id in api_live_ids - local_known_ids
+        ]
+
+        events_to_log.extend(
+            await self._live_listing_events(sync_run_id, api_live_ids & local_known_ids, local_reverb_items)
+        )
+
+        for reverb_id in local_live_ids - api_live_ids:
+            new_status = self._listing_state_slug(changed_map[reverb_id])
+            if not new_status:
+                continue
+            db_item = local_reverb_items[reverb_id]
+            events_to_log.append(self._prepare_sync_event(
+                sync_run_id, 'status_change',
+                external_id=reverb_id,
+                product_id=db_item['product_id'],
+                platform_common_id=db_item['platform_common_id'],
+                change_data={'old': 'live', 'new': new_status, 'reverb_id': reverb_id}
+            ))
+
+        return events_to_log
+
+    async def _live_listing_events(
+        self, sync_run_id: uuid.UUID, live_known_ids: Set[str], local_reverb_items: Dict[str, Dict]
+    ) -> List[Dict]:
+        """
+        For listings live on Reverb and known locally, log status mismatches
+        (e.g. local draft -> API live) and reconcile stale
+        reverb_listings.reverb_state when the API confirms live.
+        """
+        events_to_log = []
+        stale_rl_platform_ids = []
+        for reverb_id in live_known_ids:
+            db_item = local_reverb_items.get(reverb_id)
+            if not db_item:
+                continue
+
+            rl_state = str(db_item.get('reverb_state') or '').lower()
+            pc_status = str(db_item.get('platform_status') or '').lower()
+
+            # Reconcile: API says live, but reverb_listings.reverb_state is stale
+            if rl_state and rl_state != 'live':
+                pc_id = db_item.get('platform_common_id')
+                if pc_id:
+                    stale_rl_platform_ids.append(pc_id)
+                    logger.info(
+                        "Reconciling stale reverb_listings state for %s "
+                        "(rl=%s, pc=%s -> live)",
+                        reverb_id, rl_state, pc_status,
                     )
-                )
 
-            # Batch-fix stale reverb_listings rows where API confirms live
-            if stale_rl_platform_ids:
-                logger.info(
-                    "Fixing %d stale reverb_listings.reverb_state -> 'live'",
-                    len(stale_rl_platform_ids),
-                )
-                await self.db.execute(
-                    text("""
-                        UPDATE reverb_listings
-                        SET reverb_state = 'live', last_synced_at = NOW()
-                        WHERE platform_id = ANY(:ids)
-                          AND reverb_state <> 'live'
-                    """),
-                    {"ids": stale_rl_platform_ids},
+            # Use reverb_state if available, fall back to platform_status
+            local_status = rl_state or pc_status
+
+            if local_status in {'live', 'active'}:
+                continue
+
+            events_to_log.append(
+                self._prepare_sync_event(
+                    sync_run_id,
+                    'status_change',
+                    external_id=reverb_id,
+                    product_id=db_item.get('product_id'),
+                    platform_common_id=db_item.get('platform_common_id'),
+                    change_data={
+                        'old': local_status or 'unknown',
+                        'new': 'live',
+                        'reverb_id': reverb_id,
+                    },
                 )
+            )
 
-            # 5. For items no longer 'live' on the API, fetch their details to find out WHY.
-            for reverb_id in missing_from_api_ids:
-                db_item = local_reverb_items[reverb_id]
-                try:
-                    # This second API call is crucial to get the new status (e.g., 'sold', 'ended').
-                    details = await self.client.get_listing_details(reverb_id)
-                    new_status = details.get('state', {}).get('slug', 'unknown')
+        # Batch-fix stale reverb_listings rows where API confirms live
+        if stale_rl_platform_ids:
+            logger.info(
+                "Fixing %d stale reverb_listings.reverb_state -> 'live'",
+                len(stale_rl_platform_ids),
+            )
+            await self.db.execute(
+                text("""
+                    UPDATE reverb_listings
+                    SET reverb_state = 'live', last_synced_at = NOW()
+                    WHERE platform_id = ANY(:ids)
+                      AND reverb_state <> 'live'
+                """),
+                {"ids": stale_rl_platform_ids},
+            )
 
-                    # Only log if status actually changed (avoid false positives from API lag/pagination)
-                    if new_status == 'live':
-                        logger.info(f"Item {reverb_id} still live on API - skipping false positive status_change")
-                        continue
+        return events_to_log
 
-                    events_to_log.append(self._prepare_sync_event(
-                        sync_run_id, 'status_change',
-                        external_id=reverb_id,
-                        product_id=db_item['product_id'],
-                        platform_common_id=db_item['platform_common_id'],
-                        change_data={'old': 'live', 'new': new_status, 'reverb_id': reverb_id}
-                    ))
-                except ReverbAPIError:
-                    # If the API gives a 'Not Found' error, the listing was likely deleted.
-                    logger.warning(f"Logging item {reverb_id} as 'deleted' due to API error (Not Found).")
-                    events_to_log.append(self._prepare_sync_event(
-                        sync_run_id, 'status_change',
-                        external_id=reverb_id,
-                        product_id=db_item['product_id'],
-                        platform_common_id=db_item['platform_common_id'],
-                        change_data={'old': 'live', 'new': 'deleted', 'reverb_id': reverb_id, 'reason': 'API Not Found'}
-                    ))
-                    stats['errors'] += 1
+    @staticmethod
+    def _locally_live_ids(local_reverb_items: Dict[str, Dict]) -> Set[str]:
+        return {
+            reverb_id
+            for reverb_id, data in local_reverb_items.items()
+            if str(data.get('reverb_state', '')).lower() == 'live'
+            or str(data.get('platform_status', '')).lower() in {'active', 'live'}
+        }
 
-            # 6. Log all generated events to the database.
-            if events_to_log:
-                await self._batch_log_events(events_to_log)
-                stats['events_logged'] = len(events_to_log)
-            
-            await self.db.commit()
-            logger.info(f"=== ReverbService: FINISHED SYNC === Final Stats: {stats}")
-            return {"status": "success", "message": "Reverb sync complete.", **stats}
+    @staticmethod
+    def _listing_state_slug(listing: Dict[str, Any]) -> Optional[str]:
+        state = listing.get('state')
+        if isinstance(state, dict):
+            state = state.get('slug')
+        return str(state).lower() if state else None
 
-        except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Reverb sync failed: {e}", exc_info=True)
-            stats['errors'] += 1
-            return {"status": "error", "message": str(e), **stats}
+    @staticmethod
+    def _new_listing_change_data(listing: Dict[str, Any]) -> Dict[str, Any]:
+        # Extract primary image URL
+        photos = listing.get('photos', [])
+        primary_image_url = None
+        if photos:
+            primary_image_url = photos[0].get('_links', {}).get('full', {}).get('href')
+
+        return {
+            'reason': 'Live on Reverb but not in local DB',
+            'title': listing.get('title'),
+            'price': listing.get('price', {}).get('amount'),
+            'brand': listing.get('make'),  # Reverb uses 'make' for brand
+            'model': listing.get('model'),
+            'primary_image_url': primary_image_url
+        }
 
     # Ensure these helper methods are in your ReverbService class
     
@@ -2843,22 +3033,13 @@ class ReverbService:
             'status': 'pending'
         }
 
-    async def _batch_log_events(self, events: List[Dict]):
-        """Bulk inserts a list of sync events."""
+    async def _batch_log_events(self, events: List[Dict]) -> int:
+        """Bulk inserts a list of sync events, returning how many were new."""
         if not events:
-            return
+            return 0
         logger.info(f"Logging {len(events)} events to the database.")
         try:
-            # stmt = insert(SyncEvent).values(events)
-            # stmt = stmt.on_conflict_do_nothing(
-            #     constraint='sync_events_platform_external_change_unique'
-            # )
-            stmt = insert(SyncEvent).values(events)
-            stmt = stmt.on_conflict_do_nothing(
-                index_elements=['platform_name', 'external_id', 'change_type'],
-                index_where=(SyncEvent.status == 'pending')
-            )
-            await self.db.execute(stmt)
+            return await bulk_insert_sync_events(self.db, events)
         except Exception as e:
             logger.error(f"Failed to bulk insert sync events: {e}", exc_info=True)
             raise
@@ -2964,30 +3145,19 @@ class ReverbService:
                 {"product_id": product_id}
             )
 
-    async def _fetch_local_live_reverb_ids(self) -> Dict[str, Dict]:
+    async def _fetch_local_live_reverb_ids(self, external_ids: Optional[List[str]] = None) -> Dict[str, Dict]:
         """Fetch all known Reverb listings from the local DB, regardless of status.
 
         Uses DISTINCT ON to return one row per external_id, preferring the
         reverb_listings row with state='live' (handles refreshed items that
-        have both an old 'ended' and a new 'live' RL row).
+        have both an old 'ended' and a new 'live' RL row). Pass external_ids
+        to restrict the lookup to those listings (incremental sync).
         """
         logger.info("Fetching Reverb listings from local DB (all statuses).")
-        query = text("""
-            SELECT DISTINCT ON (pc.external_id)
-                pc.external_id,
-                pc.product_id,
-                pc.id AS platform_common_id,
-                pc.status AS platform_status,
-                rl.reverb_state
-            FROM platform_common pc
-            LEFT JOIN reverb_listings rl ON pc.id = rl.platform_id
-            WHERE pc.platform_name = 'reverb'
-              AND pc.external_id IS NOT NULL
-              AND pc.status NOT IN ('deleted', 'removed')
-            ORDER BY pc.external_id,
-                     CASE WHEN rl.reverb_state = 'live' THEN 0 ELSE 1 END
-        """)
-        result = await self.db.execute(query)
+        id_filter = "AND pc.external_id = ANY(:external_ids)" if external_ids is not None else ""
+        query = text(_LOCAL_REVERB_LISTINGS_SQL.format(id_filter=id_filter))
+        params = {"external_ids": external_ids} if external_ids is not None else {}
+        result = await self.db.execute(query, params)
         return {str(row.external_id): row._asdict() for row in result.fetchall()}
 
     def _convert_api_timestamp_to_naive_utc(self, timestamp_str: str | None) -> datetime | None:
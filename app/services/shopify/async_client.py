@@ -0,0 +1,322 @@
+# app.services.shopify.async_client
+
+import asyncio
+import json
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.services.shopify.client import ShopifyGraphQLClient, ShopifyGraphQLError
+
+logger = logging.getLogger(__name__)
+
+
+class ShopifyCostBucket:
+    """
+    Token bucket mirroring Shopify's GraphQL cost-based rate limit.
+
+    Shopify reports `throttleStatus` (maximumAvailable / currentlyAvailable /
+    restoreRate) in the `extensions.cost` block of every response. The bucket
+    adopts those numbers as the source of truth and refills locally between
+    responses, so any number of coroutines can share one store's budget.
+
+    Callers reserve the *estimated* cost before sending a query and settle
+    once the response arrives; in-flight reservations are subtracted from the
+    server's figure so concurrent queries don't all spend the same points.
+
+    Buckets are shared process-wide, possibly across event loops (a script
+    calling asyncio.run() more than once), so the lock is created per loop.
+    """
+
+    def __init__(
+        self,
+        maximum_available: float = 2000.0,
+        restore_rate: float = 100.0,
+        safety_buffer_percentage: float = 0.25,
+    ):
+        self.maximum_available = maximum_available
+        self.currently_available = maximum_available
+        self.restore_rate = restore_rate
+        self.safety_buffer_percentage = safety_buffer_percentage
+        self._in_flight = 0.0
+        self._updated_at = time.monotonic()
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def _lock(self) -> asyncio.Lock:
+        """The lock for the running loop; an asyncio.Lock can't be used from another loop."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    @property
+    def safety_buffer_points(self) -> float:
+        return self.maximum_available * self.safety_buffer_percentage
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed > 0 and self.restore_rate > 0:
+            self.currently_available = min(
+                self.maximum_available,
+                self.currently_available + elapsed * self.restore_rate,
+            )
+
+    async def acquire(self, cost: float) -> None:
+        """Wait (without blocking the loop) until `cost` points can be spent, then reserve them."""
+        # Never demand more than the bucket can ever hold
+        required = min(cost + self.safety_buffer_points, self.maximum_available)
+        while True:
+            async with self._lock:
+                self._refill()
+                if self.currently_available >= required:
+                    self.currently_available -= cost
+                    self._in_flight += cost
+                    return
+                shortfall = required - self.currently_available
+                wait_time = (shortfall / self.restore_rate) if self.restore_rate > 0 else 1.0
+
+            logger.debug(
+                "Shopify cost bucket low (%.0f/%.0f available, need %.0f); waiting %.2fs",
+                self.currently_available, self.maximum_available, required, wait_time,
+            )
+            await asyncio.sleep(wait_time)
+
+    def settle(self, cost: float, extensions: Optional[Dict[str, Any]] = None) -> None:
+        """Release a reservation and resynchronise with Shopify's reported throttle status."""
+        self._in_flight = max(0.0, self._in_flight - cost)
+
+        throttle = ((extensions or {}).get("cost") or {}).get("throttleStatus")
+        if not throttle:
+            return
+
+        self.maximum_available = float(throttle["maximumAvailable"])
+        self.restore_rate = float(throttle["restoreRate"])
+        self.currently_available = float(throttle["currentlyAvailable"]) - self._in_flight
+        self._updated_at = time.monotonic()
+
+    def drain(self) -> None:
+        """Empty the bucket after a THROTTLED/429 response so every caller backs off."""
+        self.currently_available = 0.0
+        self._updated_at = time.monotonic()
+
+
+_buckets: Dict[str, ShopifyCostBucket] = {}
+
+
+def get_shared_cost_bucket(store_domain: str) -> ShopifyCostBucket:
+    """One bucket per store: the rate limit is per app per shop, not per client instance."""
+    bucket = _buckets.get(store_domain)
+    if bucket is None:
+        bucket = ShopifyCostBucket()
+        _buckets[store_domain] = bucket
+    return bucket
+
+
+class _LoopBridgedClient(ShopifyGraphQLClient):
+    """
+    ShopifyGraphQLClient whose GraphQL transport is forwarded to the event loop.
+
+    The public methods run in a worker thread (see AsyncShopifyGraphQLClient._run)
+    so their query-building and parsing code is reused verbatim; only the HTTP
+    round trip and any throttling wait happen as coroutines on the loop.
+    """
+
+    def __init__(self, owner: "AsyncShopifyGraphQLClient", safety_buffer_percentage: float):
+        super().__init__(safety_buffer_percentage=safety_buffer_percentage)
+        self._owner = owner
+
+    def _make_request(self, query: str, variables: dict = None, estimated_cost: int = 10):
+        loop = self._owner._loop
+        if loop is None or threading.get_ident() == self._owner._loop_thread_id:
+            raise RuntimeError(
+                "AsyncShopifyGraphQLClient methods must be awaited; the bridged client "
+                "cannot issue requests from the event loop thread"
+            )
+        future = asyncio.run_coroutine_threadsafe(
+            self._owner._make_request(query, variables, estimated_cost), loop
+        )
+        return future.result()
+
+
+class AsyncShopifyGraphQLClient:
+    """
+    Asyncio-native counterpart of ShopifyGraphQLClient.
+
+    Exposes the same method names as awaitables. GraphQL requests go through a
+    pooled httpx.AsyncClient and a ShopifyCostBucket shared by every client for
+    the same store, so concurrent coroutines divide the 1000/2000-point budget
+    and throttling waits use asyncio.sleep instead of freezing the loop.
+
+    REST helpers (variant/inventory/image operations) keep their existing
+    `requests` implementation and run in a worker thread.
+
+    Usage:
+        async with AsyncShopifyGraphQLClient() as client:
+            products = await client.get_all_products_summary()
+    """
+
+    MAX_THROTTLE_RETRIES = 3
+
+    def __init__(
+        self,
+        safety_buffer_percentage: float = 0.25,
+        bucket: Optional[ShopifyCostBucket] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self._client = _LoopBridgedClient(self, safety_buffer_percentage)
+        self.store_domain = self._client.store_domain
+        self.graphql_url = self._client.graphql_url
+        self.headers = self._client.headers
+
+        self.bucket = bucket or get_shared_cost_bucket(self.store_domain)
+        self.bucket.safety_buffer_percentage = safety_buffer_percentage
+
+        self._owns_http_client = http_client is None
+        self._http_client = http_client
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+
+    async def __aenter__(self) -> "AsyncShopifyGraphQLClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            )
+        return self._http_client
+
+    # --- Transport ---
+
+    async def _make_request(self, query: str, variables: dict = None, estimated_cost: int = 10):
+        """
+        Send a GraphQL request, waiting on the shared cost bucket first.
+
+        THROTTLED errors and HTTP 429s drain the bucket and are retried up to
+        MAX_THROTTLE_RETRIES times; other errors are raised as in the sync client.
+        """
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+
+        for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+            await self.bucket.acquire(estimated_cost)
+            extensions = None
+            try:
+                response = await self._get_http_client().post(
+                    self.graphql_url, headers=self.headers, json=payload
+                )
+
+                if response.status_code == 429 and attempt < self.MAX_THROTTLE_RETRIES:
+                    retry_after = float(response.headers.get("Retry-After") or 1.0)
+                    logger.warning("Shopify returned 429; retrying in %.1fs", retry_after)
+                    self.bucket.drain()
+                    await asyncio.sleep(retry_after)
+                    continue
+
+                response.raise_for_status()
+
+                try:
+                    response_data = response.json()
+                except json.JSONDecodeError:
+                    raise ShopifyGraphQLError(
+                        [{"message": "Failed to decode JSON response", "response_text": response.text}]
+                    )
+
+                extensions = response_data.get("extensions")
+                errors = response_data.get("errors")
+                if errors:
+                    throttled = any(
+                        (error.get("extensions") or {}).get("code") == "THROTTLED" for error in errors
+                    )
+                    if throttled and attempt < self.MAX_THROTTLE_RETRIES:
+                        logger.warning("Shopify query THROTTLED; waiting for the cost bucket to refill")
+                        self.bucket.drain()
+                        continue
+                    raise ShopifyGraphQLError(errors)
+
+                return response_data.get("data")
+            finally:
+                self.bucket.settle(estimated_cost, extensions)
+
+        raise ShopifyGraphQLError([{"message": "Shopify request still throttled after retries"}])
+
+    async def execute(self, query: str, variables: dict | None = None, estimated_cost: int = 10):
+        return await self._make_request(query, variables, estimated_cost)
+
+    async def _run(self, method_name: str, *args, **kwargs):
+        """Run a ShopifyGraphQLClient method in a worker thread with its GraphQL calls bridged to this loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        method = getattr(self._client, method_name)
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+    # --- Native async helpers already defined on the sync client ---
+
+    async def mark_product_as_sold(self, product_gid: str, reduce_by: int = 1) -> dict:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        return await self._client.mark_product_as_sold(product_gid, reduce_by)
+
+    async def update_product_variant_price(self, product_gid: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        return await self._client.update_product_variant_price(product_gid, payload)
+
+
+def _bridged(name: str):
+    async def method(self, *args, **kwargs):
+        return await self._run(name, *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f"AsyncShopifyGraphQLClient.{name}"
+    method.__doc__ = getattr(ShopifyGraphQLClient, name).__doc__
+    return method
+
+
+# Same public surface as ShopifyGraphQLClient, as coroutines
+for _name in (
+    "get_products_count",
+    "get_all_products_summary",
+    "get_product_snapshot_by_id",
+    "create_metafield_definition",
+    "set_metafields",
+    "delete_metafield_by_key",
+    "update_inventory_item",
+    "get_shop_locations",
+    "get_online_store_publication_id",
+    "get_variant_details_rest",
+    "get_product_categories",
+    "find_category_gid",
+    "set_product_category",
+    "create_product",
+    "update_product",
+    "delete_product",
+    "update_complete_product",
+    "update_variant_rest",
+    "delete_product_images_rest",
+    "create_product_images",
+    "publish_product_to_sales_channel",
+    "assign_variants_to_delivery_profile",
+):
+    setattr(AsyncShopifyGraphQLClient, _name, _bridged(_name))
+del _name
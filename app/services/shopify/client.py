@@ -1373,7 +1373,10 @@ class ShopifyGraphQLClient:
             }
             """
             
-            result = self._make_request(verify_query, {"id": product_gid}, estimated_cost=5)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                None, self._make_request, verify_query, {"id": product_gid}, 5
+            )
             
             if result and result.get("product"):
                 product = result["product"]
@@ -8,7 +8,6 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, List, Any, Tuple, Set, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy import select, or_
 from html.parser import HTMLParser
 
@@ -20,12 +19,55 @@ from app.core.config import Settings, get_settings
 from app.core.exceptions import ShopifyAPIError
 from app.core.enums import ManufacturingCountry
 from app.services.shopify.client import ShopifyGraphQLClient  # You'll need to create this
+from app.services.shopify.async_client import AsyncShopifyGraphQLClient
 from app.services.reverb_service import ReverbService # We might need this for data mapping later
 from app.services.match_utils import suggest_product_match
+from app.services.sync_event_writer import bulk_insert_sync_events
+from app.services.snapshot_diff import SnapshotDiffSpec, calculate_changes_in_db, snapshot_diff_enabled
+from app.services.websockets.manager import publish_sync_progress
 
 
 logger = logging.getLogger(__name__)
 
+# Local Shopify rows compared against the API snapshot (see sync_shopify_inventory)
+_EXISTING_SHOPIFY_DATA_SQL = """
+    SELECT
+        p.id as product_id,
+        p.sku,
+        p.base_price, -- For price comparison
+        pc.id as platform_common_id,
+        pc.external_id,
+        pc.status as platform_common_status, -- This is our source of truth
+        pc.listing_url,
+        pc.created_at as platform_created_at, -- For grace period on new listings
+        sl.shopify_legacy_id -- Keep for matching
+    FROM platform_common pc
+    LEFT JOIN products p ON p.id = pc.product_id
+    LEFT JOIN shopify_listings sl ON pc.id = sl.platform_id
+    WHERE pc.platform_name = 'shopify'
+      AND pc.status NOT IN ('refreshed', 'deleted', 'removed')
+"""
+
+# SQL form of _calculate_changes / _has_changed, used when SYNC_SNAPSHOT_DIFF_IN_DB is on
+SHOPIFY_SNAPSHOT_DIFF = SnapshotDiffSpec(
+    platform="shopify",
+    local_sql=_EXISTING_SHOPIFY_DATA_SQL,
+    changed_sql="""
+        NOT (
+            (COALESCE(s.status, '') IN ('sold', 'ended', 'archived', 'removed', 'deleted')
+             AND COALESCE(l.platform_common_status, '') IN ('sold', 'ended', 'archived', 'removed', 'deleted'))
+            OR s.status IS NOT DISTINCT FROM l.platform_common_status
+        )
+        OR (
+            l.platform_common_status = 'active'
+            AND (
+                abs(COALESCE(s.price, 0) - COALESCE(l.base_price, 0)) > 0.01
+                OR (COALESCE(s.listing_url, '') <> '' AND s.listing_url IS DISTINCT FROM l.listing_url)
+            )
+        )
+    """,
+)
+
 
 class _PlainTextHTMLParser(HTMLParser):
     """Simple HTML parser that collects text nodes."""
@@ -818,13 +860,16 @@ class ShopifyService:
         try:
             # Fetch all products from Shopify
             logger.info("Fetching all Shopify products...")
-            products_from_api = self.client.get_all_products_summary()
+            # Async client so Shopify throttling waits don't stall the event loop
+            async with AsyncShopifyGraphQLClient() as async_client:
+                products_from_api = await async_client.get_all_products_summary()
             
             if not products_from_api:
                 logger.error("No products fetched from Shopify API")
                 return {"status": "error", "message": "No Shopify products received"}
             
             logger.info(f"Total products fetched from API: {len(products_from_api)}")
+            publish_sync_progress("shopify", "fetch", sync_run_id, items_fetched=len(products_from_api))
             
             # Run the differential sync logic
             sync_stats = await self.sync_shopify_inventory(products_from_api, sync_run_id)
@@ -853,16 +898,25 @@ class ShopifyService:
         }
 
         try:
-            # Step 1: Fetch all existing Shopify data from our DB
-            existing_data = await self._fetch_existing_shopify_data()
+            if snapshot_diff_enabled(self.settings):
+                # Steps 1-3 in Postgres via a staging table; only changed rows come back
+                api_items = self._prepare_api_data(shopify_products)
+                changes = await calculate_changes_in_db(self.db, SHOPIFY_SNAPSHOT_DIFF, api_items)
+            else:
+                # Step 1: Fetch all existing Shopify data from our DB
+                existing_data = await self._fetch_existing_shopify_data()
 
-            # Step 2: Prepare data for comparison
-            api_items = self._prepare_api_data(shopify_products)
-            db_items = self._prepare_db_data(existing_data)
+                # Step 2: Prepare data for comparison
+                api_items = self._prepare_api_data(shopify_products)
+                db_items = self._prepare_db_data(existing_data)
 
-            # Step 3: Calculate differences
-            changes = self._calculate_changes(api_items, db_items)
+                # Step 3: Calculate differences
+                changes = self._calculate_changes(api_items, db_items)
             logger.info(f"Applying changes: {len(changes['create'])} new, {len(changes['update'])} updates, {len(changes['remove'])} removals")
+            publish_sync_progress(
+                "shopify", "diff", sync_run_id, items_diffed=len(api_items),
+                created=len(changes['create']), updated=len(changes['update']), removed=len(changes['remove']),
+            )
 
             # Step 4: Apply changes and log events
             if changes['create']:
@@ -876,6 +930,7 @@ class ShopifyService:
                 stats['events_logged'] += events_removed
 
             stats['unchanged'] = len(api_items) - stats['created'] - stats['updated']
+            publish_sync_progress("shopify", "events", sync_run_id, events_written=stats['events_logged'])
             await self.db.commit()
             
         except Exception as e:
@@ -1184,14 +1239,7 @@ class ShopifyService:
         # Bulk insert with ON CONFLICT DO NOTHING to handle duplicates gracefully
         if events_to_create:
             try:
-                stmt = insert(SyncEvent).values(events_to_create)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending')
-                )
-                result = await self.db.execute(stmt)
-                events_logged = len(events_to_create)
-                logger.info(f"Attempted to log {len(events_to_create)} new listing events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, events_to_create)
             except Exception as e:
                 logger.error(f"Failed to bulk insert new listing events: {e}", exc_info=True)
         
@@ -1253,14 +1301,7 @@ class ShopifyService:
         # Bulk insert all events with duplicate handling
         if all_events:
             try:
-                stmt = insert(SyncEvent).values(all_events)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending')
-                )
-                result = await self.db.execute(stmt)
-                events_logged = len(all_events)
-                logger.info(f"Attempted to log {len(all_events)} update events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, all_events)
             except Exception as e:
                 logger.error(f"Failed to bulk insert update events: {e}", exc_info=True)
         
@@ -1341,14 +1382,7 @@ class ShopifyService:
         # Bulk insert logic
         if all_events:
             try:
-                stmt = insert(SyncEvent).values(all_events)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending')
-                )
-                await self.db.execute(stmt)
-                events_logged = len(all_events)
-                logger.info(f"Attempted to log {len(all_events)} update events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, all_events)
             except Exception as e:
                 logger.error(f"Failed to bulk insert update events: {e}", exc_info=True)
         
@@ -1383,14 +1417,7 @@ class ShopifyService:
         # Bulk insert with duplicate handling
         if events_to_create:
             try:
-                stmt = insert(SyncEvent).values(events_to_create)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending')
-                )
-                result = await self.db.execute(stmt)
-                events_logged = len(events_to_create)
-                logger.info(f"Attempted to log {len(events_to_create)} removal events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, events_to_create)
             except Exception as e:
                 logger.error(f"Failed to bulk insert removal events: {e}", exc_info=True)
         
@@ -2299,23 +2326,7 @@ class ShopifyService:
     # =========================================================================
     async def _fetch_existing_shopify_data(self) -> List[Dict]:
         """Fetches all Shopify-related data from the local database, focusing on the source of truth."""
-        query = text("""
-            SELECT
-                p.id as product_id,
-                p.sku,
-                p.base_price, -- For price comparison
-                pc.id as platform_common_id,
-                pc.external_id,
-                pc.status as platform_common_status, -- This is our source of truth
-                pc.listing_url,
-                pc.created_at as platform_created_at, -- For grace period on new listings
-                sl.shopify_legacy_id -- Keep for matching
-            FROM platform_common pc
-            LEFT JOIN products p ON p.id = pc.product_id
-            LEFT JOIN shopify_listings sl ON pc.id = sl.platform_id
-            WHERE pc.platform_name = 'shopify'
-              AND pc.status NOT IN ('refreshed', 'deleted', 'removed')
-        """)
+        query = text(_EXISTING_SHOPIFY_DATA_SQL)
         result = await self.db.execute(query)
         rows = [row._asdict() for row in result.fetchall()]
 
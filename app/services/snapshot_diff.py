@@ -0,0 +1,194 @@
+"""
+Staging-table diff for the platform inventory syncs.
+
+The default sync path loads every local listing for a platform into Python
+dicts and compares them with the fetched snapshot (_prepare_db_data /
+_calculate_changes). With SYNC_SNAPSHOT_DIFF_IN_DB enabled the prepared
+snapshot is COPY'd into a temp table instead, and Postgres works out which
+listings are new, changed or gone. Only those rows come back to Python, so the
+cost of a sync follows the number of changes rather than the catalogue size.
+
+Each service describes its comparison with a SnapshotDiffSpec: the query it
+already uses for its local data, plus SQL predicates mirroring its
+_has_changed / create / remove rules. The result has the same shape as
+_calculate_changes, so the existing _batch_* methods log the sync_events.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TABLE = "sync_platform_snapshot"
+SNAPSHOT_COLUMNS = ("external_id", "status", "price", "quantity_available", "listing_url")
+
+# ON COMMIT DROP: the snapshot only lives for the sync's transaction
+_CREATE_SQL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS {SNAPSHOT_TABLE} (
+        external_id text PRIMARY KEY,
+        status text,
+        price double precision,
+        quantity_available integer,
+        listing_url text
+    ) ON COMMIT DROP
+"""
+
+# Fallback when the driver connection can't COPY (same jsonb trick as sync_event_writer)
+_INSERT_SQL = f"""
+    INSERT INTO {SNAPSHOT_TABLE} (external_id, status, price, quantity_available, listing_url)
+    SELECT r.external_id, r.status, r.price, r.quantity_available, r.listing_url
+    FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r(
+        external_id text,
+        status text,
+        price double precision,
+        quantity_available integer,
+        listing_url text
+    )
+    ON CONFLICT (external_id) DO NOTHING
+"""
+
+_LOCAL_CTE = """
+    WITH local AS (
+        SELECT q.* FROM ({local_sql}) q
+        WHERE COALESCE(q.external_id::text, '') <> ''
+    )
+"""
+
+_CREATE_IDS_SQL = _LOCAL_CTE + f"""
+    SELECT s.external_id
+    FROM {SNAPSHOT_TABLE} s
+    WHERE NOT EXISTS (SELECT 1 FROM local l WHERE l.external_id::text = s.external_id)
+      AND ({{create_sql}})
+"""
+
+_UPDATE_ROWS_SQL = _LOCAL_CTE + f"""
+    SELECT l.*
+    FROM {SNAPSHOT_TABLE} s
+    JOIN local l ON l.external_id::text = s.external_id
+    WHERE {{changed_sql}}
+"""
+
+_REMOVE_ROWS_SQL = _LOCAL_CTE + f"""
+    SELECT l.*
+    FROM local l
+    WHERE NOT EXISTS (SELECT 1 FROM {SNAPSHOT_TABLE} s WHERE s.external_id = l.external_id::text)
+      AND ({{remove_sql}})
+"""
+
+
+@dataclass(frozen=True)
+class SnapshotDiffSpec:
+    """
+    How one platform's snapshot is compared with local data.
+
+    local_sql is the service's existing local-data query (must select
+    external_id). The predicates are SQL over s (the staged snapshot) and/or
+    l (a local row) and must match the service's Python rules.
+    """
+    platform: str
+    local_sql: str
+    changed_sql: str
+    create_sql: str = "TRUE"  # over s: unmatched snapshot rows to report as new
+    remove_sql: str = "TRUE"  # over l: local rows missing from the snapshot to report
+
+
+def snapshot_diff_enabled(settings: Optional[Settings] = None) -> bool:
+    return bool(getattr(settings or get_settings(), "SYNC_SNAPSHOT_DIFF_IN_DB", False))
+
+
+def _snapshot_record(external_id: str, item: Dict[str, Any]) -> tuple:
+    def _as_float(value):
+        try:
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _as_int(value):
+        try:
+            return int(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    return (
+        external_id,
+        item.get("status"),
+        _as_float(item.get("price")),
+        _as_int(item.get("quantity_available")),
+        item.get("listing_url"),
+    )
+
+
+async def stage_platform_snapshot(db: AsyncSession, api_items: Dict[str, Dict[str, Any]]) -> int:
+    """Load prepared API items into the snapshot temp table; returns the row count."""
+    await db.execute(text(_CREATE_SQL))
+    await db.execute(text(f"TRUNCATE {SNAPSHOT_TABLE}"))
+
+    records = [_snapshot_record(str(external_id), item) for external_id, item in api_items.items()]
+    if not records:
+        return 0
+
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = getattr(raw_connection, "driver_connection", None)
+    if hasattr(driver_connection, "copy_records_to_table"):
+        # asyncpg: binary COPY on the session's own connection and transaction
+        await driver_connection.copy_records_to_table(SNAPSHOT_TABLE, records=records, columns=SNAPSHOT_COLUMNS)
+    else:
+        rows = [dict(zip(SNAPSHOT_COLUMNS, record)) for record in records]
+        await db.execute(text(_INSERT_SQL), {"rows": json.dumps(rows)})
+
+    await db.execute(text(f"ANALYZE {SNAPSHOT_TABLE}"))
+    return len(records)
+
+
+async def diff_staged_snapshot(
+    db: AsyncSession,
+    spec: SnapshotDiffSpec,
+    api_items: Dict[str, Dict[str, Any]],
+) -> Dict[str, List]:
+    """Compare the staged snapshot with local data; same result shape as _calculate_changes."""
+    api_by_id = {str(external_id): item for external_id, item in api_items.items()}
+
+    result = await db.execute(text(_CREATE_IDS_SQL.format(local_sql=spec.local_sql, create_sql=spec.create_sql)))
+    create_ids = {row.external_id for row in result.fetchall()}
+
+    result = await db.execute(text(_UPDATE_ROWS_SQL.format(local_sql=spec.local_sql, changed_sql=spec.changed_sql)))
+    updates = [
+        {"api_data": api_by_id[str(db_row["external_id"])], "db_data": db_row}
+        for db_row in (row._asdict() for row in result.fetchall())
+    ]
+
+    result = await db.execute(text(_REMOVE_ROWS_SQL.format(local_sql=spec.local_sql, remove_sql=spec.remove_sql)))
+    removals = [row._asdict() for row in result.fetchall()]
+
+    return {
+        "create": [item for external_id, item in api_by_id.items() if external_id in create_ids],
+        "update": updates,
+        "remove": removals,
+    }
+
+
+async def calculate_changes_in_db(
+    db: AsyncSession,
+    spec: SnapshotDiffSpec,
+    api_items: Dict[str, Dict[str, Any]],
+) -> Dict[str, List]:
+    """
+    Stage the snapshot, diff it in SQL and drop the staging table. The caller
+    commits; if it rolls back instead the table goes with the transaction.
+    """
+    staged = await stage_platform_snapshot(db, api_items)
+    changes = await diff_staged_snapshot(db, spec, api_items)
+    await db.execute(text(f"DROP TABLE IF EXISTS {SNAPSHOT_TABLE}"))
+    logger.info(
+        "%s snapshot diff in DB: %d staged, %d new, %d changed, %d removed",
+        spec.platform, staged, len(changes["create"]), len(changes["update"]), len(changes["remove"]),
+    )
+    return changes
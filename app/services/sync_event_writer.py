@@ -0,0 +1,91 @@
+"""Bulk writer for sync_events rows produced by the platform sync services."""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+SYNC_EVENT_COLUMNS = (
+    "sync_run_id",
+    "platform_name",
+    "product_id",
+    "platform_common_id",
+    "external_id",
+    "change_type",
+    "change_data",
+    "status",
+)
+
+# The whole batch travels as one jsonb parameter, so a sync with thousands of
+# changes is a single statement regardless of asyncpg's bind-parameter limit.
+# Duplicate pending events are dropped by ix_unique_pending_sync_event.
+_INSERT_SQL = """
+    INSERT INTO sync_events (
+        sync_run_id, platform_name, product_id, platform_common_id,
+        external_id, change_type, change_data, status
+    )
+    SELECT
+        e.sync_run_id, e.platform_name, e.product_id, e.platform_common_id,
+        e.external_id, e.change_type, e.change_data, e.status
+    FROM jsonb_to_recordset(CAST(:events AS jsonb)) AS e(
+        sync_run_id uuid,
+        platform_name varchar,
+        product_id integer,
+        platform_common_id integer,
+        external_id varchar,
+        change_type varchar,
+        change_data json,
+        status varchar
+    )
+    {seen_filter}
+    ON CONFLICT (platform_name, external_id, change_type) WHERE status = 'pending'
+    DO NOTHING
+    RETURNING id
+"""
+
+# Also skip events already recorded with any status (processed, ignored, ...)
+_SEEN_FILTER = """
+    WHERE NOT EXISTS (
+        SELECT 1 FROM sync_events s
+        WHERE s.platform_name = e.platform_name
+          AND s.external_id = e.external_id
+          AND s.change_type = e.change_type
+    )
+"""
+
+
+def _normalise_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    row = {column: event.get(column) for column in SYNC_EVENT_COLUMNS}
+    row["external_id"] = str(row["external_id"]) if row["external_id"] is not None else None
+    row["status"] = row["status"] or "pending"
+    return row
+
+
+async def bulk_insert_sync_events(
+    db: AsyncSession,
+    events: Iterable[Dict[str, Any]],
+    *,
+    skip_seen: bool = False,
+) -> int:
+    """
+    Insert sync event dicts in one INSERT ... ON CONFLICT DO NOTHING statement.
+
+    Events that duplicate an existing *pending* event for the same
+    (platform_name, external_id, change_type) are skipped by the database.
+    With skip_seen=True events that were ever recorded for that key are
+    skipped too. Returns the number of rows actually inserted. The caller
+    commits.
+    """
+    rows: List[Dict[str, Any]] = [_normalise_event(event) for event in events]
+    if not rows:
+        return 0
+
+    sql = _INSERT_SQL.format(seen_filter=_SEEN_FILTER if skip_seen else "")
+    result = await db.execute(text(sql), {"events": json.dumps(rows, default=str)})
+    inserted = len(result.fetchall())
+    logger.info("Logged %s of %s sync events (duplicates ignored)", inserted, len(rows))
+    return inserted
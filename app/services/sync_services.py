@@ -11,10 +11,11 @@ This service coordinates:
 
 import asyncio
 import logging
+import time
 
-from typing import Dict, List, Any, Optional, Set, Tuple, Union, Sequence
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple, Union, Sequence
 from datetime import datetime, timezone
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from sqlalchemy import select, text, update, cast, or_, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -40,6 +41,14 @@ from app.services.reverb_service import ReverbService
 from app.services.shopify_service import ShopifyService
 from app.services.vr_service import VRService
 from app.services.vr_job_queue import enqueue_vr_job
+from app.services.platform_job_queue import (
+    ACTION_APPLY_UPDATE,
+    ACTION_END_LISTING,
+    ACTION_UPDATE_PRICE,
+    ACTION_VR_UPDATE,
+    enqueue_platform_job,
+)
+from app.models.platform_job import PlatformJobPriority
 
 # Note: logging.basicConfig removed - use app.core.logging_config instead
 logger = logging.getLogger(__name__)
@@ -109,7 +118,8 @@ class SyncReport:
     changes_detected: List[DetectedChange]
     errors: List[str]
     processing_time_seconds: float
-    
+    detector_timings: Dict[str, float] = field(default_factory=dict)  # detector -> seconds
+
     @property
     def changes_by_type(self) -> Dict[str, int]:
         """Group changes by type for summary"""
@@ -118,6 +128,57 @@ class SyncReport:
             counts[change.change_type] = counts.get(change.change_type, 0) + 1
         return counts
 
+@dataclass
+class CombinedSyncReport:
+    """Reports from a concurrent all-platform run, with per-phase timings."""
+    started_at: datetime
+    reports: Dict[str, SyncReport]
+    phase_timings: Dict[str, Dict[str, float]]  # platform -> {"fetch": s, "detect": s}
+    total_seconds: float
+
+    @property
+    def sequential_seconds(self) -> float:
+        """What the same phases would have taken back to back."""
+        return sum(sum(phases.values()) for phases in self.phase_timings.values())
+
+@dataclass
+class VRMatchIndex:
+    """
+    Candidate products for V&R rogue-listing matching, loaded once per sync run.
+
+    by_sku maps a product SKU to (product, its VR platform_common row);
+    by_brand maps a lower-cased brand to every (product, VR platform_common)
+    pair for that brand. other_platform_counts holds how many non-VR listings
+    each candidate product has.
+    """
+    by_sku: Dict[str, Tuple[Product, Optional[PlatformCommon]]]
+    by_brand: Dict[str, List[Tuple[Product, Optional[PlatformCommon]]]]
+    other_platform_counts: Dict[int, int]
+
+@dataclass
+class DeferredEndListing:
+    """An end-listing call held back during a batched reconcile, plus the events waiting on it."""
+    platform: str
+    external_id: str
+    product_id: int
+    sku: str
+    events: List[SyncEvent]
+
+@dataclass
+class ReconcileBatch:
+    """
+    Rows for a batched reconcile_sync_run, loaded up front in a few IN queries.
+
+    products and links_by_product replace the per-event lookups; listing_prices
+    maps platform_common id to the specialist table's price. End-listing calls
+    collected in end_listings are sent once every event has been handled.
+    """
+    products: Dict[int, Product]
+    links_by_product: Dict[int, List[PlatformCommon]]
+    listing_prices: Dict[int, Optional[float]]
+    end_listings: List[DeferredEndListing] = field(default_factory=list)
+    current_events: List[SyncEvent] = field(default_factory=list)
+
 @dataclass
 class ReconciliationReport:
     """A comprehensive report for a sync reconciliation run (the Action Phase)."""
@@ -156,7 +217,7 @@ class SyncService:
     
     """Coordinates synchronization between inventory system and external platforms."""
     
-    def __init__(self, db: AsyncSession, stock_manager=None, vr_executor=None):
+    def __init__(self, db: AsyncSession, stock_manager=None, vr_executor=None, session_factory=None):
         self.db = db
         self.stock_manager = stock_manager
         settings = get_settings()
@@ -168,6 +229,13 @@ class SyncService:
         }
         self.email_service = EmailNotificationService(settings)
         self.vr_executor = vr_executor
+        # Route outbound writes through platform_jobs instead of sending them inline
+        self.use_job_queue = settings.PLATFORM_JOB_QUEUE_ENABLED
+        self.job_max_attempts = settings.PLATFORM_JOB_MAX_ATTEMPTS
+        self.reconcile_batched = settings.SYNC_RECONCILE_BATCHED
+        self.reconcile_platform_concurrency = settings.SYNC_RECONCILE_PLATFORM_CONCURRENCY
+        self.session_factory = session_factory
+        self._reconcile_batch: Optional[ReconcileBatch] = None
         self._vr_semaphore = asyncio.Semaphore(1)
         self._background_tasks: Set[asyncio.Task] = set()
 
@@ -271,11 +339,7 @@ class SyncService:
                 source_platforms = {e.platform_name for e in product_events}
                 for event in product_events:
                     # Find the platform_common record
-                    stmt = select(PlatformCommon).where(
-                        PlatformCommon.product_id == product.id,
-                        PlatformCommon.platform_name == event.platform_name
-                    )
-                    platform_link = (await self.db.execute(stmt)).scalar_one_or_none()
+                    platform_link = await self._get_platform_common(product.id, event.platform_name)
                     
                     if platform_link:
                         # For status_change events, mark as sold/ended
@@ -309,11 +373,9 @@ class SyncService:
                 # Update platform_common status for successfully propagated platforms
                 if not dry_run and success_platforms:
                     for platform in success_platforms:
-                        stmt = select(PlatformCommon).where(
-                            PlatformCommon.product_id == product.id,
-                            PlatformCommon.platform_name == platform
-                        )
-                        platform_link = (await self.db.execute(stmt)).scalar_one_or_none()
+                        if self._end_listing_deferred(product.id, platform):
+                            continue  # set by _flush_deferred_end_listings once the call succeeds
+                        platform_link = await self._get_platform_common(product.id, platform)
                         if platform_link:
                             # Mark as ended (propagated from sale elsewhere)
                             platform_link.status = ListingStatus.ENDED.value
@@ -338,6 +400,7 @@ class SyncService:
             except Exception as e:
                 logger.error(f"Error in coordinated event handling: {e}", exc_info=True)
                 await self.db.rollback()
+                self._discard_reconcile_rows(product.id)
                 for event in product_events:
                     event.status = 'error'
                     event.notes = f"Error during coordinated processing: {str(e)}"
@@ -384,7 +447,7 @@ class SyncService:
             
         return success
 
-    async def reconcile_sync_run(self, sync_run_id: str, dry_run: bool = True, event_type: str = 'all', sku: Optional[str] = None) -> ReconciliationReport:
+    async def reconcile_sync_run(self, sync_run_id: str, dry_run: bool = True, event_type: str = 'all', sku: Optional[str] = None, batched: Optional[bool] = None) -> ReconciliationReport:
             logger.info(f"Starting reconciliation for sync_run_id: {sync_run_id} (Dry Run: {dry_run}, Type: {event_type})")
             
             summary = {"processed": 0, "sales": 0, "non_sale_changes": 0, "actions_taken": 0, "errors": 0}
@@ -480,30 +543,50 @@ class SyncService:
             
             # Also collect events without product_id for individual processing
             orphan_events = [e for e in events if not e.product_id]
-            
-            # Process coordinated events first
-            for product_id, product_events in grouped_events.items():
-                # Check if we should process these together
-                event_types = {e.change_type for e in product_events}
-                
-                if len(product_events) > 1 and ('status_change' in event_types or 'removed_listing' in event_types):
-                    # Multiple events for same product - process together
-                    success = await self._handle_coordinated_events(product_events, summary, actions, dry_run)
-                    summary["processed"] += len(product_events)
-                    for event in product_events:
-                        detected_changes.append(event.change_data)
-                else:
-                    # Single event - process individually
-                    for event in product_events:
-                        detected_changes.append(event.change_data)
-                        success = await self._process_single_event(event, summary, actions, dry_run)
-                        summary["processed"] += 1
-            
-            # Process orphan events individually
-            for event in orphan_events:
-                detected_changes.append(event.change_data)
-                success = await self._process_single_event(event, summary, actions, dry_run)
-                summary["processed"] += 1
+
+            if self.reconcile_batched if batched is None else batched:
+                self._reconcile_batch = await self._prefetch_reconcile_batch(grouped_events.keys())
+                logger.info(
+                    f"Batched reconcile: prefetched {len(self._reconcile_batch.products)} products "
+                    f"and {sum(len(links) for links in self._reconcile_batch.links_by_product.values())} listings."
+                )
+
+            try:
+                # Process coordinated events first
+                for product_id, product_events in grouped_events.items():
+                    # Check if we should process these together
+                    event_types = {e.change_type for e in product_events}
+
+                    if len(product_events) > 1 and ('status_change' in event_types or 'removed_listing' in event_types):
+                        # Multiple events for same product - process together
+                        self._set_reconcile_events(product_events)
+                        success = await self._handle_coordinated_events(product_events, summary, actions, dry_run)
+                        summary["processed"] += len(product_events)
+                        for event in product_events:
+                            detected_changes.append(event.change_data)
+                    else:
+                        # Single event - process individually
+                        for event in product_events:
+                            detected_changes.append(event.change_data)
+                            self._set_reconcile_events([event])
+                            success = await self._process_single_event(event, summary, actions, dry_run)
+                            summary["processed"] += 1
+
+                # Process orphan events individually
+                for event in orphan_events:
+                    detected_changes.append(event.change_data)
+                    self._set_reconcile_events([event])
+                    success = await self._process_single_event(event, summary, actions, dry_run)
+                    summary["processed"] += 1
+
+                if self._reconcile_batch is not None and self._reconcile_batch.end_listings and not dry_run:
+                    # Each deferred call updates the product's platform_common and
+                    # listing rows from its own session; commit first so this
+                    # transaction isn't holding their row locks while we wait on it
+                    await self.db.commit()
+                    await self._flush_deferred_end_listings(summary, actions)
+            finally:
+                self._reconcile_batch = None
 
             if not dry_run:
                 await self.db.commit()
@@ -532,6 +615,152 @@ class SyncService:
                 detected_changes=detected_changes
             )
 
+    async def _prefetch_reconcile_batch(self, product_ids: Iterable[int]) -> ReconcileBatch:
+        """Load the products, platform_common rows and listing prices for a reconcile run in a few IN queries."""
+        product_ids = list(product_ids)
+        batch = ReconcileBatch(products={}, links_by_product={}, listing_prices={})
+        if not product_ids:
+            return batch
+
+        products = (await self.db.execute(select(Product).where(Product.id.in_(product_ids)))).scalars().all()
+        batch.products = {product.id: product for product in products}
+
+        batch.links_by_product = {product_id: [] for product_id in batch.products}
+        links = (
+            await self.db.execute(select(PlatformCommon).where(PlatformCommon.product_id.in_(product_ids)))
+        ).scalars().all()
+        link_ids_by_platform: Dict[str, List[int]] = {}
+        for link in links:
+            batch.links_by_product.setdefault(link.product_id, []).append(link)
+            link_ids_by_platform.setdefault(link.platform_name, []).append(link.id)
+
+        # Same price columns as _derive_sale_price_from_listing
+        price_sources = {
+            'reverb': (ReverbListing, ReverbListing.list_price),
+            'ebay': (EbayListing, EbayListing.price),
+            'shopify': (ShopifyListing, ShopifyListing.price),
+            'vr': (VRListing, VRListing.price_notax),
+        }
+        for platform_name, link_ids in link_ids_by_platform.items():
+            config = price_sources.get(platform_name)
+            if not config:
+                continue
+            table, column = config
+            batch.listing_prices.update({link_id: None for link_id in link_ids})
+            rows = await self.db.execute(select(table.platform_id, column).where(table.platform_id.in_(link_ids)))
+            for platform_id, value in rows.all():
+                try:
+                    batch.listing_prices[platform_id] = float(value) if value is not None else None
+                except (TypeError, ValueError):
+                    batch.listing_prices[platform_id] = None
+
+        return batch
+
+    def _set_reconcile_events(self, events: List[SyncEvent]) -> None:
+        """Record which events the next handler call is for, so deferred end-listings can report back."""
+        if self._reconcile_batch is not None:
+            self._reconcile_batch.current_events = events
+
+    def _end_listing_deferred(self, product_id: int, platform_name: str) -> bool:
+        batch = self._reconcile_batch
+        return batch is not None and any(
+            item.product_id == product_id and item.platform == platform_name for item in batch.end_listings
+        )
+
+    def _discard_reconcile_rows(self, product_id: int) -> None:
+        """After a rollback: prefetched rows are expired, and the product's deferred calls are void."""
+        batch = self._reconcile_batch
+        if batch is None:
+            return
+        batch.products.clear()
+        batch.links_by_product.clear()
+        batch.end_listings = [item for item in batch.end_listings if item.product_id != product_id]
+
+    def _build_platform_service(self, platform_name: str, db: AsyncSession):
+        settings = get_settings()
+        if platform_name == "reverb":
+            return ReverbService(db, settings)
+        if platform_name == "shopify":
+            return ShopifyService(db, settings)
+        if platform_name == "ebay":
+            return EbayService(db, settings)
+        if platform_name == "vr":
+            return VRService(db)
+        return None
+
+    async def _flush_deferred_end_listings(self, summary: Dict, actions: List) -> None:
+        """
+        Send the end-listing calls deferred during a batched reconcile.
+
+        Calls are grouped by platform; platforms run side by side and each runs
+        up to reconcile_platform_concurrency[platform] calls at once. Every call
+        gets its own session (an AsyncSession can't be shared across concurrent
+        tasks) so the service's local listing update commits independently.
+        Failed calls leave their events 'partial', as in the coordinated path.
+        """
+        deferred = self._reconcile_batch.end_listings
+        if not deferred:
+            return
+
+        session_factory = self.session_factory
+        if session_factory is None:
+            from app.database import async_session
+            session_factory = async_session
+
+        by_platform: Dict[str, List[DeferredEndListing]] = {}
+        for item in deferred:
+            by_platform.setdefault(item.platform, []).append(item)
+
+        async def end_one(item: DeferredEndListing, semaphore: asyncio.Semaphore) -> Any:
+            async with semaphore:
+                async with session_factory() as db:
+                    service = self._build_platform_service(item.platform, db)
+                    result = await service.mark_item_as_sold(item.external_id)
+                    await db.commit()
+                    return result
+
+        async def run_platform(platform_name: str, items: List[DeferredEndListing]) -> List[Any]:
+            semaphore = asyncio.Semaphore(max(self.reconcile_platform_concurrency.get(platform_name, 1), 1))
+            return await asyncio.gather(*(end_one(item, semaphore) for item in items), return_exceptions=True)
+
+        logger.info(
+            "Sending %d deferred end-listing calls (%s)",
+            len(deferred),
+            ", ".join(f"{platform_name}: {len(items)}" for platform_name, items in by_platform.items()),
+        )
+        platform_names = list(by_platform)
+        platform_results = await asyncio.gather(
+            *(run_platform(platform_name, by_platform[platform_name]) for platform_name in platform_names)
+        )
+
+        for platform_name, results in zip(platform_names, platform_results):
+            for item, res in zip(by_platform[platform_name], results):
+                if isinstance(res, Exception) or res is False:
+                    error_msg = (
+                        f"[ERROR] Product #{item.product_id} (SKU: {item.sku}) on {platform_name.upper()} (ID: {item.external_id})"
+                        f" -> FAILED to end. Reason: {res}"
+                    )
+                    actions.append(error_msg)
+                    logger.error(error_msg)
+                    summary["errors"] += 1
+                    for event in item.events:
+                        event.status = 'partial'
+                        event.notes = f"Batched end listing failed on {platform_name}: {res}"
+                    continue
+
+                success_msg = (
+                    f"[SUCCESS] Product #{item.product_id} (SKU: {item.sku}) on {platform_name.upper()} (ID: {item.external_id})"
+                    " -> Listing ended successfully."
+                )
+                actions.append(success_msg)
+                logger.info(success_msg)
+                summary["actions_taken"] += 1
+                await self._update_local_platform_status(
+                    product_id=item.product_id,
+                    platform_name=platform_name,
+                    new_status=ListingStatus.ENDED.value,
+                )
+
     async def _handle_new_listing(self, event: SyncEvent, summary: Dict, actions: List, dry_run: bool) -> bool:
         logger.info(f"Handling 'new_listing' event for {event.platform_name} item {event.external_id}")
         
@@ -884,6 +1113,8 @@ class SyncService:
             if not dry_run and successful_platforms:
                 logger.info(f"Updating local status for successfully ended platforms: {successful_platforms}")
                 for platform in successful_platforms:
+                    if self._end_listing_deferred(product.id, platform):
+                        continue  # set by _flush_deferred_end_listings once the call succeeds
                     logger.info(
                         "Applying propagated status update for product %s on %s -> %s",
                         product.id,
@@ -1171,11 +1402,7 @@ class SyncService:
             return True
 
         # Find the corresponding platform_common record
-        stmt = select(PlatformCommon).where(
-            PlatformCommon.product_id == event.product_id,
-            PlatformCommon.platform_name == event.platform_name
-        )
-        platform_link = (await self.db.execute(stmt)).scalar_one_or_none()
+        platform_link = await self._get_platform_common(event.product_id, event.platform_name)
 
         if platform_link:
             # CHANGE 1: Use the correct status
@@ -1214,10 +1441,28 @@ class SyncService:
         return set()
 
     async def _get_product(self, product_id: int) -> Optional[Product]:
+        batch = self._reconcile_batch
+        if batch is not None and product_id in batch.products:
+            return batch.products[product_id]
         stmt = select(Product).where(Product.id == product_id)
         return (await self.db.execute(stmt)).scalar_one_or_none()
 
+    async def _get_platform_links(self, product_id: int) -> List[PlatformCommon]:
+        batch = self._reconcile_batch
+        if batch is not None and product_id in batch.links_by_product:
+            return batch.links_by_product[product_id]
+        stmt = select(PlatformCommon).where(PlatformCommon.product_id == product_id)
+        return list((await self.db.execute(stmt)).scalars().all())
+
     async def _get_platform_common(self, product_id: int, platform_name: str) -> Optional[PlatformCommon]:
+        batch = self._reconcile_batch
+        if batch is not None:
+            cached = next(
+                (link for link in batch.links_by_product.get(product_id, []) if link.platform_name == platform_name),
+                None,
+            )
+            if cached is not None:
+                return cached
         stmt = (
             select(PlatformCommon)
             .where(PlatformCommon.product_id == product_id)
@@ -1229,6 +1474,10 @@ class SyncService:
         if not platform_common_id:
             return None
 
+        batch = self._reconcile_batch
+        if batch is not None and platform_common_id in batch.listing_prices:
+            return batch.listing_prices[platform_common_id]
+
         price_sources = {
             'reverb': (ReverbListing, ReverbListing.list_price),
             'ebay': (EbayListing, EbayListing.price),
@@ -1304,7 +1553,7 @@ class SyncService:
         action_log: List[str] = []
         successful_platforms = []
         failed_count = 0
-        all_platform_links = (await self.db.execute(select(PlatformCommon).where(PlatformCommon.product_id == product.id))).scalars().all()
+        all_platform_links = await self._get_platform_links(product.id)
 
         tasks, task_map = [], {}
         for link in all_platform_links:
@@ -1336,6 +1585,36 @@ class SyncService:
                     action_log.append(action_desc)
                     logger.info(action_desc)
                     successful_platforms.append(link.platform_name)
+                elif self.use_job_queue:
+                    await self._enqueue_platform_job(
+                        link.platform_name,
+                        ACTION_END_LISTING,
+                        {"external_id": link.external_id},
+                        product_id=product.id,
+                        priority=PlatformJobPriority.END_LISTING,
+                        idempotency_key=f"{ACTION_END_LISTING}:{link.platform_name}:{link.external_id}",
+                    )
+                    queued_msg = (
+                        f"[QUEUED] Product #{product.id} (SKU: {product.sku}) on {link.platform_name.upper()}"
+                        f" (ID: {link.external_id}) -> End listing queued."
+                    )
+                    action_log.append(queued_msg)
+                    logger.info(queued_msg)
+                    successful_platforms.append(link.platform_name)
+                elif self._reconcile_batch is not None:
+                    # Sent with the rest of the run's end-listings, grouped by platform
+                    self._reconcile_batch.end_listings.append(DeferredEndListing(
+                        platform=link.platform_name,
+                        external_id=link.external_id,
+                        product_id=product.id,
+                        sku=product.sku,
+                        events=list(self._reconcile_batch.current_events),
+                    ))
+                    action_log.append(
+                        f"[BATCHED] Product #{product.id} (SKU: {product.sku}) on {link.platform_name.upper()}"
+                        f" (ID: {link.external_id}) -> End listing deferred to the batched platform pass."
+                    )
+                    successful_platforms.append(link.platform_name)
                 else:
                     logger.info(
                         "Queueing mark_item_as_sold for product %s on %s (external_id=%s)",
@@ -1451,14 +1730,7 @@ class SyncService:
                             "Queueing VR background price update for %s",
                             link.external_id,
                         )
-                        task = asyncio.create_task(
-                            self._run_vr_update_background(
-                                snapshot,
-                                link.external_id,
-                                {"base_price"},
-                            )
-                        )
-                        self._track_background_task(task)
+                        await self._schedule_vr_update(product.id, snapshot, link.external_id, {"base_price"})
                         action_desc = (
                             f"[QUEUED] Scheduled VR price update to £{new_price:.2f}"
                             f" for listing {link.external_id}."
@@ -1960,6 +2232,19 @@ class SyncService:
             service = self.platform_services.get(link.platform_name)
             if not service or not hasattr(service, "apply_product_update"):
                 continue
+            if self.use_job_queue:
+                if changed_fields:
+                    fields = sorted(changed_fields)
+                    await self._enqueue_platform_job(
+                        link.platform_name,
+                        ACTION_APPLY_UPDATE,
+                        {"platform_common_id": link.id, "changed_fields": fields},
+                        product_id=product.id,
+                        priority=PlatformJobPriority.EDIT,
+                        idempotency_key=f"{ACTION_APPLY_UPDATE}:{link.id}:{','.join(fields)}",
+                    )
+                    results[link.platform_name] = "queued"
+                continue
             task_platforms.append(link.platform_name)
             tasks.append(service.apply_product_update(product, link, changed_fields))
 
@@ -1987,12 +2272,24 @@ class SyncService:
                 service = self.platform_services.get(link.platform_name)
                 if not service or not hasattr(service, "update_listing_price"):
                     continue
-                try:
-                    platform_key = (link.platform_name or "").lower()
-                    desired_price = overrides.get(
-                        platform_key,
-                        calculate_platform_price(platform_key, base_price_value),
+                platform_key = (link.platform_name or "").lower()
+                desired_price = overrides.get(
+                    platform_key,
+                    calculate_platform_price(platform_key, base_price_value),
+                )
+                status_key = f"{link.platform_name}_price"
+                if self.use_job_queue:
+                    await self._enqueue_platform_job(
+                        link.platform_name,
+                        ACTION_UPDATE_PRICE,
+                        {"platform_common_id": link.id, "external_id": link.external_id, "price": desired_price},
+                        product_id=product.id,
+                        priority=PlatformJobPriority.PRICE,
+                        idempotency_key=f"{ACTION_UPDATE_PRICE}:{link.id}",
                     )
+                    results[status_key] = "queued"
+                    continue
+                try:
                     success = await service.update_listing_price(link.external_id, desired_price)
                 except Exception as exc:
                     logger.error(
@@ -2005,51 +2302,9 @@ class SyncService:
                     results[f"{link.platform_name}_price_error"] = str(exc)
                     continue
 
-                status_key = f"{link.platform_name}_price"
                 if success:
                     results[status_key] = "updated"
-                    timestamp = datetime.utcnow()
-
-                    if link.platform_name == "shopify":
-                        listing_stmt = select(ShopifyListing).where(ShopifyListing.platform_id == link.id)
-                        listing_result = await self.db.execute(listing_stmt)
-                        listing = listing_result.scalar_one_or_none()
-                        if listing:
-                            listing.price = desired_price
-                            listing.updated_at = timestamp
-                            listing.last_synced_at = timestamp
-                            self.db.add(listing)
-                    elif link.platform_name == "ebay":
-                        listing_stmt = select(EbayListing).where(
-                            EbayListing.platform_id == link.id,
-                            EbayListing.listing_status == 'ACTIVE'
-                        )
-                        listing_result = await self.db.execute(listing_stmt)
-                        listing = listing_result.scalar_one_or_none()
-                        if listing:
-                            listing.price = desired_price
-                            listing.updated_at = timestamp
-                            listing.last_synced_at = timestamp
-                            self.db.add(listing)
-                    elif link.platform_name == "reverb":
-                        listing_stmt = select(ReverbListing).where(
-                            ReverbListing.platform_id == link.id,
-                            ReverbListing.reverb_state == 'live'
-                        )
-                        listing_result = await self.db.execute(listing_stmt)
-                        listing = listing_result.scalar_one_or_none()
-                        if listing:
-                            listing.list_price = desired_price
-                            listing.updated_at = timestamp
-                            listing.last_synced_at = timestamp
-                            self.db.add(listing)
-
-                    platform_data = dict(link.platform_specific_data or {})
-                    platform_data["price"] = desired_price
-                    link.platform_specific_data = platform_data
-                    link.last_sync = timestamp
-                    link.sync_status = SyncStatus.SYNCED.value
-                    self.db.add(link)
+                    await self.record_listing_price(link, desired_price)
                 else:
                     results[status_key] = "failed"
 
@@ -2099,6 +2354,16 @@ class SyncService:
                     link.sync_status = SyncStatus.SYNCED.value
                     self.db.add(link)
 
+                    if self.use_job_queue:
+                        await self._enqueue_platform_job(
+                            "vr",
+                            ACTION_UPDATE_PRICE,
+                            {"platform_common_id": link.id, "external_id": link.external_id, "price": desired_price},
+                            product_id=product.id,
+                            priority=PlatformJobPriority.PRICE,
+                            idempotency_key=f"{ACTION_UPDATE_PRICE}:{link.id}",
+                        )
+                        continue
                     task = asyncio.create_task(_run_vr_price_update(link.external_id, desired_price))
                     self._track_background_task(task)
 
@@ -2111,6 +2376,19 @@ class SyncService:
                 old_qty = int(original_values.get("quantity") or 0)
                 new_qty = int(product.quantity or 0)
                 if old_qty > 0 and new_qty == 0 and service and hasattr(service, "mark_item_as_sold"):
+                    if self.use_job_queue:
+                        await self._enqueue_platform_job(
+                            "vr",
+                            ACTION_END_LISTING,
+                            {"external_id": link.external_id},
+                            product_id=product.id,
+                            priority=PlatformJobPriority.END_LISTING,
+                            idempotency_key=f"{ACTION_END_LISTING}:vr:{link.external_id}",
+                        )
+                        link.status = ListingStatus.ENDED.value
+                        self.db.add(link)
+                        results["vr"] = "end_queued"
+                        continue
                     try:
                         await service.mark_item_as_sold(link.external_id)
                         link.status = ListingStatus.ENDED.value
@@ -2132,10 +2410,7 @@ class SyncService:
                     link.external_id,
                     ",".join(sorted(changed_fields & vr_fields)),
                 )
-                task = asyncio.create_task(
-                    self._run_vr_update_background(snapshot, link.external_id, changed_fields)
-                )
-                self._track_background_task(task)
+                await self._schedule_vr_update(product.id, snapshot, link.external_id, changed_fields)
             results["vr_detail_update"] = "queued"
 
         await self.db.commit()
@@ -2157,6 +2432,96 @@ class SyncService:
             "video_url": product.video_url,
         }
 
+    async def record_listing_price(self, link: PlatformCommon, desired_price: float) -> None:
+        """Mirror a price the platform accepted into the specialist table and platform_common."""
+        timestamp = datetime.utcnow()
+
+        if link.platform_name == "shopify":
+            listing_stmt = select(ShopifyListing).where(ShopifyListing.platform_id == link.id)
+            listing_result = await self.db.execute(listing_stmt)
+            listing = listing_result.scalar_one_or_none()
+            if listing:
+                listing.price = desired_price
+                listing.updated_at = timestamp
+                listing.last_synced_at = timestamp
+                self.db.add(listing)
+        elif link.platform_name == "ebay":
+            listing_stmt = select(EbayListing).where(
+                EbayListing.platform_id == link.id,
+                EbayListing.listing_status == 'ACTIVE'
+            )
+            listing_result = await self.db.execute(listing_stmt)
+            listing = listing_result.scalar_one_or_none()
+            if listing:
+                listing.price = desired_price
+                listing.updated_at = timestamp
+                listing.last_synced_at = timestamp
+                self.db.add(listing)
+        elif link.platform_name == "reverb":
+            listing_stmt = select(ReverbListing).where(
+                ReverbListing.platform_id == link.id,
+                ReverbListing.reverb_state == 'live'
+            )
+            listing_result = await self.db.execute(listing_stmt)
+            listing = listing_result.scalar_one_or_none()
+            if listing:
+                listing.list_price = desired_price
+                listing.updated_at = timestamp
+                listing.last_synced_at = timestamp
+                self.db.add(listing)
+
+        platform_data = dict(link.platform_specific_data or {})
+        platform_data["price"] = desired_price
+        link.platform_specific_data = platform_data
+        link.last_sync = timestamp
+        link.sync_status = SyncStatus.SYNCED.value
+        self.db.add(link)
+
+    async def _enqueue_platform_job(
+        self,
+        platform: str,
+        action: str,
+        payload: Dict[str, Any],
+        *,
+        product_id: Optional[int],
+        priority: int,
+        idempotency_key: Optional[str],
+    ) -> int:
+        return await enqueue_platform_job(
+            self.db,
+            platform=platform,
+            action=action,
+            payload=payload,
+            product_id=product_id,
+            priority=priority,
+            idempotency_key=idempotency_key,
+            max_attempts=self.job_max_attempts,
+        )
+
+    async def _schedule_vr_update(
+        self,
+        product_id: int,
+        product_snapshot: Dict[str, Any],
+        external_id: str,
+        changed_fields: Set[str],
+    ) -> None:
+        """Queue a V&R detail edit as a platform job, or run it as a tracked background task."""
+        if self.use_job_queue:
+            fields = sorted(changed_fields)
+            await self._enqueue_platform_job(
+                "vr",
+                ACTION_VR_UPDATE,
+                {"external_id": external_id, "snapshot": product_snapshot, "changed_fields": fields},
+                product_id=product_id,
+                priority=PlatformJobPriority.EDIT,
+                idempotency_key=f"{ACTION_VR_UPDATE}:{external_id}:{','.join(fields)}",
+            )
+            return
+        task = asyncio.create_task(
+            self._run_vr_update_background(product_snapshot, external_id, changed_fields)
+        )
+        self._track_background_task(task)
+
     def _track_background_task(self, task: asyncio.Task) -> None:
         self._background_tasks.add(task)
         task.add_done_callback(self._background_tasks.discard)
@@ -2166,6 +2531,8 @@ class SyncService:
         product_snapshot: Dict[str, Any],
         external_id: str,
         changed_fields: Set[str],
+        *,
+        raise_on_error: bool = False,
     ) -> None:
         logger.info(
             "Starting VR background update for %s (fields: %s)",
@@ -2231,6 +2598,8 @@ class SyncService:
                     exc,
                     exc_info=True,
                 )
+                if raise_on_error:
+                    raise
         logger.info("Finished VR background update for %s", external_id)
     
     async def _update_platform_common(
@@ -2329,11 +2698,8 @@ class SyncService:
 
         if platform_name in specialist_tables:
             config = specialist_tables[platform_name]
-            pc_id_stmt = select(PlatformCommon.id).where(
-                PlatformCommon.product_id == product_id,
-                PlatformCommon.platform_name == platform_name
-            )
-            platform_common_id = (await self.db.execute(pc_id_stmt)).scalar_one_or_none()
+            platform_link = await self._get_platform_common(product_id, platform_name)
+            platform_common_id = platform_link.id if platform_link else None
 
             if platform_common_id:
                 # Use a dictionary for the values to set the column name dynamically
@@ -2362,32 +2728,48 @@ class ChangeDetector:
     ) -> SyncReport:
         """
         Main entry point - detect all changes for a platform
+
+        The status, price and title comparisons share one pass over the listings
+        present on both sides; new and removed listings are one pass each.
         
         Args:
             platform: Platform name (ebay, reverb, shopify, vr)
             platform_data: List of items from platform API
             
         Returns:
-            SyncReport with detected changes
+            SyncReport with detected changes and per-detector timings
         """
         start_time = datetime.now()
         changes = []
         errors = []
+        timings: Dict[str, float] = {}
         
         try:
             # Get local data for this platform
+            phase_start = time.perf_counter()
             local_data = await self._get_local_platform_data(platform)
+            timings["load_local"] = time.perf_counter() - phase_start
             
-            # Convert to lookup dictionaries for efficient comparison
-            platform_lookup = {item.get('external_id') or item.get('id'): item for item in platform_data}
-            local_lookup = {item['external_id']: item for item in local_data if item['external_id']}
+            # Convert to lookup dictionaries for efficient comparison. Keys are
+            # strings on both sides: some APIs return numeric ids (Reverb) while
+            # platform_common.external_id is text
+            platform_lookup = {}
+            for item in platform_data:
+                external_id = item.get('external_id') or item.get('id')
+                if external_id is not None:
+                    platform_lookup[str(external_id)] = item
+            local_lookup = {str(item['external_id']): item for item in local_data if item['external_id']}
             
             # Detect changes
-            changes.extend(await self._detect_status_changes(platform, platform_lookup, local_lookup))
-            changes.extend(await self._detect_price_changes(platform, platform_lookup, local_lookup))
-            changes.extend(await self._detect_content_changes(platform, platform_lookup, local_lookup))
+            changes.extend(self._detect_matched_changes(platform, platform_lookup, local_lookup, timings))
+
+            phase_start = time.perf_counter()
             changes.extend(await self._detect_new_listings(platform, platform_lookup, local_lookup))
+            timings["new_listings"] = time.perf_counter() - phase_start
+
+            phase_start = time.perf_counter()
             changes.extend(await self._detect_removed_listings(platform, platform_lookup, local_lookup))
+            timings["removed_listings"] = time.perf_counter() - phase_start
             
         except Exception as e:
             logger.exception(f"Error during change detection for {platform}")
@@ -2402,8 +2784,58 @@ class ChangeDetector:
             total_local_items=len(local_data) if 'local_data' in locals() else 0,
             changes_detected=changes,
             errors=errors,
-            processing_time_seconds=processing_time
+            processing_time_seconds=processing_time,
+            detector_timings=timings,
         )
+
+    def _detect_matched_changes(
+        self,
+        platform: str,
+        platform_lookup: Dict,
+        local_lookup: Dict,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> List[DetectedChange]:
+        """
+        Status, price and title changes for every listing present on both sides, in one pass.
+
+        Changes are returned grouped by detector (status, then price, then title).
+        Time spent in each comparison is added to timings["status"|"price"|"content"].
+        """
+        status_changes: List[DetectedChange] = []
+        price_changes: List[DetectedChange] = []
+        content_changes: List[DetectedChange] = []
+        status_seconds = price_seconds = content_seconds = 0.0
+        clock = time.perf_counter
+
+        for external_id, platform_item in platform_lookup.items():
+            local_item = local_lookup.get(external_id)
+            if local_item is None:
+                continue
+
+            started = clock()
+            change = self._status_change_for(platform, external_id, platform_item, local_item)
+            if change:
+                status_changes.append(change)
+            checkpoint = clock()
+            status_seconds += checkpoint - started
+
+            change = self._price_change_for(platform, external_id, platform_item, local_item)
+            if change:
+                price_changes.append(change)
+            started = clock()
+            price_seconds += started - checkpoint
+
+            change = self._title_change_for(platform, external_id, platform_item, local_item)
+            if change:
+                content_changes.append(change)
+            content_seconds += clock() - started
+
+        if timings is not None:
+            timings["status"] = timings.get("status", 0.0) + status_seconds
+            timings["price"] = timings.get("price", 0.0) + price_seconds
+            timings["content"] = timings.get("content", 0.0) + content_seconds
+
+        return status_changes + price_changes + content_changes
     
     async def _get_local_platform_data(self, platform: str) -> List[Dict[str, Any]]:
         """Get current local data for platform from PlatformCommon + related tables"""
@@ -2471,62 +2903,71 @@ class ChangeDetector:
     ) -> List[DetectedChange]:
         """Detect status changes (active->sold, active->ended, etc.)"""
         changes = []
-        
         for external_id, platform_item in platform_lookup.items():
-            if external_id not in local_lookup:
-                continue
-                
-            local_item = local_lookup[external_id]
-            
-            # Get status from platform data (normalize field names)
-            if platform == "ebay":
-                platform_status = platform_item.get('listing_status') or platform_item.get('sellingStatus', {}).get('listingStatus')
-            elif platform == "reverb":
-                raw_state = platform_item.get('state') or platform_item.get('reverb_state')
-                # Reverb API returns state as dict {'slug': 'live', 'description': 'Live'}
-                platform_status = raw_state.get('slug') if isinstance(raw_state, dict) else raw_state
-            elif platform == "shopify":
-                platform_status = platform_item.get('status')
-            elif platform == "vr":
-                platform_status = platform_item.get('state') or platform_item.get('vr_state')
-            else:
+            local_item = local_lookup.get(external_id)
+            if local_item is None:
                 continue
+            change = self._status_change_for(platform, external_id, platform_item, local_item)
+            if change:
+                changes.append(change)
+        return changes
 
-            # Get local status — prefer platform-specific state over pc.status
-            if platform == "reverb":
-                local_status = local_item.get('reverb_state') or local_item.get('status')
-            elif platform == "ebay":
-                local_status = local_item.get('listing_status') or local_item.get('status')
-            elif platform == "vr":
-                local_status = local_item.get('vr_state') or local_item.get('status')
-            else:
-                local_status = local_item.get('status')
-            
-            # Compare statuses
-            normalized_platform_status = _normalize_platform_status(platform, platform_status)
-            normalized_local_status = _normalize_platform_status(platform, local_status)
-
-            if (
-                normalized_platform_status is not None
-                and normalized_local_status is not None
-                and normalized_platform_status != normalized_local_status
-            ):
-                changes.append(DetectedChange(
-                    platform=platform,
-                    external_id=external_id,
-                    product_id=local_item.get('product_id'),
-                    sku=local_item.get('sku', 'unknown'),
-                    change_type="status_change",
-                    field="status",
-                    old_value=local_status,
-                    new_value=platform_status,
-                    requires_propagation=self._should_propagate_status_change(
-                        normalized_platform_status,
-                        normalized_local_status,
-                    )
-                ))
+    def _status_change_for(
+        self,
+        platform: str,
+        external_id: Any,
+        platform_item: Dict[str, Any],
+        local_item: Dict[str, Any],
+    ) -> Optional[DetectedChange]:
+        # Get status from platform data (normalize field names)
+        if platform == "ebay":
+            platform_status = platform_item.get('listing_status') or platform_item.get('sellingStatus', {}).get('listingStatus')
+        elif platform == "reverb":
+            raw_state = platform_item.get('state') or platform_item.get('reverb_state')
+            # Reverb API returns state as dict {'slug': 'live', 'description': 'Live'}
+            platform_status = raw_state.get('slug') if isinstance(raw_state, dict) else raw_state
+        elif platform == "shopify":
+            platform_status = platform_item.get('status')
+        elif platform == "vr":
+            platform_status = platform_item.get('state') or platform_item.get('vr_state')
+        else:
+            return None
 
-        return changes
+        # Get local status — prefer platform-specific state over pc.status
+        if platform == "reverb":
+            local_status = local_item.get('reverb_state') or local_item.get('status')
+        elif platform == "ebay":
+            local_status = local_item.get('listing_status') or local_item.get('status')
+        elif platform == "vr":
+            local_status = local_item.get('vr_state') or local_item.get('status')
+        else:
+            local_status = local_item.get('status')
+        
+        # Compare statuses
+        normalized_platform_status = _normalize_platform_status(platform, platform_status)
+        normalized_local_status = _normalize_platform_status(platform, local_status)
+
+        if (
+            normalized_platform_status is None
+            or normalized_local_status is None
+            or normalized_platform_status == normalized_local_status
+        ):
+            return None
+
+        return DetectedChange(
+            platform=platform,
+            external_id=external_id,
+            product_id=local_item.get('product_id'),
+            sku=local_item.get('sku', 'unknown'),
+            change_type="status_change",
+            field="status",
+            old_value=local_status,
+            new_value=platform_status,
+            requires_propagation=self._should_propagate_status_change(
+                normalized_platform_status,
+                normalized_local_status,
+            )
+        )
     
     async def _detect_price_changes(
         self, 
@@ -2536,73 +2977,76 @@ class ChangeDetector:
     ) -> List[DetectedChange]:
         """Detect price changes"""
         changes = []
-        
         for external_id, platform_item in platform_lookup.items():
-            if external_id not in local_lookup:
+            local_item = local_lookup.get(external_id)
+            if local_item is None:
                 continue
-                
-            local_item = local_lookup[external_id]
+            change = self._price_change_for(platform, external_id, platform_item, local_item)
+            if change:
+                changes.append(change)
+        return changes
 
-            # Skip ended/sold listings — price changes are not actionable
-            local_status = str(local_item.get('status', '')).lower()
-            if local_status in ('ended', 'sold'):
-                continue
+    def _price_change_for(
+        self,
+        platform: str,
+        external_id: Any,
+        platform_item: Dict[str, Any],
+        local_item: Dict[str, Any],
+    ) -> Optional[DetectedChange]:
+        # Skip ended/sold listings — price changes are not actionable
+        local_status = str(local_item.get('status', '')).lower()
+        if local_status in ('ended', 'sold'):
+            return None
 
-            if platform == "vr":
-                # VR listings intentionally carry platform-specific markups; API feed also
-                # returns inconsistent values. Skip automated price-drift detection.
-                continue
+        if platform == "vr":
+            # VR listings intentionally carry platform-specific markups; API feed also
+            # returns inconsistent values. Skip automated price-drift detection.
+            return None
 
-            # Get price from platform data
-            if platform == "ebay":
-                platform_price = platform_item.get('current_price') or platform_item.get('buyItNowPrice', {}).get('value')
-            elif platform == "reverb":
-                platform_price = platform_item.get('price', {}).get('amount') if isinstance(platform_item.get('price'), dict) else platform_item.get('price')
-            elif platform == "shopify":
-                platform_price = platform_item.get('price')
-            elif platform == "vr":
-                platform_price = platform_item.get('price_notax')
-            else:
-                continue
+        # Get price from platform data, and the local price (prefer platform-specific
+        # field, fall back to master price)
+        if platform == "ebay":
+            platform_price = platform_item.get('current_price') or platform_item.get('buyItNowPrice', {}).get('value')
+            local_price = local_item.get('price')
+        elif platform == "reverb":
+            platform_price = platform_item.get('price', {}).get('amount') if isinstance(platform_item.get('price'), dict) else platform_item.get('price')
+            local_price = local_item.get('list_price')
+        elif platform == "shopify":
+            platform_price = platform_item.get('price')
+            local_price = local_item.get('price')
+        else:
+            return None
 
-            # Get local price (prefer platform-specific field, fall back to master price)
-            if platform == "ebay":
-                local_price = local_item.get('price')
-            elif platform == "reverb":
-                local_price = local_item.get('list_price')
-            elif platform == "shopify":
-                local_price = local_item.get('price')
-            else:
-                local_price = None
+        if local_price is None:
+            local_price = local_item.get('base_price')
 
-            if local_price is None:
-                local_price = local_item.get('base_price')
+        if platform_price is None or local_price is None:
+            return None
 
-            # Compare prices (with tolerance for floating point)
-            if platform_price is not None and local_price is not None:
-                try:
-                    platform_price_float = float(platform_price)
-                    local_price_float = float(local_price)
-
-                    # Consider significant if difference > 1% or > £1
-                    price_diff = abs(platform_price_float - local_price_float)
-                    if price_diff > max(1.0, local_price_float * 0.01):
-                        changes.append(DetectedChange(
-                            platform=platform,
-                            external_id=external_id,
-                            product_id=local_item.get('product_id'),
-                            sku=local_item.get('sku', 'unknown'),
-                            change_type="price_change",
-                            field="price",
-                            old_value=local_price_float,
-                            new_value=platform_price_float,
-                            requires_propagation=True
-                        ))
-                except (ValueError, TypeError):
-                    # Price comparison failed - log but continue
-                    pass
-        
-        return changes
+        # Compare prices (with tolerance for floating point)
+        try:
+            platform_price_float = float(platform_price)
+            local_price_float = float(local_price)
+        except (ValueError, TypeError):
+            # Price comparison failed - skip this listing
+            return None
+
+        # Consider significant if difference > 1% or > £1
+        price_diff = abs(platform_price_float - local_price_float)
+        if price_diff <= max(1.0, local_price_float * 0.01):
+            return None
+
+        return DetectedChange(
+            platform=platform,
+            external_id=external_id,
+            product_id=local_item.get('product_id'),
+            sku=local_item.get('sku', 'unknown'),
+            change_type="price_change",
+            field="price",
+            old_value=local_price_float,
+            new_value=platform_price_float,
+            requires_propagation=True
+        )
     
     async def _detect_content_changes(
         self, 
@@ -2612,31 +3056,39 @@ class ChangeDetector:
     ) -> List[DetectedChange]:
         """Detect title/description changes"""
         changes = []
-        
         for external_id, platform_item in platform_lookup.items():
-            if external_id not in local_lookup:
+            local_item = local_lookup.get(external_id)
+            if local_item is None:
                 continue
-                
-            local_item = local_lookup[external_id]
-            
-            # Compare titles
-            platform_title = platform_item.get('title')
-            local_title = local_item.get('title')
-            
-            if platform_title and local_title and platform_title.strip() != local_title.strip():
-                changes.append(DetectedChange(
-                    platform=platform,
-                    external_id=external_id,
-                    product_id=local_item.get('product_id'),
-                    sku=local_item.get('sku', 'unknown'),
-                    change_type="title_change",
-                    field="title",
-                    old_value=local_title,
-                    new_value=platform_title,
-                    requires_propagation=False  # Usually don't propagate title changes
-                ))
-        
+            change = self._title_change_for(platform, external_id, platform_item, local_item)
+            if change:
+                changes.append(change)
         return changes
+
+    def _title_change_for(
+        self,
+        platform: str,
+        external_id: Any,
+        platform_item: Dict[str, Any],
+        local_item: Dict[str, Any],
+    ) -> Optional[DetectedChange]:
+        platform_title = platform_item.get('title')
+        local_title = local_item.get('title')
+
+        if not (platform_title and local_title) or platform_title.strip() == local_title.strip():
+            return None
+
+        return DetectedChange(
+            platform=platform,
+            external_id=external_id,
+            product_id=local_item.get('product_id'),
+            sku=local_item.get('sku', 'unknown'),
+            change_type="title_change",
+            field="title",
+            old_value=local_title,
+            new_value=platform_title,
+            requires_propagation=False  # Usually don't propagate title changes
+        )
     
     async def _detect_new_listings(
         self,
@@ -2647,13 +3099,27 @@ class ChangeDetector:
         """Detect new listings that appeared on platform"""
         changes = []
 
-        for external_id, platform_item in platform_lookup.items():
-            if external_id in local_lookup:
-                continue
+        unmatched = {
+            external_id: platform_item
+            for external_id, platform_item in platform_lookup.items()
+            if external_id not in local_lookup
+        }
+        if not unmatched:
+            return changes
+
+        # Known old listings from a refresh (exist in the platform-specific listing
+        # table but no longer in platform_common.external_id) - one query for all
+        known_old_ids = await self._known_old_listing_ids(platform, [str(external_id) for external_id in unmatched])
+
+        # Load V&R match candidates once for every unmatched row
+        vr_match_index = None
+        if platform == "vr":
+            vr_match_index = await self._build_vr_match_index(
+                item for external_id, item in unmatched.items() if str(external_id) not in known_old_ids
+            )
 
-            # Check if this is a known old listing from a refresh (exists in
-            # platform-specific listing table but no longer in platform_common.external_id)
-            if await self._is_known_old_listing(platform, str(external_id)):
+        for external_id, platform_item in unmatched.items():
+            if str(external_id) in known_old_ids:
                 logger.debug(
                     "Skipping known old %s listing %s (refresh artifact)",
                     platform, external_id,
@@ -2662,7 +3128,7 @@ class ChangeDetector:
 
             # Attempt to suggest a match for specific platforms
             if platform == "vr":
-                match_candidate = await self._suggest_vr_match(platform_item)
+                match_candidate = await self._suggest_vr_match(platform_item, vr_match_index)
                 if match_candidate:
                     changes.append(DetectedChange(
                         platform=platform,
@@ -2707,76 +3173,142 @@ class ChangeDetector:
         but still exist in the platform-specific table with ended/sold state. These
         should not be treated as new listings.
         """
+        return external_id in await self._known_old_listing_ids(platform, [external_id])
+
+    async def _known_old_listing_ids(self, platform: str, external_ids: List[str]) -> Set[str]:
+        """Batch form of _is_known_old_listing: which of external_ids exist in the platform listing table."""
+        if not external_ids:
+            return set()
         try:
             if platform == "reverb":
                 from app.models.reverb import ReverbListing
-                stmt = select(ReverbListing.id).where(
-                    ReverbListing.reverb_listing_id == external_id
-                ).limit(1)
+                id_column = ReverbListing.reverb_listing_id
             elif platform == "ebay":
                 from app.models.ebay import EbayListing
-                stmt = select(EbayListing.id).where(
-                    EbayListing.ebay_item_id == external_id
-                ).limit(1)
+                id_column = EbayListing.ebay_item_id
             elif platform == "vr":
                 from app.models.vr import VRListing
-                stmt = select(VRListing.id).where(
-                    VRListing.vr_listing_id == external_id
-                ).limit(1)
+                id_column = VRListing.vr_listing_id
             else:
-                return False
-            result = await self.db.execute(stmt)
-            return result.scalar_one_or_none() is not None
+                return set()
+            result = await self.db.execute(select(id_column).where(id_column.in_(external_ids)).distinct())
+            return {str(value) for value in result.scalars().all()}
         except Exception:
-            return False
-
-    async def _suggest_vr_match(self, platform_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Attempt to match a V&R listing without a local record to an existing product."""
-
-        sku = str(platform_item.get('sku') or platform_item.get('product_sku') or '').strip()
-        brand_value = str(platform_item.get('brand_name') or platform_item.get('brand name') or '').lower().strip()
-        model_value = str(platform_item.get('product_model_name') or platform_item.get('product model name') or '').lower().strip()
-        finish_value = str(platform_item.get('product_finish') or platform_item.get('product finish') or '').lower().strip()
-        year_value = str(platform_item.get('product_year') or platform_item.get('product year') or '').strip()
-        description_value = str(platform_item.get('product_description') or platform_item.get('product description') or '').lower()
+            return set()
 
+    @staticmethod
+    def _vr_item_fields(platform_item: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalised matching fields from a V&R CSV row (handles both header styles)."""
         try:
             price_value = float(platform_item.get('product_price') or platform_item.get('product price') or 0)
         except (TypeError, ValueError):
             price_value = 0.0
 
-        candidates: List[Tuple[Product, Optional[PlatformCommon]]] = []
-        seen_product_ids: Set[int] = set()
-
-        # Direct SKU lookup
-        if sku:
-            product_stmt = select(Product).where(Product.sku == sku)
-            product = await self.db.scalar(product_stmt)
-            if product:
-                pc_stmt = select(PlatformCommon).where(
-                    PlatformCommon.product_id == product.id,
-                    PlatformCommon.platform_name == 'vr'
-                )
-                platform_common = await self.db.scalar(pc_stmt)
-                candidates.append((product, platform_common))
-                seen_product_ids.add(product.id)
+        return {
+            "sku": str(platform_item.get('sku') or platform_item.get('product_sku') or '').strip(),
+            "brand": str(platform_item.get('brand_name') or platform_item.get('brand name') or '').lower().strip(),
+            "model": str(platform_item.get('product_model_name') or platform_item.get('product model name') or '').lower().strip(),
+            "finish": str(platform_item.get('product_finish') or platform_item.get('product finish') or '').lower().strip(),
+            "year": str(platform_item.get('product_year') or platform_item.get('product year') or '').strip(),
+            "description": str(platform_item.get('product_description') or platform_item.get('product description') or '').lower(),
+            "price": price_value,
+        }
 
-        if not brand_value:
-            return None
+    async def _build_vr_match_index(self, platform_items) -> VRMatchIndex:
+        """
+        Load every candidate product for a set of unmatched V&R rows in two queries.
 
-        # Pending VR platform entries with matching brand
-        pending_stmt = (
+        Candidates are products whose SKU or lower-cased brand appears in any of
+        the rows, each paired with its VR platform_common row (if any).
+        """
+        skus: Set[str] = set()
+        brands: Set[str] = set()
+        for platform_item in platform_items:
+            fields = self._vr_item_fields(platform_item)
+            if fields["sku"]:
+                skus.add(fields["sku"])
+            if fields["brand"]:
+                brands.add(fields["brand"])
+
+        index = VRMatchIndex(by_sku={}, by_brand={}, other_platform_counts={})
+        if not skus and not brands:
+            return index
+
+        conditions = []
+        if skus:
+            conditions.append(Product.sku.in_(skus))
+        if brands:
+            conditions.append(func.lower(Product.brand).in_(brands))
+
+        candidate_stmt = (
             select(Product, PlatformCommon)
             .outerjoin(
                 PlatformCommon,
                 (PlatformCommon.product_id == Product.id)
                 & (PlatformCommon.platform_name == 'vr')
             )
-            .where(func.lower(Product.brand) == brand_value)
+            .where(or_(*conditions))
+            .order_by(Product.id, PlatformCommon.id)
         )
 
-        pending_rows = await self.db.execute(pending_stmt)
-        for product, platform_common in pending_rows.all():
+        candidate_ids: Set[int] = set()
+        for product, platform_common in (await self.db.execute(candidate_stmt)).all():
+            candidate_ids.add(product.id)
+            if product.sku in skus and product.sku not in index.by_sku:
+                index.by_sku[product.sku] = (product, platform_common)
+            brand_key = (product.brand or '').lower()
+            if brand_key in brands:
+                index.by_brand.setdefault(brand_key, []).append((product, platform_common))
+
+        if candidate_ids:
+            other_stmt = (
+                select(PlatformCommon.product_id, func.count())
+                .where(
+                    PlatformCommon.product_id.in_(candidate_ids),
+                    PlatformCommon.platform_name != 'vr'
+                )
+                .group_by(PlatformCommon.product_id)
+            )
+            index.other_platform_counts = {pid: count for pid, count in (await self.db.execute(other_stmt)).all()}
+
+        return index
+
+    async def _suggest_vr_match(
+        self,
+        platform_item: Dict[str, Any],
+        match_index: Optional[VRMatchIndex] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Attempt to match a V&R listing without a local record to an existing product.
+
+        Pass a VRMatchIndex built for the whole run to avoid per-row queries;
+        without one an index is built for this row alone.
+        """
+        if match_index is None:
+            match_index = await self._build_vr_match_index([platform_item])
+
+        fields = self._vr_item_fields(platform_item)
+        sku = fields["sku"]
+        brand_value = fields["brand"]
+        model_value = fields["model"]
+        finish_value = fields["finish"]
+        year_value = fields["year"]
+        description_value = fields["description"]
+        price_value = fields["price"]
+
+        candidates: List[Tuple[Product, Optional[PlatformCommon]]] = []
+        seen_product_ids: Set[int] = set()
+
+        # Direct SKU lookup
+        if sku and sku in match_index.by_sku:
+            product, platform_common = match_index.by_sku[sku]
+            candidates.append((product, platform_common))
+            seen_product_ids.add(product.id)
+
+        if not brand_value:
+            return None
+
+        # Pending VR platform entries with matching brand
+        for product, platform_common in match_index.by_brand.get(brand_value, []):
             if product.id in seen_product_ids:
                 continue
 
@@ -2791,18 +3323,7 @@ class ChangeDetector:
         if not candidates:
             return None
 
-        candidate_ids = [product.id for product, _ in candidates]
-        other_counts: Dict[int, int] = {}
-        if candidate_ids:
-            other_stmt = (
-                select(PlatformCommon.product_id, func.count())
-                .where(
-                    PlatformCommon.product_id.in_(candidate_ids),
-                    PlatformCommon.platform_name != 'vr'
-                )
-                .group_by(PlatformCommon.product_id)
-            )
-            other_counts = {pid: count for pid, count in (await self.db.execute(other_stmt)).all()}
+        other_counts = match_index.other_platform_counts
 
         best_match = None
         best_score = 0
@@ -2859,8 +3380,9 @@ class ChangeDetector:
                     score += 15
                     reasons.append('sku_in_description')
                 else:
-                    ratio = SequenceMatcher(None, product_desc[:200], description_value[:200]).ratio()
-                    if ratio >= 0.4:
+                    matcher = SequenceMatcher(None, product_desc[:200], description_value[:200])
+                    # quick_ratio() is an upper bound on ratio(); skip the full diff when it can't reach 0.4
+                    if matcher.quick_ratio() >= 0.4 and matcher.ratio() >= 0.4:
                         score += 8
                         reasons.append('description')
 
@@ -2894,19 +3416,20 @@ class ChangeDetector:
         changes = []
         
         for external_id, local_item in local_lookup.items():
-            if external_id not in platform_lookup:
-                # This listing exists locally but not on platform
-                changes.append(DetectedChange(
-                    platform=platform,
-                    external_id=external_id,
-                    product_id=local_item.get('product_id'),
-                    sku=local_item.get('sku', 'unknown'),
-                    change_type="removed_listing",
-                    field="listing",
-                    old_value=local_item.get('title', 'Removed listing'),
-                    new_value=None,
-                    requires_propagation=True  # Might need to propagate removal
-                ))
+            if external_id in platform_lookup:
+                continue
+            # This listing exists locally but not on platform
+            changes.append(DetectedChange(
+                platform=platform,
+                external_id=external_id,
+                product_id=local_item.get('product_id'),
+                sku=local_item.get('sku', 'unknown'),
+                change_type="removed_listing",
+                field="listing",
+                old_value=local_item.get('title', 'Removed listing'),
+                new_value=None,
+                requires_propagation=True  # Might need to propagate removal
+            ))
         
         return changes
     
@@ -2925,10 +3448,15 @@ class ChangeDetector:
 class InboundSyncScheduler:
     """Coordinates periodic platform data fetching and comparison"""
     
-    def __init__(self, db: AsyncSession, report_only: bool = True):
+    PLATFORMS = ("ebay", "reverb", "shopify", "vr")
+
+    def __init__(self, db: AsyncSession, report_only: bool = True, session_factory=None):
         self.db = db
         self.report_only = report_only
         self.change_detector = ChangeDetector(db)
+        # Used by run_all_platforms_concurrently to give each platform its own session
+        self.session_factory = session_factory
+        self._reverb_client = None
     
     async def run_platform_sync(self, platform: str) -> SyncReport:
         """
@@ -2969,7 +3497,7 @@ class InboundSyncScheduler:
     
     async def run_all_platforms_sync(self) -> Dict[str, SyncReport]:
         """Run sync for all platforms and return comprehensive report"""
-        platforms = ["ebay", "reverb", "shopify", "vr"]
+        platforms = list(self.PLATFORMS)
         reports = {}
         
         for platform in platforms:
@@ -2989,39 +3517,177 @@ class InboundSyncScheduler:
         
         return reports
     
-    async def _fetch_platform_data(self, platform: str) -> List[Dict[str, Any]]:
+    async def run_all_platforms_concurrently(
+        self, platforms: Optional[Sequence[str]] = None
+    ) -> CombinedSyncReport:
+        """
+        Run every platform's fetch + change detection at the same time.
+
+        Each platform gets its own session from session_factory (falls back to
+        app.database.async_session) since an AsyncSession can't be shared across
+        concurrent tasks. Detection for a platform starts as soon as its own data
+        arrives, so the run takes roughly as long as the slowest platform.
+        """
+        session_factory = self.session_factory
+        if session_factory is None:
+            from app.database import async_session
+            session_factory = async_session
+
+        platforms = list(platforms or self.PLATFORMS)
+        phase_timings: Dict[str, Dict[str, float]] = {platform: {} for platform in platforms}
+        started_at = datetime.now()
+        run_start = time.monotonic()
+
+        async def run_one(platform: str) -> SyncReport:
+            timings = phase_timings[platform]
+            async with session_factory() as db:
+                try:
+                    phase_start = time.monotonic()
+                    platform_data = await self._fetch_platform_data(platform, db=db)
+                    timings["fetch"] = time.monotonic() - phase_start
+
+                    phase_start = time.monotonic()
+                    report = await ChangeDetector(db).detect_platform_changes(platform, platform_data)
+                    timings["detect"] = time.monotonic() - phase_start
+                except Exception as e:
+                    logger.exception(f"Failed to sync {platform}")
+                    return SyncReport(
+                        platform=platform,
+                        timestamp=datetime.now(),
+                        total_platform_items=0,
+                        total_local_items=0,
+                        changes_detected=[],
+                        errors=[f"Platform sync failed: {str(e)}"],
+                        processing_time_seconds=sum(timings.values())
+                    )
+
+            if not self.report_only and report.changes_detected:
+                logger.info(f"Would apply {len(report.changes_detected)} {platform} changes (report_only=False not implemented yet)")
+            logger.info(
+                "%s sync finished: fetch %.1fs, detect %.1fs, %d changes",
+                platform, timings.get("fetch", 0), timings.get("detect", 0), len(report.changes_detected),
+            )
+            return report
+
+        results = await asyncio.gather(*(run_one(platform) for platform in platforms))
+
+        return CombinedSyncReport(
+            started_at=started_at,
+            reports=dict(zip(platforms, results)),
+            phase_timings=phase_timings,
+            total_seconds=time.monotonic() - run_start,
+        )
+
+    async def _fetch_platform_data(self, platform: str, db: Optional[AsyncSession] = None) -> List[Dict[str, Any]]:
         """Fetch current data from platform using existing service clients"""
+        db = db or self.db
         
         if platform == "ebay":
-            from app.services.ebay_service import EbayService
-            ebay_service = EbayService(self.db)
-            # Use existing method to get all listings
-            return await ebay_service.get_all_active_listings()  # You'll need to implement this method
+            return await self._fetch_ebay_listings()
             
         elif platform == "reverb":
-            from app.services.reverb.client import ReverbClient
-            reverb_client = ReverbClient()
-            # Use existing method
-            listings = await reverb_client.get_all_listings_detailed()
+            # One client per scheduler; its requests share the pooled Reverb transport
+            if self._reverb_client is None:
+                from app.services.reverb.client import ReverbClient
+                self._reverb_client = ReverbClient(api_key=get_settings().REVERB_API_KEY)
+            listings = await self._reverb_client.get_all_listings_detailed()
             return [listing.__dict__ if hasattr(listing, '__dict__') else listing for listing in listings]
             
         elif platform == "shopify":
-            from app.services.shopify.client import ShopifyClient
-            shopify_client = ShopifyClient()
-            # Use existing method
-            products = await shopify_client.get_all_products_summary()
+            from app.services.shopify.async_client import AsyncShopifyGraphQLClient
+            async with AsyncShopifyGraphQLClient() as shopify_client:
+                products = await shopify_client.get_all_products_summary()
             return products
             
         elif platform == "vr":
-            from app.services.vr_service import VRService
-            vr_service = VRService(self.db)
-            # Use existing CSV download method
-            df = await vr_service.download_inventory_dataframe()
-            return df.to_dict('records') if df is not None else []
+            return await self._fetch_vr_listings(db)
             
         else:
             raise ValueError(f"Unknown platform: {platform}")
 
+    # eBay's selling lists mapped onto the statuses EbayService stores locally
+    EBAY_LIST_STATUSES = {"active": "ACTIVE", "sold": "SOLD", "unsold": "ENDED"}
+
+    async def _fetch_ebay_listings(self) -> List[Dict[str, Any]]:
+        """
+        Active, sold and unsold eBay listings in the shape ChangeDetector reads.
+
+        All three lists are fetched so locally sold/ended listings show up as
+        status changes rather than removals. A failed page raises, as an
+        incomplete list would flag every missing listing as removed.
+        """
+        from app.services.ebay.trading import EbayTradingLegacyAPI
+
+        trading_api = EbayTradingLegacyAPI(sandbox=get_settings().EBAY_SANDBOX_MODE)
+        selling_lists = await trading_api.get_all_selling_listings(include_details=True, concurrent=True)
+
+        listings = []
+        for list_type, items in selling_lists.items():
+            for item in items:
+                item_id = item.get('ItemID')
+                if not item_id:
+                    continue
+                price = (item.get('SellingStatus') or {}).get('CurrentPrice') or {}
+                listings.append({
+                    'external_id': str(item_id),
+                    'listing_status': self.EBAY_LIST_STATUSES[list_type],
+                    'current_price': price.get('#text') if isinstance(price, dict) else price,
+                    'title': item.get('Title'),
+                    'sku': item.get('SKU'),
+                })
+        return listings
+
+    async def _fetch_vr_listings(self, db: AsyncSession) -> List[Dict[str, Any]]:
+        """
+        Rows of the V&R inventory CSV, keyed by external_id with a vr_state.
+
+        The raw CSV columns are kept since V&R match suggestions read them.
+        Authentication and download failures raise instead of returning an
+        empty inventory, which would report every listing as removed.
+        """
+        from app.services.vintageandrare.client import VintageAndRareClient
+
+        settings = get_settings()
+        client = VintageAndRareClient(
+            settings.VINTAGE_AND_RARE_USERNAME, settings.VINTAGE_AND_RARE_PASSWORD, db_session=db
+        )
+        if not await client.authenticate():
+            raise RuntimeError("V&R authentication failed")
+
+        inventory = await client.download_inventory_dataframe()
+        if isinstance(inventory, str):
+            raise RuntimeError("V&R inventory download timed out; retry during off-peak hours")
+        if inventory is None:
+            raise RuntimeError("V&R inventory download failed")
+
+        # NaN cells would otherwise read as the string 'nan' in the matchers
+        inventory = inventory.astype(object).where(inventory.notna(), None)
+        listings = []
+        for row in inventory.to_dict('records'):
+            vr_id = row.get('product_id')
+            if vr_id in (None, ''):
+                continue
+            is_sold = str(row.get('product_sold') or '').lower() == 'yes'
+            listings.append({
+                **row,
+                'external_id': str(vr_id),
+                'vr_state': 'sold' if is_sold else 'active',
+            })
+        return listings
+
+    def print_combined_report(self, combined: CombinedSyncReport) -> None:
+        """Print every platform report followed by the phase timings"""
+        for report in combined.reports.values():
+            self.print_sync_report(report)
+
+        print(f"{'='*60}")
+        print("PHASE TIMINGS")
+        print(f"{'='*60}")
+        for platform, phases in combined.phase_timings.items():
+            print(f"  {platform:<8} fetch {phases.get('fetch', 0):7.2f}s   detect {phases.get('detect', 0):7.2f}s")
+        print(f"Wall clock: {combined.total_seconds:.2f}s (sequential would be ~{combined.sequential_seconds:.2f}s)")
+        print(f"{'='*60}\n")
+
     def print_sync_report(self, report: SyncReport) -> None:
         """Print a human-readable sync report"""
         print(f"\n{'='*60}")
@@ -3031,6 +3697,10 @@ class InboundSyncScheduler:
         print(f"Processing Time: {report.processing_time_seconds:.2f} seconds")
         print(f"Platform Items: {report.total_platform_items}")
         print(f"Local Items: {report.total_local_items}")
+        if report.detector_timings:
+            print("Detector Timings: " + ", ".join(
+                f"{name} {seconds * 1000:.1f}ms" for name, seconds in report.detector_timings.items()
+            ))
         
         if report.errors:
             print(f"\n❌ ERRORS ({len(report.errors)}):")
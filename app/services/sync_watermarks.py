@@ -0,0 +1,54 @@
+"""Helpers for reading and advancing per-platform sync high-water marks."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.sync_watermark import SyncWatermark
+
+
+async def get_sync_watermark(db: AsyncSession, platform_name: str) -> Optional[SyncWatermark]:
+    """Return the stored watermark row for a platform, if any."""
+    result = await db.execute(
+        select(SyncWatermark).where(SyncWatermark.platform_name == platform_name)
+    )
+    return result.scalar_one_or_none()
+
+
+def needs_full_reconcile(
+    watermark: Optional[SyncWatermark],
+    full_reconcile_interval: timedelta,
+    now: Optional[datetime] = None,
+) -> bool:
+    """True when there is no usable watermark or the last full sync is too old."""
+    if watermark is None or watermark.watermark_at is None or watermark.last_full_sync_at is None:
+        return True
+    now = now or datetime.now(timezone.utc)
+    return now - watermark.last_full_sync_at >= full_reconcile_interval
+
+
+async def save_sync_watermark(
+    db: AsyncSession,
+    platform_name: str,
+    *,
+    watermark_at: datetime,
+    full_sync: bool,
+    sync_run_id: Optional[str] = None,
+) -> None:
+    """Upsert the watermark. Caller commits, so it lands with the sync's events."""
+    values = {
+        "platform_name": platform_name,
+        "watermark_at": watermark_at,
+        "last_sync_run_id": str(sync_run_id) if sync_run_id else None,
+        "updated_at": datetime.now(timezone.utc),
+    }
+    if full_sync:
+        values["last_full_sync_at"] = watermark_at
+
+    stmt = insert(SyncWatermark).values(**values)
+    update_columns = {key: stmt.excluded[key] for key in values if key != "platform_name"}
+    stmt = stmt.on_conflict_do_update(index_elements=["platform_name"], set_=update_columns)
+    await db.execute(stmt)
@@ -1416,7 +1416,8 @@ class VintageAndRareClient:
             test_mode: bool = True,
             from_scratch: bool = False,
             db_session=None,
-            skip_id_resolution: bool = False
+            skip_id_resolution: bool = False,
+            browser_session=None,
             ) -> Dict[str, Any]:
             """
             Create a listing on V&R using Selenium automation via inspect_form.py.
@@ -1428,6 +1429,9 @@ class VintageAndRareClient:
                 from_scratch: If True, uses internal category mapping. If False, expects
                             pre-mapped V&R categories in product_data.
                 skip_id_resolution: If True, skip CSV download for ID resolution (for batched processing).
+                browser_session: Optional pooled VRBrowserSession (see session_pool.py). When given,
+                            its already logged-in browser fills the form instead of a fresh
+                            login_and_navigate driver.
 
             Returns:
                 Dict with status, message, and potentially vr_listing_id (currently None).
@@ -1587,7 +1591,7 @@ class VintageAndRareClient:
                 
                 result = await loop.run_in_executor(
                     None, # Default thread pool executor
-                    lambda: self._run_selenium_automation(form_data, test_mode, db_session) # Pass prepared data
+                    lambda: self._run_selenium_automation(form_data, test_mode, db_session, browser_session) # Pass prepared data
                 )
 
                 if result.get("status") == "success":
@@ -1655,7 +1659,7 @@ class VintageAndRareClient:
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 }
     
-    def _run_selenium_automation(self, form_data: Dict[str, Any], test_mode: bool, db_session=None) -> Dict[str, Any]:
+    def _run_selenium_automation(self, form_data: Dict[str, Any], test_mode: bool, db_session=None, browser_session=None) -> Dict[str, Any]:
         """
         Wrapper function to execute the blocking Selenium login_and_navigate function.
         This runs in a separate thread via run_in_executor.
@@ -1663,6 +1667,7 @@ class VintageAndRareClient:
         Args:
             form_data: The dictionary of data prepared for the V&R form.
             test_mode: Boolean indicating if the form should be submitted.
+            browser_session: Optional pooled VRBrowserSession to fill the form with.
 
         Returns:
             Dictionary containing the result status, message, and vr_listing_id (None).
@@ -1672,14 +1677,18 @@ class VintageAndRareClient:
 
         try:
             logger.info(f"Starting Selenium automation in executor thread (Test Mode: {test_mode})...")
-            # Call the imported function from inspect_form.py
-            login_and_navigate(
-                username=self.username,
-                password=self.password,
-                item_data=form_data,
-                test_mode=test_mode,
-                db_session=None  # ✅ Don't pass db_session to avoid async loop conflicts
-            )
+            if browser_session is not None:
+                logger.info(f"Using pooled V&R browser session {browser_session.index}")
+                browser_session.fill_listing_form(form_data, test_mode)
+            else:
+                # Call the imported function from inspect_form.py
+                login_and_navigate(
+                    username=self.username,
+                    password=self.password,
+                    item_data=form_data,
+                    test_mode=test_mode,
+                    db_session=None  # ✅ Don't pass db_session to avoid async loop conflicts
+                )
 
             # Note: The actual V&R product ID is not retrieved here.
             # Reconciliation needed after inventory download.
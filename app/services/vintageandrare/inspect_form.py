@@ -210,6 +210,162 @@ def map_category_options(driver):
         driver.save_screenshot("category_map_error.png")
         raise e
 
+def build_listing_driver(remote_debugging_port=9222):
+    """
+    Create the Chrome driver used for listing automation.
+
+    Uses the Selenium Grid at SELENIUM_GRID_URL when set (with health-check
+    retries), otherwise a local ChromeDriver. Pooled drivers running side by
+    side pass remote_debugging_port=0 so Chrome picks a free port each.
+    Returns (driver, is_remote).
+    """
+    # Initialize Selenium with network logging enabled
+    options = webdriver.ChromeOptions()
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    # Harden headless Chrome for container environments (Railway, Docker, etc.)
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    
+    # Enable performance logging to capture network events
+    options.add_experimental_option('perfLoggingPrefs', {
+        'enableNetwork': True,
+        'enablePage': False
+    })
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    
+    # Enable DevTools for response body access
+    if remote_debugging_port is not None:
+        options.add_argument(f"--remote-debugging-port={remote_debugging_port}")
+    
+    # Check for Selenium Grid URL from environment
+    selenium_grid_url = os.environ.get('SELENIUM_GRID_URL')
+
+    if selenium_grid_url:
+        # Debug the raw value
+        print(f"DEBUG: Raw SELENIUM_GRID_URL from env: '{selenium_grid_url}'")
+        print(f"DEBUG: URL repr: {repr(selenium_grid_url)}")
+
+        # Strip any whitespace from the URL
+        selenium_grid_url = selenium_grid_url.strip()
+
+        # Use remote Selenium Grid
+        print(f"DEBUG: After strip, using remote Selenium Grid at: '{selenium_grid_url}'")
+
+        # Ensure the URL has the correct format
+        if not selenium_grid_url.startswith('http'):
+            selenium_grid_url = f"http://{selenium_grid_url}"
+        if not selenium_grid_url.endswith('/wd/hub'):
+            selenium_grid_url = f"{selenium_grid_url}/wd/hub"
+
+        print(f"DEBUG: Formatted Selenium Grid URL: {selenium_grid_url}")
+
+        # Health check with retry logic for container restarts
+        import urllib.parse
+        import time as health_time
+        status_url = selenium_grid_url
+        if status_url.endswith('/wd/hub'):
+            status_url = status_url[:-6]
+        status_url = urllib.parse.urljoin(status_url + '/', 'status')
+
+        max_retries = 5
+        retry_delays = [5, 10, 15, 20, 30]  # Increasing delays between retries
+        last_error = None
+
+        for attempt in range(max_retries):
+            try:
+                print(f"DEBUG: Pinging Selenium Grid status endpoint (attempt {attempt + 1}/{max_retries}): {status_url}")
+                health_response = requests.get(status_url, timeout=30)
+                health_json = {}
+                try:
+                    health_json = health_response.json()
+                except Exception:
+                    pass
+                grid_ready = (
+                    health_response.status_code == 200
+                    and isinstance(health_json, dict)
+                    and health_json.get("value", {}).get("ready", False)
+                )
+                if grid_ready:
+                    print(f"DEBUG: Selenium Grid is ready (attempt {attempt + 1})")
+                    break
+                else:
+                    last_error = RuntimeError(
+                        f"Selenium Grid not ready (status={health_response.status_code}, body={health_json})"
+                    )
+                    print(f"DEBUG: Grid not ready yet: {last_error}")
+            except Exception as health_exc:
+                last_error = health_exc
+                print(f"DEBUG: Health check failed (attempt {attempt + 1}): {health_exc}")
+
+            if attempt < max_retries - 1:
+                wait_time = retry_delays[attempt]
+                print(f"DEBUG: Waiting {wait_time}s before retry (container may be restarting)...")
+                health_time.sleep(wait_time)
+        else:
+            # All retries exhausted
+            print(f"ERROR: Selenium Grid health check failed after {max_retries} attempts: {last_error}")
+            raise RuntimeError(
+                "Remote Selenium browser is unavailable after multiple retries. The Chrome container may be down or restarting."
+            ) from last_error
+
+        driver = webdriver.Remote(
+            command_executor=selenium_grid_url,
+            options=options
+        )
+        print("DEBUG: Connected to Selenium Grid successfully")
+    else:
+        # Local Chrome setup
+        print("DEBUG: Starting ChromeDriver download/check...")
+
+        import time as time_module
+        start_time = time_module.time()
+
+        try:
+            driver_path = ChromeDriverManager().install()
+            elapsed = time_module.time() - start_time
+            print(f"DEBUG: ChromeDriver installed/found in {elapsed:.2f} seconds at: {driver_path}")
+        except Exception as e:
+            elapsed = time_module.time() - start_time
+            print(f"ERROR: ChromeDriver download failed after {elapsed:.2f} seconds: {e}")
+            raise
+
+        print("DEBUG: Creating Chrome WebDriver instance...")
+        driver = webdriver.Chrome(
+            service=Service(driver_path),
+            options=options
+        )
+        print("DEBUG: Chrome WebDriver created successfully")
+
+    # Enable Network domain for CDP (only for local Chrome, not RemoteWebDriver)
+    if not selenium_grid_url:
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+        except Exception as cdp_error:
+            print(f"WARNING: Failed to enable CDP Network domain: {cdp_error}")
+
+    return driver, bool(selenium_grid_url)
+
+
+def open_add_item_form(driver):
+    """Navigate an authenticated driver to the add/edit item page, dismissing cookie consent."""
+    driver.get('https://www.vintageandrare.com/instruments/add_edit_item')
+    time.sleep(2)
+
+    # Handle cookie consent again if it appears
+    try:
+        cookie_button = driver.find_element(By.CLASS_NAME, "cc-nb-okagree")
+        print("Handling cookie consent on new page...")
+        cookie_button.click()
+        time.sleep(1)
+    except:
+        print("No cookie consent needed on new page")
+
+
 def login_and_navigate(username, password, item_data=None, test_mode=True, map_categories=False, db_session=None, edit_mode=False, edit_item_id=None):
     """
     Unified function for both create and edit operations ed. 31/07/2025
@@ -249,133 +405,7 @@ def login_and_navigate(username, password, item_data=None, test_mode=True, map_c
     if 'account' in response.url:
         print("3. Login successful via requests!")
         
-        # Initialize Selenium with network logging enabled
-        options = webdriver.ChromeOptions()
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--headless=new")
-        options.add_argument("--window-size=1920,1080")
-        # Harden headless Chrome for container environments (Railway, Docker, etc.)
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        
-        # Enable performance logging to capture network events
-        options.add_experimental_option('perfLoggingPrefs', {
-            'enableNetwork': True,
-            'enablePage': False
-        })
-        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
-        
-        # Enable DevTools for response body access
-        options.add_argument("--remote-debugging-port=9222")
-        
-        # Check for Selenium Grid URL from environment
-        selenium_grid_url = os.environ.get('SELENIUM_GRID_URL')
-
-        if selenium_grid_url:
-            # Debug the raw value
-            print(f"DEBUG: Raw SELENIUM_GRID_URL from env: '{selenium_grid_url}'")
-            print(f"DEBUG: URL repr: {repr(selenium_grid_url)}")
-
-            # Strip any whitespace from the URL
-            selenium_grid_url = selenium_grid_url.strip()
-
-            # Use remote Selenium Grid
-            print(f"DEBUG: After strip, using remote Selenium Grid at: '{selenium_grid_url}'")
-
-            # Ensure the URL has the correct format
-            if not selenium_grid_url.startswith('http'):
-                selenium_grid_url = f"http://{selenium_grid_url}"
-            if not selenium_grid_url.endswith('/wd/hub'):
-                selenium_grid_url = f"{selenium_grid_url}/wd/hub"
-
-            print(f"DEBUG: Formatted Selenium Grid URL: {selenium_grid_url}")
-
-            # Health check with retry logic for container restarts
-            import urllib.parse
-            import time as health_time
-            status_url = selenium_grid_url
-            if status_url.endswith('/wd/hub'):
-                status_url = status_url[:-6]
-            status_url = urllib.parse.urljoin(status_url + '/', 'status')
-
-            max_retries = 5
-            retry_delays = [5, 10, 15, 20, 30]  # Increasing delays between retries
-            last_error = None
-
-            for attempt in range(max_retries):
-                try:
-                    print(f"DEBUG: Pinging Selenium Grid status endpoint (attempt {attempt + 1}/{max_retries}): {status_url}")
-                    health_response = requests.get(status_url, timeout=30)
-                    health_json = {}
-                    try:
-                        health_json = health_response.json()
-                    except Exception:
-                        pass
-                    grid_ready = (
-                        health_response.status_code == 200
-                        and isinstance(health_json, dict)
-                        and health_json.get("value", {}).get("ready", False)
-                    )
-                    if grid_ready:
-                        print(f"DEBUG: Selenium Grid is ready (attempt {attempt + 1})")
-                        break
-                    else:
-                        last_error = RuntimeError(
-                            f"Selenium Grid not ready (status={health_response.status_code}, body={health_json})"
-                        )
-                        print(f"DEBUG: Grid not ready yet: {last_error}")
-                except Exception as health_exc:
-                    last_error = health_exc
-                    print(f"DEBUG: Health check failed (attempt {attempt + 1}): {health_exc}")
-
-                if attempt < max_retries - 1:
-                    wait_time = retry_delays[attempt]
-                    print(f"DEBUG: Waiting {wait_time}s before retry (container may be restarting)...")
-                    health_time.sleep(wait_time)
-            else:
-                # All retries exhausted
-                print(f"ERROR: Selenium Grid health check failed after {max_retries} attempts: {last_error}")
-                raise RuntimeError(
-                    "Remote Selenium browser is unavailable after multiple retries. The Chrome container may be down or restarting."
-                ) from last_error
-
-            driver = webdriver.Remote(
-                command_executor=selenium_grid_url,
-                options=options
-            )
-            print("DEBUG: Connected to Selenium Grid successfully")
-        else:
-            # Local Chrome setup
-            print("DEBUG: Starting ChromeDriver download/check...")
-
-            import time as time_module
-            start_time = time_module.time()
-
-            try:
-                driver_path = ChromeDriverManager().install()
-                elapsed = time_module.time() - start_time
-                print(f"DEBUG: ChromeDriver installed/found in {elapsed:.2f} seconds at: {driver_path}")
-            except Exception as e:
-                elapsed = time_module.time() - start_time
-                print(f"ERROR: ChromeDriver download failed after {elapsed:.2f} seconds: {e}")
-                raise
-
-            print("DEBUG: Creating Chrome WebDriver instance...")
-            driver = webdriver.Chrome(
-                service=Service(driver_path),
-                options=options
-            )
-            print("DEBUG: Chrome WebDriver created successfully")
-        
-        # Enable Network domain for CDP (only for local Chrome, not RemoteWebDriver)
-        if not selenium_grid_url:
-            try:
-                driver.execute_cdp_cmd('Network.enable', {})
-            except Exception as cdp_error:
-                print(f"WARNING: Failed to enable CDP Network domain: {cdp_error}")
+        driver, is_remote = build_listing_driver()
         
         try:
             print("4. Setting up Selenium session...")
@@ -410,17 +440,7 @@ def login_and_navigate(username, password, item_data=None, test_mode=True, map_c
             print(f"Current URL: {driver.current_url}")
             
             print("\n10. Attempting to navigate to add/edit item...")
-            driver.get('https://www.vintageandrare.com/instruments/add_edit_item')
-            time.sleep(2)
-            
-            # Handle cookie consent again if it appears
-            try:
-                cookie_button = driver.find_element(By.CLASS_NAME, "cc-nb-okagree")
-                print("Handling cookie consent on new page...")
-                cookie_button.click()
-                time.sleep(1)
-            except:
-                print("No cookie consent needed on new page")
+            open_add_item_form(driver)
             
             print(f"11. Final URL: {driver.current_url}")
             driver.save_screenshot("data/final_page.png")
@@ -434,7 +454,7 @@ def login_and_navigate(username, password, item_data=None, test_mode=True, map_c
                 category_map = map_category_options(driver)
             elif item_data:
                 print("\n12. Filling form...")
-                result = fill_item_form(driver, item_data, test_mode, db_session, is_remote=bool(selenium_grid_url))  # Pass db_session and is_remote
+                result = fill_item_form(driver, item_data, test_mode, db_session, is_remote=is_remote)  # Pass db_session and is_remote
                 return result
             else:
                 print("\n12. Analyzing form elements...")
@@ -455,7 +475,7 @@ def login_and_navigate(username, password, item_data=None, test_mode=True, map_c
         return result
     elif item_data:
         print("\n12. Filling create form...")
-        result = fill_item_form(driver, item_data, test_mode, db_session, is_remote=bool(selenium_grid_url))
+        result = fill_item_form(driver, item_data, test_mode, db_session, is_remote=is_remote)
         return result
     else:
         print("\n12. Analyzing form elements...")
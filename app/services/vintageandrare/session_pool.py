@@ -0,0 +1,184 @@
+"""
+Pool of warmed, authenticated browser sessions for parallel V&R listing jobs.
+
+create_listing_selenium normally goes through inspect_form.login_and_navigate,
+which logs in over HTTP, starts a fresh Chrome, copies the cookies across and
+quits the browser again - for every single listing. The parallel worker mode
+in scripts/vr_worker.py instead checks a VRBrowserSession out of a
+VRSessionPool: the browser is already running with the V&R session cookies
+(harvested once via harvest_cookies_from_grid, or from a requests login) and
+only has to open the add-item form and fill it in.
+
+A session is recycled (browser quit, replaced on next checkout) after
+max_jobs_per_session jobs or as soon as a job using it fails. A session that
+fails its very first job also marks the cached cookies stale, so the
+replacement is warmed with freshly harvested ones.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from app.services.vintageandrare.client import VintageAndRareClient
+from app.services.vintageandrare.inspect_form import (
+    build_listing_driver,
+    fill_item_form,
+    open_add_item_form,
+)
+
+logger = logging.getLogger(__name__)
+
+CookieSource = Callable[[], Awaitable[List[Dict[str, Any]]]]
+
+
+async def harvest_session_cookies(username: str, password: str) -> List[Dict[str, Any]]:
+    """
+    Return authenticated V&R cookies for seeding pooled browsers.
+
+    Prefers a Selenium Grid harvest (passes Cloudflare with a real browser);
+    falls back to the client's requests/curl_cffi login.
+    """
+    client = VintageAndRareClient(username, password)
+
+    if (os.environ.get("SELENIUM_GRID_URL") or "").strip():
+        harvested = await client.harvest_cookies_from_grid()
+        if harvested.get("status") == "success" and harvested.get("cookies"):
+            return harvested["cookies"]
+        logger.warning("Grid cookie harvest failed (%s); falling back to HTTP login", harvested.get("message"))
+
+    if not await client.authenticate():
+        raise RuntimeError("V&R authentication failed - cannot seed browser sessions")
+
+    jar = client.cf_session.cookies if client.cf_session else client.session.cookies
+    return [
+        {"name": name, "value": value, "domain": ".vintageandrare.com", "path": "/"}
+        for name, value in jar.items()
+    ]
+
+
+class VRBrowserSession:
+    """One logged-in Chrome driver. Used by a single job at a time."""
+
+    def __init__(self, index: int, cookies: List[Dict[str, Any]]):
+        self.index = index
+        self.cookies = cookies
+        self.driver = None
+        self.is_remote = False
+        self.jobs_completed = 0
+        self.failed = False
+
+    def warm(self) -> None:
+        """Start the browser and install the session cookies (blocking)."""
+        driver, is_remote = build_listing_driver(remote_debugging_port=0)
+        try:
+            driver.get(VintageAndRareClient.BASE_URL)
+            time.sleep(2)
+            driver.delete_all_cookies()
+            for cookie in self.cookies:
+                driver.add_cookie({
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "domain": cookie.get("domain") or ".vintageandrare.com",
+                    "path": cookie.get("path") or "/",
+                })
+            driver.refresh()
+        except Exception:
+            driver.quit()
+            raise
+        self.driver = driver
+        self.is_remote = is_remote
+        logger.info("V&R browser session %s warmed (remote=%s)", self.index, is_remote)
+
+    def fill_listing_form(self, form_data: Dict[str, Any], test_mode: bool) -> Any:
+        """Open the add-item form and fill (and unless test_mode, submit) it (blocking)."""
+        open_add_item_form(self.driver)
+        return fill_item_form(self.driver, form_data, test_mode, None, is_remote=self.is_remote)
+
+    def quit(self) -> None:
+        driver, self.driver = self.driver, None
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Error quitting V&R browser session %s: %s", self.index, exc)
+
+
+class VRSessionPool:
+    """
+    Up to `size` VRBrowserSessions, created lazily on checkout.
+
+    Usage:
+        pool = VRSessionPool(3, max_jobs_per_session=10, cookie_source=...)
+        async with pool.session() as browser:
+            await vr_service.create_listing_from_product(..., browser_session=browser)
+        await pool.close()
+    """
+
+    def __init__(self, size: int, max_jobs_per_session: int, cookie_source: CookieSource):
+        self.size = size
+        self.max_jobs_per_session = max_jobs_per_session
+        self._cookie_source = cookie_source
+        self._cookies: Optional[List[Dict[str, Any]]] = None
+        self._cookie_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[VRBrowserSession] = []
+        self._created = 0
+
+    async def _get_cookies(self) -> List[Dict[str, Any]]:
+        async with self._cookie_lock:
+            if self._cookies is None:
+                self._cookies = await self._cookie_source()
+                logger.info("Seeded V&R session pool with %d cookies", len(self._cookies))
+            return self._cookies
+
+    async def _new_session(self) -> VRBrowserSession:
+        self._created += 1
+        browser = VRBrowserSession(self._created, await self._get_cookies())
+        await asyncio.get_running_loop().run_in_executor(None, browser.warm)
+        return browser
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[VRBrowserSession]:
+        await self._slots.acquire()
+        try:
+            browser = self._idle.pop() if self._idle else await self._new_session()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        try:
+            yield browser
+            browser.jobs_completed += 1
+        except BaseException:
+            browser.failed = True
+            raise
+        finally:
+            await self._check_in(browser)
+            self._slots.release()
+
+    async def _check_in(self, browser: VRBrowserSession) -> None:
+        if browser.failed or browser.jobs_completed >= self.max_jobs_per_session:
+            logger.info(
+                "Recycling V&R browser session %s after %d jobs (failed=%s)",
+                browser.index, browser.jobs_completed, browser.failed,
+            )
+            if browser.failed and browser.jobs_completed == 0:
+                # Failed on its first job: the cookies are the likely culprit,
+                # so the replacement is seeded with a fresh harvest
+                self._cookies = None
+            await asyncio.get_running_loop().run_in_executor(None, browser.quit)
+        else:
+            self._idle.append(browser)
+
+    async def close_idle(self) -> None:
+        """Quit browsers not currently checked out (e.g. once the queue drains)."""
+        idle, self._idle = self._idle, []
+        loop = asyncio.get_running_loop()
+        for browser in idle:
+            await loop.run_in_executor(None, browser.quit)
+
+    async def close(self) -> None:
+        await self.close_idle()
@@ -1,12 +1,20 @@
 """Helpers for enqueuing and managing V&R listing jobs."""
 
+import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.vr_job import VRJob, VRJobStatus
+from app.services.pg_listener import PgNotificationListener
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel the V&R worker LISTENs on. NOTIFY is transactional, so the
+# worker is only woken once the enqueueing transaction has committed.
+VR_JOB_CHANNEL = "vr_jobs"
 
 
 async def enqueue_vr_job(
@@ -51,15 +59,29 @@ async def enqueue_vr_job(
     db.add(job)
     await db.flush()
     await db.refresh(job)
+    await notify_vr_worker(db, job.id)
     return job
 
 
+async def notify_vr_worker(db: AsyncSession, job_id: Optional[int] = None) -> None:
+    """Queue a NOTIFY on VR_JOB_CHANNEL, delivered when the caller commits."""
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": VR_JOB_CHANNEL, "payload": str(job_id or "")},
+    )
+
+
 async def fetch_next_queued_job(db: AsyncSession) -> Optional[VRJob]:
-    """Fetch the next queued job (using SKIP LOCKED to avoid contention)."""
+    """Fetch the next queued job (using SKIP LOCKED to avoid contention).
+
+    Only the returned row is locked, so parallel workers each claim a
+    different job.
+    """
     stmt = (
         select(VRJob)
         .where(VRJob.status == VRJobStatus.QUEUED.value)
         .order_by(VRJob.created_at.asc())
+        .limit(1)
         .with_for_update(skip_locked=True)
     )
     result = await db.execute(stmt)
@@ -136,3 +158,15 @@ async def increment_resolution_attempts(db: AsyncSession, job: VRJob) -> None:
     new_payload["resolution_attempts"] = new_payload.get("resolution_attempts", 0) + 1
     job.payload = new_payload
     await db.flush()
+
+
+class VRJobListener(PgNotificationListener):
+    """
+    PgNotificationListener on VR_JOB_CHANNEL.
+
+    The worker awaits wait() between jobs instead of sleeping a fixed poll
+    interval, falling back to polling while the connection is down.
+    """
+
+    def __init__(self, dsn: Optional[str] = None, channel: str = VR_JOB_CHANNEL):
+        super().__init__(channel=channel, dsn=dsn)
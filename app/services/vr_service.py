@@ -8,7 +8,6 @@ import json
 from datetime import datetime, timezone
 from typing import Optional, Dict, List, Any, Tuple, Set
 from sqlalchemy import text, select
-from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -17,11 +16,49 @@ from app.models.product import Product
 from app.models.platform_common import PlatformCommon, ListingStatus, SyncStatus
 from app.models.vr import VRListing
 from app.services.match_utils import suggest_product_match
-from app.models.sync_event import SyncEvent
+from app.services.sync_event_writer import bulk_insert_sync_events
+from app.services.snapshot_diff import SnapshotDiffSpec, calculate_changes_in_db, snapshot_diff_enabled
+from app.services.websockets.manager import publish_sync_progress
 from app.models.shipping import ShippingProfile
 
 logger = logging.getLogger(__name__)
 
+# Local V&R rows compared against the inventory snapshot (see sync_vr_inventory)
+_EXISTING_VR_DATA_SQL = """
+    SELECT 
+        p.id as product_id, 
+        p.sku, 
+        p.base_price,
+        p.is_stocked_item,
+        p.quantity,
+        pc.id as platform_common_id, 
+        pc.external_id, 
+        pc.status as platform_common_status,
+        vl.price_notax
+    FROM platform_common pc
+    LEFT JOIN products p ON p.id = pc.product_id
+    LEFT JOIN vr_listings vl ON vl.platform_id = pc.id
+        AND vl.vr_state = 'active'
+    WHERE pc.platform_name = 'vr'
+      AND pc.status NOT IN ('refreshed', 'deleted', 'removed')
+"""
+
+# SQL form of _calculate_changes / _has_changed, used when SYNC_SNAPSHOT_DIFF_IN_DB is on
+VR_SNAPSHOT_DIFF = SnapshotDiffSpec(
+    platform="vr",
+    local_sql=_EXISTING_VR_DATA_SQL,
+    changed_sql="""
+        NOT (
+            (lower(COALESCE(s.status, '')) IN ('sold', 'ended', 'removed', 'deleted')
+             AND lower(COALESCE(l.platform_common_status, '')) IN ('sold', 'ended', 'removed', 'deleted'))
+            OR lower(COALESCE(s.status, '')) = lower(COALESCE(l.platform_common_status, ''))
+        )
+        OR abs(COALESCE(s.price, 0) - COALESCE(l.base_price, 0)) > 0.01
+    """,
+    create_sql="s.status = 'active'",
+    remove_sql="lower(COALESCE(l.platform_common_status, '')) = 'active'",
+)
+
 class VRService:
     """
     Service for handling the full Vintage & Rare inventory import and differential sync process.
@@ -113,6 +150,7 @@ class VRService:
                 return {"status": "success", "message": f"V&R inventory saved with {len(inventory_df)} records", "count": len(inventory_df)}
             
             logger.info("Processing inventory updates using differential sync...")
+            publish_sync_progress("vr", "fetch", sync_run_id, items_fetched=len(inventory_df))
             sync_stats = await self.sync_vr_inventory(inventory_df, sync_run_id)
 
             logger.info(f"Inventory sync process complete: {sync_stats}")
@@ -131,15 +169,24 @@ class VRService:
         stats = {"total_from_vr": len(df), "events_logged": 0, "created": 0, "updated": 0, "removed": 0, "unchanged": 0, "errors": 0}
         
         try:
-            logger.info("Fetching existing V&R inventory from database...")
-            existing_data = await self._fetch_existing_vr_data()
+            if snapshot_diff_enabled(self.settings):
+                # Diff in Postgres via a staging table; only changed rows come back
+                api_items = self._prepare_api_data(df)
+                changes = await calculate_changes_in_db(self.db, VR_SNAPSHOT_DIFF, api_items)
+            else:
+                logger.info("Fetching existing V&R inventory from database...")
+                existing_data = await self._fetch_existing_vr_data()
             
-            api_items = self._prepare_api_data(df)
-            db_items = self._prepare_db_data(existing_data)
+                api_items = self._prepare_api_data(df)
+                db_items = self._prepare_db_data(existing_data)
             
-            changes = self._calculate_changes(api_items, db_items)
+                changes = self._calculate_changes(api_items, db_items)
             
             logger.info(f"Applying changes: {len(changes['create'])} new, {len(changes['update'])} updates, {len(changes['remove'])} removals")
+            publish_sync_progress(
+                "vr", "diff", sync_run_id, items_diffed=len(api_items),
+                created=len(changes['create']), updated=len(changes['update']), removed=len(changes['remove']),
+            )
             
             if changes['create']:
                 stats['created'], events_created = await self._batch_create_products(changes['create'], sync_run_id)
@@ -152,6 +199,7 @@ class VRService:
                 stats['events_logged'] += events_removed
         
             stats['unchanged'] = len(api_items) - stats['created'] - stats['updated']
+            publish_sync_progress("vr", "events", sync_run_id, events_written=stats['events_logged'])
             logger.info(f"Sync complete: {stats}")
             
         except Exception as e:
@@ -277,13 +325,7 @@ class VRService:
 
         if events_to_create:
             try:
-                stmt = insert(SyncEvent).values(events_to_create)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending'))
-                await self.db.execute(stmt)
-                events_logged = len(events_to_create)
-                logger.info(f"Attempted to log {len(events_to_create)} new listing events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, events_to_create)
             except Exception as e:
                 logger.error(f"Failed to bulk insert new listing events: {e}", exc_info=True)
         return created_count, events_logged
@@ -318,13 +360,7 @@ class VRService:
         
         if all_events:
             try:
-                stmt = insert(SyncEvent).values(all_events)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending'))
-                await self.db.execute(stmt)
-                events_logged = len(all_events)
-                logger.info(f"Attempted to log {len(all_events)} update events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, all_events)
             except Exception as e:
                 logger.error(f"Failed to bulk insert update events: {e}", exc_info=True)
         return updated_count, events_logged
@@ -381,13 +417,7 @@ class VRService:
         
         # Bulk insert logic remains the same
         if all_events:
-            stmt = insert(SyncEvent).values(all_events)
-            stmt = stmt.on_conflict_do_nothing(
-                index_elements=['platform_name', 'external_id', 'change_type'],
-                index_where=(SyncEvent.status == 'pending')
-            )
-            await self.db.execute(stmt)
-            events_logged = len(all_events)
+            events_logged = await bulk_insert_sync_events(self.db, all_events)
 
         return updated_count, events_logged
 
@@ -434,14 +464,7 @@ class VRService:
 
         if events_to_create:
             try:
-                stmt = insert(SyncEvent).values(events_to_create)
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=['platform_name', 'external_id', 'change_type'],
-                    index_where=(SyncEvent.status == 'pending')
-                )
-                await self.db.execute(stmt)
-                events_logged = len(events_to_create)
-                logger.info(f"Attempted to log {len(events_to_create)} V&R removal events (duplicates ignored)")
+                events_logged = await bulk_insert_sync_events(self.db, events_to_create)
             except Exception as e:
                 logger.error(f"Failed to bulk insert V&R removal events: {e}", exc_info=True)
 
@@ -555,6 +578,7 @@ class VRService:
         reverb_data: Dict[str, Any] = None,
         platform_options: Optional[Dict[str, Any]] = None,
         skip_id_resolution: bool = False,
+        browser_session=None,
     ) -> Dict[str, Any]:
         """Creates a Vintage & Rare listing from a local master Product object.
 
@@ -563,6 +587,7 @@ class VRService:
             reverb_data: Optional Reverb API data for images/shipping
             platform_options: Optional platform-specific options (price override, etc.)
             skip_id_resolution: If True, skip CSV download for ID resolution (for batched processing)
+            browser_session: Optional pooled, already-authenticated VRBrowserSession (parallel worker)
         """
         logger.info(f"Creating V&R listing for Product ID: {product.id}, SKU: {product.sku}")
         try:
@@ -573,8 +598,9 @@ class VRService:
                 password=settings.VINTAGE_AND_RARE_PASSWORD
             )
             
-            # Authenticate with V&R - no timeout, just like the working script
-            if not await client.authenticate():
+            # Authenticate with V&R - no timeout, just like the working script.
+            # A pooled browser session already carries the login cookies.
+            if browser_session is None and not await client.authenticate():
                 logger.error("Failed to authenticate with V&R")
                 return {"status": "error", "message": "V&R authentication failed"}
             
@@ -899,6 +925,7 @@ class VRService:
                 from_scratch=False,  # Using category strings, not IDs
                 db_session=self.db,
                 skip_id_resolution=skip_id_resolution,
+                browser_session=browser_session,
             )
             
             logger.info(f"V&R creation result: {result}")
@@ -1469,24 +1496,7 @@ class VRService:
     
     async def _fetch_existing_vr_data(self) -> List[Dict]:
         """Fetches all V&R-related data from the local database, focusing on the source of truth."""
-        query = text("""
-            SELECT 
-                p.id as product_id, 
-                p.sku, 
-                p.base_price,
-                p.is_stocked_item,
-                p.quantity,
-                pc.id as platform_common_id, 
-                pc.external_id, 
-                pc.status as platform_common_status,
-                vl.price_notax
-            FROM platform_common pc
-            LEFT JOIN products p ON p.id = pc.product_id
-            LEFT JOIN vr_listings vl ON vl.platform_id = pc.id
-                AND vl.vr_state = 'active'
-            WHERE pc.platform_name = 'vr'
-              AND pc.status NOT IN ('refreshed', 'deleted', 'removed')
-        """)
+        query = text(_EXISTING_VR_DATA_SQL)
         result = await self.db.execute(query)
         return [row._asdict() for row in result.fetchall()]    
     
@@ -0,0 +1,261 @@
+"""Inbox for platform order webhooks.
+
+app/routes/webhooks.py verifies each delivery, stores the raw payload in
+webhook_events and returns straight away. WebhookInboxConsumer (started in
+the app lifespan) drains pending rows: a webhook is treated as a trigger to
+pull that platform's latest orders through the same upsert used by the
+hourly order jobs, then OrderSaleProcessor handles any new sales and ends
+sold one-off items on the other platforms. This keeps one ingestion path
+whatever shape the webhook payload has, and a burst of deliveries for one
+platform costs a single fetch.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.webhook import WebhookEvent
+from app.services.order_sale_processor import OrderSaleProcessor
+from app.services.response_cache import invalidate_cache_tags
+
+logger = logging.getLogger(__name__)
+
+INBOX_PLATFORMS = ("reverb", "ebay", "shopify")
+# Orders pulled per webhook-triggered fetch; webhooks only need the newest few
+_REVERB_PAGES = 1
+_EBAY_DAYS = 1
+_SHOPIFY_ORDERS = 20
+
+
+async def record_webhook_event(
+    db: AsyncSession,
+    *,
+    platform: str,
+    event_type: Optional[str],
+    payload: Dict[str, Any],
+    delivery_id: Optional[str] = None,
+) -> bool:
+    """Store a webhook delivery; returns False if this delivery_id was already stored."""
+    stmt = insert(WebhookEvent).values(
+        platform=platform,
+        event_type=event_type,
+        payload=payload,
+        delivery_id=delivery_id,
+        status="pending",
+        attempts=0,
+        processed=False,
+    )
+    if delivery_id:
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=[WebhookEvent.platform, WebhookEvent.delivery_id],
+            index_where=WebhookEvent.delivery_id.isnot(None),
+        )
+    result = await db.execute(stmt.returning(WebhookEvent.id))
+    await db.commit()
+    stored = result.scalar_one_or_none() is not None
+    if stored:
+        webhook_inbox_consumer.wake()
+    return stored
+
+
+async def _fetch_reverb_orders(settings, events: List[WebhookEvent]) -> List[Dict[str, Any]]:
+    # Order webhooks carry the same order body as the API; anything else triggers a fetch
+    orders = [
+        event.payload for event in events
+        if isinstance(event.payload, dict) and (event.payload.get("uuid") or event.payload.get("order_number"))
+    ]
+    if len(orders) < len(events):
+        from app.services.reverb.client import ReverbClient
+
+        client = ReverbClient(api_key=settings.REVERB_API_KEY)
+        orders.extend(await client.get_all_sold_orders(per_page=50, max_pages=_REVERB_PAGES) or [])
+    return orders
+
+
+async def _fetch_ebay_orders(settings, events: List[WebhookEvent]) -> List[Dict[str, Any]]:
+    from app.services.ebay.trading import EbayTradingLegacyAPI
+
+    api = EbayTradingLegacyAPI(sandbox=False)
+    response = await api.get_orders(
+        number_of_days=_EBAY_DAYS,
+        order_status="All",
+        order_role="Seller",
+        entries_per_page=100,
+    )
+    return response.get("orders", [])
+
+
+async def _fetch_shopify_orders(settings, events: List[WebhookEvent]) -> List[Dict[str, Any]]:
+    from app.services.shopify.client import ShopifyGraphQLClient
+    from scripts.shopify.get_shopify_orders import fetch_orders_sync
+
+    # The GraphQL client is synchronous
+    return await asyncio.to_thread(fetch_orders_sync, ShopifyGraphQLClient(), _SHOPIFY_ORDERS)
+
+
+def _upsert_function(platform: str):
+    if platform == "reverb":
+        from scripts.reverb.get_reverb_sold_orders import upsert_orders
+    elif platform == "ebay":
+        from scripts.ebay.get_ebay_orders import upsert_orders
+    else:
+        from scripts.shopify.get_shopify_orders import upsert_orders
+    return upsert_orders
+
+
+_FETCHERS = {
+    "reverb": _fetch_reverb_orders,
+    "ebay": _fetch_ebay_orders,
+    "shopify": _fetch_shopify_orders,
+}
+
+
+async def ingest_platform_events(db: AsyncSession, platform: str, events: List[WebhookEvent], settings=None) -> Dict:
+    """Upsert the orders behind a platform's pending webhooks and process any sales."""
+    settings = settings or get_settings()
+    orders = await _FETCHERS[platform](settings, events)
+    upsert_summary = {}
+    if orders:
+        upsert_summary = await _upsert_function(platform)(db, orders)
+    # Commits; also picks up any order the hourly job upserted but didn't process
+    sale_summary = await OrderSaleProcessor(db, settings).process_unprocessed_orders(
+        platform, dry_run=False, end_other_listings=True,
+    )
+    logger.info(
+        "Webhook ingest %s: %d deliveries, upsert %s, %d sales processed",
+        platform, len(events), upsert_summary, sale_summary.get("sales_detected", 0),
+    )
+    return sale_summary
+
+
+class WebhookInboxConsumer:
+    """
+    Drains pending webhook_events rows.
+
+    Rows are claimed with SKIP LOCKED and marked 'processing' with a
+    claimed_at time (safe with several app replicas); platforms are drained
+    side by side, each in its own session. A claim older than
+    WEBHOOK_INBOX_LEASE_SECONDS is taken to belong to a consumer that died
+    and is returned to the queue. wake() is called when a delivery is stored,
+    and the poll interval covers deliveries stored by another process and
+    retries.
+    """
+
+    def __init__(self, session_factory=None):
+        self.session_factory = session_factory
+        self._event = asyncio.Event()
+        self._stopping = False
+
+    def wake(self) -> None:
+        self._event.set()
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._event.set()
+
+    async def run(self) -> None:
+        settings = get_settings()
+        logger.info("Webhook inbox consumer started (poll=%ss)", settings.WEBHOOK_INBOX_POLL_SECONDS)
+        while not self._stopping:
+            try:
+                requeued = await self.requeue_expired(settings.WEBHOOK_INBOX_LEASE_SECONDS)
+                if requeued:
+                    logger.warning("Re-queued %d webhook deliveries whose consumer stopped mid-ingest", requeued)
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Could not re-queue expired webhook deliveries: %s", exc)
+            results = await asyncio.gather(
+                *(self.drain_platform(platform) for platform in INBOX_PLATFORMS), return_exceptions=True
+            )
+            for platform, result in zip(INBOX_PLATFORMS, results):
+                if isinstance(result, Exception):
+                    logger.error("Webhook inbox consumer error (%s): %s", platform, result, exc_info=result)
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=settings.WEBHOOK_INBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._event.clear()
+
+    def _session_factory(self):
+        if self.session_factory is None:
+            from app.database import async_session
+            return async_session
+        return self.session_factory
+
+    async def requeue_expired(self, lease_seconds: float) -> int:
+        """Return rows claimed more than lease_seconds ago and still 'processing' to the queue."""
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=lease_seconds)
+        async with self._session_factory()() as db:
+            result = await db.execute(
+                update(WebhookEvent)
+                .where(
+                    WebhookEvent.status == "processing",
+                    or_(WebhookEvent.claimed_at.is_(None), WebhookEvent.claimed_at < cutoff),
+                )
+                .values(status="pending", claimed_at=None)
+            )
+            await db.commit()
+            return result.rowcount or 0
+
+    async def drain_platform(self, platform: str) -> int:
+        """Handle every pending delivery for one platform; returns how many were claimed."""
+        settings = get_settings()
+        async with self._session_factory()() as db:
+            stmt = (
+                select(WebhookEvent)
+                .where(WebhookEvent.platform == platform, WebhookEvent.status == "pending")
+                .order_by(WebhookEvent.id)
+                .limit(200)
+                .with_for_update(skip_locked=True)
+            )
+            events = list((await db.execute(stmt)).scalars().all())
+            if not events:
+                return 0
+            # The order upserts commit part way through, so claim the rows explicitly
+            claimed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            for event in events:
+                event.status = "processing"
+                event.attempts = (event.attempts or 0) + 1
+                event.claimed_at = claimed_at
+            await db.commit()
+            # The rollback below expires the instances; keep what the failure path needs
+            attempts = {event.id: event.attempts for event in events}
+
+            try:
+                await ingest_platform_events(db, platform, events, settings)
+            except Exception as exc:  # noqa: BLE001
+                await db.rollback()
+                logger.error("Webhook ingest for %s failed: %s", platform, exc, exc_info=True)
+                exhausted = [event_id for event_id, count in attempts.items() if count >= settings.WEBHOOK_INBOX_MAX_ATTEMPTS]
+                retry = [event_id for event_id in attempts if event_id not in exhausted]
+                for status, ids in (("error", exhausted), ("pending", retry)):
+                    if ids:
+                        await db.execute(
+                            update(WebhookEvent)
+                            .where(WebhookEvent.id.in_(ids))
+                            .values(status=status, last_error=str(exc)[:2000], claimed_at=None)
+                        )
+                await db.commit()
+                return len(events)
+
+            await db.execute(
+                update(WebhookEvent)
+                .where(WebhookEvent.id.in_(list(attempts)))
+                .values(
+                    status="processed",
+                    processed=True,
+                    processed_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                    last_error=None,
+                )
+            )
+            await invalidate_cache_tags("orders", "products", db=db)
+            await db.commit()
+            return len(events)
+
+
+webhook_inbox_consumer = WebhookInboxConsumer()
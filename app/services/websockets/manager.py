@@ -1,43 +1,172 @@
 # app/services/websockets/manager.py
-from typing import Dict, List
-from fastapi import WebSocket
+"""
+WebSocket fan-out for dashboard updates.
+
+broadcast()/publish() never wait on a socket: the message is serialised once
+and put on each client's bounded queue, and a per-client sender task writes
+it out. When a queue is full its oldest message is dropped, so a burst
+published faster than the sender gets a turn only loses stale progress. A
+client whose queue stays full for the grace period without sending anything
+(a stalled browser tab) is dropped rather than slowing the sync that is
+publishing.
+
+Messages published without a topic go to every client. Topic messages
+(e.g. "sync.ebay" progress) only go to clients that subscribed to the topic
+or a dotted prefix of it ("sync" covers "sync.ebay"; "*" covers everything),
+by sending {"action": "subscribe", "topics": [...]}.
+"""
+import asyncio
 import json
 import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set
+
+from fastapi import WebSocket
+
+from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Close code for clients dropped because they couldn't keep up ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class _Client:
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.topics: Set[str] = set()
+        self.sender: Optional[asyncio.Task] = None
+        self.full_since: Optional[float] = None  # first overflow since the sender last took a message
+        self.dropped_messages = 0
+
+    def wants(self, topic: Optional[str]) -> bool:
+        if topic is None or "*" in self.topics:
+            return True
+        parts = topic.split(".")
+        return any(".".join(parts[:i]) in self.topics for i in range(1, len(parts) + 1))
+
+
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        
+    def __init__(self, queue_size: Optional[int] = None, slow_client_grace_seconds: Optional[float] = None):
+        self.queue_size = queue_size
+        self.slow_client_grace_seconds = slow_client_grace_seconds
+        self._clients: Dict[WebSocket, _Client] = {}
+
+    @property
+    def active_connections(self):
+        return list(self._clients)
+
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
-        
+        queue_size = self.queue_size or get_settings().WEBSOCKET_CLIENT_QUEUE_SIZE
+        client = _Client(websocket, queue_size)
+        client.sender = asyncio.create_task(self._send_loop(client))
+        self._clients[websocket] = client
+        logger.info(f"WebSocket connected. Total connections: {len(self._clients)}")
+
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
-        
+        client = self._clients.pop(websocket, None)
+        if client and client.sender and client.sender is not asyncio.current_task():
+            client.sender.cancel()
+        logger.info(f"WebSocket disconnected. Total connections: {len(self._clients)}")
+
+    def subscribe(self, websocket: WebSocket, topics: Iterable[str]) -> None:
+        client = self._clients.get(websocket)
+        if client:
+            client.topics.update(str(topic) for topic in topics)
+
+    def unsubscribe(self, websocket: WebSocket, topics: Iterable[str]) -> None:
+        client = self._clients.get(websocket)
+        if client:
+            client.topics.difference_update(str(topic) for topic in topics)
+
     async def send_personal_message(self, message: str, websocket: WebSocket):
-        await websocket.send_text(message)
-        
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        json_message = json.dumps(message)
-        disconnected = []
-        
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json_message)
-            except Exception as e:
-                logger.error(f"Error sending to WebSocket: {e}")
-                disconnected.append(connection)
-        
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        client = self._clients.get(websocket)
+        if client:
+            self._enqueue(client, message)
+
+    async def broadcast(self, message: dict, topic: Optional[str] = None):
+        """Broadcast message to all connected clients (or a topic's subscribers)"""
+        self.publish(message, topic)
+
+    def publish(self, message: dict, topic: Optional[str] = None) -> int:
+        """Queue message for every interested client without waiting; returns how many got it."""
+        if not self._clients:
+            return 0
+        json_message = json.dumps(message, default=str)
+        delivered = 0
+        for client in list(self._clients.values()):
+            if client.wants(topic) and self._enqueue(client, json_message):
+                delivered += 1
+        return delivered
+
+    def _enqueue(self, client: _Client, json_message: str) -> bool:
+        if not client.queue.full():
+            client.queue.put_nowait(json_message)
+            return True
+
+        now = time.monotonic()
+        grace = self.slow_client_grace_seconds
+        if grace is None:
+            grace = get_settings().WEBSOCKET_SLOW_CLIENT_GRACE_SECONDS
+        if client.full_since is None:
+            client.full_since = now
+        elif now - client.full_since >= grace:
+            logger.warning(
+                "Dropping slow WebSocket client (%d messages queued, %d dropped)",
+                client.queue.qsize(), client.dropped_messages,
+            )
+            self.disconnect(client.websocket)
+            asyncio.create_task(self._close(client.websocket))
+            return False
+
+        # Still within the grace period: make room by dropping the oldest message
+        client.queue.get_nowait()
+        client.dropped_messages += 1
+        client.queue.put_nowait(json_message)
+        return True
+
+    async def _send_loop(self, client: _Client):
+        try:
+            while True:
+                json_message = await client.queue.get()
+                client.full_since = None
+                await client.websocket.send_text(json_message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending to WebSocket: {e}")
+            self.disconnect(client.websocket)
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:  # noqa: BLE001 - already gone
+            pass
+
+
+def publish_sync_progress(platform: str, phase: str, sync_run_id: Any = None, **counts) -> None:
+    """
+    Publish a sync progress event on topic "sync.<platform>".
+
+    phase is e.g. "fetch", "diff", "events" or "complete"; counts carry the
+    numbers for that phase (pages_fetched, items_fetched, created, ...).
+    """
+    manager.publish(
+        {
+            "type": "sync_progress",
+            "platform": platform,
+            "phase": phase,
+            "sync_run_id": str(sync_run_id) if sync_run_id else None,
+            "timestamp": datetime.utcnow().isoformat(),
+            **counts,
+        },
+        topic=f"sync.{platform}",
+    )
+
 
 # Global connection manager instance
-manager = ConnectionManager()
\ No newline at end of file
+manager = ConnectionManager()
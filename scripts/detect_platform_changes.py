@@ -0,0 +1,55 @@
+"""
+Report-only change detection across the platforms.
+
+Fetches each platform's live listings, compares them with the local
+platform_common rows and prints what changed; nothing is written. By default
+every platform runs at the same time on its own session; --sequential runs
+them one after another on a single session.
+
+    python -m scripts.detect_platform_changes
+    python -m scripts.detect_platform_changes --platform ebay --platform vr
+    python -m scripts.detect_platform_changes --sequential
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.database import async_session
+from app.services.sync_services import InboundSyncScheduler
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def detect_changes(platforms, sequential: bool = False) -> None:
+    async with async_session() as db:
+        scheduler = InboundSyncScheduler(db, report_only=True, session_factory=async_session)
+
+        if not sequential:
+            combined = await scheduler.run_all_platforms_concurrently(platforms)
+            scheduler.print_combined_report(combined)
+            return
+
+        for platform in platforms:
+            report = await scheduler.run_platform_sync(platform)
+            scheduler.print_sync_report(report)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report platform changes without applying them")
+    parser.add_argument(
+        "--platform",
+        action="append",
+        choices=InboundSyncScheduler.PLATFORMS,
+        help="Platform to check (repeatable, default: all)",
+    )
+    parser.add_argument("--sequential", action="store_true", help="Run platforms one at a time")
+    args = parser.parse_args()
+
+    platforms = args.platform or list(InboundSyncScheduler.PLATFORMS)
+    asyncio.run(detect_changes(platforms, sequential=args.sequential))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import os
+import signal
+from datetime import timedelta
+from typing import Any, Optional
+
+from app.core.config import get_settings
+from app.database import async_session
+from app.models.platform_job import PlatformJob, PlatformJobStatus
+from app.services.pg_listener import PgNotificationListener
+from app.services.platform_job_handlers import run_platform_job
+from app.services.platform_job_queue import (
+    PLATFORM_JOB_CHANNEL,
+    PlatformJobPermanentError,
+    PlatformThrottle,
+    fetch_next_platform_job,
+    mark_platform_job_completed,
+    mark_platform_job_failed,
+    mark_platform_job_in_progress,
+    requeue_stale_platform_jobs,
+)
+
+logger = logging.getLogger("platform_job_worker")
+logging.basicConfig(
+    level=os.environ.get("PLATFORM_WORKER_LOG_LEVEL", "INFO"),
+    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+)
+
+POLL_INTERVAL = float(os.environ.get("PLATFORM_WORKER_POLL_INTERVAL", "5"))
+# Safety-net poll while LISTEN is active; also picks up retries whose backoff has elapsed
+IDLE_POLL_INTERVAL = float(os.environ.get("PLATFORM_WORKER_IDLE_POLL_INTERVAL", "30"))
+# Jobs IN_PROGRESS for longer than this are assumed orphaned by a dead worker
+STALE_JOB_MINUTES = int(os.environ.get("PLATFORM_WORKER_STALE_JOB_MINUTES", "30"))
+
+# Graceful shutdown flag
+_shutdown_requested = False
+_listener: Optional[PgNotificationListener] = None
+
+
+def _handle_signal(*_: Any) -> None:
+    global _shutdown_requested
+    if _shutdown_requested:
+        # Second signal = force exit
+        logger.warning("Forced shutdown requested")
+        raise SystemExit(1)
+    _shutdown_requested = True
+    logger.info("Shutdown requested - will exit after in-flight jobs complete")
+    if _listener is not None:
+        _listener.wake()
+
+
+async def _claim_next_job(throttle: PlatformThrottle) -> Optional[PlatformJob]:
+    """Claim the most urgent job for a platform with spare capacity and commit it as in progress."""
+    platforms = throttle.available_platforms(throttle.concurrency.keys())
+    if not platforms:
+        return None
+    async with async_session() as session:
+        job = await fetch_next_platform_job(session, platforms)
+        if not job:
+            return None
+        # Another slot may have filled this platform while we were fetching
+        if not throttle.has_capacity(job.platform):
+            await session.rollback()
+            return None
+        throttle.reserve(job.platform)
+        try:
+            await mark_platform_job_in_progress(session, job)
+            await session.commit()
+        except Exception as exc:
+            await session.rollback()
+            throttle.release(job.platform)
+            logger.error("Failed to mark platform job %s in progress: %s", job.id, exc, exc_info=True)
+            return None
+        return job
+
+
+async def _run_claimed_job(job_id: int) -> None:
+    settings = get_settings()
+    async with async_session() as session:
+        job = await session.get(PlatformJob, job_id)
+        try:
+            await run_platform_job(session, job)
+            await mark_platform_job_completed(session, job)
+            await session.commit()
+            logger.info("Platform job %s (%s on %s) completed", job_id, job.action, job.platform)
+        except Exception as exc:
+            await session.rollback()
+            error_message = str(exc) or exc.__class__.__name__
+            try:
+                # The rollback expired the instance; reload it before touching its columns
+                job = await session.get(PlatformJob, job_id)
+                retrying = await mark_platform_job_failed(
+                    session,
+                    job,
+                    error_message,
+                    retryable=not isinstance(exc, PlatformJobPermanentError),
+                    base_delay_seconds=settings.PLATFORM_JOB_RETRY_BASE_SECONDS,
+                    max_delay_seconds=settings.PLATFORM_JOB_RETRY_MAX_SECONDS,
+                )
+                await session.commit()
+            except Exception as inner_exc:
+                await session.rollback()
+                logger.exception(
+                    "Failed to record failure for platform job %s (%s): %s", job_id, error_message, inner_exc,
+                )
+            else:
+                if retrying:
+                    logger.warning(
+                        "Platform job %s failed (attempt %s/%s), retry at %s: %s",
+                        job_id, job.attempts, job.max_attempts, job.run_after, error_message,
+                    )
+                elif job.status == PlatformJobStatus.SUPERSEDED.value:
+                    logger.info("Platform job %s failed and was superseded by a newer queued job: %s", job_id, error_message)
+                else:
+                    logger.error("Platform job %s failed permanently: %s", job_id, error_message)
+
+
+async def _wait_for_work(listener: Optional[PgNotificationListener]) -> None:
+    """Block until a job is enqueued (NOTIFY) or the fallback poll interval elapses."""
+    if listener is None:
+        await asyncio.sleep(POLL_INTERVAL)
+        return
+    await listener.wait(IDLE_POLL_INTERVAL if listener.is_listening else POLL_INTERVAL)
+
+
+async def _worker_slot(throttle: PlatformThrottle, listener: Optional[PgNotificationListener]) -> None:
+    while not _shutdown_requested:
+        job = await _claim_next_job(throttle)
+        if job is None:
+            await _wait_for_work(listener)
+            continue
+        try:
+            await throttle.wait_turn(job.platform)
+            await _run_claimed_job(job.id)
+        finally:
+            throttle.release(job.platform)
+            # Idle slots may have skipped this platform while it was at its limit
+            if listener is not None:
+                listener.wake()
+
+
+async def main() -> None:
+    global _listener
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, _handle_signal)
+
+    settings = get_settings()
+    throttle = PlatformThrottle(
+        rates=settings.PLATFORM_JOB_RATE_LIMITS,
+        concurrency=settings.PLATFORM_JOB_PLATFORM_CONCURRENCY,
+    )
+    concurrency = max(settings.PLATFORM_JOB_WORKER_CONCURRENCY, 1)
+
+    async with async_session() as session:
+        requeued = await requeue_stale_platform_jobs(session, timedelta(minutes=STALE_JOB_MINUTES))
+        await session.commit()
+    if requeued:
+        logger.warning("Re-queued %d platform jobs left in progress by a previous worker", requeued)
+
+    _listener = PgNotificationListener(channel=PLATFORM_JOB_CHANNEL)
+    listening = await _listener.start()
+    logger.info(
+        "Starting platform job worker (listen=%s, poll=%ss, concurrency=%s, platforms=%s)",
+        listening,
+        IDLE_POLL_INTERVAL if listening else POLL_INTERVAL,
+        concurrency,
+        dict(settings.PLATFORM_JOB_PLATFORM_CONCURRENCY),
+    )
+
+    try:
+        await asyncio.gather(*(_worker_slot(throttle, _listener) for _ in range(concurrency)))
+    except SystemExit:
+        pass
+    finally:
+        await _listener.close()
+
+    logger.info("Platform job worker shutdown complete")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
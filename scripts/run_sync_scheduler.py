@@ -1,14 +1,14 @@
 import asyncio
 import logging
-import math
-import uuid
 from datetime import datetime, timedelta, timezone
 
 from app.core.config import get_settings
 from app.database import async_session
+from app.services.job_scheduler import JobRunner, ScheduledJob, OVERLAP_COALESCE
 from app.services.ebay_service import EbayService
 from app.services.ebay.trading import EbayTradingLegacyAPI
-from app.services.reverb.client import ReverbClient
+from app.services.reverb.client import ReverbClient, close_shared_http_client as close_reverb_http_client
+from app.services.ebay.http_client import close_shared_http_client as close_ebay_http_client
 from app.routes.platforms.ebay import run_ebay_sync_background
 from app.routes.platforms.reverb import run_reverb_sync_background
 from app.routes.platforms.shopify import run_shopify_sync_background
@@ -27,6 +27,8 @@ from app.services.order_sale_processor import OrderSaleProcessor
 from app.services.listing_stats_service import ListingStatsService
 from app.services.reverb_service import ReverbService
 from app.services.reconciliation_service import process_reconciliation
+from app.services.report_views import refresh_report_views, refresh_report_views_in_background
+from app.services.response_cache import invalidate_cache_tags
 from app.models.sync_event import SyncEvent
 from sqlalchemy import select, text
 from shopify.auto_archive import run_auto_archive
@@ -36,42 +38,6 @@ configure_logging()
 logger = logging.getLogger(__name__)
 
 
-class ScheduledJob:
-    def __init__(self, name: str, interval_minutes: int, coro):
-        self.name = name
-        self.interval = timedelta(minutes=interval_minutes)
-        self.coro = coro
-        self.next_run = self._compute_next_run(datetime.now(timezone.utc))
-
-    def _compute_next_run(self, reference: datetime) -> datetime:
-        """
-        Align the next run to the next interval boundary after `reference`.
-        """
-        interval_seconds = self.interval.total_seconds()
-        reference_ts = reference.timestamp()
-        next_ts = math.ceil(reference_ts / interval_seconds) * interval_seconds
-        next_run = datetime.fromtimestamp(next_ts, tz=timezone.utc)
-        if next_run <= reference:
-            next_run = reference + self.interval
-        return next_run
-
-    def update_next_run(self):
-        self.next_run = self.next_run + self.interval
-
-
-async def run_job(job: ScheduledJob, settings):
-    sync_run_id = uuid.uuid4()
-    logger.info("Starting job=%s sync_run_id=%s", job.name, sync_run_id)
-    try:
-        async with async_session() as db:
-            await job.coro(db=db, settings=settings, sync_run_id=sync_run_id)
-        logger.info("Completed job=%s sync_run_id=%s", job.name, sync_run_id)
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Job %s failed: %s", job.name, exc, exc_info=True)
-    finally:
-        job.update_next_run()
-
-
 async def main():
     settings = get_settings()
 
@@ -167,9 +133,21 @@ async def main():
                 logger.info("✅ Auto-processed %s ended/sold status_change events", auto_count)
             else:
                 logger.info("🔍 No ended/sold status_change events to auto-process")
+            if status_change_events:
+                await invalidate_cache_tags("sync_events", "products", db=db)
+                await db.commit()
         except Exception as e:
             logger.warning("❌ Status change auto-processing failed: %s", e, exc_info=True)
 
+    async def _refresh_reports_after_sync():
+        """Bring the /reports views up to date with what the sync just wrote."""
+        if settings.REPORT_VIEWS_REFRESH_AFTER_SYNC:
+            await refresh_report_views_in_background()
+
+    async def refresh_report_views_job(db, settings, sync_run_id):
+        """Scheduled refresh of the /reports views (covers manual edits and order jobs)."""
+        await refresh_report_views(db)
+
     async def reverb_sync_and_autoprocess(db, settings, sync_run_id):
         """Run Reverb listing sync, then auto-process ended/sold status changes."""
         await run_reverb_sync_background(
@@ -177,8 +155,10 @@ async def main():
             db=db,
             settings=settings,
             sync_run_id=sync_run_id,
+            incremental=True,  # delta since the last watermark; full reconcile runs daily
         )
         await _auto_process_ended_sold_events(db, sync_run_id)
+        await _refresh_reports_after_sync()
 
     async def ebay_sync_and_autoprocess(db, settings, sync_run_id):
         """Run eBay listing sync, then auto-process ended/sold status changes."""
@@ -188,6 +168,7 @@ async def main():
             sync_run_id=sync_run_id,
         )
         await _auto_process_ended_sold_events(db, sync_run_id)
+        await _refresh_reports_after_sync()
 
     async def shopify_sync_and_autoprocess(db, settings, sync_run_id):
         """Run Shopify listing sync, then auto-process ended/sold status changes."""
@@ -197,6 +178,7 @@ async def main():
             sync_run_id=sync_run_id,
         )
         await _auto_process_ended_sold_events(db, sync_run_id)
+        await _refresh_reports_after_sync()
 
     async def vr_sync_and_autoprocess(db, settings, sync_run_id):
         """Run VR listing sync, then auto-process ended/sold status changes.
@@ -214,6 +196,7 @@ async def main():
             sync_run_id,
         )
         await _auto_process_ended_sold_events(db, sync_run_id)
+        await _refresh_reports_after_sync()
 
     async def fetch_reverb_orders(db, settings, sync_run_id):
         """Fetch recent Reverb orders, upsert, and process for inventory."""
@@ -275,6 +258,7 @@ async def main():
                         "order_sale_events": events_created,
                     }
                 )
+                await invalidate_cache_tags("orders", "products", db=db)
                 await db.commit()
             else:
                 logger.info("No Reverb orders returned")
@@ -330,6 +314,7 @@ async def main():
                         "quantity_decrements": sale_summary.get("quantity_decrements", 0),
                     }
                 )
+                await invalidate_cache_tags("orders", "products", db=db)
                 await db.commit()
             else:
                 logger.info("No eBay orders returned")
@@ -384,6 +369,7 @@ async def main():
                         "quantity_decrements": sale_summary.get("quantity_decrements", 0),
                     }
                 )
+                await invalidate_cache_tags("orders", "products", db=db)
                 await db.commit()
             else:
                 logger.info("No Shopify orders returned (store may not have orders yet)")
@@ -594,59 +580,77 @@ async def main():
             "reverb_hourly",
             60,
             reverb_sync_and_autoprocess,
+            platform="reverb",
         ),
         ScheduledJob(
             "ebay_hourly",
             60,
             ebay_sync_and_autoprocess,
+            platform="ebay",
         ),
         ScheduledJob(
             "shopify_hourly",
             60,
             shopify_sync_and_autoprocess,
+            platform="shopify",
         ),
         ScheduledJob(
             "vr_every_3h",
             180,
             vr_sync_and_autoprocess,
+            platform="vr",
         ),
         ScheduledJob(
             "ebay_metadata_12h",
             720,
             refresh_ebay_metadata,
+            platform="ebay",
         ),
         # Stats refresh jobs - run daily (1440 minutes = 24 hours)
         ScheduledJob(
             "reverb_stats_daily",
             1440,
             refresh_reverb_stats,
+            platform="reverb",
         ),
         ScheduledJob(
             "ebay_stats_daily",
             1440,
             refresh_ebay_stats,
+            platform="ebay",
         ),
-        # Orders fetch jobs - run hourly after platform syncs
+        # Orders fetch jobs - run hourly; a run still in flight when the next is due gets one follow-up.
+        # They are priority jobs so long syncs on the same platform can't hold them back
         ScheduledJob(
             "reverb_orders_hourly",
             60,
             fetch_reverb_orders,
+            platform="reverb",
+            overlap=OVERLAP_COALESCE,
+            priority=True,
         ),
         ScheduledJob(
             "ebay_orders_hourly",
             60,
             fetch_ebay_orders,
+            platform="ebay",
+            overlap=OVERLAP_COALESCE,
+            priority=True,
         ),
         ScheduledJob(
             "shopify_orders_hourly",
             60,
             fetch_shopify_orders_job,
+            platform="shopify",
+            overlap=OVERLAP_COALESCE,
+            priority=True,
         ),
         # Weekly auto-archive job - 10080 minutes = 7 days
         ScheduledJob(
             "shopify_auto_archive_weekly",
             10080,
             shopify_auto_archive,
+            platform="shopify",
         ),
         # State reconciliation - every 6 hours (360 minutes)
         ScheduledJob(
@@ -654,25 +658,30 @@ async def main():
             360,
             reconcile_listing_states,
         ),
+        # Materialized /reports views; a run due while one is in flight gets one follow-up
+        ScheduledJob(
+            "report_views_refresh",
+            settings.REPORT_VIEWS_REFRESH_MINUTES,
+            refresh_report_views_job,
+            overlap=OVERLAP_COALESCE,
+        ),
     ]
 
-    heartbeat_interval = timedelta(minutes=60)
-    next_heartbeat = datetime.now(timezone.utc) + heartbeat_interval
+    runner = JobRunner(jobs, settings)
+    logger.info(
+        "Scheduler started with %d jobs (max %d concurrent, %d per platform)",
+        len(jobs), runner.max_concurrent, runner.max_per_platform,
+    )
+    await runner.run_forever(heartbeat_interval=timedelta(minutes=60))
 
-    while True:
-        now = datetime.now(timezone.utc)
-        due_jobs = [job for job in jobs if job.next_run <= now]
 
-        for job in due_jobs:
-            await run_job(job, settings)
-
-        if datetime.now(timezone.utc) >= next_heartbeat:
-            schedule = {job.name: job.next_run.isoformat() for job in jobs}
-            logger.info("Scheduler heartbeat; next runs: %s", schedule)
-            next_heartbeat = datetime.now(timezone.utc) + heartbeat_interval
-
-        await asyncio.sleep(60)  # check every minute
+async def run_scheduler():
+    try:
+        await main()
+    finally:
+        await close_reverb_http_client()
+        await close_ebay_http_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run_scheduler())
@@ -9,9 +9,11 @@ from sqlalchemy.orm import selectinload
 
 from app.database import async_session
 from app.models.product import Product
+from app.models.vr_job import VRJob
 from app.services.vintageandrare.brand_validator import VRBrandValidator
 from app.services.vintageandrare.client import VintageAndRareClient
 from app.services.vintageandrare.constants import DEFAULT_VR_BRAND
+from app.services.vintageandrare.session_pool import VRSessionPool, harvest_session_cookies
 from app.services.vr_job_queue import (
     count_pending_resolutions,
     fetch_next_queued_job,
@@ -22,6 +24,7 @@ from app.services.vr_job_queue import (
     mark_job_in_progress,
     mark_job_pending_id,
     peek_queue_count,
+    VRJobListener,
 )
 from app.services.vr_service import VRService
 
@@ -32,12 +35,19 @@ logging.basicConfig(
 )
 
 POLL_INTERVAL = float(os.environ.get("VR_WORKER_POLL_INTERVAL", "5"))
+# Safety-net poll while LISTEN is active; POLL_INTERVAL applies when it is not
+IDLE_POLL_INTERVAL = float(os.environ.get("VR_WORKER_IDLE_POLL_INTERVAL", "60"))
 MAX_BATCH_SIZE = int(os.environ.get("VR_MAX_BATCH_SIZE", "10"))
 MAX_RESOLUTION_ATTEMPTS = int(os.environ.get("VR_MAX_RESOLUTION_ATTEMPTS", "3"))
+# >1 enables the parallel mode: that many pooled browser sessions claim jobs concurrently
+WORKER_CONCURRENCY = int(os.environ.get("VR_WORKER_CONCURRENCY", "1"))
+# Pooled browser sessions are recycled after this many jobs (or on any failure)
+SESSION_MAX_JOBS = int(os.environ.get("VR_SESSION_MAX_JOBS", "10"))
 
 # Graceful shutdown flag
 _shutdown_requested = False
 _current_job_id: Optional[int] = None
+_listener: Optional[VRJobListener] = None
 
 
 def _handle_signal(*_: Any) -> None:
@@ -48,13 +58,20 @@ def _handle_signal(*_: Any) -> None:
         raise SystemExit(1)
     _shutdown_requested = True
     logger.info("Shutdown requested - will exit after current work completes")
+    if _listener is not None:
+        _listener.wake()
 
 
 for sig in (signal.SIGINT, signal.SIGTERM):
     signal.signal(sig, _handle_signal)
 
 
-async def _process_job(session: AsyncSession, job, skip_id_resolution: bool = False) -> Dict[str, Any]:
+async def _process_job(
+    session: AsyncSession,
+    job,
+    skip_id_resolution: bool = False,
+    browser_session=None,
+) -> Dict[str, Any]:
     """
     Process a VR job - create listing via Selenium.
 
@@ -62,6 +79,7 @@ async def _process_job(session: AsyncSession, job, skip_id_resolution: bool = Fa
         session: Database session
         job: VRJob to process
         skip_id_resolution: If True, skip CSV download (for batched processing)
+        browser_session: Pooled VRBrowserSession to use (parallel mode)
 
     Returns:
         Result dict from VRService including match_criteria if skip_id_resolution=True
@@ -130,6 +148,7 @@ async def _process_job(session: AsyncSession, job, skip_id_resolution: bool = Fa
             reverb_data=reverb_data,
             platform_options=platform_options,
             skip_id_resolution=skip_id_resolution,
+            browser_session=browser_session,
         )
     finally:
         if brand_overridden:
@@ -288,7 +307,15 @@ async def _should_resolve_now(session: AsyncSession) -> bool:
     return False
 
 
-async def worker_loop() -> None:
+async def _wait_for_work(listener: Optional[VRJobListener]) -> None:
+    """Block until a job is enqueued (NOTIFY) or the fallback poll interval elapses."""
+    if listener is None:
+        await asyncio.sleep(POLL_INTERVAL)
+        return
+    await listener.wait(IDLE_POLL_INTERVAL if listener.is_listening else POLL_INTERVAL)
+
+
+async def worker_loop(listener: Optional[VRJobListener] = None) -> None:
     global _current_job_id
 
     while not _shutdown_requested:
@@ -394,19 +421,128 @@ async def worker_loop() -> None:
                     if should_resolve:
                         await _resolve_pending_batch(session)
 
-        if not job_processed:
-            await asyncio.sleep(POLL_INTERVAL)
+        if not job_processed and not _shutdown_requested:
+            await _wait_for_work(listener)
+
+
+async def _claim_next_job() -> Optional[int]:
+    """Claim the oldest queued job (SKIP LOCKED) and commit it as in progress."""
+    async with async_session() as session:
+        job = await fetch_next_queued_job(session)
+        if not job:
+            return None
+        try:
+            await mark_job_in_progress(session, job)
+            await session.commit()
+        except Exception as exc:
+            await session.rollback()
+            logger.error("Failed to mark job %s in progress: %s", job.id, exc, exc_info=True)
+            return None
+        return job.id
+
+
+async def _run_claimed_job(job_id: int, pool: VRSessionPool) -> None:
+    async with async_session() as session:
+        job = await session.get(VRJob, job_id)
+        is_image_fix = (job.payload or {}).get("sync_source", "") == "image_fix"
+        try:
+            if is_image_fix:
+                await _process_image_fix_job(session, job)
+                await mark_job_completed(session, job)
+            else:
+                # Always batch ID resolution in parallel mode; it runs once the queue drains
+                async with pool.session() as browser:
+                    result = await _process_job(session, job, skip_id_resolution=True, browser_session=browser)
+                if result.get("match_criteria"):
+                    await mark_job_pending_id(session, job, result["match_criteria"])
+                else:
+                    await mark_job_completed(session, job)
+            await session.commit()
+            logger.info("V&R job %s done (parallel mode)", job_id)
+        except Exception as exc:
+            await session.rollback()
+            error_message = str(exc)
+            try:
+                await mark_job_failed(session, job, error_message)
+                await session.commit()
+            except Exception as inner_exc:
+                await session.rollback()
+                logger.exception(
+                    "Failed to record failure for job %s (%s): %s", job_id, error_message, inner_exc,
+                )
+            else:
+                logger.error("V&R job %s failed: %s", job_id, error_message)
+
+
+async def _drain_queue(pool: VRSessionPool) -> int:
+    """Claim and run jobs until none are queued; returns how many were run."""
+    processed = 0
+    while not _shutdown_requested:
+        job_id = await _claim_next_job()
+        if job_id is None:
+            break
+        await _run_claimed_job(job_id, pool)
+        processed += 1
+    return processed
+
+
+async def parallel_worker_loop(listener: Optional[VRJobListener], concurrency: int) -> None:
+    """
+    Run up to `concurrency` jobs at once, each on a pooled browser session.
+
+    Every slot claims jobs with SKIP LOCKED until the queue is empty; the
+    burst's pending V&R IDs are then resolved with one CSV download and the
+    idle browsers are closed until the next notification.
+    """
+    username = os.environ.get("VINTAGE_AND_RARE_USERNAME") or ""
+    password = os.environ.get("VINTAGE_AND_RARE_PASSWORD") or ""
+    pool = VRSessionPool(
+        concurrency,
+        max_jobs_per_session=SESSION_MAX_JOBS,
+        cookie_source=lambda: harvest_session_cookies(username, password),
+    )
+
+    try:
+        while not _shutdown_requested:
+            processed = await asyncio.gather(*(_drain_queue(pool) for _ in range(concurrency)))
+            if sum(processed):
+                logger.info("Parallel burst finished: %d jobs", sum(processed))
+            await pool.close_idle()
+
+            async with async_session() as session:
+                pending_count = await count_pending_resolutions(session)
+                if pending_count > 0:
+                    logger.info(f"Queue drained, resolving {pending_count} pending...")
+                    await _resolve_pending_batch(session)
+
+            if not _shutdown_requested:
+                await _wait_for_work(listener)
+    finally:
+        await pool.close()
 
 
 async def main() -> None:
-    global _shutdown_requested
+    global _shutdown_requested, _listener
 
-    logger.info("Starting V&R worker (poll=%ss, max_batch=%s)", POLL_INTERVAL, MAX_BATCH_SIZE)
+    _listener = VRJobListener()
+    listening = await _listener.start()
+    logger.info(
+        "Starting V&R worker (listen=%s, poll=%ss, max_batch=%s, concurrency=%s)",
+        listening,
+        IDLE_POLL_INTERVAL if listening else POLL_INTERVAL,
+        MAX_BATCH_SIZE,
+        WORKER_CONCURRENCY,
+    )
 
     try:
-        await worker_loop()
+        if WORKER_CONCURRENCY > 1:
+            await parallel_worker_loop(_listener, WORKER_CONCURRENCY)
+        else:
+            await worker_loop(_listener)
     except SystemExit:
         pass
+    finally:
+        await _listener.close()
 
     # Graceful shutdown - resolve any pending jobs
     if _shutdown_requested:
@@ -1,5 +1,9 @@
 # tests/conftest.py
 import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -75,6 +79,68 @@ async def db_session(test_engine):
         await session.rollback()
         print("DB session rolled back.")
 
+@pytest.fixture
+def session_factory(test_engine):
+    """Sessionmaker on the test database, for code that opens its own sessions"""
+    return sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+class MockSessionFactory:
+    """Stand-in for async_session: every call yields a fresh MagicMock session"""
+
+    def __init__(self):
+        self.sessions = []
+        self.rows = []  # what session.execute(...).scalars().all() returns
+
+    @asynccontextmanager
+    async def __call__(self):
+        session = MagicMock(name=f"session-{len(self.sessions)}")
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = self.rows
+        session.execute = AsyncMock(return_value=result)
+        session.flush = AsyncMock()
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+        self.sessions.append(session)
+        yield session
+
+    @property
+    def commits(self):
+        return sum(session.commit.await_count for session in self.sessions)
+
+    @property
+    def rollbacks(self):
+        return sum(session.rollback.await_count for session in self.sessions)
+
+
+class ConcurrencyProbe:
+    """Counts calls in flight per key and keeps the peak"""
+
+    def __init__(self):
+        self.in_flight = defaultdict(int)
+        self.peak = defaultdict(int)
+
+    @asynccontextmanager
+    async def track(self, key="all", hold=0.01):
+        self.in_flight[key] += 1
+        self.peak[key] = max(self.peak[key], self.in_flight[key])
+        try:
+            # Hold the slot long enough for the other tasks to start
+            await asyncio.sleep(hold)
+            yield
+        finally:
+            self.in_flight[key] -= 1
+
+
+@pytest.fixture
+def mock_session_factory():
+    """Session factory for code that opens its own sessions, without a database"""
+    return MockSessionFactory()
+
+@pytest.fixture
+def concurrency_probe():
+    """Peak-concurrency counter for tests of bounded fan-out"""
+    return ConcurrencyProbe()
+
 @pytest.fixture
 def test_client(settings):
     """Provide a test client with overridden settings"""
@@ -242,53 +242,33 @@ async def test_list_products_scenarios(
     # Arrange: Mock dependencies and DB calls
     mock_session = AsyncMock()
 
-    # Mock DB result objects based on scenario parameters
-
-    # Mock for Count query -> .scalar_one() returns mock_total
-    mock_execute_count_result = MagicMock()
-    mock_execute_count_result.scalar_one.return_value = mock_total
+    # Totals and dropdown facets come from the count cache
+    mock_counts = mocker.patch(
+        'app.routes.inventory.get_inventory_counts',
+        AsyncMock(return_value={
+            "total": mock_total,
+            "categories": mock_cats,
+            "brands": mock_brands,
+            "status_counts": {},
+        }),
+    )
 
-    # Mock for Product query -> .scalars().all() returns mock_products
+    # Mock for Product query -> .scalars().all() returns mock_products, plus the
+    # look-ahead row the route fetches to know there is a next page
+    db_rows = list(mock_products)
+    if expected_context.get("has_next"):
+        db_rows.append(create_mock_product(99, "LOOKAHEAD", "X", "Y", "Z", 1.0, ProductStatus.ACTIVE))
     mock_execute_product_result = MagicMock()
     mock_scalar_result_for_products = MagicMock() # Mock object returned by .scalars()
-    mock_scalar_result_for_products.all.return_value = mock_products # .all() on that returns the list
+    mock_scalar_result_for_products.all.return_value = db_rows # .all() on that returns the list
     mock_execute_product_result.scalars.return_value = mock_scalar_result_for_products # .scalars() returns the mock above
 
-    # Mock for Categories query -> .all() returns mock_cats
-    mock_execute_categories_result = MagicMock()
-    mock_execute_categories_result.all.return_value = mock_cats
-
-    # Mock for Brands query -> .all() returns mock_brands
-    mock_execute_brands_result = MagicMock()
-    mock_execute_brands_result.all.return_value = mock_brands
-
-    # The execute_side_effect function remains the same as the previous version (based on call_index)
     # Store the actual query passed to execute for inspection
     executed_queries = []
     async def execute_side_effect(query, *args, **kwargs):
-        # ... (keep the side effect logic based on call_index from previous response) ...
-        """Mocks db.execute, returning appropriate result based on the call order."""
+        """Mocks db.execute; the product page query is the only one left in the route."""
         executed_queries.append(str(query)) # Store query string representation
-        call_index = mock_session.execute.await_count - 1 # Get call number (0-based)
-        print(f"Mock DB Execute Call {call_index + 1}")
-
-        # Return results based on the expected call order
-        if call_index == 0:
-            print(" -> Returning Count Result (Call 1)")
-            return mock_execute_count_result
-        elif call_index == 1:
-            print(" -> Returning Product List Result (Call 2)")
-            return mock_execute_product_result
-        elif call_index == 2:
-            print(" -> Returning Categories Result (Call 3)")
-            return mock_execute_categories_result
-        elif call_index == 3:
-            print(" -> Returning Brands Result (Call 4)")
-            return mock_execute_brands_result
-        else:
-            # This case shouldn't be reached in the current logic
-            print(f" -> WARNING: Unexpected DB Execute Call {call_index + 1}")
-            return MagicMock() # Fallback
+        return mock_execute_product_result
 
     mock_session.execute = AsyncMock(side_effect=execute_side_effect)
 
@@ -328,29 +308,13 @@ async def test_list_products_scenarios(
         assert context.get(key) == expected_value, f"Context mismatch for key '{key}'"
 
     # Assert DB calls
-    # The number of execute calls might vary slightly if filters mean category/brand queries aren't needed,
-    # but typically it will be 4 (count, products, categories, brands)
-    assert mock_session.execute.await_count >= 2 # At least count and products should be called
-    mock_execute_count_result.scalar_one.assert_called_once()
+    assert mock_session.execute.await_count == 1 # Just the product page
+    mock_counts.assert_awaited_once()
     if mock_products: # Only check product query details if products were expected
          mock_execute_product_result.scalars().all.assert_called_once()
-    # Check if category/brand queries were called (might depend on implementation details)
-    # mock_execute_categories_result.all.assert_called_once()
-    # mock_execute_brands_result.all.assert_called_once()
 
 # --- Basic Query Assertions (Checking for Filters and Placeholders) ---
-    product_query_str = ""
-    count_query_str = ""
-    for q in executed_queries:
-        q_lower = q.lower()
-        # Find the query that selects from 'product' but isn't the count query or category/brand query
-        if "select" in q_lower and "product" in q_lower and "count(" not in q_lower and "group_by" not in q_lower:
-            product_query_str = q_lower
-        # Find the count query
-        elif "count(" in q_lower and "product" in q_lower:
-             count_query_str = q_lower
-
-    print(f"Count Query String Found: {count_query_str}")
+    product_query_str = executed_queries[0].lower()
     print(f"Product Query String Found: {product_query_str}")
 
     if not product_query_str and mock_total > 0:
@@ -363,15 +327,12 @@ async def test_list_products_scenarios(
         per_page_val = route_params.get('per_page', 100)
         page_val = route_params.get('page', 1)
 
-        if isinstance(per_page_val, int) and per_page_val > 0:
-            assert "limit :" in product_query_str, f"LIMIT placeholder missing in query for per_page={per_page_val}"
-            if page_val > 1:
-                assert "offset :" in product_query_str, f"OFFSET placeholder missing for page={page_val}"
-            else:
-                 assert "offset :" in product_query_str or " offset " not in product_query_str, "OFFSET should have placeholder or be absent for page 1"
-        elif per_page_val == 'all':
-            assert "limit :" not in product_query_str, "LIMIT placeholder should NOT be present when per_page='all'"
-            assert "offset :" not in product_query_str, "OFFSET placeholder should NOT be present when per_page='all'"
+        # per_page='all' is capped at INVENTORY_MAX_PAGE_SIZE, so every page is limited
+        assert "limit :" in product_query_str, f"LIMIT placeholder missing in query for per_page={per_page_val}"
+        if page_val > 1:
+            assert "offset :" in product_query_str, f"OFFSET placeholder missing for page={page_val}"
+        else:
+             assert "offset :" in product_query_str or " offset " not in product_query_str, "OFFSET should have placeholder or be absent for page 1"
 
         # Check Filtering Placeholders in Query
         search_term = route_params.get('search')
@@ -379,11 +340,11 @@ async def test_list_products_scenarios(
         brand_term = route_params.get('brand')
 
         if search_term or category_term or brand_term:
-             assert "where" in product_query_str or ("where" in count_query_str if count_query_str else False), "WHERE clause expected but missing when filters are active"
+             assert "where" in product_query_str, "WHERE clause expected but missing when filters are active"
 
         if search_term:
             assert "like" in product_query_str, "LIKE expected for search filter"
-            assert ":brand_1" in product_query_str or ":model_1" in product_query_str or ":sku_1" in product_query_str or ":description_1" in product_query_str
+            assert "products.search_vector @@ to_tsquery(" in product_query_str, "Full-text match expected for search filter"
 
         if category_term:
              # CORRECTED: Check with standard spacing in lowercase query string
@@ -1324,7 +1285,8 @@ async def test_update_product_stock(mocker):
     response = await update_product_stock(
         product_id=product_id_to_update,
         quantity=new_stock,
-        request=mock_request
+        request=mock_request,
+        db=mock_session
     )
     
     # Assert: Check response
@@ -1334,6 +1296,12 @@ async def test_update_product_stock(mocker):
     # Verify stock manager was called to process the update
     mock_stock_manager.process_stock_update.assert_awaited_once()
     
+    # Verify other processes are told to drop the product's cached responses on commit
+    statement, params = mock_session.execute.await_args.args
+    assert "pg_notify" in str(statement)
+    assert params["tags"] == f"product:{product_id_to_update},products"
+    mock_session.commit.assert_awaited_once()
+    
     print("--- Test update_product_stock Passed ---")
 
 # 2. Test for Shipping Profiles Endpoint
@@ -1832,41 +1800,20 @@ async def test_list_inventory_route_success(mocker):
     mock_execute_products_result.scalars.return_value = mock_products_scalar
     mock_execute_products_result.unique.return_value = mock_execute_products_result
     
-    # Mock count result
-    mock_count_result = MagicMock()
-    mock_count_result.scalar_one.return_value = len(mock_products)
-    
-    # Mock categories and brands results
+    # Mock categories and brands results (served from the count cache)
     mock_categories = [("Electric Guitars", 2), ("Acoustic Guitars", 1)]  # Include count
-    mock_execute_categories_result = MagicMock()
-    mock_execute_categories_result.all.return_value = mock_categories
-    
     mock_brands = [("Fender", 1), ("Gibson", 1)]  # Include count
-    mock_execute_brands_result = MagicMock()
-    mock_execute_brands_result.all.return_value = mock_brands
-    
-    # Configure execute side effect based on call order
-    async def execute_side_effect(query, *args, **kwargs):
-        call_index = mock_session.execute.await_count - 1
-        print(f"Mock DB Execute Call {call_index + 1}")
-        
-        if call_index == 0:  # First call fetches count
-            print(" -> Returning Count Result")
-            return mock_count_result
-        elif call_index == 1:  # Second call fetches products
-            print(" -> Returning Products Result")
-            return mock_execute_products_result
-        elif call_index == 2:  # Third call fetches categories
-            print(" -> Returning Categories Result")
-            return mock_execute_categories_result
-        elif call_index == 3:  # Fourth call fetches brands
-            print(" -> Returning Brands Result")
-            return mock_execute_brands_result
-        else:
-            print(f" -> WARNING: Unexpected DB Execute Call {call_index + 1}")
-            return MagicMock()
-    
-    mock_session.execute = AsyncMock(side_effect=execute_side_effect)
+    mocker.patch(
+        'app.routes.inventory.get_inventory_counts',
+        AsyncMock(return_value={
+            "total": len(mock_products),
+            "categories": mock_categories,
+            "brands": mock_brands,
+            "status_counts": {"active": 2},
+        }),
+    )
+
+    mock_session.execute = AsyncMock(return_value=mock_execute_products_result)
     
     # Mock template response
     mock_template_render = mocker.patch('app.routes.inventory.templates.TemplateResponse')
@@ -1900,7 +1847,7 @@ async def test_list_inventory_route_success(mocker):
     assert "brands" in context
     
     # Verify DB calls
-    assert mock_session.execute.await_count == 4  # Products, count, categories, brands
+    assert mock_session.execute.await_count == 1  # Products only; counts come from the cache
     
     print("--- Test list_inventory_route_success Passed ---")
 
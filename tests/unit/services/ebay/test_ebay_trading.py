@@ -1,5 +1,6 @@
 # tests/unit/services/ebay/test_ebay_trading.py
 import pytest
+import asyncio
 import json
 import xmltodict
 from unittest.mock import patch, AsyncMock, MagicMock
@@ -94,12 +95,10 @@ async def test_make_request(mocker):
       </Item>
     </GetItemResponse>"""
     
-    # Create a mock for the AsyncClient that correctly handles the async context manager
-    async_client_mock = AsyncMock()
-    async_client_mock.__aenter__.return_value.post.return_value = mock_response
-    
-    # Patch httpx.AsyncClient
-    mocker.patch('httpx.AsyncClient', return_value=async_client_mock)
+    # Mock the shared eBay HTTP client
+    http_client_mock = AsyncMock()
+    http_client_mock.post.return_value = mock_response
+    mocker.patch('app.services.ebay.trading.get_shared_http_client', return_value=http_client_mock)
     
     # Call _make_request
     call_name = "GetItem"
@@ -111,10 +110,10 @@ async def test_make_request(mocker):
     assert response["GetItemResponse"]["Item"]["Title"] == "Test Item"
     
     # Verify API call
-    async_client_mock.__aenter__.return_value.post.assert_called_once()
+    http_client_mock.post.assert_called_once()
     
     # Check headers included token and call name
-    call_args = async_client_mock.__aenter__.return_value.post.call_args
+    call_args = http_client_mock.post.call_args
     headers = call_args[1].get('headers', {})
     assert "X-EBAY-API-CALL-NAME" in headers
     assert headers["X-EBAY-API-CALL-NAME"] == "GetItem"
@@ -163,12 +162,10 @@ async def test_make_request_network_error(mocker):
     # Mock auth_manager.get_access_token
     api.auth_manager.get_access_token = AsyncMock(return_value="test-token")
     
-    # Mock httpx.AsyncClient to raise a network error
-    async_client_mock = AsyncMock()
-    async_client_mock.__aenter__.return_value.post.side_effect = Exception("Network error")
-    
-    # Patch httpx.AsyncClient
-    mocker.patch('httpx.AsyncClient', return_value=async_client_mock)
+    # Mock the shared eBay HTTP client to raise a network error
+    http_client_mock = AsyncMock()
+    http_client_mock.post.side_effect = Exception("Network error")
+    mocker.patch('app.services.ebay.trading.get_shared_http_client', return_value=http_client_mock)
     
     # Call _make_request and expect an error
     with pytest.raises(EbayAPIError) as exc_info:
@@ -599,3 +596,255 @@ async def test_get_valid_end_reasons(mocker):
     assert len(custom_reasons) == 2
     assert custom_reasons[0]["code"] == "NotAvailable"
     assert custom_reasons[1]["code"] == "SoldOffEbay"
+
+"""
+11. Concurrent GetMyeBaySelling Pagination Tests
+"""
+
+def _selling_page(list_type, item_ids, total_pages):
+    """Build a parsed GetMyeBaySelling response for one page of one list"""
+    if list_type == "SoldList":
+        array = {"OrderTransactionArray": {"OrderTransaction": [{"Item": {"ItemID": i}} for i in item_ids]}}
+    else:
+        array = {"ItemArray": {"Item": [{"ItemID": i} for i in item_ids]}}
+    return {
+        "GetMyeBaySellingResponse": {
+            "Ack": "Success",
+            list_type: {"PaginationResult": {"TotalNumberOfPages": str(total_pages)}, **array},
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_all_selling_listings_concurrent(mocker):
+    """Concurrent mode fans out remaining pages and keeps page order"""
+    api = EbayTradingLegacyAPI(sandbox=True)
+
+    pages = {
+        ("ActiveList", 1): _selling_page("ActiveList", ["a1"], 3),
+        ("ActiveList", 2): _selling_page("ActiveList", ["a2"], 3),
+        ("ActiveList", 3): _selling_page("ActiveList", ["a3"], 3),
+        ("SoldList", 1): _selling_page("SoldList", ["s1"], 1),
+        ("UnsoldList", 1): _selling_page("UnsoldList", [], 1),
+    }
+    calls = []
+
+    async def fake_get_my_ebay_selling_page(list_name, page_number, entries_per_page, detail_level):
+        calls.append((list_name, page_number, entries_per_page))
+        return api._parse_selling_page(pages[(list_name, page_number)], list_name, page_number)
+
+    api.get_my_ebay_selling_page = fake_get_my_ebay_selling_page
+
+    result = await api.get_all_selling_listings(include_details=True, concurrent=True, max_concurrent=2)
+
+    assert [item["ItemID"] for item in result["active"]] == ["a1", "a2", "a3"]
+    assert [item["ItemID"] for item in result["sold"]] == ["s1"]
+    assert result["unsold"] == []
+    # ActiveList uses the larger 200-entry page size
+    assert ("ActiveList", 2, 200) in calls
+    assert ("SoldList", 1, 100) in calls
+
+
+@pytest.mark.asyncio
+async def test_get_all_selling_listings_concurrent_retries_page(mocker):
+    """A failing page is retried rather than ending the list"""
+    api = EbayTradingLegacyAPI(sandbox=True)
+    mocker.patch("app.services.ebay.trading.asyncio.sleep", new=AsyncMock())
+
+    attempts = {"page2": 0}
+
+    async def fake_get_my_ebay_selling_page(list_name, page_number, entries_per_page, detail_level):
+        if page_number == 2:
+            attempts["page2"] += 1
+            if attempts["page2"] == 1:
+                raise EbayAPIError("Transient failure")
+            return api._parse_selling_page(_selling_page(list_name, ["a2"], 2), list_name, page_number)
+        return api._parse_selling_page(_selling_page(list_name, ["a1"], 2), list_name, page_number)
+
+    api.get_my_ebay_selling_page = fake_get_my_ebay_selling_page
+
+    result = await api.get_all_selling_listings(
+        include_sold=False, include_unsold=False, concurrent=True
+    )
+
+    assert [item["ItemID"] for item in result["active"]] == ["a1", "a2"]
+    assert attempts["page2"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_all_selling_listings_concurrent_fails_when_a_page_keeps_failing(mocker):
+    """A page that exhausts its retries aborts the fetch instead of being dropped"""
+    api = EbayTradingLegacyAPI(sandbox=True)
+    mocker.patch("app.services.ebay.trading.asyncio.sleep", new=AsyncMock())
+
+    async def fake_get_my_ebay_selling_page(list_name, page_number, entries_per_page, detail_level):
+        if page_number == 3:
+            raise EbayAPIError("Still failing")
+        return api._parse_selling_page(_selling_page(list_name, [f"a{page_number}"], 4), list_name, page_number)
+
+    api.get_my_ebay_selling_page = fake_get_my_ebay_selling_page
+
+    with pytest.raises(EbayAPIError, match="ActiveList page 3"):
+        await api.get_all_selling_listings(include_sold=False, include_unsold=False, concurrent=True)
+
+
+"""
+12. Streaming XML Parsing Tests
+"""
+
+def _mock_streaming_client(mocker, body: bytes, chunk_size: int = 64):
+    """Patch the shared eBay HTTP client so client.stream() yields body in small chunks"""
+    response = MagicMock()
+    response.status_code = 200
+
+    async def aiter_bytes():
+        for start in range(0, len(body), chunk_size):
+            yield body[start:start + chunk_size]
+
+    response.aiter_bytes = aiter_bytes
+    stream_cm = MagicMock()
+    stream_cm.__aenter__ = AsyncMock(return_value=response)
+    stream_cm.__aexit__ = AsyncMock(return_value=False)
+
+    client = MagicMock()
+    client.stream = MagicMock(return_value=stream_cm)
+    mocker.patch('app.services.ebay.trading.get_shared_http_client', return_value=client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_my_ebay_selling_page_streams_items(mocker):
+    """Streamed items match what xmltodict produces for the same page"""
+    body = b"""<?xml version="1.0" encoding="utf-8"?>
+    <GetMyeBaySellingResponse xmlns="urn:ebay:apis:eBLBaseComponents">
+      <Ack>Success</Ack>
+      <ActiveList>
+        <ItemArray>
+          <Item>
+            <ItemID>111</ItemID>
+            <Title>Fender Stratocaster</Title>
+            <SellingStatus><CurrentPrice currencyID="GBP">1250.0</CurrentPrice></SellingStatus>
+            <PictureDetails><PictureURL>https://i.ebayimg.com/1.jpg</PictureURL><PictureURL>https://i.ebayimg.com/2.jpg</PictureURL></PictureDetails>
+          </Item>
+          <Item>
+            <ItemID>222</ItemID>
+            <Title>Gibson Les Paul</Title>
+            <SellingStatus><CurrentPrice currencyID="GBP">2400.0</CurrentPrice></SellingStatus>
+          </Item>
+        </ItemArray>
+        <PaginationResult>
+          <TotalNumberOfPages>3</TotalNumberOfPages>
+          <TotalNumberOfEntries>402</TotalNumberOfEntries>
+        </PaginationResult>
+      </ActiveList>
+    </GetMyeBaySellingResponse>"""
+
+    api = EbayTradingLegacyAPI(sandbox=True)
+    api.auth_manager.get_access_token = AsyncMock(return_value="test-token")
+    client = _mock_streaming_client(mocker, body)
+
+    items, total_pages = await api.get_my_ebay_selling_page(list_name="ActiveList", page_number=1)
+
+    expected, _ = api._parse_selling_page(xmltodict.parse(body), "ActiveList", 1)
+    assert items == expected
+    assert total_pages == 3
+    assert items[0]["SellingStatus"]["CurrentPrice"] == {"@currencyID": "GBP", "#text": "1250.0"}
+    assert client.stream.call_args[0][0] == "POST"
+    assert client.stream.call_args[1]["headers"]["X-EBAY-API-CALL-NAME"] == "GetMyeBaySelling"
+
+
+@pytest.mark.asyncio
+async def test_get_orders_streams_orders(mocker):
+    """GetOrders returns each Order record plus the envelope's pagination flags"""
+    body = b"""<?xml version="1.0" encoding="utf-8"?>
+    <GetOrdersResponse xmlns="urn:ebay:apis:eBLBaseComponents">
+      <Ack>Success</Ack>
+      <OrderArray>
+        <Order><OrderID>1-1</OrderID></Order>
+      </OrderArray>
+      <HasMoreOrders>true</HasMoreOrders>
+    </GetOrdersResponse>"""
+
+    api = EbayTradingLegacyAPI(sandbox=True)
+    api.auth_manager.get_access_token = AsyncMock(return_value="test-token")
+    _mock_streaming_client(mocker, body, chunk_size=16)
+
+    response = await api.get_orders(number_of_days=7)
+
+    assert response["orders"] == [{"OrderID": "1-1"}]
+    assert response["has_more"] is True
+    assert response["ack"] == "Success"
+
+
+"""
+13. Shared Transport and Token Cache Tests
+"""
+
+@pytest.mark.asyncio
+async def test_concurrent_token_requests_share_one_refresh(mocker):
+    """Callers that all miss the token cache wait on a single refresh request"""
+    from app.services.ebay.token_manager import clear_all_tokens
+
+    clear_all_tokens()
+    token_response = MagicMock()
+    token_response.status_code = 200
+    token_response.json.return_value = {"access_token": "fresh-token", "expires_in": 7200}
+
+    async def slow_post(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return token_response
+
+    http_client_mock = MagicMock()
+    http_client_mock.post = AsyncMock(side_effect=slow_post)
+    mocker.patch('app.services.ebay.auth.get_shared_http_client', return_value=http_client_mock)
+
+    try:
+        managers = [EbayAuthManager(sandbox=True) for _ in range(5)]
+        tokens = await asyncio.gather(*(manager.get_access_token() for manager in managers))
+    finally:
+        clear_all_tokens()
+
+    assert tokens == ["fresh-token"] * 5
+    http_client_mock.post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_token_near_expiry_is_refreshed_in_background(mocker):
+    """A token inside the refresh margin is still returned while a new one is fetched"""
+    from app.services.ebay import auth as auth_module
+    from app.services.ebay.token_manager import clear_all_tokens
+
+    clear_all_tokens()
+    manager = EbayAuthManager(sandbox=True)
+    manager.token_manager.save_access_token("old-token", 400)  # inside the 600s margin
+
+    token_response = MagicMock()
+    token_response.status_code = 200
+    token_response.json.return_value = {"access_token": "new-token", "expires_in": 7200}
+    http_client_mock = MagicMock()
+    http_client_mock.post = AsyncMock(return_value=token_response)
+    mocker.patch('app.services.ebay.auth.get_shared_http_client', return_value=http_client_mock)
+
+    try:
+        assert await manager.get_access_token() == "old-token"
+        await auth_module._background_refreshes["sandbox"]
+        assert await manager.get_access_token() == "new-token"
+    finally:
+        clear_all_tokens()
+
+    http_client_mock.post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_trading_api_instances_share_http_client():
+    """Separately constructed API objects reuse one pooled client on the same loop"""
+    from app.services.ebay.http_client import close_shared_http_client
+
+    try:
+        first = EbayTradingLegacyAPI(sandbox=True)._get_http_client()
+        second = EbayTradingLegacyAPI(sandbox=True)._get_http_client()
+        assert first is second
+        assert not first.is_closed
+    finally:
+        await close_shared_http_client()
+    assert first.is_closed
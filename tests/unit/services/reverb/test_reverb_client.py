@@ -1,4 +1,5 @@
 # API client unit tests
+import asyncio
 import pytest
 import httpx
 import json
@@ -10,6 +11,13 @@ from app.core.exceptions import ReverbAPIError
 
 settings = get_settings()
 
+
+def _mock_http_client(mocker):
+    """Pooled AsyncClient stand-in injected via ReverbClient(http_client=...)."""
+    mock_http = mocker.AsyncMock(spec=httpx.AsyncClient)
+    mock_http.is_closed = False
+    return mock_http
+
 """
 1. Client Authentication Tests
 """
@@ -18,20 +26,20 @@ settings = get_settings()
 async def test_reverb_auth_sandbox(mocker):
     """Test authentication with Reverb sandbox API"""
     # Mock HTTP client
-    mock_client = mocker.patch("httpx.AsyncClient")
+    mock_http = _mock_http_client(mocker)
     mock_response = mocker.MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"success": True}
-    mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+    mock_http.request.return_value = mock_response
     
     # Create client with sandbox credentials
-    client = ReverbClient(api_key=settings.REVERB_SANDBOX_API_KEY)
+    client = ReverbClient(api_key=settings.REVERB_SANDBOX_API_KEY, http_client=mock_http)
     
     # Test a simple API call
     result = await client._make_request("GET", "/categories/flat")
     
     # Verify headers contain sandbox API key
-    _, kwargs = mock_client.return_value.__aenter__.return_value.request.call_args
+    _, kwargs = mock_http.request.call_args
     auth_header = kwargs["headers"]["Authorization"]
     assert f"Bearer {settings.REVERB_SANDBOX_API_KEY}" == auth_header
     assert result == {"success": True}
@@ -87,15 +95,15 @@ async def test_reverb_get_listing_conditions(mocker):
 @pytest.mark.asyncio
 async def test_reverb_api_error_handling(mocker):
     """Test proper handling of API errors"""
-    # Mock the AsyncClient request to return an error response
-    mock_client = mocker.patch("httpx.AsyncClient")
+    # Mock the pooled client's request to return an error response
+    mock_http = _mock_http_client(mocker)
     mock_response = mocker.MagicMock()
     mock_response.status_code = 400
     mock_response.text = "Bad Request"
-    mock_client.return_value.__aenter__.return_value.request.return_value = mock_response
+    mock_http.request.return_value = mock_response
     
     # Create client
-    client = ReverbClient(api_key="test_key")
+    client = ReverbClient(api_key="test_key", http_client=mock_http)
     
     # Test the error handling
     with pytest.raises(ReverbAPIError) as exc_info:
@@ -109,13 +117,12 @@ async def test_reverb_api_error_handling(mocker):
 @pytest.mark.asyncio
 async def test_reverb_network_error(mocker):
     """Test proper handling of network errors"""
-    # Mock the AsyncClient request to raise a RequestError
-    mock_client = mocker.patch("httpx.AsyncClient")
-    mock_client.return_value.__aenter__.return_value.request.side_effect = \
-        httpx.RequestError("Connection failed")
+    # Mock the pooled client's request to raise a RequestError
+    mock_http = _mock_http_client(mocker)
+    mock_http.request.side_effect = httpx.RequestError("Connection failed")
     
     # Create client
-    client = ReverbClient(api_key="test_key")
+    client = ReverbClient(api_key="test_key", http_client=mock_http)
     
     # Test the error handling
     with pytest.raises(ReverbAPIError) as exc_info:
@@ -129,13 +136,12 @@ async def test_reverb_network_error(mocker):
 @pytest.mark.asyncio
 async def test_reverb_timeout_error(mocker):
     """Test proper handling of timeout errors"""
-    # Mock the AsyncClient request to raise a TimeoutException
-    mock_client = mocker.patch("httpx.AsyncClient")
-    mock_client.return_value.__aenter__.return_value.request.side_effect = \
-        httpx.TimeoutException("Request timed out")
+    # Mock the pooled client's request to raise a TimeoutException
+    mock_http = _mock_http_client(mocker)
+    mock_http.request.side_effect = httpx.TimeoutException("Request timed out")
     
     # Create client
-    client = ReverbClient(api_key="test_key")
+    client = ReverbClient(api_key="test_key", http_client=mock_http)
     
     # Test the error handling
     with pytest.raises(ReverbAPIError) as exc_info:
@@ -145,6 +151,48 @@ async def test_reverb_timeout_error(mocker):
     assert "Request timed out" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_clients_share_pooled_transport():
+    """Separate ReverbClient instances reuse one pooled connection client"""
+    from app.services.reverb.client import close_shared_http_client
+
+    first = ReverbClient(api_key="test_key")
+    second = ReverbClient(api_key="test_key")
+    try:
+        assert first.http_client is second.http_client
+        assert not first.http_client.is_closed
+    finally:
+        shared = first.http_client
+        await close_shared_http_client()
+
+    assert shared.is_closed
+    # A fresh pool is created lazily after shutdown
+    assert ReverbClient(api_key="test_key").http_client is not shared
+    await close_shared_http_client()
+
+
+def test_pool_from_a_previous_loop_is_closed():
+    """A new event loop gets a new pool and the old loop's pool is closed"""
+    from app.services.reverb.client import close_shared_http_client, get_shared_http_client
+
+    async def get_client():
+        return get_shared_http_client()
+
+    async def replace_client():
+        client = get_shared_http_client()
+        await asyncio.sleep(0.01)  # let the old pool's close task run
+        return client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(replace_client())
+    try:
+        assert second is not first
+        assert first.is_closed
+        assert not second.is_closed
+    finally:
+        asyncio.run(close_shared_http_client())
+
+
 @pytest.mark.asyncio
 async def test_create_listing(mocker):
     """Test creating a listing on Reverb"""
@@ -339,6 +387,84 @@ async def test_get_all_listings_pagination(mocker):
     # mock_get_listings.assert_any_call(page=2, per_page=50)
 
 
+@pytest.mark.asyncio
+async def test_iter_listing_pages_fetches_remaining_pages_concurrently(mocker):
+    """Page 1 gives the total; later pages are all requested and streamed"""
+    async def fake_get_my_listings(page=1, per_page=50, state="all", updated_start_date=None):
+        return {"listings": [{"id": f"{page}-{i}"} for i in range(2)], "total": 6}
+
+    mock_get_listings = mocker.patch.object(
+        ReverbClient, "get_my_listings", side_effect=fake_get_my_listings
+    )
+
+    client = ReverbClient(api_key="test_key")
+    pages = [page async for page, _ in client.iter_listing_pages(state="live", per_page=2)]
+
+    assert pages[0] == 1
+    assert sorted(pages) == [1, 2, 3]
+    mock_get_listings.assert_any_call(page=3, per_page=2, state="live", updated_start_date=None)
+
+    listings = await client.get_all_listings(state="live")
+    assert [listing["id"] for listing in listings][:2] == ["1-0", "1-1"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_listings_detailed_pipelines_details(mocker):
+    """Details are fetched for every listing, falling back to the basic listing on error"""
+    async def fake_get_my_listings(page=1, per_page=50, state="all", updated_start_date=None):
+        if page == 1:
+            return {"listings": [{"id": i} for i in range(1, 51)], "total": 75}
+        return {"listings": [{"id": i} for i in range(51, 76)], "total": 75}
+
+    async def fake_get_listing_details(listing_id):
+        if listing_id == "7":
+            raise ReverbAPIError("boom")
+        return {"id": int(listing_id), "detailed": True}
+
+    mocker.patch.object(ReverbClient, "get_my_listings", side_effect=fake_get_my_listings)
+    mocker.patch.object(ReverbClient, "get_listing_details", side_effect=fake_get_listing_details)
+
+    client = ReverbClient(api_key="test_key")
+    listings = await client.get_all_listings_detailed(max_concurrent=4)
+
+    assert sorted(listing["id"] for listing in listings) == list(range(1, 76))
+    assert sum(1 for listing in listings if listing.get("detailed")) == 74
+
+
+@pytest.mark.asyncio
+async def test_iter_all_listings_detailed_stops_cleanly_on_early_exit(mocker):
+    """Breaking out of the stream must not leave the producer blocked on the full queue"""
+    async def fake_get_my_listings(page=1, per_page=50, state="all", updated_start_date=None):
+        return {"listings": [{"id": (page - 1) * 50 + i} for i in range(1, 51)], "total": 200}
+
+    async def fake_get_listing_details(listing_id):
+        return {"id": int(listing_id), "detailed": True}
+
+    mocker.patch.object(ReverbClient, "get_my_listings", side_effect=fake_get_my_listings)
+    mocker.patch.object(ReverbClient, "get_listing_details", side_effect=fake_get_listing_details)
+
+    client = ReverbClient(api_key="test_key")
+    seen = []
+    stream = client.iter_all_listings_detailed(max_concurrent=2)
+
+    async def consume():
+        try:
+            async for listing in stream:
+                seen.append(listing)
+                if len(seen) == 3:
+                    break
+        finally:
+            # Close explicitly rather than leaving the generator to the garbage collector
+            await stream.aclose()
+
+    await asyncio.wait_for(consume(), timeout=5)
+
+    assert len(seen) == 3
+    assert all(listing["detailed"] for listing in seen)
+    # The producer and workers have all finished, none is left blocked on a queue
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+
 @pytest.mark.asyncio
 async def test_end_listing(mocker):
     """Test ending a listing on Reverb"""
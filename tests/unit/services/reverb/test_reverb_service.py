@@ -474,3 +474,58 @@ async def test_reverb_get_listing_details(db_session, mocker):
     
     # Verify client was called correctly - use get_listing instead of get_listing_details
     mock_client.get_listing.assert_called_once_with("test-123")    
+
+"""
+Incremental Sync Tests
+"""
+
+@pytest.mark.asyncio
+async def test_reverb_incremental_sync_uses_watermark(mocker):
+    """Delta sync only fetches listings updated since the watermark and reads state from the payload"""
+    from datetime import timedelta
+    from app.models.sync_watermark import SyncWatermark
+
+    db = mocker.AsyncMock()
+    settings = mocker.MagicMock()
+    settings.REVERB_FULL_RECONCILE_HOURS = 24
+    settings.REVERB_SYNC_WATERMARK_OVERLAP_MINUTES = 10
+
+    service = ReverbService(db, settings)
+    service.client = mocker.MagicMock(spec=ReverbClient)
+    service.client.get_all_listings = AsyncMock(return_value=[
+        {"id": 101, "state": {"slug": "live"}, "title": "New Strat", "price": {"amount": "900.00"}, "photos": []},
+        {"id": 202, "state": {"slug": "sold"}, "title": "Sold Les Paul"},
+    ])
+    service.client.get_listing_details = AsyncMock()
+
+    watermark_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    watermark = SyncWatermark(
+        platform_name="reverb",
+        watermark_at=watermark_at,
+        last_full_sync_at=datetime.now(timezone.utc) - timedelta(hours=2),
+    )
+    mocker.patch("app.services.reverb_service.get_sync_watermark", AsyncMock(return_value=watermark))
+    save_watermark = mocker.patch("app.services.reverb_service.save_sync_watermark", AsyncMock())
+    service._fetch_local_live_reverb_ids = AsyncMock(return_value={
+        "202": {"product_id": 7, "platform_common_id": 70, "platform_status": "active", "reverb_state": "live"},
+    })
+    service._batch_log_events = AsyncMock()
+
+    result = await service.run_import_process("run-1", incremental=True)
+
+    assert result["status"] == "success"
+    assert result["mode"] == "incremental"
+    service.client.get_all_listings.assert_awaited_once_with(
+        state="all", updated_start_date=watermark_at - timedelta(minutes=10), on_page=mocker.ANY
+    )
+    assert callable(service.client.get_all_listings.await_args.kwargs["on_page"])
+    service._fetch_local_live_reverb_ids.assert_awaited_once_with(external_ids=["101", "202"])
+    service.client.get_listing_details.assert_not_called()
+
+    events = {event["external_id"]: event for event in service._batch_log_events.call_args.args[0]}
+    assert events["101"]["change_type"] == "new_listing"
+    assert events["202"]["change_type"] == "status_change"
+    assert events["202"]["change_data"]["new"] == "sold"
+
+    assert save_watermark.await_args.kwargs["full_sync"] is False
+    db.commit.assert_awaited_once()
@@ -0,0 +1,132 @@
+# Async Shopify client unit tests
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from app.services.shopify import client as shopify_client_module
+from app.services.shopify.async_client import AsyncShopifyGraphQLClient, ShopifyCostBucket
+
+
+@pytest.fixture
+def shopify_settings(mocker):
+    settings = MagicMock()
+    settings.SHOPIFY_SHOP_URL = "test-shop.myshopify.com"
+    settings.SHOPIFY_ADMIN_API_ACCESS_TOKEN = "test_token"
+    settings.SHOPIFY_API_VERSION = "2024-01"
+    mocker.patch.object(shopify_client_module, "get_settings", return_value=settings)
+    return settings
+
+
+def _response(data, available=1900.0, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.raise_for_status.return_value = None
+    response.json.return_value = {
+        "data": data,
+        "extensions": {
+            "cost": {
+                "throttleStatus": {
+                    "maximumAvailable": 2000.0,
+                    "currentlyAvailable": available,
+                    "restoreRate": 100.0,
+                }
+            }
+        },
+    }
+    return response
+
+
+@pytest.mark.asyncio
+async def test_bucket_adopts_throttle_status():
+    """Settling a response resynchronises the bucket with Shopify's figures"""
+    bucket = ShopifyCostBucket(maximum_available=1000.0, restore_rate=50.0)
+    await bucket.acquire(10)
+    bucket.settle(10, {"cost": {"throttleStatus": {
+        "maximumAvailable": 2000.0, "currentlyAvailable": 1500.0, "restoreRate": 100.0,
+    }}})
+
+    assert bucket.maximum_available == 2000.0
+    assert bucket.restore_rate == 100.0
+    assert bucket.currently_available == 1500.0
+
+
+def test_shared_bucket_works_across_event_loops():
+    """A bucket contended on one loop can still be used from a later loop"""
+    bucket = ShopifyCostBucket(safety_buffer_percentage=0)
+
+    async def contended_acquire():
+        # Hold the lock so the acquire has to wait on it (binding it to this loop)
+        async with bucket._lock:
+            waiter = asyncio.create_task(bucket.acquire(10))
+            await asyncio.sleep(0)
+        await waiter
+
+    asyncio.run(contended_acquire())
+    asyncio.run(contended_acquire())
+
+    assert bucket._in_flight == 20
+
+
+@pytest.mark.asyncio
+async def test_bucket_waits_without_blocking_loop(mocker):
+    """A drained bucket sleeps via asyncio rather than time.sleep"""
+    bucket = ShopifyCostBucket(maximum_available=1000.0, restore_rate=100.0, safety_buffer_percentage=0)
+    bucket.drain()
+    sleep_mock = mocker.patch("app.services.shopify.async_client.asyncio.sleep")
+
+    async def _refill(_seconds):
+        bucket.currently_available = bucket.maximum_available
+
+    sleep_mock.side_effect = _refill
+    await bucket.acquire(50)
+
+    assert sleep_mock.await_count == 1
+    assert sleep_mock.await_args.args[0] == pytest.approx(0.5, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_bridged_method_uses_async_transport(shopify_settings):
+    """Sync method bodies run off-loop while their GraphQL calls go through httpx"""
+    http_client = MagicMock(spec=httpx.AsyncClient)
+
+    async def _post(url, headers=None, json=None):
+        return _response({"productsCount": {"count": 42}})
+
+    http_client.post.side_effect = _post
+    client = AsyncShopifyGraphQLClient(bucket=ShopifyCostBucket(), http_client=http_client)
+
+    counts = await asyncio.gather(client.get_products_count(), client.get_products_count())
+
+    assert counts == [42, 42]
+    assert http_client.post.call_count == 2
+    assert client.bucket.currently_available == pytest.approx(1900.0, abs=1.0)
+
+
+@pytest.mark.asyncio
+async def test_throttled_query_is_retried(shopify_settings, mocker):
+    """THROTTLED GraphQL errors drain the bucket and retry instead of failing"""
+    mocker.patch("app.services.shopify.async_client.asyncio.sleep")
+    throttled = _response(None, available=0.0)
+    throttled.json.return_value["errors"] = [{"message": "Throttled", "extensions": {"code": "THROTTLED"}}]
+    ok = _response({"shop": {"name": "Test"}})
+
+    http_client = MagicMock(spec=httpx.AsyncClient)
+    responses = iter([throttled, ok])
+
+    async def _post(url, headers=None, json=None):
+        return next(responses)
+
+    http_client.post.side_effect = _post
+    bucket = ShopifyCostBucket(safety_buffer_percentage=0)
+    client = AsyncShopifyGraphQLClient(bucket=bucket, http_client=http_client, safety_buffer_percentage=0)
+
+    # Refill instantly so the retry can proceed
+    mocker.patch.object(bucket, "drain")
+    data = await client.execute("{ shop { name } }")
+
+    assert data == {"shop": {"name": "Test"}}
+    assert http_client.post.call_count == 2
+    bucket.drain.assert_called_once()
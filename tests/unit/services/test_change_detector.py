@@ -0,0 +1,252 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.enums import SyncStatus
+from app.models.platform_common import PlatformCommon
+from app.models.product import Product
+from app.services.sync_services import ChangeDetector, VRMatchIndex
+
+
+def _vr_row(external_id, brand, model, sku=""):
+    return {
+        'external_id': external_id,
+        'brand_name': brand,
+        'product_model_name': model,
+        'sku': sku,
+        'product_price': '0',
+    }
+
+
+@pytest.mark.asyncio
+async def test_suggest_vr_match_uses_prebuilt_index():
+    """Scoring runs against the in-memory index without touching the database"""
+    db = MagicMock()
+    db.execute = AsyncMock()
+    detector = ChangeDetector(db)
+
+    strat = Product(id=1, sku="RIFF-1", brand="Fender", model="Stratocaster", year=1965)
+    tele = Product(id=2, sku="RIFF-2", brand="Fender", model="Telecaster")
+    synced = Product(id=3, sku="RIFF-3", brand="Fender", model="Stratocaster")
+    synced_pc = PlatformCommon(product_id=3, platform_name="vr", sync_status=SyncStatus.SYNCED.value)
+    index = VRMatchIndex(
+        by_sku={},
+        by_brand={"fender": [(strat, None), (tele, None), (synced, synced_pc)]},
+        other_platform_counts={1: 2},
+    )
+
+    row = _vr_row("900", "Fender", "Stratocaster")
+    row['product_year'] = "1965"
+    match = await detector._suggest_vr_match(row, index)
+
+    assert match["product"] is strat
+    assert "model" in match["reason"] and "platform_gap" in match["reason"]
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_detect_new_listings_batches_vr_lookups(mocker):
+    """Hundreds of rogue V&R rows cost a fixed number of queries"""
+    db = MagicMock()
+    detector = ChangeDetector(db)
+    detector._known_old_listing_ids = AsyncMock(return_value={"5"})
+    detector._build_vr_match_index = AsyncMock(
+        return_value=VRMatchIndex(by_sku={}, by_brand={}, other_platform_counts={})
+    )
+
+    platform_lookup = {str(i): _vr_row(str(i), "Gibson", f"Model {i}") for i in range(300)}
+    changes = await detector._detect_new_listings("vr", platform_lookup, local_lookup={"0": {}})
+
+    detector._known_old_listing_ids.assert_awaited_once()
+    detector._build_vr_match_index.assert_awaited_once()
+    assert len(changes) == 298  # one already local, one known old listing
+    assert all(change.change_type == "new_listing" for change in changes)
+
+
+@pytest.mark.asyncio
+async def test_inbound_scheduler_runs_platforms_concurrently(mocker, mock_session_factory, concurrency_probe):
+    """Platforms fetch in parallel, each on its own session, with per-phase timings"""
+    from datetime import datetime
+    from app.services.sync_services import InboundSyncScheduler, SyncReport
+
+    async def fake_fetch(platform, db=None):
+        async with concurrency_probe.track():
+            if platform == "vr":
+                raise RuntimeError("V&R login failed")
+            return [{"external_id": f"{platform}-1"}]
+
+    async def fake_detect(self, platform, platform_data):
+        return SyncReport(platform, datetime.now(), len(platform_data), 0, [], [], 0.0)
+
+    mocker.patch.object(ChangeDetector, "detect_platform_changes", fake_detect)
+    scheduler = InboundSyncScheduler(MagicMock(), session_factory=mock_session_factory)
+    scheduler._fetch_platform_data = fake_fetch
+
+    combined = await scheduler.run_all_platforms_concurrently()
+
+    assert concurrency_probe.peak["all"] == 4
+    assert len(mock_session_factory.sessions) == 4
+    assert combined.reports["reverb"].total_platform_items == 1
+    assert combined.reports["vr"].errors == ["Platform sync failed: V&R login failed"]
+    assert combined.reports["vr"].changes_detected == []
+    assert set(combined.phase_timings["ebay"]) == {"fetch", "detect"}
+    assert combined.total_seconds < combined.sequential_seconds
+
+
+@pytest.mark.asyncio
+async def test_detect_platform_changes_single_pass_with_timings():
+    """Status, price and title diffs come from one pass; each detector reports its time"""
+    detector = ChangeDetector(MagicMock())
+    detector._get_local_platform_data = AsyncMock(return_value=[
+        {'external_id': '1', 'product_id': 1, 'sku': 'RIFF-1', 'status': 'active',
+         'reverb_state': 'live', 'list_price': 1000, 'title': 'Fender Strat'},
+        {'external_id': '2', 'product_id': 2, 'sku': 'RIFF-2', 'status': 'active',
+         'reverb_state': 'live', 'list_price': 500, 'title': 'Gibson SG'},
+        {'external_id': '3', 'product_id': 3, 'sku': 'RIFF-3', 'status': 'active',
+         'reverb_state': 'live', 'list_price': 800, 'title': 'Gretsch'},
+    ])
+    detector._known_old_listing_ids = AsyncMock(return_value=set())
+    platform_data = [
+        {'external_id': '1', 'state': {'slug': 'sold'}, 'price': {'amount': '1000'}, 'title': 'Fender Strat'},
+        {'external_id': '2', 'state': {'slug': 'live'}, 'price': {'amount': '450'}, 'title': 'Gibson SG Standard'},
+        {'external_id': '4', 'state': {'slug': 'live'}, 'price': {'amount': '300'}, 'title': 'New pedal'},
+    ]
+
+    report = await detector.detect_platform_changes("reverb", platform_data)
+
+    assert report.errors == []
+    assert [(c.change_type, c.external_id) for c in report.changes_detected] == [
+        ("status_change", "1"),
+        ("price_change", "2"),
+        ("title_change", "2"),
+        ("new_listing", "4"),
+        ("removed_listing", "3"),
+    ]
+    assert set(report.detector_timings) == {
+        "load_local", "status", "price", "content", "new_listings", "removed_listings",
+    }
+    detector._known_old_listing_ids.assert_awaited_once_with("reverb", ["4"])
+
+
+def _local_row(external_id, product_id, sku, status="active", **extra):
+    return {
+        'external_id': external_id, 'product_id': product_id, 'status': status,
+        'sku': sku, 'title': f"{external_id} title", 'base_price': None, **extra,
+    }
+
+
+@pytest.fixture
+def detection_scheduler(mocker):
+    """InboundSyncScheduler whose ChangeDetector reads canned local rows instead of the database"""
+    from app.services.sync_services import InboundSyncScheduler
+
+    local_rows = {}
+
+    async def fake_local_data(self, platform):
+        return local_rows[platform]
+
+    mocker.patch.object(ChangeDetector, "_get_local_platform_data", fake_local_data)
+    mocker.patch.object(ChangeDetector, "_known_old_listing_ids", AsyncMock(return_value=set()))
+    mocker.patch.object(ChangeDetector, "_build_vr_match_index", AsyncMock(
+        return_value=VRMatchIndex(by_sku={}, by_brand={}, other_platform_counts={})
+    ))
+    scheduler = InboundSyncScheduler(MagicMock())
+    return scheduler, local_rows
+
+
+def _changes_by_id(report):
+    return {(change.external_id, change.change_type): change for change in report.changes_detected}
+
+
+@pytest.mark.asyncio
+async def test_ebay_detection_uses_all_selling_lists(mocker, detection_scheduler):
+    """GetMyeBaySelling lists are fetched and mapped onto the eBay detector fields"""
+    scheduler, local_rows = detection_scheduler
+    selling = {
+        "active": [{"ItemID": "111", "Title": "111 title", "SellingStatus": {"CurrentPrice": {"#text": "950.0"}}}],
+        "sold": [{"ItemID": "222", "Title": "222 title", "SellingStatus": {"CurrentPrice": {"#text": "500.0"}}}],
+        "unsold": [],
+    }
+    fetch = mocker.patch(
+        "app.services.ebay.trading.EbayTradingLegacyAPI.get_all_selling_listings",
+        AsyncMock(return_value=selling),
+    )
+    local_rows["ebay"] = [
+        _local_row("111", 1, "RIFF-1", listing_status="ACTIVE", price=1000.0),
+        _local_row("222", 2, "RIFF-2", listing_status="ACTIVE", price=500.0),
+        _local_row("333", 3, "RIFF-3", listing_status="ACTIVE", price=100.0),
+    ]
+
+    report = await scheduler.run_platform_sync("ebay")
+
+    fetch.assert_awaited_once_with(include_details=True, concurrent=True)
+    changes = _changes_by_id(report)
+    assert report.errors == []
+    assert report.total_platform_items == 2
+    assert changes[("111", "price_change")].new_value == 950.0
+    assert changes[("222", "status_change")].new_value == "SOLD"
+    assert ("333", "removed_listing") in changes
+    assert len(changes) == 3
+
+
+@pytest.mark.asyncio
+async def test_vr_detection_reads_the_inventory_csv(mocker, detection_scheduler):
+    """CSV rows are keyed by product_id with a vr_state, and empty cells don't read as 'nan'"""
+    pd = pytest.importorskip("pandas")
+    scheduler, local_rows = detection_scheduler
+    inventory = pd.DataFrame([
+        {"product_id": 900, "product_sold": "yes", "brand_name": "Fender", "product_model_name": None},
+        {"product_id": 901, "product_sold": "no", "brand_name": "Gibson", "product_model_name": "SG"},
+    ])
+    mocker.patch(
+        "app.services.vintageandrare.client.VintageAndRareClient.authenticate", AsyncMock(return_value=True)
+    )
+    mocker.patch(
+        "app.services.vintageandrare.client.VintageAndRareClient.download_inventory_dataframe",
+        AsyncMock(return_value=inventory),
+    )
+    local_rows["vr"] = [_local_row("900", 1, "RIFF-1", vr_state="active")]
+
+    platform_data = await scheduler._fetch_platform_data("vr")
+    assert platform_data[0]["product_model_name"] is None
+    report = await scheduler.run_platform_sync("vr")
+
+    changes = _changes_by_id(report)
+    assert report.errors == []
+    assert changes[("900", "status_change")].new_value == "sold"
+    assert changes[("901", "new_listing")].product_id is None
+    assert len(changes) == 2
+
+
+@pytest.mark.asyncio
+async def test_vr_detection_fails_rather_than_reporting_everything_removed(mocker, detection_scheduler):
+    scheduler, local_rows = detection_scheduler
+    mocker.patch(
+        "app.services.vintageandrare.client.VintageAndRareClient.authenticate", AsyncMock(return_value=True)
+    )
+    mocker.patch(
+        "app.services.vintageandrare.client.VintageAndRareClient.download_inventory_dataframe",
+        AsyncMock(return_value="RETRY_NEEDED"),
+    )
+    local_rows["vr"] = [_local_row("900", 1, "RIFF-1", vr_state="active")]
+
+    report = await scheduler.run_platform_sync("vr")
+
+    assert report.changes_detected == []
+    assert "timed out" in report.errors[0]
+
+
+@pytest.mark.asyncio
+async def test_reverb_detection_matches_numeric_listing_ids(mocker, detection_scheduler):
+    """Reverb's integer ids line up with the text external_ids stored locally"""
+    scheduler, local_rows = detection_scheduler
+    mocker.patch(
+        "app.services.reverb.client.ReverbClient.get_all_listings_detailed",
+        AsyncMock(return_value=[{"id": 555, "state": {"slug": "sold"}, "price": {"amount": "1200.00"}}]),
+    )
+    local_rows["reverb"] = [_local_row("555", 1, "REV-555", reverb_state="live", list_price=1200.0)]
+
+    report = await scheduler.run_platform_sync("reverb")
+
+    changes = _changes_by_id(report)
+    assert report.errors == []
+    assert list(changes) == [("555", "status_change")]
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services import dashboard_snapshot
+from app.services.dashboard_snapshot import DashboardSnapshotCache, _bucket_counts
+
+
+def test_bucket_counts_match_platform_status_maps():
+    ebay = _bucket_counts("ebay", [("Active", 5), ("completed", 2), (None, 1), ("Scheduled", 3), ("weird", 4)])
+
+    assert ebay == {
+        "count": 5,
+        "sold_count": 2,
+        "ended_count": 1,
+        "archived_count": 0,
+        "draft_count": 3,
+        "other_count": 4,
+        "total": 15,
+    }
+    vr = _bucket_counts("vr", [("removed", 2), ("published", 1), ("pending", 1)])
+    assert (vr["ended_count"], vr["archived_count"], vr["draft_count"]) == (2, 1, 1)
+    assert _bucket_counts("reverb", [])["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_shares_builds_and_rebuilds_after_invalidation(mocker):
+    calls = []
+
+    async def build(session_factory):
+        calls.append(session_factory)
+        await asyncio.sleep(0)
+        return {"build": len(calls)}
+
+    mocker.patch.object(dashboard_snapshot, "build_dashboard_snapshot", AsyncMock(side_effect=build))
+    cache = DashboardSnapshotCache(session_factory="factory", ttl_seconds=60)
+
+    first, second = await asyncio.gather(cache.get(), cache.get())
+    assert first == second == {"build": 1}
+    assert await cache.get() == {"build": 1}
+
+    cache.invalidate()
+    assert await cache.get() == {"build": 2}
+    assert calls == ["factory", "factory"]
+
+
+@pytest.mark.asyncio
+async def test_expired_snapshot_is_served_while_refreshing(mocker):
+    release = asyncio.Event()
+    builds = iter([{"build": 1}, {"build": 2}])
+
+    async def build(session_factory):
+        snapshot = next(builds)
+        if snapshot["build"] == 2:
+            await release.wait()
+        return snapshot
+
+    mocker.patch.object(dashboard_snapshot, "build_dashboard_snapshot", AsyncMock(side_effect=build))
+    cache = DashboardSnapshotCache(ttl_seconds=0)
+
+    assert await cache.get() == {"build": 1}
+    assert await cache.get() == {"build": 1}
+
+    release.set()
+    await cache._refresh_task
+    assert cache._snapshot == {"build": 2}
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_build_is_not_overwritten(mocker):
+    cache = DashboardSnapshotCache(ttl_seconds=60)
+
+    async def build(session_factory):
+        cache.invalidate()
+        return {"stale": True}
+
+    mocker.patch.object(dashboard_snapshot, "build_dashboard_snapshot", AsyncMock(side_effect=build))
+
+    assert await cache.get() == {"stale": True}
+    assert cache._snapshot is None
+
+
+@pytest.mark.parametrize("platform", ["ebay", "reverb", "shopify", "vr"])
+@pytest.mark.asyncio
+async def test_platform_sync_invalidates_the_snapshot_once(mocker, platform):
+    """Each sync route drops the snapshot (and queues its NOTIFY) exactly once before committing"""
+    import importlib
+    import uuid
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    routes = importlib.import_module(f"app.routes.platforms.{platform}")
+    service_name, result, run = {
+        "ebay": ("EbayService", {"api_errors": 1}, lambda db: routes.run_ebay_sync_background(
+            db=db, settings=MagicMock(), sync_run_id=uuid.uuid4())),
+        "reverb": ("ReverbService", {"status": "error"}, lambda db: routes.run_reverb_sync_background(
+            api_key="key", db=db, settings=MagicMock(), sync_run_id=uuid.uuid4())),
+        "shopify": ("ShopifyService", {"status": "error"}, lambda db: routes.run_shopify_sync_background(
+            db=db, settings=MagicMock(), sync_run_id=uuid.uuid4())),
+        "vr": ("VRService", {"status": "error"}, lambda db: routes.run_vr_sync_background(
+            "user", "pass", db, uuid.uuid4())),
+    }[platform]
+
+    service = SimpleNamespace(run_import_process=AsyncMock(return_value=result))
+    mocker.patch.object(routes, service_name, return_value=service)
+    mocker.patch.object(routes, "ActivityLogger", return_value=SimpleNamespace(log_activity=AsyncMock()))
+    mocker.patch.object(routes.manager, "broadcast", AsyncMock())
+    mocker.patch.object(routes, "invalidate_cache_tags", AsyncMock())
+    invalidate = mocker.patch.object(routes, "invalidate_dashboard_snapshot", AsyncMock())
+    db = MagicMock(execute=AsyncMock(), commit=AsyncMock(), rollback=AsyncMock())
+
+    await run(db)
+
+    invalidate.assert_awaited_once_with(db)
+    db.commit.assert_awaited()
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.models.sync_event import SyncEvent
+from app.services import event_processor
+from app.services.event_processor import (
+    EventProcessingResult,
+    partition_events_by_product,
+    process_sync_events_bulk,
+)
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _event(event_id, product_id=None, minutes=0, platform="reverb", external_id=None, change_type="status_change",
+           change_data=None):
+    return SyncEvent(
+        id=event_id,
+        product_id=product_id,
+        platform_name=platform,
+        external_id=external_id or str(event_id),
+        change_type=change_type,
+        change_data=change_data,
+        status="pending",
+        detected_at=T0 + timedelta(minutes=minutes),
+    )
+
+
+def test_partitions_keep_per_product_detection_order():
+    events = [
+        _event(3, product_id=1, minutes=5),
+        _event(1, product_id=1, minutes=0),
+        _event(2, product_id=2, minutes=1),
+        _event(4, platform="ebay", external_id="E1", change_type="new_listing"),
+        _event(5, platform="ebay", external_id="E1", minutes=2),
+    ]
+
+    partitions = partition_events_by_product(events)
+
+    assert [[e.id for e in p] for p in partitions] == [[1, 3], [2], [4, 5]]
+
+
+def test_match_candidate_joins_its_product_partition():
+    """An unmatched listing matched to a product runs in that product's partition"""
+    candidate = {"match_candidate": {"product_id": 7, "sku": "RIFF-7"}}
+    events = [
+        _event(1, product_id=7, minutes=5),
+        _event(2, platform="vr", external_id="V1", change_type="new_listing", change_data=candidate),
+        _event(3, platform="vr", external_id="V1", minutes=1),
+        _event(4, platform="ebay", external_id="E1", change_type="new_listing", change_data={}),
+    ]
+
+    partitions = partition_events_by_product(events)
+
+    assert [[e.id for e in p] for p in partitions] == [[2, 3, 1], [4]]
+
+
+@pytest.mark.asyncio
+async def test_bulk_runs_products_concurrently_and_blocks_after_failure(
+    mocker, mock_session_factory, concurrency_probe,
+):
+    events = [
+        _event(1, product_id=1, minutes=0),
+        _event(2, product_id=1, minutes=1),
+        _event(3, product_id=2, minutes=0),
+        _event(4, product_id=3, minutes=0),
+        _event(5, product_id=2, minutes=3),
+    ]
+    by_id = {event.id: event for event in events}
+    order = []
+
+    async def fake_process(session, event_id, platforms=None, sandbox=False):
+        async with concurrency_probe.track():
+            order.append(event_id)
+            result = EventProcessingResult()
+            result.success = event_id != 3
+            result.message = "boom" if event_id == 3 else "ok"
+            by_id[event_id].status = "processed" if result.success else "error"
+            return result
+
+    mocker.patch.object(event_processor, "process_sync_event", side_effect=fake_process)
+    invalidate = mocker.patch.object(event_processor, "invalidate_cache_tags", AsyncMock())
+    mock_session_factory.rows = events
+
+    summary = await process_sync_events_bulk(
+        [e.id for e in events], concurrency=3, session_factory=mock_session_factory,
+    )
+
+    assert concurrency_probe.peak["all"] == 3
+    assert order.index(1) < order.index(2)
+    assert sorted(summary.processed) == [1, 2, 4]
+    assert summary.failed == [3]
+    assert summary.blocked == [5]
+    assert summary.to_dict()["errors"] == {3: "boom"}
+    assert invalidate.await_args.args == ("sync_events", "products")
+    # The failed event is rolled back and its blocked successor is left for the next run
+    assert {e.id: e.status for e in events} == {
+        1: "processed", 2: "processed", 3: "error", 4: "processed", 5: "pending",
+    }
+    assert mock_session_factory.rollbacks == 1
+    assert mock_session_factory.sessions[-1].commit.await_count == 1
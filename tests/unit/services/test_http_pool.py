@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.ebay import http_client as ebay_http_client
+from app.services.http_pool import SharedHttpPool
+
+
+def test_pool_reads_limits_from_its_settings_prefix(mocker):
+    mocker.patch(
+        "app.services.http_pool.get_settings",
+        return_value=SimpleNamespace(
+            EBAY_HTTP_MAX_CONNECTIONS=7, EBAY_HTTP_MAX_KEEPALIVE=3, EBAY_HTTP_KEEPALIVE_EXPIRY=12.0,
+        ),
+    )
+    async_client = mocker.patch("app.services.http_pool.httpx.AsyncClient")
+    limits = mocker.patch("app.services.http_pool.httpx.Limits")
+
+    SharedHttpPool("eBay", settings_prefix="EBAY").build()
+
+    limits.assert_called_once_with(max_connections=7, max_keepalive_connections=3, keepalive_expiry=12.0)
+    assert async_client.call_args.kwargs["http2"] is False  # no EBAY_HTTP2 setting
+
+
+def test_ebay_pool_from_a_previous_loop_is_closed():
+    """Like the Reverb pool, a new event loop gets a new eBay pool and the old one is closed"""
+
+    async def get_client():
+        return ebay_http_client.get_shared_http_client()
+
+    async def replace_client():
+        client = ebay_http_client.get_shared_http_client()
+        await asyncio.sleep(0.01)  # let the old pool's close task run
+        return client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(replace_client())
+    try:
+        assert second is not first
+        assert first.is_closed
+        assert not second.is_closed
+    finally:
+        asyncio.run(ebay_http_client.close_shared_http_client())
+
+
+@pytest.mark.asyncio
+async def test_same_loop_reuses_the_pool_until_closed():
+    pool = SharedHttpPool("Reverb", settings_prefix="REVERB")
+    first = pool.get()
+    assert pool.get() is first
+
+    await pool.close()
+    assert first.is_closed
+    second = pool.get()
+    assert second is not first
+    await pool.close()
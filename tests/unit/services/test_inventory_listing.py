@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.enums import ProductStatus
+from app.models.product import Product
+from app.services.inventory_listing import (
+    FACETS_KEY,
+    InvalidCursor,
+    apply_keyset,
+    decode_cursor,
+    encode_cursor,
+    filter_cache_key,
+    get_inventory_counts,
+)
+
+
+def test_cursor_round_trips_for_each_sort():
+    product = SimpleNamespace(
+        id=42,
+        created_at=datetime(2026, 10, 1, 12, 30),
+        brand=None,
+        base_price=1299.5,
+        status=ProductStatus.ACTIVE,
+    )
+
+    assert decode_cursor(encode_cursor(product, "created_at"), "created_at") == (datetime(2026, 10, 1, 12, 30), 42)
+    assert decode_cursor(encode_cursor(product, "brand"), "brand") == ("", 42)
+    assert decode_cursor(encode_cursor(product, "price"), "price") == (1299.5, 42)
+    assert decode_cursor(encode_cursor(product, "status"), "status") == (ProductStatus.ACTIVE, 42)
+    with pytest.raises(InvalidCursor):
+        decode_cursor(encode_cursor(product, "brand"), "created_at")
+
+
+def test_keyset_seeks_on_sort_value_and_id():
+    def sql(query):
+        return str(query.compile(dialect=postgresql.dialect())).replace("\n", " ")
+
+    forward = sql(apply_keyset(select(Product), "brand", False, ("Fender", 10)))
+    assert "(coalesce(products.brand, ''), products.id) > (" in forward
+    assert forward.endswith("ORDER BY coalesce(products.brand, ''), products.id")
+
+    # "Previous" from a newest-first page walks oldest-first from the cursor
+    backwards = sql(apply_keyset(select(Product), "created_at", True, (datetime(2026, 1, 1), 10), backwards=True))
+    assert "(products.created_at, products.id) > (" in backwards
+    assert backwards.endswith("ORDER BY products.created_at, products.id")
+
+
+def test_filter_cache_key_ignores_empty_filters():
+    assert filter_cache_key(brand="Fender", search=None) == filter_cache_key(search="", brand="Fender")
+    assert filter_cache_key(brand="Fender") != filter_cache_key(brand="fender")
+
+
+@pytest.mark.asyncio
+async def test_fresh_cache_rows_skip_counting(mocker):
+    mocker.patch(
+        "app.services.inventory_listing.get_settings",
+        return_value=SimpleNamespace(INVENTORY_COUNTS_CACHE_SECONDS=120),
+    )
+    key = filter_cache_key(brand="Fender")
+    now = datetime.utcnow()
+    cached = [
+        SimpleNamespace(filter_key=key, facet="total", value="", count=7, refreshed_at=now),
+        SimpleNamespace(filter_key=FACETS_KEY, facet="products", value="", count=9, refreshed_at=now),
+        SimpleNamespace(filter_key=FACETS_KEY, facet="category", value="Amps", count=2, refreshed_at=now),
+        SimpleNamespace(filter_key=FACETS_KEY, facet="category", value="Guitars", count=7, refreshed_at=now),
+        SimpleNamespace(filter_key=FACETS_KEY, facet="brand", value="Gibson", count=4, refreshed_at=now),
+        SimpleNamespace(filter_key=FACETS_KEY, facet="brand", value="Fender", count=5, refreshed_at=now),
+        SimpleNamespace(filter_key=FACETS_KEY, facet="status", value="ACTIVE", count=9, refreshed_at=now),
+    ]
+    result = MagicMock()
+    result.fetchall.return_value = cached
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+
+    counts = await get_inventory_counts(db, key, select(Product))
+
+    assert counts == {
+        "total": 7,
+        "categories": [("Guitars", 7), ("Amps", 2)],
+        "brands": [("Fender", 5), ("Gibson", 4)],
+        "status_counts": {"active": 9},
+    }
+    db.execute.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stale_total_is_recounted_and_stored(mocker):
+    mocker.patch(
+        "app.services.inventory_listing.get_settings",
+        return_value=SimpleNamespace(INVENTORY_COUNTS_CACHE_SECONDS=120),
+    )
+    key = filter_cache_key(search="strat")
+    stale = datetime.utcnow() - timedelta(minutes=10)
+    fresh = datetime.utcnow()
+    cache_rows = MagicMock()
+    cache_rows.fetchall.return_value = [
+        SimpleNamespace(filter_key=key, facet="total", value="", count=3, refreshed_at=stale),
+        SimpleNamespace(filter_key=FACETS_KEY, facet="products", value="", count=9, refreshed_at=fresh),
+    ]
+    count_result = MagicMock()
+    count_result.scalar_one.return_value = 4
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[cache_rows, count_result, MagicMock(), MagicMock()])
+    db.commit = AsyncMock()
+
+    counts = await get_inventory_counts(db, key, select(Product))
+
+    assert counts["total"] == 4
+    stored = [call for call in db.execute.await_args_list if "INSERT INTO inventory_count_cache" in str(call.args[0])]
+    assert len(stored) == 1
+    assert key in stored[0].args[1]["rows"]
+    db.commit.assert_awaited_once()
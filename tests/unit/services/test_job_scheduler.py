@@ -0,0 +1,176 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.job_scheduler import JobRunner, ScheduledJob, OVERLAP_COALESCE
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield None
+
+
+def _runner(jobs, **kwargs):
+    settings = SimpleNamespace(
+        SCHEDULER_MAX_CONCURRENT_JOBS=4, SCHEDULER_MAX_JOBS_PER_PLATFORM=1, SCHEDULER_RESERVED_PRIORITY_SLOTS=1
+    )
+    return JobRunner(jobs, settings, session_factory=_fake_session, **kwargs)
+
+
+def _make_due(*jobs):
+    now = datetime.now(timezone.utc)
+    for job in jobs:
+        job.next_run = now - timedelta(seconds=5)
+    return now
+
+
+@pytest.mark.asyncio
+async def test_due_jobs_run_concurrently_within_platform_limit():
+    """Different platforms overlap; jobs on the same platform wait for a slot"""
+    running = set()
+    peak = {"reverb": 0, "total": 0}
+
+    def job_coro(platform):
+        async def run(db, settings, sync_run_id):
+            running.add((platform, sync_run_id))
+            peak["total"] = max(peak["total"], len(running))
+            peak["reverb"] = max(peak["reverb"], sum(1 for p, _ in running if p == "reverb"))
+            await asyncio.sleep(0.02)
+            running.discard((platform, sync_run_id))
+        return run
+
+    jobs = [
+        ScheduledJob("reverb_sync", 60, job_coro("reverb"), platform="reverb"),
+        ScheduledJob("reverb_orders", 60, job_coro("reverb"), platform="reverb"),
+        ScheduledJob("ebay_orders", 60, job_coro("ebay"), platform="ebay"),
+        ScheduledJob("vr_sync", 180, job_coro("vr"), platform="vr"),
+    ]
+    runner = _runner(jobs)
+    now = _make_due(*jobs)
+
+    tasks = runner.dispatch_due(now)
+    await asyncio.gather(*tasks)
+
+    assert len(tasks) == 4
+    assert peak["total"] == 3
+    assert peak["reverb"] == 1
+    assert all(job.metrics.runs == 1 and job.metrics.failures == 0 for job in jobs)
+    assert all(job.next_run > now for job in jobs)
+    # The second reverb job queued behind the first, which shows up as lag
+    assert max(job.metrics.last_lag_seconds for job in jobs[:2]) >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_overlapping_runs_are_skipped_or_coalesced():
+    """A job still in flight is skipped, or coalesced into one follow-up run"""
+    release = asyncio.Event()
+    calls = {"sync": 0, "orders": 0}
+
+    def job_coro(key):
+        async def run(db, settings, sync_run_id):
+            calls[key] += 1
+            await release.wait()
+        return run
+
+    sync_job = ScheduledJob("vr_sync", 180, job_coro("sync"), platform="vr")
+    orders_job = ScheduledJob("ebay_orders", 60, job_coro("orders"), platform="ebay", overlap=OVERLAP_COALESCE)
+    runner = _runner([sync_job, orders_job])
+
+    runner.dispatch_due(_make_due(sync_job, orders_job))
+    await asyncio.sleep(0)
+    # Both fall due twice more while the first runs are blocked
+    for _ in range(2):
+        assert runner.dispatch_due(_make_due(sync_job, orders_job)) == []
+
+    assert sync_job.metrics.skipped == 2
+    assert orders_job.metrics.coalesced == 1
+    assert orders_job.metrics.skipped == 1
+
+    first_orders_task = orders_job.task
+    release.set()
+    await sync_job.task
+    await first_orders_task
+    assert orders_job.task is not first_orders_task
+    await orders_job.task
+
+    assert calls == {"sync": 1, "orders": 2}
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_counted_and_next_due_is_exact():
+    async def failing(db, settings, sync_run_id):
+        raise RuntimeError("boom")
+
+    job = ScheduledJob("ebay_stats", 1440, failing, platform="ebay")
+    runner = _runner([job])
+    now = _make_due(job)
+
+    await asyncio.gather(*runner.dispatch_due(now))
+
+    assert job.metrics.failures == 1
+    assert job.metrics.last_duration_seconds is not None
+    assert runner.seconds_until_next_due(now) == pytest.approx((job.next_run - now).total_seconds())
+    assert 0 < runner.seconds_until_next_due(now) <= timedelta(minutes=1440).total_seconds()
+
+
+@pytest.mark.asyncio
+async def test_waiting_on_a_platform_does_not_hold_a_global_slot():
+    """A job queued behind its platform leaves the global slot to other platforms"""
+    release = asyncio.Event()
+    started = []
+
+    def job_coro(name):
+        async def run(db, settings, sync_run_id):
+            started.append(name)
+            await release.wait()
+        return run
+
+    jobs = [
+        ScheduledJob("reverb_sync", 60, job_coro("reverb_sync"), platform="reverb"),
+        ScheduledJob("reverb_stats", 60, job_coro("reverb_stats"), platform="reverb"),
+        ScheduledJob("ebay_sync", 60, job_coro("ebay_sync"), platform="ebay"),
+    ]
+    runner = _runner(jobs, max_concurrent=2, reserved_slots=0)
+
+    tasks = runner.dispatch_due(_make_due(*jobs))
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert sorted(started) == ["ebay_sync", "reverb_sync"]
+    release.set()
+    await asyncio.gather(*tasks)
+    assert len(started) == 3
+
+
+@pytest.mark.asyncio
+async def test_priority_jobs_use_reserved_slots():
+    """Long syncs fill the ordinary slots; an order fetch still starts straight away"""
+    release = asyncio.Event()
+    started = []
+
+    def job_coro(name):
+        async def run(db, settings, sync_run_id):
+            started.append(name)
+            await release.wait()
+        return run
+
+    syncs = [
+        ScheduledJob(f"{platform}_sync", 60, job_coro(f"{platform}_sync"), platform=platform)
+        for platform in ("reverb", "ebay", "shopify")
+    ]
+    orders = ScheduledJob("ebay_orders", 60, job_coro("ebay_orders"), platform="ebay", priority=True)
+    runner = _runner([*syncs, orders], max_concurrent=3, max_per_platform=2)
+
+    tasks = runner.dispatch_due(_make_due(*syncs, orders))
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    # One of the three syncs is held back by the global reserve, not the order fetch
+    assert "ebay_orders" in started
+    assert len(started) == 3
+    release.set()
+    await asyncio.gather(*tasks)
+    assert len(started) == 4
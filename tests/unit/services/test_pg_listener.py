@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.pg_listener import PgNotificationListener
+
+
+def _connection():
+    connection = MagicMock()
+    connection.add_listener = AsyncMock()
+    connection.remove_listener = AsyncMock()
+    connection.close = AsyncMock()
+    connection.is_closed.return_value = False
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_failed_start_is_retried_on_a_later_wait(mocker):
+    """A listener that couldn't connect at startup keeps trying instead of polling forever"""
+    connection = _connection()
+    connect = mocker.patch(
+        "asyncpg.connect", AsyncMock(side_effect=[OSError("connection refused"), connection])
+    )
+    listener = PgNotificationListener(channel="cache", dsn="postgresql://localhost/test", retry_interval=60)
+
+    assert await listener.start() is False
+    # Within the retry interval: still polling, no new attempt
+    assert await listener.wait(0.01) is False
+    assert connect.await_count == 1
+
+    listener.retry_interval = 0
+    # Connected now; wakes the consumer since notifications may have been missed meanwhile
+    assert await listener.wait(0.01) is True
+    assert listener.is_listening
+    assert listener.drain_payloads() == [""]
+    connection.add_listener.assert_awaited_once()
+
+    await listener.close()
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_is_replaced(mocker):
+    dropped, replacement = _connection(), _connection()
+    mocker.patch("asyncpg.connect", AsyncMock(side_effect=[dropped, replacement]))
+    listener = PgNotificationListener(channel="cache", dsn="postgresql://localhost/test", retry_interval=0)
+
+    assert await listener.start() is True
+    dropped.is_closed.return_value = True
+
+    assert await listener.wait(0.01) is True
+    assert listener.is_listening
+    replacement.add_listener.assert_awaited_once()
+
+    await listener.close()
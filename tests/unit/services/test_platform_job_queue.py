@@ -0,0 +1,196 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.platform_job import PlatformJob, PlatformJobPriority, PlatformJobStatus
+from app.services.platform_job_queue import (
+    PLATFORM_JOB_CHANNEL,
+    PlatformThrottle,
+    enqueue_platform_job,
+    mark_platform_job_failed,
+    requeue_stale_platform_jobs,
+    retry_delay_seconds,
+)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_platform_job_upserts_on_idempotency_key_and_notifies():
+    db = MagicMock()
+    inserted = MagicMock()
+    inserted.scalar_one.return_value = 17
+    db.execute = AsyncMock(return_value=inserted)
+
+    job_id = await enqueue_platform_job(
+        db,
+        platform="ebay",
+        action="update_quantity",
+        payload={"platform_common_id": 3},
+        product_id=9,
+        priority=PlatformJobPriority.SALE,
+        idempotency_key="update_quantity:3",
+    )
+
+    assert job_id == 17
+    insert_stmt = db.execute.await_args_list[0].args[0]
+    assert "ON CONFLICT" in str(insert_stmt.compile(dialect=_postgres_dialect()))
+    statement, params = db.execute.await_args_list[-1].args
+    assert "pg_notify" in str(statement)
+    assert params == {"channel": PLATFORM_JOB_CHANNEL, "payload": "17"}
+
+
+def test_retry_delay_is_exponential_and_capped():
+    assert retry_delay_seconds(1, 30, 1800) == 30
+    assert retry_delay_seconds(2, 30, 1800) == 60
+    assert retry_delay_seconds(3, 30, 1800) == 120
+    assert retry_delay_seconds(10, 30, 1800) == 1800
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_requeued_with_backoff_until_max_attempts():
+    db = MagicMock()
+    db.flush = AsyncMock()
+    job = PlatformJob(platform="reverb", action="end_listing", attempts=1, max_attempts=2)
+
+    before = datetime.now(timezone.utc)
+    assert await mark_platform_job_failed(db, job, "429 Too Many Requests", base_delay_seconds=30) is True
+    assert job.status == PlatformJobStatus.QUEUED.value
+    assert (job.run_after - before).total_seconds() >= 29
+
+    job.attempts = 2
+    assert await mark_platform_job_failed(db, job, "429 Too Many Requests") is False
+    assert job.status == PlatformJobStatus.FAILED.value
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_failure_fails_immediately():
+    db = MagicMock()
+    db.flush = AsyncMock()
+    job = PlatformJob(platform="shopify", action="apply_product_update", attempts=1, max_attempts=5)
+
+    assert await mark_platform_job_failed(db, job, "listing gone", retryable=False) is False
+    assert job.status == PlatformJobStatus.FAILED.value
+    assert job.last_error == "listing gone"
+
+
+def test_throttle_limits_in_flight_jobs_per_platform():
+    throttle = PlatformThrottle(rates={}, concurrency={"ebay": 1, "reverb": 2})
+
+    throttle.reserve("ebay")
+    assert throttle.available_platforms(["ebay", "reverb"]) == ["reverb"]
+
+    throttle.release("ebay")
+    assert throttle.has_capacity("ebay")
+
+
+@pytest.mark.asyncio
+async def test_throttle_spaces_job_starts_per_platform():
+    throttle = PlatformThrottle(rates={"vr": 20.0}, concurrency={"vr": 3})
+
+    started = time.monotonic()
+    await asyncio.gather(*(throttle.wait_turn("vr") for _ in range(3)))
+    # Three starts at 20/s: the third waits ~0.1s
+    assert time.monotonic() - started >= 0.09
+
+    # Platforms without a rate are not delayed
+    started = time.monotonic()
+    await throttle.wait_turn("ebay")
+    assert time.monotonic() - started < 0.05
+
+
+# --- Against a real AsyncSession (expiry on rollback matters here) ----------------
+
+@pytest.fixture
+def job_sessions(test_engine):
+    return async_sessionmaker(test_engine, expire_on_commit=False)
+
+
+async def _add_job(sessions, **values):
+    values = {
+        "platform": "reverb",
+        "action": "end_listing",
+        "payload": {},
+        "status": PlatformJobStatus.IN_PROGRESS.value,
+        "attempts": 1,
+        "max_attempts": 3,
+        "last_attempt_at": datetime.now(timezone.utc),
+        **values,
+    }
+    async with sessions() as session:
+        job = PlatformJob(**values)
+        session.add(job)
+        await session.commit()
+        return job.id
+
+
+async def _load_jobs(sessions):
+    async with sessions() as session:
+        return {job.id: job for job in (await session.execute(select(PlatformJob))).scalars()}
+
+
+@pytest.mark.asyncio
+async def test_worker_records_failure_after_rolling_back(job_sessions, mocker):
+    from scripts import platform_job_worker
+
+    job_id = await _add_job(job_sessions)
+
+    async def failing_handler(session, job):
+        job.payload = {"touched": True}
+        await session.flush()
+        raise RuntimeError("Reverb 503")
+
+    mocker.patch.object(platform_job_worker, "async_session", job_sessions)
+    mocker.patch.object(platform_job_worker, "run_platform_job", failing_handler)
+
+    await platform_job_worker._run_claimed_job(job_id)
+
+    job = (await _load_jobs(job_sessions))[job_id]
+    assert job.status == PlatformJobStatus.QUEUED.value
+    assert job.last_error == "Reverb 503"
+    assert job.payload == {}  # the handler's writes were rolled back
+    assert job.run_after > datetime.now(timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_superseded_when_its_key_is_queued_again(job_sessions):
+    failing_id = await _add_job(job_sessions, idempotency_key="end_listing:7")
+    queued_id = await _add_job(job_sessions, idempotency_key="end_listing:7", status=PlatformJobStatus.QUEUED.value, attempts=0)
+
+    async with job_sessions() as session:
+        job = await session.get(PlatformJob, failing_id)
+        assert await mark_platform_job_failed(session, job, "timeout") is False
+        await session.commit()
+
+    jobs = await _load_jobs(job_sessions)
+    assert jobs[failing_id].status == PlatformJobStatus.SUPERSEDED.value
+    assert jobs[queued_id].status == PlatformJobStatus.QUEUED.value
+
+
+@pytest.mark.asyncio
+async def test_stale_requeue_skips_keys_that_are_already_queued(job_sessions):
+    long_ago = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    plain_id = await _add_job(job_sessions, last_attempt_at=long_ago)
+    older_id = await _add_job(job_sessions, idempotency_key="qty:3", last_attempt_at=long_ago)
+    newer_id = await _add_job(job_sessions, idempotency_key="qty:3", last_attempt_at=long_ago)
+    collided_id = await _add_job(job_sessions, idempotency_key="qty:4", last_attempt_at=long_ago)
+    await _add_job(job_sessions, idempotency_key="qty:4", status=PlatformJobStatus.QUEUED.value, attempts=0)
+
+    async with job_sessions() as session:
+        assert await requeue_stale_platform_jobs(session, timedelta(minutes=30)) == 2
+        await session.commit()
+
+    jobs = await _load_jobs(job_sessions)
+    assert jobs[plain_id].status == PlatformJobStatus.QUEUED.value
+    assert jobs[newer_id].status == PlatformJobStatus.QUEUED.value
+    assert jobs[older_id].status == PlatformJobStatus.SUPERSEDED.value
+    assert jobs[collided_id].status == PlatformJobStatus.SUPERSEDED.value
+
+
+def _postgres_dialect():
+    from sqlalchemy.dialects import postgresql
+
+    return postgresql.dialect()
@@ -0,0 +1,41 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.product import Product
+from app.services.product_search import (
+    search_clause,
+    search_condition_sql,
+    search_params,
+    to_prefix_tsquery,
+)
+
+
+def test_every_query_word_is_a_prefix_match():
+    assert to_prefix_tsquery("Fender Strat '62") == "fender:* & strat:* & 62:*"
+    assert to_prefix_tsquery("REV-1234") == "rev:* & 1234:*"
+    assert to_prefix_tsquery("  !! ") is None
+
+
+def test_params_escape_like_wildcards():
+    params = search_params(" 100%_Tube ")
+
+    assert params["search_like"] == "%100\\%\\_tube%"
+    assert params["search_term"] == "100%_tube"
+    assert params["search_tsquery"] == "100:* & tube:*"
+
+
+def test_clause_hits_both_search_indexes():
+    query = select(Product.id).where(search_clause("stratocastr"))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert "products.search_vector @@ to_tsquery(" in sql
+    assert "lower(coalesce(products.brand, '')" in sql
+    assert "%> " in sql  # word similarity (rendered %%> under pyformat)
+
+
+def test_raw_condition_uses_table_alias():
+    condition = search_condition_sql("p")
+
+    assert condition.startswith("(p.search_vector @@")
+    assert "coalesce(p.sku, '')" in condition
+    assert "products." not in condition
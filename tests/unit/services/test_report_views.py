@@ -0,0 +1,112 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.product import ProductStatus
+from app.services import report_views
+from app.services.report_views import (
+    LISTING_HEALTH_TABLE,
+    LISTING_STATUS_VIEW,
+    PLATFORM_PRICES_VIEW,
+    evaluate_listing_health,
+    get_report_as_of,
+    refresh_report_views,
+)
+
+
+def _product(**overrides):
+    fields = dict(
+        id=7,
+        sku="RIFF-7",
+        title="Fender Stratocaster",
+        category="Electric Guitars",
+        is_stocked_item=False,
+        quantity=1,
+        description="Nice",
+        status=ProductStatus.ACTIVE,
+        shipping_profile_id=3,
+        primary_image="a.jpg",
+        additional_images=["b.jpg"],
+        created_at=datetime(2026, 1, 2),
+        platform_listings=[],
+    )
+    fields.update(overrides)
+    return SimpleNamespace(generate_title=lambda: None, **fields)
+
+
+def test_listing_health_row_is_json_ready():
+    reverb = SimpleNamespace(
+        platform_name="reverb",
+        external_id="123",
+        listing_url="https://reverb.com/item/123",
+        sync_status="synced",
+        reverb_listing=SimpleNamespace(reverb_state=None),
+    )
+
+    row = evaluate_listing_health(_product(platform_listings=[reverb], additional_images=[]))
+
+    assert row["product_status"] == "ACTIVE"
+    assert row["media"] == {"status": "warning", "issues": ["No Additional Images"]}
+    assert row["platforms"]["reverb"]["issues"] == ["Reverb state missing"]
+    assert row["platforms"]["ebay"]["status"] == "not_listed"
+    assert row["overall_status"] == "warning"
+    assert row["created_at"] == "2026-01-02T00:00:00"
+
+
+def _db(locked_sources=()):
+    db = MagicMock()
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+
+    async def execute(statement, params=None):
+        result = MagicMock()
+        if "pg_try_advisory_xact_lock" in str(statement):
+            result.scalar.return_value = params["key"].split(":", 1)[1] not in locked_sources
+        return result
+
+    db.execute = AsyncMock(side_effect=execute)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_sources_already_being_refreshed(mocker):
+    rebuild = mocker.patch.object(report_views, "rebuild_listing_health", AsyncMock(return_value=0))
+    db = _db(locked_sources={LISTING_STATUS_VIEW})
+
+    timings = await refresh_report_views(db, [LISTING_STATUS_VIEW, PLATFORM_PRICES_VIEW, LISTING_HEALTH_TABLE])
+
+    assert set(timings) == {PLATFORM_PRICES_VIEW, LISTING_HEALTH_TABLE}
+    statements = [str(call.args[0]) for call in db.execute.await_args_list]
+    assert any(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {PLATFORM_PRICES_VIEW}" in s for s in statements)
+    assert not any(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {LISTING_STATUS_VIEW}" in s for s in statements)
+    rebuild.assert_awaited_once_with(db)
+    marked = [call.args[1]["view_name"] for call in db.execute.await_args_list if "report_refresh_state" in str(call.args[0])]
+    assert marked == [PLATFORM_PRICES_VIEW, LISTING_HEALTH_TABLE]
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_going(mocker):
+    mocker.patch.object(report_views, "rebuild_listing_health", AsyncMock(side_effect=RuntimeError("boom")))
+    db = _db()
+
+    timings = await refresh_report_views(db, [LISTING_HEALTH_TABLE, PLATFORM_PRICES_VIEW])
+
+    assert list(timings) == [PLATFORM_PRICES_VIEW]
+    db.rollback.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_as_of_is_oldest_refresh_and_none_until_all_refreshed():
+    older, newer = datetime(2026, 10, 16, 9, 0), datetime(2026, 10, 16, 9, 30)
+    db = MagicMock()
+    result = MagicMock()
+    result.fetchall.return_value = [
+        SimpleNamespace(view_name=LISTING_STATUS_VIEW, refreshed_at=newer),
+        SimpleNamespace(view_name=PLATFORM_PRICES_VIEW, refreshed_at=older),
+    ]
+    db.execute = AsyncMock(return_value=result)
+
+    assert await get_report_as_of(db, LISTING_STATUS_VIEW, PLATFORM_PRICES_VIEW) == older
+    assert await get_report_as_of(db, LISTING_STATUS_VIEW, LISTING_HEALTH_TABLE) is None
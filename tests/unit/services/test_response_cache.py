@@ -0,0 +1,133 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import Depends
+from fastapi.responses import StreamingResponse
+from starlette.requests import Request
+
+from app.services.response_cache import (
+    CacheEntry,
+    MemoryCacheBackend,
+    ResponseCache,
+    RESPONSE_CACHE_CHANNEL,
+    etag_matches,
+    find_policy,
+    invalidate_cache_tags,
+    make_etag,
+    response_cache_middleware,
+)
+
+
+def _entry(body=b"{}", tags=()):
+    return CacheEntry(body=body, etag=make_etag(body), tags=list(tags))
+
+
+def _request(path, query=b"", headers=None):
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": query, "headers": raw_headers})
+
+
+def test_policies_match_templated_paths_and_format_tags():
+    policy, params = find_policy("/inventory/api/products/42")
+    assert params == {"product_id": "42"}
+    assert policy.tags_for(params) == ["product:42", "products"]
+
+    assert find_policy("/inventory/api/products/search") is None
+    assert find_policy("/orders/api/stats")[0].tags == ("orders",)
+
+
+def test_if_none_match_uses_weak_comparison():
+    etag = make_etag(b'{"a": 1}')
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2)
+    await backend.set("a", _entry(), 60)
+    await backend.set("b", _entry(), 60)
+    await backend.get("a")
+    await backend.set("c", _entry(), 60)
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") is not None
+    assert await backend.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_tags_drop_only_their_entries():
+    backend = MemoryCacheBackend()
+    await backend.set("stats", _entry(tags=["orders"]), 60)
+    await backend.set("product", _entry(tags=["product:1", "products"]), 60)
+    await backend.set("latest", _entry(tags=["products"]), 60)
+
+    assert await backend.invalidate(["product:1"]) == 1
+    assert await backend.get("latest") is not None
+    assert await backend.invalidate(["products", "orders"]) == 2
+    assert await backend.get("stats") is None
+
+
+@pytest.mark.asyncio
+async def test_response_read_before_an_invalidation_is_not_stored():
+    cache = ResponseCache(MemoryCacheBackend())
+    generation = cache.generation
+    await cache.invalidate_tags(["orders"])
+
+    assert not await cache.store("stats", _entry(tags=["orders"]), 60, generation)
+    assert await cache.get("stats") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_notifies_through_the_session_when_there_is_one(mocker):
+    cache = ResponseCache(MemoryCacheBackend())
+    mocker.patch("app.services.response_cache.response_cache", cache)
+    await cache.backend.set("product", _entry(tags=["products"]), 60)
+    db = MagicMock()
+    db.execute = AsyncMock()
+
+    await invalidate_cache_tags("product:1", "products", db=db)
+
+    assert await cache.get("product") is None
+    statement, params = db.execute.await_args.args
+    assert "pg_notify" in str(statement)
+    assert params == {"channel": RESPONSE_CACHE_CHANNEL, "tags": "product:1,products"}
+
+    # No session, or a route called directly with its Depends default: local only
+    await invalidate_cache_tags("products")
+    await invalidate_cache_tags("products", db=Depends(lambda: None))
+    db.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_middleware_serves_hits_and_not_modified(mocker):
+    cache = ResponseCache(MemoryCacheBackend())
+    mocker.patch("app.services.response_cache.response_cache", cache)
+    calls = []
+
+    async def call_next(request):
+        # Like Starlette's call_next, hand back the body as a stream
+        calls.append(request)
+        return StreamingResponse(iter([b'{"total":3}']), media_type="application/json")
+
+    auth = {"Authorization": "Basic YWRtaW46c2VjcmV0"}
+    first = await response_cache_middleware(_request("/orders/api/stats", b"days=30", auth), call_next)
+    assert first.headers["X-Cache"] == "MISS"
+    etag = first.headers["ETag"]
+
+    second = await response_cache_middleware(_request("/orders/api/stats", b"days=30", auth), call_next)
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.body == first.body
+
+    revalidated = await response_cache_middleware(
+        _request("/orders/api/stats", b"days=30", {**auth, "If-None-Match": etag}), call_next
+    )
+    assert revalidated.status_code == 304
+    assert len(calls) == 1
+
+    # Other credentials never see the cached body
+    await response_cache_middleware(_request("/orders/api/stats", b"days=30", {"Authorization": "Basic b3RoZXI="}), call_next)
+    assert len(calls) == 2
@@ -0,0 +1,86 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.snapshot_diff import (
+    SNAPSHOT_COLUMNS,
+    SnapshotDiffSpec,
+    calculate_changes_in_db,
+    stage_platform_snapshot,
+)
+
+SPEC = SnapshotDiffSpec(platform="vr", local_sql="SELECT 1", changed_sql="TRUE")
+
+
+def _rows(*dicts):
+    result = MagicMock()
+    result.fetchall.return_value = [
+        SimpleNamespace(_asdict=lambda d=d: dict(d), **d) for d in dicts
+    ]
+    return result
+
+
+def _db(driver_connection=None):
+    db = MagicMock()
+    db.execute = AsyncMock()
+    raw = SimpleNamespace(driver_connection=driver_connection)
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    db.connection = AsyncMock(return_value=connection)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_copied_on_asyncpg_connections():
+    driver = MagicMock()
+    driver.copy_records_to_table = AsyncMock()
+    db = _db(driver)
+
+    staged = await stage_platform_snapshot(db, {101: {"status": "active", "price": "1250", "listing_url": None}})
+
+    assert staged == 1
+    driver.copy_records_to_table.assert_awaited_once()
+    kwargs = driver.copy_records_to_table.await_args.kwargs
+    assert kwargs["columns"] == SNAPSHOT_COLUMNS
+    assert kwargs["records"] == [("101", "active", 1250.0, None, None)]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_falls_back_to_jsonb_insert():
+    db = _db(driver_connection=object())
+
+    await stage_platform_snapshot(db, {"7": {"status": "sold", "price": 99.0, "quantity_available": "2"}})
+
+    inserts = [call for call in db.execute.await_args_list if len(call.args) > 1]
+    assert len(inserts) == 1
+    assert json.loads(inserts[0].args[1]["rows"]) == [
+        {"external_id": "7", "status": "sold", "price": 99.0, "quantity_available": 2, "listing_url": None}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_changes_keep_calculate_changes_shape(mocker):
+    db = _db()
+    mocker.patch("app.services.snapshot_diff.stage_platform_snapshot", AsyncMock(return_value=3))
+    db.execute.side_effect = [
+        _rows({"external_id": "3"}),                                        # new on the platform
+        _rows({"external_id": "1", "product_id": 10, "base_price": 500}),   # changed
+        _rows({"external_id": "9", "product_id": 90}),                      # gone from the platform
+        MagicMock(),                                                        # DROP TABLE
+    ]
+    api_items = {
+        "1": {"external_id": "1", "status": "active", "price": 450.0},
+        "2": {"external_id": "2", "status": "active", "price": 100.0},
+        "3": {"external_id": "3", "status": "active", "price": 75.0},
+    }
+
+    changes = await calculate_changes_in_db(db, SPEC, api_items)
+
+    assert changes["create"] == [api_items["3"]]
+    assert changes["update"] == [
+        {"api_data": api_items["1"], "db_data": {"external_id": "1", "product_id": 10, "base_price": 500}}
+    ]
+    assert changes["remove"] == [{"external_id": "9", "product_id": 90}]
+    assert "DROP TABLE" in str(db.execute.await_args_list[-1].args[0])
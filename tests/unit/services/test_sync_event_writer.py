@@ -0,0 +1,59 @@
+import json
+import uuid
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.sync_event_writer import bulk_insert_sync_events
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_sync_events_single_statement():
+    """All events go out in one statement and the inserted count comes from RETURNING"""
+    db = MagicMock()
+    result = MagicMock()
+    result.fetchall.return_value = [(1,), (2,)]
+    db.execute = AsyncMock(return_value=result)
+
+    run_id = uuid.uuid4()
+    events = [
+        {'sync_run_id': run_id, 'platform_name': 'ebay', 'external_id': 123, 'change_type': 'price',
+         'change_data': {'old': 10, 'new': 12}},
+        {'sync_run_id': run_id, 'platform_name': 'ebay', 'external_id': '456', 'change_type': 'status_change',
+         'change_data': {'old': 'active', 'new': 'sold'}, 'product_id': 7, 'status': 'pending'},
+        {'sync_run_id': run_id, 'platform_name': 'ebay', 'external_id': '456', 'change_type': 'status_change',
+         'change_data': {'old': 'active', 'new': 'sold'}, 'product_id': 7, 'status': 'pending'},
+    ]
+
+    inserted = await bulk_insert_sync_events(db, events)
+
+    assert inserted == 2
+    db.execute.assert_awaited_once()
+    statement, params = db.execute.await_args.args
+    assert "ON CONFLICT (platform_name, external_id, change_type) WHERE status = 'pending'" in str(statement)
+    assert "NOT EXISTS" not in str(statement)
+
+    rows = json.loads(params['events'])
+    assert len(rows) == 3
+    assert rows[0]['external_id'] == '123'
+    assert rows[0]['status'] == 'pending'
+    assert rows[0]['product_id'] is None
+    assert rows[0]['sync_run_id'] == str(run_id)
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_sync_events_skip_seen_and_empty():
+    """skip_seen adds the any-status filter; an empty batch never hits the database"""
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(fetchall=MagicMock(return_value=[])))
+
+    assert await bulk_insert_sync_events(db, []) == 0
+    db.execute.assert_not_awaited()
+
+    await bulk_insert_sync_events(
+        db,
+        [{'sync_run_id': uuid.uuid4(), 'platform_name': 'ebay', 'external_id': '1',
+          'change_type': 'removed_listing', 'change_data': {}}],
+        skip_seen=True,
+    )
+    assert "NOT EXISTS" in str(db.execute.await_args.args[0])
@@ -0,0 +1,117 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.platform_common import PlatformCommon
+from app.models.product import Product
+from app.models.sync_event import SyncEvent
+from app.services.sync_services import DeferredEndListing, ReconcileBatch, SyncService
+
+
+def _sync_service(db, session_factory=None):
+    service = SyncService.__new__(SyncService)
+    service.db = db
+    service.reconcile_platform_concurrency = {"reverb": 2, "vr": 1}
+    service._reconcile_batch = None
+    service.session_factory = session_factory
+    return service
+
+
+@pytest.mark.asyncio
+async def test_lookups_use_prefetched_rows():
+    """Per-event product and listing lookups don't hit the database during a batched run"""
+    db = MagicMock()
+    db.execute = AsyncMock()
+    service = _sync_service(db)
+
+    product = Product(id=1, sku="RIFF-1")
+    reverb_link = PlatformCommon(id=10, product_id=1, platform_name="reverb")
+    service._reconcile_batch = ReconcileBatch(
+        products={1: product},
+        links_by_product={1: [reverb_link]},
+        listing_prices={10: 1250.0},
+    )
+
+    assert await service._get_product(1) is product
+    assert await service._get_platform_common(1, "reverb") is reverb_link
+    assert await service._get_platform_links(1) == [reverb_link]
+    assert await service._derive_sale_price_from_listing("reverb", 10) == 1250.0
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_flush_groups_calls_by_platform_with_bounded_concurrency(mock_session_factory, concurrency_probe):
+    service = _sync_service(MagicMock(), mock_session_factory)
+    service._update_local_platform_status = AsyncMock()
+
+    def build_service(platform_name, db):
+        async def mark_item_as_sold(external_id):
+            async with concurrency_probe.track(platform_name):
+                if external_id == "bad":
+                    raise RuntimeError("listing locked")
+                return True
+
+        platform_service = MagicMock()
+        platform_service.mark_item_as_sold = mark_item_as_sold
+        return platform_service
+
+    service._build_platform_service = build_service
+
+    failed_event = SyncEvent(id=99, status="processed")
+    ended_event = SyncEvent(id=98, status="processed")
+    deferred = [
+        DeferredEndListing(platform="reverb", external_id=str(i), product_id=i, sku=f"RIFF-{i}", events=[])
+        for i in range(5)
+    ]
+    deferred += [
+        DeferredEndListing(platform="vr", external_id="v1", product_id=7, sku="RIFF-7", events=[ended_event]),
+        DeferredEndListing(platform="vr", external_id="bad", product_id=8, sku="RIFF-8", events=[failed_event]),
+    ]
+    service._reconcile_batch = ReconcileBatch(
+        products={}, links_by_product={}, listing_prices={}, end_listings=deferred,
+    )
+
+    summary = {"actions_taken": 0, "errors": 0}
+    actions = []
+    await service._flush_deferred_end_listings(summary, actions)
+
+    assert concurrency_probe.peak == {"reverb": 2, "vr": 1}
+    assert summary == {"actions_taken": 6, "errors": 1}
+    assert failed_event.status == "partial"
+    assert "listing locked" in failed_event.notes
+    assert ended_event.status == "processed"
+    # One session per call; the failed call never commits its session
+    assert len(mock_session_factory.sessions) == 7
+    assert mock_session_factory.commits == 6
+    ended = {call.kwargs["product_id"] for call in service._update_local_platform_status.await_args_list}
+    assert ended == {0, 1, 2, 3, 4, 7}
+
+
+@pytest.mark.asyncio
+async def test_deferred_end_listings_are_reported_but_ended_locally_only_after_the_call():
+    service = _sync_service(MagicMock())
+    service.use_job_queue = False
+    reverb = MagicMock()
+    reverb.mark_item_as_sold = AsyncMock()
+    service.platform_services = {"reverb": reverb}
+
+    product = Product(id=1, sku="RIFF-1")
+    event = SyncEvent(id=5, status="pending")
+    service._reconcile_batch = ReconcileBatch(
+        products={1: product},
+        links_by_product={1: [
+            PlatformCommon(id=10, product_id=1, platform_name="ebay", external_id="e1", status="sold"),
+            PlatformCommon(id=11, product_id=1, platform_name="reverb", external_id="r1", status="active"),
+        ]},
+        listing_prices={},
+        current_events=[event],
+    )
+
+    successful, _, failed = await service._propagate_end_listing(product, "ebay", dry_run=False)
+
+    # In the sale alert's propagated platforms, but not sent yet
+    assert successful == ["reverb"]
+    assert failed == 0
+    reverb.mark_item_as_sold.assert_not_awaited()
+    assert service._end_listing_deferred(1, "reverb")
+    assert not service._end_listing_deferred(1, "ebay")
+    assert service._reconcile_batch.end_listings[0].events == [event]
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.vr_job_queue import VR_JOB_CHANNEL, VRJobListener, enqueue_vr_job
+
+
+@pytest.mark.asyncio
+async def test_enqueue_vr_job_notifies_worker():
+    """A newly queued job issues pg_notify on the worker channel within the same transaction"""
+    db = MagicMock()
+    no_existing = MagicMock()
+    no_existing.scalar_one_or_none.return_value = None
+    db.execute = AsyncMock(return_value=no_existing)
+    db.flush = AsyncMock()
+
+    async def assign_id(job):
+        job.id = 42
+
+    db.refresh = AsyncMock(side_effect=assign_id)
+
+    job = await enqueue_vr_job(db, product_id=7, payload={"sync_source": "test"})
+
+    assert job.id == 42
+    statement, params = db.execute.await_args_list[-1].args
+    assert "pg_notify" in str(statement)
+    assert params == {"channel": VR_JOB_CHANNEL, "payload": "42"}
+
+
+@pytest.mark.asyncio
+async def test_enqueue_vr_job_existing_job_does_not_notify():
+    existing = MagicMock()
+    db = MagicMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = existing
+    db.execute = AsyncMock(return_value=result)
+
+    assert await enqueue_vr_job(db, product_id=7, payload={}) is existing
+    db.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_listener_wakes_on_notification_and_falls_back_to_timeout(mocker):
+    connection = MagicMock()
+    connection.add_listener = AsyncMock()
+    connection.remove_listener = AsyncMock()
+    connection.close = AsyncMock()
+    connection.is_closed.return_value = False
+    mocker.patch("asyncpg.connect", AsyncMock(return_value=connection))
+
+    listener = VRJobListener(dsn="postgresql://localhost/test")
+    assert await listener.start() is True
+    assert listener.is_listening
+    callback = connection.add_listener.await_args.args[1]
+
+    # Nothing queued: returns after the fallback timeout
+    assert await listener.wait(0.01) is False
+
+    waiter = asyncio.create_task(listener.wait(5))
+    await asyncio.sleep(0)
+    callback(connection, 123, VR_JOB_CHANNEL, "42")
+    assert await asyncio.wait_for(waiter, 1) is True
+
+    await listener.close()
+    connection.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_listener_start_failure_uses_polling(mocker):
+    mocker.patch("asyncpg.connect", AsyncMock(side_effect=OSError("connection refused")))
+
+    listener = VRJobListener(dsn="postgresql://localhost/test")
+    assert await listener.start() is False
+    assert not listener.is_listening
+    assert await listener.wait(0.01) is False
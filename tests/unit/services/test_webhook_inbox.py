@@ -0,0 +1,164 @@
+import base64
+import hashlib
+import hmac
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import select
+
+from app.models.platform_common import PlatformCommon
+from app.models.product import Product
+from app.models.webhook import WebhookEvent
+from app.routes.webhooks import (
+    parse_ebay_notification,
+    verify_ebay_notification,
+    verify_shopify_webhook,
+)
+from app.services import webhook_inbox
+from app.services.order_sale_processor import OrderSaleProcessor
+from app.services.webhook_inbox import WebhookInboxConsumer
+
+
+def test_shopify_signature_is_checked_against_raw_body():
+    body = b'{"id": 1}'
+    signature = base64.b64encode(hmac.new(b"shh", body, hashlib.sha256).digest()).decode()
+
+    assert verify_shopify_webhook(body, signature, "shh")
+    assert not verify_shopify_webhook(body + b" ", signature, "shh")
+    assert not verify_shopify_webhook(body, signature, "")
+
+
+def _ebay_envelope(timestamp, signature):
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+  <soapenv:Header>
+    <ebl:RequesterCredentials xmlns:ebl="urn:ebay:apis:eBLBaseComponents">
+      <ebl:NotificationSignature>{signature}</ebl:NotificationSignature>
+    </ebl:RequesterCredentials>
+  </soapenv:Header>
+  <soapenv:Body>
+    <GetItemTransactionsResponse xmlns="urn:ebay:apis:eBLBaseComponents">
+      <Timestamp>{timestamp}</Timestamp>
+      <NotificationEventName>FixedPriceTransaction</NotificationEventName>
+      <Item><ItemID>1234</ItemID></Item>
+    </GetItemTransactionsResponse>
+  </soapenv:Body>
+</soapenv:Envelope>""".encode()
+
+
+def test_ebay_notification_signature_and_age():
+    settings = SimpleNamespace(
+        EBAY_DEV_ID="dev", EBAY_CLIENT_ID="app", EBAY_CLIENT_SECRET="cert", EBAY_NOTIFICATION_MAX_AGE_SECONDS=600,
+    )
+
+    def signed(timestamp):
+        digest = hashlib.md5(f"{timestamp}devappcert".encode()).digest()
+        return parse_ebay_notification(_ebay_envelope(timestamp, base64.b64encode(digest).decode()))
+
+    fresh = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    stale = (datetime.now(timezone.utc) - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    fields = signed(fresh)
+    assert fields["NotificationEventName"] == "FixedPriceTransaction"
+    assert fields["ItemID"] == "1234"
+    assert verify_ebay_notification(fields, settings)
+    assert not verify_ebay_notification(signed(stale), settings)
+    assert not verify_ebay_notification({**fields, "NotificationSignature": "forged"}, settings)
+
+
+async def _add_events(session_factory, *events):
+    async with session_factory() as session:
+        session.add_all(events)
+        await session.commit()
+        return [event.id for event in events]
+
+
+async def _load_events(session_factory):
+    async with session_factory() as session:
+        return {event.id: event for event in (await session.execute(select(WebhookEvent))).scalars()}
+
+
+@pytest.mark.asyncio
+async def test_drain_marks_rows_processed(session_factory, mocker):
+    [event_id] = await _add_events(session_factory, WebhookEvent(platform="reverb", status="pending", payload={}))
+    ingest = mocker.patch.object(webhook_inbox, "ingest_platform_events", AsyncMock(return_value={}))
+    mocker.patch.object(webhook_inbox, "invalidate_cache_tags", AsyncMock())
+
+    assert await WebhookInboxConsumer(session_factory).drain_platform("reverb") == 1
+
+    ingest.assert_awaited_once()
+    event = (await _load_events(session_factory))[event_id]
+    assert event.status == "processed"
+    assert event.processed is True
+    assert event.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_drain_retries_until_max_attempts(session_factory, mocker):
+    mocker.patch.object(
+        webhook_inbox, "get_settings",
+        return_value=SimpleNamespace(WEBHOOK_INBOX_MAX_ATTEMPTS=3, REVERB_API_KEY=""),
+    )
+
+    async def failing_ingest(db, platform, events, settings):
+        # Partial writes before the failure must not survive the rollback
+        events[0].payload = {"touched": True}
+        await db.flush()
+        raise RuntimeError("API down")
+
+    mocker.patch.object(webhook_inbox, "ingest_platform_events", failing_ingest)
+    retry_id, last_try_id = await _add_events(
+        session_factory,
+        WebhookEvent(platform="ebay", status="pending", attempts=0, payload={}),
+        WebhookEvent(platform="ebay", status="pending", attempts=2, payload={}),
+    )
+
+    await WebhookInboxConsumer(session_factory).drain_platform("ebay")
+
+    events = await _load_events(session_factory)
+    assert events[retry_id].status == "pending"
+    assert events[retry_id].payload == {}
+    assert events[retry_id].claimed_at is None
+    assert events[last_try_id].status == "error"
+    assert events[last_try_id].last_error == "API down"
+
+
+@pytest.mark.asyncio
+async def test_only_expired_claims_are_requeued(session_factory):
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    live_id, expired_id = await _add_events(
+        session_factory,
+        WebhookEvent(platform="reverb", status="processing", attempts=1, payload={}, claimed_at=now),
+        WebhookEvent(platform="reverb", status="processing", attempts=1, payload={}, claimed_at=now - timedelta(hours=1)),
+    )
+
+    assert await WebhookInboxConsumer(session_factory).requeue_expired(lease_seconds=900) == 1
+
+    events = await _load_events(session_factory)
+    assert events[live_id].status == "processing"  # another replica is still on it
+    assert events[expired_id].status == "pending"
+
+
+@pytest.mark.asyncio
+async def test_sold_one_off_item_is_ended_on_other_platforms(mocker):
+    settings = SimpleNamespace(PLATFORM_JOB_QUEUE_ENABLED=True, PLATFORM_JOB_MAX_ATTEMPTS=5)
+    processor = OrderSaleProcessor(MagicMock(), None)
+    processor.settings = settings
+    enqueue = mocker.patch("app.services.order_sale_processor.enqueue_platform_job", AsyncMock(return_value=1))
+    ebay_link = PlatformCommon(id=3, product_id=7, platform_name="ebay", external_id="e-1", status="active")
+    links = MagicMock()
+    links.scalars.return_value.all.return_value = [ebay_link]
+    processor.db.execute = AsyncMock(return_value=links)
+    processor._is_sale_order = MagicMock(return_value=True)
+    processor._get_product_for_order = AsyncMock(return_value=Product(id=7, sku="RIFF-7", is_stocked_item=False))
+    order = SimpleNamespace(order_uuid="o-1", sale_processed=False)
+
+    result = await processor.process_order(order, "reverb", end_other_listings=True)
+
+    assert result["processed"] is True
+    assert order.sale_processed is True
+    assert ebay_link.status == "ended"
+    assert enqueue.await_args.kwargs["action"] == "end_listing"
+    assert enqueue.await_args.kwargs["idempotency_key"] == "end_listing:ebay:e-1"
@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+import pytest
+
+from app.services.websockets.manager import SLOW_CONSUMER_CLOSE_CODE, ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self, stall: bool = False):
+        self.sent = []
+        self.closed_with = None
+        self._release = asyncio.Event()
+        if not stall:
+            self._release.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await self._release.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+@pytest.mark.asyncio
+async def test_burst_drops_oldest_messages_but_keeps_clients():
+    """A burst larger than the queue, published before any sender runs, disconnects nobody"""
+    manager = ConnectionManager(queue_size=2, slow_client_grace_seconds=60)
+    fast, slow = FakeWebSocket(), FakeWebSocket(stall=True)
+    await manager.connect(fast)
+    await manager.connect(slow)
+
+    for i in range(5):
+        manager.publish({"type": "sync_progress", "n": i})
+    await asyncio.sleep(0.01)
+
+    assert [message["n"] for message in fast.sent] == [3, 4]
+    assert manager.active_connections == [fast, slow]
+    assert slow.closed_with is None
+
+
+@pytest.mark.asyncio
+async def test_stalled_client_is_dropped_after_grace_period_without_blocking_publishers():
+    manager = ConnectionManager(queue_size=2, slow_client_grace_seconds=0.02)
+    fast, slow = FakeWebSocket(), FakeWebSocket(stall=True)
+    await manager.connect(fast)
+    await manager.connect(slow)
+
+    # The stalled client's queue overflows from the fourth message on
+    for i in range(8):
+        manager.publish({"type": "sync_progress", "n": i})
+        await asyncio.sleep(0.01)
+
+    assert [message["n"] for message in fast.sent] == list(range(8))
+    assert manager.active_connections == [fast]
+    assert slow.closed_with == SLOW_CONSUMER_CLOSE_CODE
+
+
+@pytest.mark.asyncio
+async def test_topic_messages_only_reach_subscribers():
+    manager = ConnectionManager(queue_size=10)
+    dashboard, ebay_only, everything = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    for websocket in (dashboard, ebay_only, everything):
+        await manager.connect(websocket)
+    manager.subscribe(ebay_only, ["sync.ebay"])
+    manager.subscribe(everything, ["sync"])
+
+    await manager.broadcast({"type": "sync_started", "platform": "all"})
+    manager.publish({"type": "sync_progress", "platform": "ebay"}, topic="sync.ebay")
+    manager.publish({"type": "sync_progress", "platform": "vr"}, topic="sync.vr")
+    await asyncio.sleep(0.01)
+
+    assert [m["type"] for m in dashboard.sent] == ["sync_started"]
+    assert [m.get("platform") for m in ebay_only.sent] == ["all", "ebay"]
+    assert [m.get("platform") for m in everything.sent] == ["all", "ebay", "vr"]
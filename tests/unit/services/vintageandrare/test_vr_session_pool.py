@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.vintageandrare.session_pool import VRSessionPool
+
+
+@pytest.fixture
+def fake_drivers(mocker):
+    """Patch driver creation so warming a session records a MagicMock driver"""
+    drivers = []
+
+    def build(remote_debugging_port=None):
+        driver = MagicMock()
+        drivers.append(driver)
+        return driver, False
+
+    mocker.patch('app.services.vintageandrare.session_pool.build_listing_driver', side_effect=build)
+    mocker.patch('app.services.vintageandrare.session_pool.time.sleep')
+    return drivers
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_sessions_in_parallel_and_reuses_cookies(fake_drivers):
+    cookie_source = AsyncMock(return_value=[{"name": "cf_clearance", "value": "abc"}])
+    pool = VRSessionPool(3, max_jobs_per_session=10, cookie_source=cookie_source)
+    in_use = set()
+    peak = 0
+
+    async def job():
+        nonlocal peak
+        async with pool.session() as browser:
+            in_use.add(browser.index)
+            peak = max(peak, len(in_use))
+            await asyncio.sleep(0.01)
+            in_use.discard(browser.index)
+
+    await asyncio.gather(*(job() for _ in range(9)))
+
+    assert peak == 3
+    assert len(fake_drivers) == 3  # warmed once, then reused
+    cookie_source.assert_awaited_once()
+    fake_drivers[0].add_cookie.assert_called_once_with(
+        {"name": "cf_clearance", "value": "abc", "domain": ".vintageandrare.com", "path": "/"}
+    )
+
+    await pool.close()
+    assert all(driver.quit.called for driver in fake_drivers)
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_after_max_jobs_and_on_failure(fake_drivers):
+    cookie_source = AsyncMock(return_value=[])
+    pool = VRSessionPool(1, max_jobs_per_session=2, cookie_source=cookie_source)
+
+    for _ in range(2):
+        async with pool.session():
+            pass
+    assert len(fake_drivers) == 1
+    assert fake_drivers[0].quit.called  # hit max_jobs_per_session
+
+    with pytest.raises(RuntimeError):
+        async with pool.session():
+            raise RuntimeError("form submit failed")
+    assert len(fake_drivers) == 2
+    assert fake_drivers[1].quit.called
+
+    # Failing a fresh session re-harvests cookies for the replacement
+    async with pool.session() as browser:
+        assert browser.jobs_completed == 0
+    assert cookie_source.await_count == 2
+    await pool.close()